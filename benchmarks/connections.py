@@ -0,0 +1,97 @@
+"""connections.py: Benchmark building Connections boards from thousands of categories.
+
+Run with ``python benchmarks/connections.py [--categories N]``. Random
+categories of 4 to 16 words are drawn from the Wordle words, so words
+belong to several categories and red herrings are common, then the index
+is built and boards are built from it. The bundled categories are timed
+too. A board is what a game waits for when its pool is empty.
+"""
+
+import argparse
+import random
+import statistics
+import time
+from math import comb
+
+from dailies.config.paths import Paths
+from dailies.file_interaction.word_cache import load_words
+from dailies.games.connections.builder import ConnectionsBuilder
+from dailies.games.connections.category_index import CategoryIndex, read_categories
+
+
+def time_builds(index: CategoryIndex, boards: int, seed: int) -> str:
+    """
+    Time building boards.
+
+    Parameters
+    ----------
+    index : CategoryIndex
+        The categories to build from.
+    boards : int
+        The number of boards to build.
+    seed : int
+        The seed of the first board.
+
+    Returns
+    -------
+    str
+        The median and worst times, and how many builds found no board.
+
+    Notes
+    -----
+    Each board gets its own seeded builder, as a game or pool worker would.
+    """
+    times = []
+    failures = 0
+    for offset in range(boards):
+        builder = ConnectionsBuilder(index, rng=random.Random(seed + offset))
+        start = time.perf_counter()
+        if builder.build() is None:
+            failures += 1
+        times.append(time.perf_counter() - start)
+    return (
+        f"median {statistics.median(times) * 1000:.2f} ms, max {max(times) * 1000:.2f} ms, "
+        f"{failures} of {boards} without a board"
+    )
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the index and board build times.
+
+    Notes
+    -----
+    The number of four-category combinations is printed for scale: that is
+    what a search without the index would have to work through.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--categories", type=int, default=5000, help="Categories to generate.")
+    parser.add_argument("--vocabulary", type=int, default=2000, help="Distinct words to use.")
+    parser.add_argument("--boards", type=int, default=200, help="Boards to build.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the random categories.")
+    arguments = parser.parse_args()
+
+    rng = random.Random(arguments.seed)
+    words = list(load_words(Paths.WORDS) or ())
+    vocabulary = rng.sample(words, min(arguments.vocabulary, len(words)))
+    categories = {
+        f"category{number}": rng.sample(vocabulary, rng.randint(4, 16))
+        for number in range(arguments.categories)
+    }
+
+    start = time.perf_counter()
+    index = CategoryIndex(categories)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{arguments.categories} categories of {len(vocabulary)} words indexed in "
+        f"{elapsed * 1000:.1f} ms ({comb(arguments.categories, 4):.2e} ways to choose four)"
+    )
+    print(f"build: {time_builds(index, arguments.boards, arguments.seed)}")
+
+    bundled = read_categories()
+    if bundled is not None:
+        print(f"bundled build: {time_builds(CategoryIndex(bundled), arguments.boards, 0)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""score_store.py: Benchmark the score store's writes and leaderboard queries.
+
+Run with ``python benchmarks/score_store.py [--results N]``. A store in a
+temporary directory is filled with random results for a few games, players
+and years of days, then each query is timed against it. The time taken by
+``record`` itself is what a game pays when it ends.
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable
+
+from dailies.file_interaction.score_store import ScoreStore
+
+GAMES = ["Wordle", "Quordle", "Octordle", "Sedecordle"]
+
+
+def time_query(query: Callable[[], object], repeats: int) -> str:
+    """
+    Time a query.
+
+    Parameters
+    ----------
+    query : Callable[[], object]
+        The query.
+    repeats : int
+        The number of times to run it.
+
+    Returns
+    -------
+    str
+        The median and worst times.
+
+    Notes
+    -----
+    The first run is included, so the worst time covers a cold page cache.
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        query()
+        times.append(time.perf_counter() - start)
+    return f"median {statistics.median(times) * 1000:.2f} ms, max {max(times) * 1000:.2f} ms"
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the write rate and query times.
+
+    Notes
+    -----
+    Results are recorded as fast as possible, so writes are batched as
+    fully as the store allows.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=1_000_000, help="Results to record.")
+    parser.add_argument("--players", type=int, default=1000, help="Distinct players.")
+    parser.add_argument("--repeats", type=int, default=50, help="Runs of each query.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the random results.")
+    arguments = parser.parse_args()
+
+    rng = random.Random(arguments.seed)
+    today = date.today()
+    with tempfile.TemporaryDirectory() as directory:
+        scores = ScoreStore(Path(directory) / "scores.sqlite3", player="player0")
+
+        record_times = []
+        start = time.perf_counter()
+        for _ in range(arguments.results):
+            game = rng.choice(GAMES)
+            won = rng.random() < 0.9
+            record_start = time.perf_counter()
+            scores.record(
+                game,
+                rng.randint(1, 6) if won else 6,
+                won,
+                player=f"player{rng.randrange(arguments.players)}",
+                played_on=today - timedelta(days=rng.randrange(3 * 365)),
+            )
+            record_times.append(time.perf_counter() - record_start)
+        for offset in range(30):
+            scores.record("Wordle", 3, True, played_on=today - timedelta(days=offset))
+        scores.flush()
+        elapsed = time.perf_counter() - start
+        print(f"{arguments.results} results written in {elapsed:.2f} s")
+        print(
+            f"record: median {statistics.median(record_times) * 1e6:.1f} µs, "
+            f"max {max(record_times) * 1000:.2f} ms"
+        )
+
+        print(f"top 10: {time_query(lambda: scores.top('Wordle', 10), arguments.repeats)}")
+        print(f"streak: {time_query(lambda: scores.streak('Wordle'), arguments.repeats)}")
+        percentile = time_query(lambda: scores.percentile("Wordle", 3), arguments.repeats)
+        print(f"percentile: {percentile}")
+        print(f"played: {time_query(lambda: scores.played('Wordle'), arguments.repeats)}")
+        scores.close()
+
+
+if __name__ == "__main__":
+    main()
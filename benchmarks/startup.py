@@ -0,0 +1,97 @@
+"""startup.py: Benchmark the time from process start to the first frame of the main menu.
+
+Run with ``python benchmarks/startup.py [--runs N]``. Each run is a fresh
+interpreter with a dummy SDL video driver and a temporary home directory, so
+the user's caches and puzzle pools are neither used nor consumed. The first
+run of each mode is discarded, since it compiles the word cache.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+CHILD = """
+import time
+start = time.perf_counter()
+
+import pygame
+
+from dailies.games.registry import DEFAULT_GAMES, GameRegistry
+from dailies.interface.graphical_menu import draw_menu
+
+registry = GameRegistry(DEFAULT_GAMES)
+if {eager}:
+    for name in registry.names():
+        registry.get(name)
+
+pygame.init()
+screen = pygame.display.set_mode((800, 600))
+draw_menu(screen, 36, registry)
+pygame.display.update()
+print(time.perf_counter() - start)
+"""
+
+
+def time_to_first_frame(eager: bool, home: str) -> float:
+    """
+    Time one start-up in a fresh interpreter.
+
+    Parameters
+    ----------
+    eager : bool
+        Whether to build every game before the first frame, as ``main`` used to.
+    home : str
+        The home directory for the run.
+
+    Returns
+    -------
+    float
+        The time to the first frame, in seconds.
+
+    Examples
+    --------
+    >>> time_to_first_frame(False, tempfile.mkdtemp())
+    0.41
+
+    Notes
+    -----
+    Interpreter start-up itself is excluded, as it is the same for both modes.
+    """
+    environment = dict(os.environ, SDL_VIDEODRIVER="dummy", HOME=home, USERPROFILE=home)
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(eager=eager)],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the median time of each mode.
+
+    Notes
+    -----
+    Lazy is the registry as ``main`` uses it; eager builds every game first.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="The number of timed runs per mode.")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        for label, eager in (("lazy", False), ("eager", True)):
+            time_to_first_frame(eager, home)
+            times = [time_to_first_frame(eager, home) for _ in range(arguments.runs)]
+            print(
+                f"{label:>5}: median {statistics.median(times) * 1000:.1f} ms, "
+                f"min {min(times) * 1000:.1f} ms over {arguments.runs} runs"
+            )
+
+
+if __name__ == "__main__":
+    main()
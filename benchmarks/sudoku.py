@@ -0,0 +1,58 @@
+"""sudoku.py: Benchmark generating standard and giant Sudoku puzzles.
+
+Run with ``python benchmarks/sudoku.py [--puzzles N]``. Seeded puzzles are
+generated at every size, as a pool worker or calendar would, and each one
+is checked for uniqueness with dancing links, stopping at a second
+solution. Giant puzzles should take well under a second each.
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+from dailies.config.constants import Constants
+from dailies.games.sudoku.exact_cover import DancingLinksSolver
+from dailies.games.sudoku.generator import generate_sudoku_puzzle
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the generation and uniqueness check times.
+
+    Notes
+    -----
+    The share of cells removed is printed too, since giant grids keep a
+    clue whenever its removal cannot be proven unique locally.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--puzzles", type=int, default=10, help="Puzzles to generate per size.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the first puzzle.")
+    arguments = parser.parse_args()
+
+    for size in (9, 16, 25):
+        solver = DancingLinksSolver(size)
+        generation_times, check_times, removed = [], [], []
+        for seed in range(arguments.seed, arguments.seed + arguments.puzzles):
+            start = time.perf_counter()
+            record = generate_sudoku_puzzle(seed, size, Constants.SUDOKU_PERCENT_TO_REMOVE)
+            generation_times.append(time.perf_counter() - start)
+
+            puzzle = np.array(record["puzzle"])
+            start = time.perf_counter()
+            solutions = solver.solve(puzzle, max_solutions=2)
+            check_times.append(time.perf_counter() - start)
+            if len(solutions) != 1:
+                raise RuntimeError(f"The {size} × {size} puzzle of seed {seed} is not unique.")
+            removed.append(float((puzzle == 0).mean()))
+
+        print(
+            f"{size} × {size}: generate median {statistics.median(generation_times) * 1000:.1f} "
+            f"ms, max {max(generation_times) * 1000:.1f} ms; "
+            f"check max {max(check_times) * 1000:.1f} ms; "
+            f"{min(removed):.0%}-{max(removed):.0%} of cells removed"
+        )
+
+
+if __name__ == "__main__":
+    main()
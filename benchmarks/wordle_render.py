@@ -0,0 +1,82 @@
+"""wordle_render.py: Benchmark the CPU usage and frame times of the Wordle render loop.
+
+Run with ``python benchmarks/wordle_render.py [--idle SECONDS]``. A fresh
+interpreter with a dummy SDL video driver plays one game: it sits idle, as a
+player thinking would, then types the answer a letter at a time and waits for
+the closing animations. CPU usage is measured over the whole game, with
+``time.process_time``, so the numbers are comparable with loops that keep no
+statistics of their own.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+CHILD = """
+import threading
+import time
+
+import pygame
+
+from dailies.games.wordle.wordle import create_wordle
+
+wordle = create_wordle()
+
+
+def post(key, unicode):
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode))
+
+
+def player():
+    while pygame.display.get_surface() is None:
+        time.sleep(0.01)
+    time.sleep({idle})
+    for letter in wordle.target_word:
+        post(ord(letter), letter)
+        time.sleep(0.2)
+    post(pygame.K_RETURN, "\\r")
+
+
+threading.Thread(target=player, daemon=True).start()
+wall_start = time.perf_counter()
+cpu_start = time.process_time()
+wordle.play()
+wall = time.perf_counter() - wall_start
+cpu = time.process_time() - cpu_start
+stats = getattr(wordle, "frame_stats", None)
+frames = stats.summary() if stats is not None else "no frame statistics"
+print(f"{{wall:.2f}} {{cpu / wall * 100:.1f}} {{frames}}")
+"""
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the wall time, CPU usage and frame statistics.
+
+    Notes
+    -----
+    100% CPU means one core kept busy for the whole game.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--idle", type=float, default=3.0, help="Seconds to wait before typing the answer."
+    )
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        environment = dict(os.environ, SDL_VIDEODRIVER="dummy", HOME=home, USERPROFILE=home)
+        result = subprocess.run(
+            [sys.executable, "-c", CHILD.format(idle=arguments.idle)],
+            env=environment,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    wall, cpu, frames = result.stdout.strip().splitlines()[-1].split(" ", 2)
+    print(f"wall {wall} s, CPU {cpu}% of one core; {frames}")
+
+
+if __name__ == "__main__":
+    main()
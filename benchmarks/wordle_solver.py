@@ -0,0 +1,77 @@
+"""wordle_solver.py: Benchmark the Wordle solver by playing it against every answer.
+
+Run with ``python benchmarks/wordle_solver.py [--games N]``. The feedback
+matrix is loaded (or built) from the usual cache directory first, and then
+timed separately from the games, which exercise pattern lookups, candidate
+filtering and entropy scoring.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from dailies.config.constants import Constants
+from dailies.config.paths import Paths
+from dailies.file_interaction.word_cache import load_words
+from dailies.games.wordle.feedback_matrix import FeedbackMatrix
+from dailies.games.wordle.scoring import score_guess
+from dailies.games.wordle.solver import WordleSolver
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the timings and the guess distribution.
+
+    Notes
+    -----
+    The opening suggestion is timed on its own, since later games reuse it.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=500, help="The number of games to play.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed used to pick the answers.")
+    arguments = parser.parse_args()
+
+    store = load_words(Paths.WORDS)
+    if store is None:
+        raise SystemExit(f"Word list not found: {Paths.WORDS}")
+    words = store.words_of_length(Constants.WORDLE_WORD_LENGTH)
+
+    start = time.perf_counter()
+    solver = WordleSolver(FeedbackMatrix.load(words, words))
+    print(f"feedback matrix: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    solver.suggest()
+    print(f"opening suggestion: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    targets = random.Random(arguments.seed).sample(words, min(arguments.games, len(words)))
+    suggestion_times = []
+    guess_counts = []
+    start = time.perf_counter()
+    for target in targets:
+        solver.reset()
+        guesses = 0
+        while True:
+            suggestion_start = time.perf_counter()
+            guess = solver.suggest()
+            suggestion_times.append(time.perf_counter() - suggestion_start)
+            guesses += 1
+            if guess == target:
+                break
+            solver.update(guess, score_guess(guess, target))
+        guess_counts.append(guesses)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{len(targets)} games in {elapsed:.2f} s: mean {statistics.mean(guess_counts):.3f} "
+        f"guesses, worst {max(guess_counts)}"
+    )
+    print(
+        f"suggestion: median {statistics.median(suggestion_times) * 1000:.2f} ms, "
+        f"max {max(suggestion_times) * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -41,4 +41,64 @@ class Constants:
     KEY_HEIGHT_DIVISOR = 30  # division of screen height for key height
     KEYBOARD_Y_DOWN = 25
     POPUP_FONT_SIZE = 30
+    MENU_FONT_SIZE = 36
+    MENU_SIZE = (800, 600)
+    MENU_TITLE_POSITION = (20, 20)
+    MENU_ITEM_X = 50
+    MENU_ITEM_Y = 60  # top of the first item
+    MENU_LINE_HEIGHT = 40
+    MENU_BUTTON_SIZE = (300, 30)  # smallest clickable area of an item
+    GLYPH_CACHE_SIZE = 512  # rendered letters and labels kept by the glyph cache
+    FONT_CACHE_SIZE = 16  # font sizes kept by the glyph cache
     FPS = 60
+    FRAME_STATS_WINDOW = 3600  # recent frames kept for frame-time statistics
+
+    # Animation settings (durations in milliseconds)
+    FLIP_DURATION = 300  # time for one tile to flip over
+    FLIP_STAGGER = 150  # delay between neighbouring tiles starting to flip
+    SHAKE_DURATION = 400
+    SHAKE_AMPLITUDE = 10  # pixels
+    SHAKE_CYCLES = 3
+
+    # Wordle settings
+    WORDLE_WORD_LENGTH = 5
+    WORDLE_SIMULATION_GAMES_DEFAULT = 10000
+    MULTI_WORDLE_BOARDS = (4, 8, 16)  # board counts offered, as in Quordle, Octordle, Sedecordle
+    MULTI_WORDLE_BOARD_COLUMNS = 4  # boards side by side before starting a new row
+
+    # Puzzle generation
+    SUDOKU_SIZE = 9
+    SUDOKU_DIFFICULTIES = ("easy", "medium", "hard", "expert", "fiendish")
+    SUDOKU_PERCENT_TO_REMOVE = 0.6
+    SUDOKU_GRADING_ATTEMPTS = 250
+    SUDOKU_GIANT_SIZE = 16  # grids this size and up use dancing links and local uniqueness proofs
+    SUDOKU_REFUTATION_LIMIT = 40  # placements allowed when refuting a candidate
+    KENKEN_SIZE = 6
+    KENKEN_SIZES = (3, 4, 5, 6, 7, 8, 9)
+    KENKEN_CAGE_SIZE_WEIGHTS = (1, 6, 5, 2)  # relative odds of cages of 1, 2, 3 and 4 cells
+    STRANDS_ROWS = 6
+    STRANDS_COLUMNS = 8
+    STRANDS_MIN_WORD_LENGTH = 4  # shortest word that counts, theme or not
+    STRANDS_SHUFFLE_MOVES = 20  # path moves per cell when shuffling the word layout
+    STRANDS_LAYOUT_ATTEMPTS = 20  # word orders tried along a path, keeping the least ambiguous
+    MINI_CROSSWORD_TEMPLATES = (  # rows of 5 × 5 grids, with "#" for black squares
+        ("#????", "?????", "?????", "?????", "????#"),
+        ("????#", "?????", "?????", "?????", "#????"),
+        ("#???#", "?????", "?????", "?????", "#???#"),
+        ("##???", "#????", "?????", "????#", "???##"),
+        ("???##", "????#", "?????", "#????", "##???"),
+    )
+    MINI_CROSSWORD_RESTART_TRIES = 200  # words tried before the first restart, doubling after
+    CONNECTIONS_GROUPS = 4
+    CONNECTIONS_GROUP_SIZE = 4
+    CONNECTIONS_RED_HERRINGS = 2  # board words allowed to also belong to another group's category
+    CONNECTIONS_BUILD_ATTEMPTS = 50  # boards tried before giving up
+    CONNECTIONS_CATEGORY_DRAWS = 200  # categories drawn per board before starting again
+    PUZZLE_POOL_COUNT_DEFAULT = 365
+    PUZZLE_POOL_SEED_DEFAULT = 0
+    DAILY_SEED = 0  # batch seed of the daily puzzles; changing it reshuffles every day
+    DAILY_DAYS_DEFAULT = 30  # days ahead precomputed by the schedule command
+
+    # Scores
+    SCORE_PLAYER_DEFAULT = "player"
+    SCORE_BATCH_SIZE = 1000  # most results written in one transaction
@@ -39,3 +39,11 @@ class DialogueEn:
     WORDLE_NAME = "Wordle"
     WORDLE_DESCRIPTION = "This is a game of Wordle."
     WORDLE_INSTRUCTIONS = "Instructions for the game of Wordle."
+
+    QUORDLE_NAME = "Quordle"
+    OCTORDLE_NAME = "Octordle"
+    SEDECORDLE_NAME = "Sedecordle"
+    MULTI_WORDLE_DESCRIPTION = "This is a game of Wordle played on several boards at once."
+    MULTI_WORDLE_INSTRUCTIONS = (
+        "Every guess is played on every board. Solve all of the boards before the guesses run out."
+    )
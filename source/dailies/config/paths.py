@@ -19,9 +19,23 @@ class Paths:
     """
 
     # Wordle words file
-    WORDS = (
-        "C:\\Users\\wills\\Documents\\GitHub\\dailies\\source\\dailies\\config\\wordle_words.txt"
-    )
+    WORDS = str(Path(__file__).parent / "wordle_words.txt")
+
+    # Mini Crossword words file, with the three and four letter words Wordle lacks
+    CROSSWORD_WORDS = str(Path(__file__).parent / "crossword_words.txt")
+
+    # Connections categories file, one "category: word word ..." per line
+    CONNECTIONS_CATEGORIES = str(Path(__file__).parent / "connections_categories.txt")
+
+    # Strands themes file, one "theme: word word ..." per line
+    STRANDS_THEMES = str(Path(__file__).parent / "strands_themes.txt")
+
+    # User data directories
+    DATA_DIR = Path.home() / ".dailies"
+    PUZZLE_POOL_DIR = DATA_DIR / "puzzle_pool"
+    DAILY_DIR = DATA_DIR / "daily"
+    CACHE_DIR = DATA_DIR / "cache"
+    SCORES_DB = DATA_DIR / "scores.sqlite3"
 
     temp_dir = Path(tempfile.mkdtemp())
 
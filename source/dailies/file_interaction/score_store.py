@@ -0,0 +1,466 @@
+"""score_store.py: A durable SQLite store of every game result, written off the render thread."""
+
+import queue
+import sqlite3
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+from ..config.constants import Constants
+from ..config.paths import Paths
+from ..logs.setup_logging import setup_logging
+
+score_store_logger = setup_logging()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    player TEXT NOT NULL,
+    played_on TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    won INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_score ON results (game, won, score, played_on);
+CREATE INDEX IF NOT EXISTS results_by_player ON results (game, player, won, played_on);
+CREATE INDEX IF NOT EXISTS results_by_date ON results (played_on);
+CREATE TABLE IF NOT EXISTS score_counts (
+    game TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    results INTEGER NOT NULL,
+    PRIMARY KEY (game, won, score)
+) WITHOUT ROWID;
+"""
+
+INSERT_RESULT = "INSERT INTO results (game, player, played_on, score, won) VALUES (?, ?, ?, ?, ?)"
+COUNT_RESULTS = (
+    "INSERT INTO score_counts (game, won, score, results) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (game, won, score) DO UPDATE SET results = results + excluded.results"
+)
+
+
+@dataclass
+class Result:
+    """
+    The result of one game.
+
+    Attributes
+    ----------
+    game : str
+        The name of the game.
+    player : str
+        The name of the player.
+    played_on : date
+        The day the game was played.
+    score : int
+        The score, where lower is better, such as the number of guesses.
+    won : bool
+        Whether the game was won.
+
+    Examples
+    --------
+    >>> Result("Wordle", "player", date(2024, 5, 1), 4, True)
+
+    Notes
+    -----
+    This is one row of the ``results`` table.
+    """
+
+    game: str
+    player: str
+    played_on: date
+    score: int
+    won: bool
+
+
+class ScoreStore:
+    """
+    A durable store of every game result, with leaderboard queries.
+
+    Attributes
+    ----------
+    path : Path
+        The SQLite database file.
+    player : str
+        The player results are recorded for when none is given.
+    batch_size : int
+        The most results written in one transaction.
+
+    Methods
+    -------
+    record(
+        game: str,
+        score: int,
+        won: bool,
+        player: str | None = None,
+        played_on: date | None = None,
+    ) -> None:
+        Queue a result to be written.
+    flush() -> None:
+        Wait until every queued result is written.
+    close() -> None:
+        Write the queued results and close the database.
+    top(game: str, count: int = 10) -> list[Result]:
+        Return the best winning results of a game.
+    streak(game: str, player: str | None = None, today: date | None = None) -> int:
+        Return the number of consecutive days up to today a game was won.
+    percentile(game: str, score: int, won: bool = True) -> float:
+        Return the percentage of a game's results that a result beats.
+    played(game: str) -> int:
+        Return the number of results recorded for a game.
+
+    Examples
+    --------
+    >>> scores = ScoreStore()
+    >>> scores.record("Wordle", 4, True)
+    >>> scores.flush()
+    >>> scores.top("Wordle", 1)[0].score
+    4
+    >>> scores.close()
+
+    Notes
+    -----
+    The database runs in write-ahead-log mode, so reads never wait for the
+    writer. Results are written by a background thread, a batch per
+    transaction, so recording a result at the end of a game returns at once.
+    Every query is answered from an index: the best scores come from the
+    front of ``results_by_score``, a streak reads only the days it covers
+    from ``results_by_player``, and a percentile sums the handful of rows
+    of ``score_counts``, which the writer keeps up to date in the same
+    transaction as the results. None of them reads the whole table, so they
+    take milliseconds even with millions of results.
+    """
+
+    def __init__(
+        self,
+        path: Path = Paths.SCORES_DB,
+        player: str = Constants.SCORE_PLAYER_DEFAULT,
+        batch_size: int = Constants.SCORE_BATCH_SIZE,
+    ) -> None:
+        """
+        Open the store, creating the database if it does not exist.
+
+        Parameters
+        ----------
+        path : Path, optional
+            The SQLite database file, by default ``Paths.SCORES_DB``.
+        player : str, optional
+            The player results are recorded for when none is given, by
+            default ``Constants.SCORE_PLAYER_DEFAULT``.
+        batch_size : int, optional
+            The most results written in one transaction, by default
+            ``Constants.SCORE_BATCH_SIZE``.
+
+        Raises
+        ------
+        ValueError
+            If the batch size is not positive.
+
+        Examples
+        --------
+        >>> scores = ScoreStore(tmp_path / "scores.sqlite3")
+
+        Notes
+        -----
+        Queries use a connection owned by the thread that opened the store,
+        and the writer thread opens its own.
+        """
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch size: {batch_size}. It must be positive.")
+
+        self.path = Path(path)
+        self.player = player
+        self.batch_size = batch_size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection = self._connect()
+        self._connection.executescript(SCHEMA)
+        self._queue: queue.Queue[Result | None] = queue.Queue()
+        self._writer = threading.Thread(target=self._write, name="score-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the database.
+
+        Returns
+        -------
+        sqlite3.Connection
+            The connection, in write-ahead-log mode.
+
+        Examples
+        --------
+        >>> connection = scores._connect()
+
+        Notes
+        -----
+        With a write-ahead log, ``synchronous=NORMAL`` only syncs at
+        checkpoints: a power cut can lose the last few results, but never
+        corrupts the database.
+        """
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _write(self) -> None:
+        """
+        Write queued results until the store is closed.
+
+        Examples
+        --------
+        >>> threading.Thread(target=scores._write).start()
+
+        Notes
+        -----
+        This runs on the writer thread. It blocks until a result arrives,
+        then takes whatever else is waiting, up to ``batch_size``, and
+        writes it all in one transaction, with one ``score_counts`` update
+        per distinct score in the batch.
+        """
+        connection = self._connect()
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            results = [result for result in batch if result is not None]
+            running = len(results) == len(batch)
+            counts = Counter((r.game, int(r.won), r.score) for r in results)
+            try:
+                with connection:
+                    connection.executemany(
+                        INSERT_RESULT,
+                        [
+                            (r.game, r.player, r.played_on.isoformat(), r.score, int(r.won))
+                            for r in results
+                        ],
+                    )
+                    connection.executemany(
+                        COUNT_RESULTS, [(*key, count) for key, count in counts.items()]
+                    )
+            except sqlite3.Error as error:
+                score_store_logger.error(f"Could not save {len(results)} results: {error}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        connection.close()
+
+    def record(
+        self,
+        game: str,
+        score: int,
+        won: bool,
+        player: str | None = None,
+        played_on: date | None = None,
+    ) -> None:
+        """
+        Queue a result to be written.
+
+        Parameters
+        ----------
+        game : str
+            The name of the game.
+        score : int
+            The score, where lower is better.
+        won : bool
+            Whether the game was won.
+        player : str | None, optional
+            The name of the player, by default the store's player.
+        played_on : date | None, optional
+            The day the game was played, by default today.
+
+        Examples
+        --------
+        >>> scores.record("Wordle", 4, True)
+
+        Notes
+        -----
+        This returns at once; call ``flush`` to wait for the write.
+        """
+        self._queue.put(Result(game, player or self.player, played_on or date.today(), score, won))
+
+    def flush(self) -> None:
+        """
+        Wait until every queued result is written.
+
+        Examples
+        --------
+        >>> scores.flush()
+
+        Notes
+        -----
+        Queries only see results that have been written.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Write the queued results and close the database.
+
+        Examples
+        --------
+        >>> scores.close()
+
+        Notes
+        -----
+        The store cannot be used afterwards.
+        """
+        self._queue.put(None)
+        self._writer.join()
+        self._connection.close()
+
+    def top(self, game: str, count: int = 10) -> list[Result]:
+        """
+        Return the best winning results of a game.
+
+        Parameters
+        ----------
+        game : str
+            The name of the game.
+        count : int, optional
+            The number of results, by default 10.
+
+        Returns
+        -------
+        list[Result]
+            The results with the lowest scores, earliest first among equals.
+
+        Examples
+        --------
+        >>> [result.score for result in scores.top("Wordle", 3)]
+        [2, 3, 3]
+
+        Notes
+        -----
+        This reads ``count`` entries from the front of ``results_by_score``.
+        """
+        rows = self._connection.execute(
+            "SELECT game, player, played_on, score, won FROM results "
+            "WHERE game = ? AND won = 1 ORDER BY score, played_on LIMIT ?",
+            (game, count),
+        )
+        return [
+            Result(name, player, date.fromisoformat(played_on), score, bool(won))
+            for name, player, played_on, score, won in rows
+        ]
+
+    def streak(self, game: str, player: str | None = None, today: date | None = None) -> int:
+        """
+        Return the number of consecutive days up to today a game was won.
+
+        Parameters
+        ----------
+        game : str
+            The name of the game.
+        player : str | None, optional
+            The name of the player, by default the store's player.
+        today : date | None, optional
+            The day to count back from, by default today.
+
+        Returns
+        -------
+        int
+            The length of the streak.
+
+        Examples
+        --------
+        >>> scores.streak("Wordle")
+        3
+
+        Notes
+        -----
+        A streak is not broken until a whole day passes without a win, so
+        one that ended yesterday still counts today. Days are read newest
+        first and reading stops at the first gap.
+        """
+        day = today or date.today()
+        rows = self._connection.execute(
+            "SELECT DISTINCT played_on FROM results "
+            "WHERE game = ? AND player = ? AND won = 1 AND played_on <= ? "
+            "ORDER BY played_on DESC",
+            (game, player or self.player, day.isoformat()),
+        )
+
+        streak = 0
+        for (played_on,) in rows:
+            won_on = date.fromisoformat(played_on)
+            if streak == 0 and won_on == day - timedelta(days=1):
+                day = won_on
+            if won_on != day:
+                break
+            streak += 1
+            day -= timedelta(days=1)
+        return streak
+
+    def percentile(self, game: str, score: int, won: bool = True) -> float:
+        """
+        Return the percentage of a game's results that a result beats.
+
+        Parameters
+        ----------
+        game : str
+            The name of the game.
+        score : int
+            The score.
+        won : bool, optional
+            Whether the game was won, by default True.
+
+        Returns
+        -------
+        float
+            The percentage of results with a higher score, counting every
+            loss as worse than any win, or 0 if there are none.
+
+        Examples
+        --------
+        >>> scores.percentile("Wordle", 3)
+        81.5
+
+        Notes
+        -----
+        This sums ``score_counts``, which has one row per distinct score.
+        """
+        beaten, total = self._connection.execute(
+            "SELECT "
+            "COALESCE(SUM(CASE WHEN won < ? OR (won = ? AND score > ?) THEN results END), 0), "
+            "COALESCE(SUM(results), 0) "
+            "FROM score_counts WHERE game = ?",
+            (int(won), int(won), score, game),
+        ).fetchone()
+        return 100 * beaten / total if total else 0.0
+
+    def played(self, game: str) -> int:
+        """
+        Return the number of results recorded for a game.
+
+        Parameters
+        ----------
+        game : str
+            The name of the game.
+
+        Returns
+        -------
+        int
+            The number of results, won or lost.
+
+        Examples
+        --------
+        >>> scores.played("Wordle")
+        12
+
+        Notes
+        -----
+        This sums ``score_counts`` rather than counting ``results``.
+        """
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(results), 0) FROM score_counts WHERE game = ?", (game,)
+        ).fetchone()
+        return int(total)
@@ -0,0 +1,335 @@
+"""word_cache.py: A versioned, memory-mapped binary cache of compiled word stores."""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+
+from ..config.paths import Paths
+from ..logs.setup_logging import setup_logging
+from .word_store import Bucket, WordStore
+
+word_cache_logger = setup_logging()
+
+CACHE_MAGIC = b"DWRD"
+CACHE_VERSION = 1
+
+# Magic, version, byte order, source size, source mtime (ns), source SHA-256, bucket count.
+HEADER = struct.Struct("<4sHBxQQ32sI")
+# Word length, byte width, word count, probe table size.
+BUCKET_ENTRY = struct.Struct("<IIQQ")
+BYTE_ORDERS = {"little": 0, "big": 1}
+
+
+def cache_path_for(source: str | Path, cache_dir: Path = Paths.CACHE_DIR) -> Path:
+    """
+    Return the cache file for a word list.
+
+    Parameters
+    ----------
+    source : str | Path
+        The word list, with one word per line.
+    cache_dir : Path, optional
+        The cache directory, by default ``Paths.CACHE_DIR``.
+
+    Returns
+    -------
+    Path
+        The cache file.
+
+    Examples
+    --------
+    >>> cache_path_for("wordle_words.txt", Path("cache"))
+    PosixPath('cache/wordle_words.v1.words')
+
+    Notes
+    -----
+    The format version is part of the name, so an upgrade never reads an old
+    cache, and downgrading does not clobber a new one.
+    """
+    return cache_dir / f"{Path(source).stem}.v{CACHE_VERSION}.words"
+
+
+def _align(offset: int) -> int:
+    """
+    Round an offset up to a multiple of four bytes.
+
+    Parameters
+    ----------
+    offset : int
+        The offset.
+
+    Returns
+    -------
+    int
+        The aligned offset.
+
+    Examples
+    --------
+    >>> _align(5)
+    8
+
+    Notes
+    -----
+    Probe tables are aligned so they can be cast to 32-bit integers in place.
+    """
+    return (offset + 3) & ~3
+
+
+def write_word_cache(
+    store: WordStore, source_stat: os.stat_result, digest: bytes, cache_path: Path
+) -> None:
+    """
+    Write a word store to a cache file.
+
+    Parameters
+    ----------
+    store : WordStore
+        The word store to write.
+    source_stat : os.stat_result
+        The status of the word list the store was built from.
+    digest : bytes
+        The SHA-256 digest of the word list.
+    cache_path : Path
+        The cache file to write.
+
+    Examples
+    --------
+    >>> write_word_cache(store, os.stat(source), digest, cache_path_for(source))
+
+    Notes
+    -----
+    The file is a header, a directory of buckets, then each bucket's packed
+    words followed by its probe table. It is written to a temporary file and
+    renamed into place, so a reader never sees a partial cache.
+    """
+    buckets = list(store.buckets.items())
+    header = HEADER.pack(
+        CACHE_MAGIC,
+        CACHE_VERSION,
+        BYTE_ORDERS[sys.byteorder],
+        source_stat.st_size,
+        source_stat.st_mtime_ns,
+        digest,
+        len(buckets),
+    )
+
+    chunks = [header]
+    offset = HEADER.size + BUCKET_ENTRY.size * len(buckets)
+    body: list[bytes] = []
+    for length, (width, packed, table) in buckets:
+        count = len(packed) // width
+        chunks.append(BUCKET_ENTRY.pack(length, width, count, len(table)))
+        body.append(bytes(packed))
+        offset += len(packed)
+        padding = _align(offset) - offset
+        body.append(bytes(padding))
+        offset += padding
+        table_bytes = bytes(table)
+        body.append(table_bytes)
+        offset += len(table_bytes)
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(temporary_path, "wb") as file:
+        file.write(b"".join(chunks + body))
+    os.replace(temporary_path, cache_path)
+    word_cache_logger.info(f"Wrote word cache: {cache_path}")
+
+
+def _map_word_cache(cache_path: Path) -> tuple[tuple, dict[int, Bucket]] | None:
+    """
+    Memory-map a cache file and read its buckets.
+
+    Parameters
+    ----------
+    cache_path : Path
+        The cache file.
+
+    Returns
+    -------
+    tuple[tuple, dict[int, Bucket]] | None
+        The unpacked header and the buckets, which are views into the mapping,
+        or None if the file is missing, from another format, or truncated.
+
+    Examples
+    --------
+    >>> header, buckets = _map_word_cache(cache_path)
+
+    Notes
+    -----
+    Nothing is copied or decoded. The views keep the mapping open for as
+    long as the store that uses them.
+    """
+    try:
+        with open(cache_path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    view = memoryview(mapping)
+    try:
+        header = HEADER.unpack_from(view)
+        magic, version, byte_order, _, _, _, bucket_count = header
+        if (magic, version, byte_order) != (
+            CACHE_MAGIC,
+            CACHE_VERSION,
+            BYTE_ORDERS[sys.byteorder],
+        ):
+            return None
+
+        buckets: dict[int, Bucket] = {}
+        offset = HEADER.size + BUCKET_ENTRY.size * bucket_count
+        for entry in range(bucket_count):
+            length, width, count, table_size = BUCKET_ENTRY.unpack_from(
+                view, HEADER.size + BUCKET_ENTRY.size * entry
+            )
+            packed_end = offset + width * count
+            table_start = _align(packed_end)
+            table_end = table_start + 4 * table_size
+            if width == 0 or table_size & (table_size - 1) or table_end > len(view):
+                return None
+            buckets[length] = (
+                width,
+                view[offset:packed_end],
+                view[table_start:table_end].cast("I"),
+            )
+            offset = table_end
+    except struct.error:
+        return None
+
+    return header, buckets
+
+
+def build_word_cache(source: str | Path, cache_dir: Path = Paths.CACHE_DIR) -> WordStore | None:
+    """
+    Compile a word list into its cache file.
+
+    Parameters
+    ----------
+    source : str | Path
+        The word list, with one word per line.
+    cache_dir : Path, optional
+        The cache directory, by default ``Paths.CACHE_DIR``.
+
+    Returns
+    -------
+    WordStore | None
+        The compiled word store, or None if the word list does not exist.
+
+    Examples
+    --------
+    >>> build_word_cache(Paths.WORDS)
+
+    Notes
+    -----
+    This is the ``dailies build-cache`` command.
+    """
+    return _compile(Path(source), None, cache_dir)
+
+
+def _compile(source: Path, data: bytes | None, cache_dir: Path) -> WordStore | None:
+    """
+    Build a word store from a word list and write its cache.
+
+    Parameters
+    ----------
+    source : Path
+        The word list.
+    data : bytes | None
+        The contents of the word list, if they have already been read.
+    cache_dir : Path
+        The cache directory.
+
+    Returns
+    -------
+    WordStore | None
+        The word store, or None if the word list does not exist.
+
+    Examples
+    --------
+    >>> _compile(Path(Paths.WORDS), None, Paths.CACHE_DIR)
+
+    Notes
+    -----
+    The word list is read at most once. If the cache cannot be written, the
+    store is still returned and the next start compiles it again.
+    """
+    try:
+        source_stat = source.stat()
+        if data is None:
+            data = source.read_bytes()
+    except OSError:
+        word_cache_logger.error(f"File not found: {source}")
+        return None
+
+    store = WordStore(data.decode("utf-8").splitlines())
+    try:
+        write_word_cache(
+            store, source_stat, hashlib.sha256(data).digest(), cache_path_for(source, cache_dir)
+        )
+    except OSError as error:
+        word_cache_logger.warning(f"Could not write word cache for {source}: {error}")
+    return store
+
+
+def load_words(source: str | Path, cache_dir: Path = Paths.CACHE_DIR) -> WordStore | None:
+    """
+    Load a word store, from its cache if it is up to date.
+
+    Parameters
+    ----------
+    source : str | Path
+        The word list, with one word per line.
+    cache_dir : Path, optional
+        The cache directory, by default ``Paths.CACHE_DIR``.
+
+    Returns
+    -------
+    WordStore | None
+        The word store, or None if the word list does not exist.
+
+    Examples
+    --------
+    >>> words = load_words(Paths.WORDS)
+
+    Notes
+    -----
+    The cache is current if the word list's size and modification time match
+    the header. If only the time differs, the word list is hashed and compared
+    with the stored SHA-256, and a match refreshes the header rather than
+    rebuilding. Otherwise the cache is rebuilt from the bytes just hashed, so
+    the word list is never read twice.
+    """
+    source = Path(source)
+    try:
+        source_stat = source.stat()
+    except OSError:
+        word_cache_logger.error(f"File not found: {source}")
+        return None
+
+    cache_path = cache_path_for(source, cache_dir)
+    mapped = _map_word_cache(cache_path)
+    if mapped is None:
+        return _compile(source, None, cache_dir)
+
+    header, buckets = mapped
+    _, _, _, size, mtime_ns, digest, _ = header
+    if (size, mtime_ns) == (source_stat.st_size, source_stat.st_mtime_ns):
+        store = WordStore.from_buckets(buckets)
+        word_cache_logger.info(f"Loaded {len(store)} words from {cache_path}.")
+        return store
+
+    data = source.read_bytes()
+    if size != len(data) or hashlib.sha256(data).digest() != digest:
+        word_cache_logger.info(f"Word cache is stale: {cache_path}")
+        return _compile(source, data, cache_dir)
+
+    try:
+        with open(cache_path, "r+b") as file:
+            file.write(HEADER.pack(*header[:4], source_stat.st_mtime_ns, *header[5:]))
+    except OSError as error:
+        word_cache_logger.warning(f"Could not refresh word cache {cache_path}: {error}")
+    return WordStore.from_buckets(buckets)
@@ -0,0 +1,533 @@
+"""word_store.py: A compact, indexed store of dictionary words shared by the games."""
+
+import random
+import zlib
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from ..logs.setup_logging import setup_logging
+from .read import read_file
+
+word_store_logger = setup_logging()
+
+Bucket = tuple[int, bytes | memoryview, array | memoryview]
+
+
+def hash_word(encoded: bytes) -> int:
+    """
+    Hash the padded bytes of a word for the bucket probe tables.
+
+    Parameters
+    ----------
+    encoded : bytes
+        The word's UTF-8 bytes, padded to the bucket width.
+
+    Returns
+    -------
+    int
+        The CRC-32 of the bytes.
+
+    Examples
+    --------
+    >>> hash_word(b"crane")
+    1446371454
+
+    Notes
+    -----
+    Unlike ``hash``, CRC-32 is the same in every process, so probe tables can
+    be written to disk and used as they are.
+    """
+    return zlib.crc32(encoded)
+
+
+def build_probe_table(packed: bytes, width: int) -> array:
+    """
+    Build the open addressing table used to look words up in a bucket.
+
+    Parameters
+    ----------
+    packed : bytes
+        The sorted, fixed-width packed words of the bucket.
+    width : int
+        The byte width of every word in the bucket.
+
+    Returns
+    -------
+    array
+        An unsigned 32-bit array whose size is a power of two at least twice
+        the number of words. Each slot holds a word's index plus one, or 0 if
+        the slot is empty.
+
+    Examples
+    --------
+    >>> build_probe_table(b"craneslate", 5)
+    array('I', [0, 0, 1, 2])
+
+    Notes
+    -----
+    Collisions are resolved by linear probing.
+    """
+    count = len(packed) // width
+    size = 1
+    while size < 2 * count:
+        size *= 2
+    mask = size - 1
+
+    table = array("I", bytes(4 * size))
+    for index in range(count):
+        start = index * width
+        end = start + width
+        slot = hash_word(packed[start:end]) & mask
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = index + 1
+    return table
+
+
+class WordStore:
+    """
+    A compact, indexed store of dictionary words.
+
+    Attributes
+    ----------
+    buckets : dict[int, Bucket]
+        The byte width, sorted fixed-width packed words, and probe table of
+        each word length.
+
+    Methods
+    -------
+    from_file(file: str | Path) -> WordStore | None:
+        Load a word store from a file with one word per line.
+    from_buckets(buckets: dict[int, Bucket]) -> WordStore:
+        Create a word store from already packed buckets.
+    lengths() -> list[int]:
+        Return the word lengths in the store.
+    count(length: int | None = None) -> int:
+        Return the number of words, optionally of a single length.
+    word_at(length: int, index: int) -> str:
+        Return a word by its position among words of the same length.
+    index_of(word: str) -> int:
+        Return the position of a word among words of the same length.
+    words_of_length(length: int) -> list[str]:
+        Return every word of a length, in sorted order.
+    random_word(length: int | None = None, rng: random.Random | None = None) -> str:
+        Return a random word.
+
+    Examples
+    --------
+    >>> store = WordStore(["crane", "slate", "at"])
+    >>> "crane" in store
+    True
+    >>> store.words_of_length(5)
+    ['crane', 'slate']
+
+    Notes
+    -----
+    Words are lowercased and deduplicated. Each word length has its own bucket,
+    with every word padded with zero bytes to the widest UTF-8 encoding in
+    that bucket, sorted, and joined into a single bytes object. This keeps one
+    object per bucket rather than one per word, and still allows binary search
+    and random access by index. Membership hashes the padded bytes into a
+    per-bucket open addressing table of word indices. Because the buckets hold
+    only flat bytes and integers, they can be written to disk and memory-mapped
+    back as they are (see ``word_cache``).
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """
+        Initialise the word store.
+
+        Parameters
+        ----------
+        words : Iterable[str]
+            The words to store.
+
+        Examples
+        --------
+        >>> store = WordStore(["crane", "slate"])
+
+        Notes
+        -----
+        Blank lines and surrounding whitespace are ignored.
+        """
+        by_length: dict[int, set[bytes]] = {}
+        for word in words:
+            word = word.strip().lower()
+            if word:
+                by_length.setdefault(len(word), set()).add(word.encode("utf-8"))
+
+        self.buckets: dict[int, Bucket] = {}
+        for length, encoded_words in sorted(by_length.items()):
+            width = max(len(encoded) for encoded in encoded_words)
+            packed = b"".join(sorted(encoded.ljust(width, b"\0") for encoded in encoded_words))
+            self.buckets[length] = (width, packed, build_probe_table(packed, width))
+        self._size = sum(len(encoded_words) for encoded_words in by_length.values())
+
+    @classmethod
+    def from_buckets(cls, buckets: dict[int, Bucket]) -> "WordStore":
+        """
+        Create a word store from already packed buckets.
+
+        Parameters
+        ----------
+        buckets : dict[int, Bucket]
+            The byte width, packed words, and probe table of each word length,
+            in ascending order of length.
+
+        Returns
+        -------
+        WordStore
+            The word store, which uses the buckets without copying them.
+
+        Examples
+        --------
+        >>> WordStore.from_buckets(store.buckets)
+
+        Notes
+        -----
+        No word is decoded, so this is how the binary word cache loads.
+        """
+        store = cls.__new__(cls)
+        store.buckets = buckets
+        store._size = sum(len(packed) // width for width, packed, _ in buckets.values())
+        return store
+
+    @classmethod
+    def from_file(cls, file: str | Path) -> "WordStore | None":
+        """
+        Load a word store from a file with one word per line.
+
+        Parameters
+        ----------
+        file : str | Path
+            The file to read.
+
+        Returns
+        -------
+        WordStore | None
+            The word store, or None if the file does not exist.
+
+        Examples
+        --------
+        >>> store = WordStore.from_file(Paths.WORDS)
+
+        Notes
+        -----
+        This method reads the file once with ``read_file``.
+        """
+        lines = read_file(str(file))
+        if lines is None:
+            return None
+
+        store = cls(lines)
+        word_store_logger.info(f"Loaded {len(store)} words from {file}.")
+        return store
+
+    def __contains__(self, word: object) -> bool:
+        """
+        Check whether a word is in the store.
+
+        Parameters
+        ----------
+        word : object
+            The word to look up.
+
+        Returns
+        -------
+        bool
+            True if the word is in the store.
+
+        Examples
+        --------
+        >>> "crane" in store
+        True
+
+        Notes
+        -----
+        This is a single hash and, on average, one or two probes, however
+        many words are stored.
+        """
+        if not isinstance(word, str):
+            return False
+
+        word = word.lower()
+        bucket = self.buckets.get(len(word))
+        if bucket is None:
+            return False
+
+        width, packed, table = bucket
+        encoded = word.encode("utf-8")
+        if len(encoded) > width:
+            return False
+
+        encoded = encoded.ljust(width, b"\0")
+        mask = len(table) - 1
+        slot = hash_word(encoded) & mask
+        while table[slot]:
+            start = (table[slot] - 1) * width
+            end = start + width
+            if packed[start:end] == encoded:
+                return True
+            slot = (slot + 1) & mask
+        return False
+
+    def __len__(self) -> int:
+        """
+        Return the number of words in the store.
+
+        Returns
+        -------
+        int
+            The number of words.
+
+        Examples
+        --------
+        >>> len(store)
+        2314
+
+        Notes
+        -----
+        The total is counted once, when the store is created.
+        """
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over every word, by length and then alphabetically.
+
+        Returns
+        -------
+        Iterator[str]
+            An iterator over the words.
+
+        Examples
+        --------
+        >>> list(store)
+        ['at', 'crane', 'slate']
+
+        Notes
+        -----
+        Words are decoded one at a time as they are iterated.
+        """
+        for length in self.buckets:
+            for index in range(self.count(length)):
+                yield self.word_at(length, index)
+
+    def lengths(self) -> list[int]:
+        """
+        Return the word lengths in the store.
+
+        Returns
+        -------
+        list[int]
+            The word lengths, in ascending order.
+
+        Examples
+        --------
+        >>> store.lengths()
+        [2, 5]
+
+        Notes
+        -----
+        Lengths are counted in characters, not bytes.
+        """
+        return list(self.buckets)
+
+    def count(self, length: int | None = None) -> int:
+        """
+        Return the number of words, optionally of a single length.
+
+        Parameters
+        ----------
+        length : int | None, optional
+            The word length to count, by default None (all words).
+
+        Returns
+        -------
+        int
+            The number of words.
+
+        Examples
+        --------
+        >>> store.count(5)
+        2
+
+        Notes
+        -----
+        This method divides the size of a bucket by its width.
+        """
+        if length is None:
+            return len(self)
+        if length not in self.buckets:
+            return 0
+        width, packed, _ = self.buckets[length]
+        return len(packed) // width
+
+    def word_at(self, length: int, index: int) -> str:
+        """
+        Return a word by its position among words of the same length.
+
+        Parameters
+        ----------
+        length : int
+            The length of the word.
+        index : int
+            The position of the word in sorted order.
+
+        Returns
+        -------
+        str
+            The word.
+
+        Examples
+        --------
+        >>> store.word_at(5, 0)
+        'crane'
+
+        Notes
+        -----
+        This method slices the word straight out of the packed bucket.
+        """
+        return self._encoded_at(length, index).rstrip(b"\0").decode("utf-8")
+
+    def index_of(self, word: str) -> int:
+        """
+        Return the position of a word among words of the same length.
+
+        Parameters
+        ----------
+        word : str
+            The word to find.
+
+        Returns
+        -------
+        int
+            The position of the word in sorted order.
+
+        Raises
+        ------
+        ValueError
+            If the word is not in the store.
+
+        Examples
+        --------
+        >>> store.index_of("slate")
+        1
+
+        Notes
+        -----
+        This method binary searches the packed bucket.
+        """
+        word = word.lower()
+        if word not in self:
+            raise ValueError(f"Word not found: {word}")
+
+        length = len(word)
+        count = self.count(length)
+        encoded = word.encode("utf-8").ljust(self.buckets[length][0], b"\0")
+        return bisect_left(range(count), encoded, key=lambda index: self._encoded_at(length, index))
+
+    def _encoded_at(self, length: int, index: int) -> bytes:
+        """
+        Return the padded bytes of a word by its position.
+
+        Parameters
+        ----------
+        length : int
+            The length of the word.
+        index : int
+            The position of the word in sorted order.
+
+        Returns
+        -------
+        bytes
+            The word's UTF-8 bytes, padded to the bucket width.
+
+        Examples
+        --------
+        >>> store._encoded_at(5, 0)
+        b'crane'
+
+        Notes
+        -----
+        This method does not decode the word.
+        """
+        width, packed, _ = self.buckets[length]
+        start = index * width
+        end = start + width
+        return bytes(packed[start:end])
+
+    def words_of_length(self, length: int) -> list[str]:
+        """
+        Return every word of a length, in sorted order.
+
+        Parameters
+        ----------
+        length : int
+            The word length.
+
+        Returns
+        -------
+        list[str]
+            The words of that length.
+
+        Examples
+        --------
+        >>> store.words_of_length(5)
+        ['crane', 'slate']
+
+        Notes
+        -----
+        This method decodes a whole bucket, so it is best called once and cached.
+        """
+        return [self.word_at(length, index) for index in range(self.count(length))]
+
+    def random_word(self, length: int | None = None, rng: random.Random | None = None) -> str:
+        """
+        Return a random word.
+
+        Parameters
+        ----------
+        length : int | None, optional
+            The length of the word, by default None (any length).
+        rng : random.Random | None, optional
+            The random number generator to use, by default the global one.
+
+        Returns
+        -------
+        str
+            The word.
+
+        Raises
+        ------
+        ValueError
+            If there are no words of the requested length.
+
+        Examples
+        --------
+        >>> store.random_word(5)
+        'slate'
+
+        Notes
+        -----
+        Every word is equally likely, whatever its length.
+        """
+        randrange = rng.randrange if rng is not None else random.randrange
+        if length is not None:
+            count = self.count(length)
+            if count == 0:
+                raise ValueError(f"No words of length {length}.")
+            return self.word_at(length, randrange(count))
+
+        if len(self) == 0:
+            raise ValueError("The word store is empty.")
+
+        index = randrange(len(self))
+        for bucket_length in self.buckets:
+            count = self.count(bucket_length)
+            if index < count:
+                return self.word_at(bucket_length, index)
+            index -= count
+        raise ValueError("The word store is empty.")
@@ -0,0 +1,311 @@
+"""builder.py: A builder for Connections boards whose groups can only be split one way."""
+
+import random
+
+from ...config.constants import Constants
+from ...config.paths import Paths
+from ...logs.setup_logging import setup_logging
+from .category_index import CategoryIndex, read_categories
+
+builder_logger = setup_logging()
+
+
+class ConnectionsBuilder:
+    """
+    A builder for Connections boards whose groups can only be split one way.
+
+    Attributes
+    ----------
+    index : CategoryIndex
+        The categories to build boards from.
+    groups : int
+        The number of groups on a board.
+    size : int
+        The number of words in a group.
+    red_herrings : int
+        The most board words that may also belong to another group's category.
+    rng : random.Random
+        The random number generator used for every random choice.
+    eligible : list[int]
+        The categories with enough words to make a group.
+
+    Methods
+    -------
+    herrings(board: dict[int, tuple[str, ...]]) -> int:
+        Count the board words that also belong to another group's category.
+    solutions(words: set[str], limit: int = 2) -> int:
+        Count the ways to split words into groups that each share a category.
+    build() -> dict[str, tuple[str, ...]] | None:
+        Build a board.
+
+    Examples
+    --------
+    >>> builder = ConnectionsBuilder(CategoryIndex(read_categories()), rng=random.Random(42))
+    >>> board = builder.build()
+
+    Notes
+    -----
+    Trying every combination of categories is hopeless with thousands of
+    them, so groups are chosen one at a time and each candidate is checked
+    against the words already on the board through the index: the board
+    keeps a count of its words in every category they belong to, so a
+    candidate category's red herrings, the board words it would also claim,
+    are one lookup, and a candidate word's are the intersection of its
+    categories with the chosen ones. Candidates over the red herring budget
+    are skipped without looking further. A finished board is accepted only
+    if its words split into groups sharing a category in exactly one way,
+    counting every category in the index, not just the chosen ones.
+    """
+
+    def __init__(
+        self,
+        index: CategoryIndex,
+        groups: int = Constants.CONNECTIONS_GROUPS,
+        size: int = Constants.CONNECTIONS_GROUP_SIZE,
+        red_herrings: int = Constants.CONNECTIONS_RED_HERRINGS,
+        rng: random.Random | None = None,
+    ) -> None:
+        """
+        Initialise the builder.
+
+        Parameters
+        ----------
+        index : CategoryIndex
+            The categories to build boards from.
+        groups : int, optional
+            The number of groups, by default ``Constants.CONNECTIONS_GROUPS``.
+        size : int, optional
+            The words in a group, by default ``Constants.CONNECTIONS_GROUP_SIZE``.
+        red_herrings : int, optional
+            The most board words that may also belong to another group's
+            category, by default ``Constants.CONNECTIONS_RED_HERRINGS``.
+        rng : random.Random | None, optional
+            The random number generator to use, by default a new unseeded one.
+
+        Raises
+        ------
+        ValueError
+            If a board would have fewer than two groups or two words per group.
+
+        Examples
+        --------
+        >>> builder = ConnectionsBuilder(index, red_herrings=0)
+
+        Notes
+        -----
+        Passing a seeded ``rng`` makes building reproducible.
+        """
+        if groups < 2 or size < 2:
+            raise ValueError(
+                f"Invalid Connections board: {groups} groups of {size}. It needs 2 of 2 or more."
+            )
+
+        self.index = index
+        self.groups = groups
+        self.size = size
+        self.red_herrings = red_herrings
+        self.rng = rng if rng is not None else random.Random()
+        self.eligible = [
+            category for category, words in enumerate(index.members) if len(words) >= size
+        ]
+
+    def herrings(self, board: dict[int, tuple[str, ...]]) -> int:
+        """
+        Count the board words that also belong to another group's category.
+
+        Parameters
+        ----------
+        board : dict[int, tuple[str, ...]]
+            The words of every group, by category number.
+
+        Returns
+        -------
+        int
+            The number of pairs of a word and another group whose category
+            holds it.
+
+        Examples
+        --------
+        >>> builder.herrings({0: ("apple", "fig", "lime", "pear"), 2: ("jade", "mint", ...)})
+        1
+
+        Notes
+        -----
+        This is one set intersection per word.
+        """
+        return sum(
+            len(self.index.categories_of(word) & board.keys()) - 1
+            for words in board.values()
+            for word in words
+        )
+
+    def solutions(self, words: set[str], limit: int = 2) -> int:
+        """
+        Count the ways to split words into groups that each share a category.
+
+        Parameters
+        ----------
+        words : set[str]
+            The words on the board.
+        limit : int, optional
+            The count to stop at, by default 2.
+
+        Returns
+        -------
+        int
+            The number of splits, up to ``limit``.
+
+        Examples
+        --------
+        >>> builder.solutions({word for words in board.values() for word in words})
+        1
+
+        Notes
+        -----
+        The candidate groups come from ``CategoryIndex.groupings``, and the
+        search always places the alphabetically first word left, so each
+        split is counted once.
+        """
+        containing: dict[str, list[frozenset[str]]] = {word: [] for word in words}
+        for group in self.index.groupings(words, self.size):
+            for word in group:
+                containing[word].append(group)
+
+        def count(remaining: frozenset[str]) -> int:
+            if not remaining:
+                return 1
+            total = 0
+            for group in containing[min(remaining)]:
+                if group <= remaining:
+                    total += count(remaining - group)
+                    if total >= limit:
+                        break
+            return total
+
+        return count(frozenset(words))
+
+    def _attempt(self) -> dict[int, tuple[str, ...]] | None:
+        """
+        Choose groups one at a time within the red herring budget.
+
+        Returns
+        -------
+        dict[int, tuple[str, ...]] | None
+            The words of every group by category number, or None if
+            ``Constants.CONNECTIONS_CATEGORY_DRAWS`` categories were drawn
+            without filling the board.
+
+        Examples
+        --------
+        >>> builder._attempt()
+        {12: ('boxer', 'pug', 'corgi', 'husky'), ...}
+
+        Notes
+        -----
+        ``overlap`` counts the board words in every category they belong to,
+        and is updated as each group is added.
+        """
+        board: dict[int, tuple[str, ...]] = {}
+        on_board: set[str] = set()
+        overlap: dict[int, int] = {}
+        herrings = 0
+
+        for _ in range(Constants.CONNECTIONS_CATEGORY_DRAWS):
+            category = self.rng.choice(self.eligible)
+            cost = herrings + overlap.get(category, 0)
+            if category in board or cost > self.red_herrings:
+                continue
+
+            free = [word for word in self.index.members[category] if word not in on_board]
+            self.rng.shuffle(free)
+            picked = []
+            for word in free:
+                extra = len(self.index.by_word[word] & board.keys())
+                if cost + extra <= self.red_herrings:
+                    picked.append(word)
+                    cost += extra
+                    if len(picked) == self.size:
+                        break
+            if len(picked) < self.size:
+                continue
+
+            board[category] = tuple(picked)
+            on_board.update(picked)
+            herrings = cost
+            for word in picked:
+                for other in self.index.by_word[word]:
+                    overlap[other] = overlap.get(other, 0) + 1
+            if len(board) == self.groups:
+                return board
+        return None
+
+    def build(self) -> dict[str, tuple[str, ...]] | None:
+        """
+        Build a board.
+
+        Returns
+        -------
+        dict[str, tuple[str, ...]] | None
+            The words of every group by category name, or None if no board
+            was found in ``Constants.CONNECTIONS_BUILD_ATTEMPTS`` attempts.
+
+        Examples
+        --------
+        >>> builder.build()
+        {'Dog breeds': ('boxer', 'pug', 'corgi', 'husky'), ...}
+
+        Notes
+        -----
+        Boards whose words split into groups more than one way are thrown
+        away, and the next attempt starts from scratch.
+        """
+        for attempt in range(Constants.CONNECTIONS_BUILD_ATTEMPTS):
+            board = self._attempt()
+            if board is None:
+                continue
+            words = {word for group in board.values() for word in group}
+            if self.solutions(words) == 1:
+                builder_logger.debug(
+                    f"Built a Connections board on attempt {attempt + 1}, "
+                    f"with {self.herrings(board)} red herring(s)."
+                )
+                return {self.index.names[category]: group for category, group in board.items()}
+        return None
+
+
+def generate_connections_puzzle(seed: int) -> dict[str, object]:
+    """
+    Generate a single seeded Connections board as a serialisable record.
+
+    Parameters
+    ----------
+    seed : int
+        The seed for the random number generator.
+
+    Returns
+    -------
+    dict[str, object]
+        The seed and the words of every group by category name, using plain lists.
+
+    Raises
+    ------
+    ValueError
+        If the categories file does not exist or no board could be built.
+
+    Examples
+    --------
+    >>> generate_connections_puzzle(42)["groups"]
+    {'Dog breeds': ['boxer', 'pug', 'corgi', 'husky'], ...}
+
+    Notes
+    -----
+    This is a module-level function so that it can be sent to worker processes.
+    """
+    categories = read_categories()
+    if categories is None:
+        raise ValueError(f"Invalid categories file: {Paths.CONNECTIONS_CATEGORIES}.")
+
+    board = ConnectionsBuilder(CategoryIndex(categories), rng=random.Random(seed)).build()
+    if board is None:
+        raise ValueError(f"Invalid categories file: no board found for seed {seed}.")
+    return {"seed": seed, "groups": {name: list(words) for name, words in board.items()}}
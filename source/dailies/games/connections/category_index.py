@@ -0,0 +1,205 @@
+"""category_index.py: An inverted index from words to the Connections categories they belong to."""
+
+from itertools import combinations
+
+from ...config.paths import Paths
+from ...file_interaction.read import read_file
+from ...logs.setup_logging import setup_logging
+
+category_index_logger = setup_logging()
+
+
+def read_categories(file: str = Paths.CONNECTIONS_CATEGORIES) -> dict[str, list[str]] | None:
+    """
+    Read the categories and their words.
+
+    Parameters
+    ----------
+    file : str, optional
+        The categories file, by default ``Paths.CONNECTIONS_CATEGORIES``.
+
+    Returns
+    -------
+    dict[str, list[str]] | None
+        The words of every category, or None if the file does not exist.
+
+    Examples
+    --------
+    >>> read_categories()["Chess pieces"]
+    ['king', 'queen', 'rook', 'bishop', 'knight', 'pawn']
+
+    Notes
+    -----
+    Each line is a category, a colon, and its words separated by spaces.
+    Blank lines are skipped and words are lowercased.
+    """
+    lines = read_file(file)
+    if lines is None:
+        return None
+
+    categories = {}
+    for line in lines:
+        category, separator, words = line.partition(":")
+        if separator:
+            categories[category.strip()] = [word.lower() for word in words.split()]
+    return categories
+
+
+class CategoryIndex:
+    """
+    An inverted index from words to the categories they belong to.
+
+    Attributes
+    ----------
+    names : list[str]
+        The name of every category, by category number.
+    members : list[tuple[str, ...]]
+        The sorted words of every category, by category number.
+    member_sets : list[frozenset[str]]
+        The words of every category as a set, by category number.
+    by_word : dict[str, frozenset[int]]
+        The numbers of the categories every word belongs to.
+
+    Methods
+    -------
+    categories_of(word: str) -> frozenset[int]:
+        Return the categories a word belongs to.
+    overlap(words: set[str]) -> dict[int, int]:
+        Count how many of some words each category holds.
+    groupings(words: set[str], size: int) -> set[frozenset[str]]:
+        Return every group of words that share a category.
+
+    Examples
+    --------
+    >>> index = CategoryIndex({"Fruit": ["apple", "lime"], "Green": ["lime", "mint"]})
+    >>> index.categories_of("lime")
+    frozenset({0, 1})
+
+    Notes
+    -----
+    Questions about a handful of words, such as which categories could also
+    claim a word on the board, are answered by intersecting the category
+    sets of those words rather than by scanning every category, so their
+    cost does not grow with the number of categories.
+    """
+
+    def __init__(self, categories: dict[str, list[str]]) -> None:
+        """
+        Initialise the index.
+
+        Parameters
+        ----------
+        categories : dict[str, list[str]]
+            The words of every category.
+
+        Examples
+        --------
+        >>> index = CategoryIndex(read_categories())
+
+        Notes
+        -----
+        Words are lowercased and deduplicated within each category.
+        """
+        self.names = list(categories)
+        self.members = [
+            tuple(sorted({word.strip().lower() for word in words if word.strip()}))
+            for words in categories.values()
+        ]
+        self.member_sets = [frozenset(words) for words in self.members]
+
+        by_word: dict[str, set[int]] = {}
+        for category, words in enumerate(self.members):
+            for word in words:
+                by_word.setdefault(word, set()).add(category)
+        self.by_word = {word: frozenset(found) for word, found in by_word.items()}
+
+        category_index_logger.debug(
+            f"Indexed {len(self.names)} categories of {len(self.by_word)} words."
+        )
+
+    def categories_of(self, word: str) -> frozenset[int]:
+        """
+        Return the categories a word belongs to.
+
+        Parameters
+        ----------
+        word : str
+            The word.
+
+        Returns
+        -------
+        frozenset[int]
+            The category numbers, empty if the word is not indexed.
+
+        Examples
+        --------
+        >>> index.categories_of("apple")
+        frozenset({0})
+
+        Notes
+        -----
+        This is one dictionary lookup.
+        """
+        return self.by_word.get(word.lower(), frozenset())
+
+    def overlap(self, words: set[str]) -> dict[int, int]:
+        """
+        Count how many of some words each category holds.
+
+        Parameters
+        ----------
+        words : set[str]
+            The words.
+
+        Returns
+        -------
+        dict[int, int]
+            The number of the words in every category holding at least one.
+
+        Examples
+        --------
+        >>> index.overlap({"apple", "lime"})
+        {0: 2, 1: 1}
+
+        Notes
+        -----
+        Categories holding none of the words are never visited.
+        """
+        counts: dict[int, int] = {}
+        for word in words:
+            for category in self.categories_of(word):
+                counts[category] = counts.get(category, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def groupings(self, words: set[str], size: int) -> set[frozenset[str]]:
+        """
+        Return every group of words that share a category.
+
+        Parameters
+        ----------
+        words : set[str]
+            The words to group.
+        size : int
+            The number of words in a group.
+
+        Returns
+        -------
+        set[frozenset[str]]
+            Every set of ``size`` of the words that one category holds.
+
+        Examples
+        --------
+        >>> index.groupings({"apple", "lime", "mint"}, 2)
+        {frozenset({'apple', 'lime'}), frozenset({'lime', 'mint'})}
+
+        Notes
+        -----
+        Only categories holding at least ``size`` of the words contribute,
+        and they are found through ``overlap``.
+        """
+        groups: set[frozenset[str]] = set()
+        for category, count in self.overlap(words).items():
+            if count >= size:
+                inside = sorted(self.member_sets[category] & words)
+                groups.update(frozenset(group) for group in combinations(inside, size))
+        return groups
@@ -1,8 +1,15 @@
 """connections.py: A game of Connections, inheriting from the Game class."""
 
+import random
+from typing import cast
+
 from ...config.dialogue_en import DialogueEn
 from ...logs.setup_logging import setup_logging
+from ..daily_scheduler import DailyCalendar
 from ..game_infrastructure import Game
+from ..puzzle_pool import PuzzleSource
+from .builder import ConnectionsBuilder
+from .category_index import CategoryIndex, read_categories
 
 connections_logger = setup_logging()
 
@@ -11,22 +18,61 @@ class Connections(Game):
     """
     A game of Connections.
 
+    Attributes
+    ----------
+    index : CategoryIndex
+        The categories to build boards from.
+    pool : PuzzleSource | None
+        The pool of pre-built boards to draw from.
+    rng : random.Random
+        The random number generator used to build and shuffle boards.
+    builder : ConnectionsBuilder
+        The builder used when the pool has no board.
+    groups : dict[str, tuple[str, ...]]
+        The words of every group on the current board, by category name.
+    words : list[str]
+        The words of the current board, in the order they are shown.
+
+    Methods
+    -------
+    play() -> None:
+        Build a board and play the game.
+
+    Examples
+    --------
+    >>> connections = Connections(CategoryIndex(read_categories()))
+    >>> connections.play()
+
     Notes
     -----
     This class represents the Connections game.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        index: CategoryIndex,
+        pool: PuzzleSource | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
         """
-        Initialises the Connections game.
+        Initialise the Connections game.
+
+        Parameters
+        ----------
+        index : CategoryIndex
+            The categories to build boards from.
+        pool : PuzzleSource | None, optional
+            The pool of pre-built boards to draw from, by default None.
+        rng : random.Random | None, optional
+            The random number generator to use, by default a new unseeded one.
 
         Examples
         --------
-        >>> connections = Connections()
+        >>> connections = Connections(index, PuzzlePool("connections"))
 
         Notes
         -----
-        This method initialises the Connections game.
+        No board is built until the game is played.
         """
         super().__init__(
             DialogueEn.CONNECTIONS_NAME,
@@ -34,4 +80,77 @@ class Connections(Game):
             DialogueEn.CONNECTIONS_INSTRUCTIONS,
         )
 
-        # TODO: Implement the Connections game.
+        self.index = index
+        self.pool = pool
+        self.rng = rng if rng is not None else random.Random()
+        self.builder = ConnectionsBuilder(index, rng=self.rng)
+        self.groups: dict[str, tuple[str, ...]] = {}
+        self.words: list[str] = []
+
+    def _generate(self) -> None:
+        """
+        Build a Connections board.
+
+        Examples
+        --------
+        >>> connections._generate()
+
+        Notes
+        -----
+        A board is drawn from the pool when one is available, and built
+        otherwise. Its words are shown in a random order.
+        """
+        record = self.pool.draw() if self.pool is not None else None
+        if record is not None:
+            groups = cast(dict[str, list[str]], record["groups"])
+            self.groups = {name: tuple(words) for name, words in groups.items()}
+        else:
+            self.groups = self.builder.build() or {}
+        self.words = [word for words in self.groups.values() for word in words]
+        self.rng.shuffle(self.words)
+
+        connections_logger.info(
+            f"Built a Connections board of {len(self.groups)} groups: "
+            + ", ".join(self.groups)
+            + "."
+        )
+
+    def play(self) -> None:
+        """
+        Build a board and play the game.
+
+        Examples
+        --------
+        >>> connections.play()
+
+        Notes
+        -----
+        The board is built on demand, in well under a millisecond.
+        """
+        self._generate()
+        super().play()
+
+    # TODO: Implement the GUI for the Connections game.
+
+
+def create_connections() -> Connections | None:
+    """
+    Create a Connections game with the bundled categories and daily calendar.
+
+    Returns
+    -------
+    Connections | None
+        The game, or None if the categories file does not exist.
+
+    Examples
+    --------
+    >>> connections = create_connections()
+
+    Notes
+    -----
+    This is the game's entry point in the game registry.
+    """
+    categories = read_categories()
+    if categories is None:
+        return None
+    return Connections(CategoryIndex(categories), DailyCalendar("connections"))
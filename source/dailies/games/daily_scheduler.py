@@ -0,0 +1,517 @@
+"""daily_scheduler.py: One seeded puzzle per game per day, precomputed into an on-disk calendar."""
+
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterable
+
+from ..config.constants import Constants
+from ..config.paths import Paths
+from ..logs.setup_logging import setup_logging
+from .puzzle_pool import PUZZLE_GENERATORS, PuzzlePool, PuzzleSource, derive_seed
+from .registry import load_entry_point
+
+daily_scheduler_logger = setup_logging()
+
+
+def daily_seed(game: str, day: date) -> int:
+    """
+    Derive the seed of a game's puzzle for a day.
+
+    Parameters
+    ----------
+    game : str
+        The key of the game, as used in ``PUZZLE_GENERATORS``.
+    day : date
+        The day.
+
+    Returns
+    -------
+    int
+        A 64-bit seed for the puzzle.
+
+    Examples
+    --------
+    >>> daily_seed("sudoku", date(2024, 1, 1))
+    11127394213574372012
+
+    Notes
+    -----
+    This is ``derive_seed`` with ``Constants.DAILY_SEED`` as the batch seed
+    and the day's ordinal as the index, so every player gets the same puzzle
+    on the same day, and any day's puzzle can be regenerated from its date.
+    """
+    return derive_seed(game, Constants.DAILY_SEED, day.toordinal())
+
+
+class DailyCalendar:
+    """
+    The daily puzzles of a single game, cached on disk by date.
+
+    Attributes
+    ----------
+    game : str
+        The key of the game, as used in ``PUZZLE_GENERATORS``.
+    directory : Path
+        The directory holding the calendar files.
+    path : Path
+        The JSON file mapping each ISO date to its puzzle record.
+    fallback : PuzzleSource
+        Where ``draw`` takes a puzzle from when today's is not cached.
+
+    Methods
+    -------
+    precompute(
+        days: int = Constants.DAILY_DAYS_DEFAULT,
+        start: date | None = None,
+        workers: int | None = None,
+    ) -> int:
+        Generate the puzzles of the coming days that are not cached yet.
+    puzzle(day: date | None = None) -> dict[str, object]:
+        Return the puzzle of a day.
+    draw() -> dict[str, object] | None:
+        Return today's puzzle, without generating it.
+
+    Examples
+    --------
+    >>> calendar = DailyCalendar("sudoku")
+    >>> calendar.precompute(30)
+    30
+    >>> puzzle = calendar.draw()
+
+    Notes
+    -----
+    The calendar file is read once, on first use, after which serving a
+    day's puzzle is a dictionary lookup. Games only ever ``draw``, which
+    never generates: until today's puzzle has been precomputed, they get a
+    practice puzzle from the fallback instead. ``puzzle`` generates a
+    missing day from its seed, for looking days up outside a game.
+    """
+
+    def __init__(
+        self,
+        game: str,
+        directory: Path = Paths.DAILY_DIR,
+        fallback: PuzzleSource | None = None,
+    ) -> None:
+        """
+        Initialise the calendar.
+
+        Parameters
+        ----------
+        game : str
+            The key of the game, as used in ``PUZZLE_GENERATORS``.
+        directory : Path, optional
+            The directory holding the calendar files, by default Paths.DAILY_DIR.
+        fallback : PuzzleSource | None, optional
+            Where to draw puzzles from when today's is not cached, by default
+            the game's ``PuzzlePool``.
+
+        Raises
+        ------
+        ValueError
+            If there is no generator for the game.
+
+        Examples
+        --------
+        >>> calendar = DailyCalendar("sudoku")
+
+        Notes
+        -----
+        No files are read or created until a puzzle is asked for.
+        """
+        if game not in PUZZLE_GENERATORS:
+            raise ValueError(
+                "Invalid game: "
+                + game
+                + ". \nValid games are: "
+                + ", ".join(PUZZLE_GENERATORS.keys())
+            )
+
+        self.game = game
+        self.directory = Path(directory)
+        self.path = self.directory / f"{game}.json"
+        self.fallback = fallback if fallback is not None else PuzzlePool(game)
+        self._puzzles: dict[str, dict[str, object]] | None = None
+
+    def _load(self) -> dict[str, dict[str, object]]:
+        """
+        Return the cached puzzles, reading the calendar file on first use.
+
+        Returns
+        -------
+        dict[str, dict[str, object]]
+            The puzzle record of every cached day, by ISO date.
+
+        Examples
+        --------
+        >>> calendar._load()["2024-01-01"]["seed"]
+        11127394213574372012
+
+        Notes
+        -----
+        A missing or unreadable calendar file counts as empty.
+        """
+        if self._puzzles is None:
+            try:
+                self._puzzles = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._puzzles = {}
+        return self._puzzles
+
+    def _save(self) -> None:
+        """
+        Write the cached puzzles to the calendar file.
+
+        Examples
+        --------
+        >>> calendar._save()
+
+        Notes
+        -----
+        The file is written next to the calendar and then moved over it, so
+        a reader never sees half a calendar.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.path.with_suffix(".tmp")
+        temporary_path.write_text(json.dumps(self._load(), sort_keys=True))
+        temporary_path.replace(self.path)
+
+    def _generate(self, days: list[date], workers: int) -> None:
+        """
+        Generate the puzzles of some days and add them to the cache.
+
+        Parameters
+        ----------
+        days : list[date]
+            The days to generate puzzles for.
+        workers : int
+            The number of worker processes.
+
+        Examples
+        --------
+        >>> calendar._generate([date.today()], workers=1)
+
+        Notes
+        -----
+        A single day or worker runs in-process. Each record also gets its
+        ``date``, so a reported puzzle can be traced back to its day.
+        """
+        generator = load_entry_point(PUZZLE_GENERATORS[self.game])
+        seeds = [daily_seed(self.game, day) for day in days]
+        if workers == 1 or len(days) == 1:
+            records = [generator(seed) for seed in seeds]
+        else:
+            chunksize = max(1, len(days) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                records = list(executor.map(generator, seeds, chunksize=chunksize))
+
+        puzzles = self._load()
+        for day, record in zip(days, records):
+            puzzles[day.isoformat()] = {**record, "date": day.isoformat()}
+
+    def precompute(
+        self,
+        days: int = Constants.DAILY_DAYS_DEFAULT,
+        start: date | None = None,
+        workers: int | None = None,
+    ) -> int:
+        """
+        Generate the puzzles of the coming days that are not cached yet.
+
+        Parameters
+        ----------
+        days : int, optional
+            The number of days to cover, by default ``Constants.DAILY_DAYS_DEFAULT``.
+        start : date | None, optional
+            The first day to cover, by default today.
+        workers : int | None, optional
+            The number of worker processes, by default one per CPU core.
+
+        Returns
+        -------
+        int
+            The number of puzzles generated.
+
+        Examples
+        --------
+        >>> calendar.precompute(30)
+        30
+        >>> calendar.precompute(31)
+        1
+
+        Notes
+        -----
+        Days before ``start`` are dropped from the calendar; they can always
+        be regenerated from their seeds.
+        """
+        start = start if start is not None else date.today()
+        wanted = [start + timedelta(days=offset) for offset in range(days)]
+        puzzles = self._load()
+        missing = [day for day in wanted if day.isoformat() not in puzzles]
+
+        if missing:
+            daily_scheduler_logger.info(
+                f"Generating {len(missing)} daily {self.game} puzzles from {missing[0]}..."
+            )
+            self._generate(missing, workers or os.cpu_count() or 1)
+        for key in [key for key in puzzles if key < start.isoformat()]:
+            del puzzles[key]
+        self._save()
+        return len(missing)
+
+    def puzzle(self, day: date | None = None) -> dict[str, object]:
+        """
+        Return the puzzle of a day.
+
+        Parameters
+        ----------
+        day : date | None, optional
+            The day, by default today.
+
+        Returns
+        -------
+        dict[str, object]
+            The puzzle record.
+
+        Examples
+        --------
+        >>> calendar.puzzle(date(2024, 1, 1))["date"]
+        '2024-01-01'
+
+        Notes
+        -----
+        A cached day is a dictionary lookup. Any other day is generated from
+        its seed and cached, so a past day can be reproduced from its date.
+        Games use ``draw`` instead, which never generates.
+        """
+        day = day if day is not None else date.today()
+        puzzles = self._load()
+        if day.isoformat() not in puzzles:
+            daily_scheduler_logger.info(f"Generating the daily {self.game} puzzle for {day}...")
+            self._generate([day], workers=1)
+            self._save()
+        return puzzles[day.isoformat()]
+
+    def draw(self) -> dict[str, object] | None:
+        """
+        Return today's puzzle, without generating it.
+
+        Returns
+        -------
+        dict[str, object] | None
+            The puzzle record, a practice puzzle from the fallback if today's
+            is not cached yet, or None if neither is available.
+
+        Examples
+        --------
+        >>> calendar.draw()["date"] == date.today().isoformat()
+        True
+
+        Notes
+        -----
+        Unlike ``PuzzlePool.draw``, this returns the same puzzle all day, so
+        a game can take a calendar wherever it takes a pool. A miss re-reads
+        the calendar file once, since ``DailyScheduler.precompute_in_background``
+        may have written today's puzzle since it was loaded. Any error is
+        logged rather than raised, so the game can build its own puzzle.
+        """
+        today = date.today().isoformat()
+        try:
+            if today not in self._load():
+                self._puzzles = None
+            puzzles = self._load()
+            if today in puzzles:
+                return puzzles[today]
+            daily_scheduler_logger.warning(
+                f"The daily {self.game} puzzle for {today} is not precomputed yet. "
+                "Using a practice puzzle..."
+            )
+            return self.fallback.draw()
+        except Exception as error:
+            daily_scheduler_logger.error(f"No daily {self.game} puzzle: {error}")
+            return None
+
+
+class DailyScheduler:
+    """
+    The daily calendars of every game.
+
+    Attributes
+    ----------
+    calendars : dict[str, DailyCalendar]
+        The calendar of every game, by key.
+
+    Methods
+    -------
+    precompute(
+        days: int = Constants.DAILY_DAYS_DEFAULT,
+        start: date | None = None,
+        workers: int | None = None,
+    ) -> int:
+        Generate the puzzles of the coming days for every game.
+    puzzle(game: str, day: date | None = None) -> dict[str, object]:
+        Return a game's puzzle of a day.
+    precompute_in_background(days: int = Constants.DAILY_DAYS_DEFAULT) -> threading.Thread:
+        Generate the puzzles of the coming days in a background thread.
+
+    Examples
+    --------
+    >>> scheduler = DailyScheduler()
+    >>> scheduler.precompute(30)
+    >>> scheduler.puzzle("sudoku", date(2024, 1, 1))["seed"]
+    11127394213574372012
+
+    Notes
+    -----
+    Looking up a past day's puzzle, for example to reproduce a reported
+    problem, only needs the game and the date.
+    """
+
+    def __init__(
+        self, games: Iterable[str] | None = None, directory: Path = Paths.DAILY_DIR
+    ) -> None:
+        """
+        Initialise the scheduler.
+
+        Parameters
+        ----------
+        games : Iterable[str] | None, optional
+            The keys of the games, by default every game in ``PUZZLE_GENERATORS``.
+        directory : Path, optional
+            The directory holding the calendar files, by default Paths.DAILY_DIR.
+
+        Raises
+        ------
+        ValueError
+            If there is no generator for a game.
+
+        Examples
+        --------
+        >>> scheduler = DailyScheduler(["sudoku", "kenken"])
+
+        Notes
+        -----
+        No files are read or created until a puzzle is asked for.
+        """
+        self.calendars = {
+            game: DailyCalendar(game, directory)
+            for game in (games if games is not None else PUZZLE_GENERATORS)
+        }
+
+    def precompute(
+        self,
+        days: int = Constants.DAILY_DAYS_DEFAULT,
+        start: date | None = None,
+        workers: int | None = None,
+    ) -> int:
+        """
+        Generate the puzzles of the coming days for every game.
+
+        Parameters
+        ----------
+        days : int, optional
+            The number of days to cover, by default ``Constants.DAILY_DAYS_DEFAULT``.
+        start : date | None, optional
+            The first day to cover, by default today.
+        workers : int | None, optional
+            The number of worker processes, by default one per CPU core.
+
+        Returns
+        -------
+        int
+            The number of puzzles generated across every game.
+
+        Examples
+        --------
+        >>> scheduler.precompute(7)
+        42
+
+        Notes
+        -----
+        See ``DailyCalendar.precompute``.
+        """
+        return sum(
+            calendar.precompute(days, start, workers) for calendar in self.calendars.values()
+        )
+
+    def puzzle(self, game: str, day: date | None = None) -> dict[str, object]:
+        """
+        Return a game's puzzle of a day.
+
+        Parameters
+        ----------
+        game : str
+            The key of the game.
+        day : date | None, optional
+            The day, by default today.
+
+        Returns
+        -------
+        dict[str, object]
+            The puzzle record.
+
+        Raises
+        ------
+        ValueError
+            If the scheduler has no calendar for the game.
+
+        Examples
+        --------
+        >>> scheduler.puzzle("kenken")["size"]
+        6
+
+        Notes
+        -----
+        See ``DailyCalendar.puzzle``.
+        """
+        if game not in self.calendars:
+            raise ValueError(
+                "Invalid game: " + game + ". \nValid games are: " + ", ".join(self.calendars)
+            )
+        return self.calendars[game].puzzle(day)
+
+    def precompute_in_background(
+        self, days: int = Constants.DAILY_DAYS_DEFAULT
+    ) -> threading.Thread:
+        """
+        Generate the puzzles of the coming days in a background thread.
+
+        Parameters
+        ----------
+        days : int, optional
+            The number of days to cover, by default ``Constants.DAILY_DAYS_DEFAULT``.
+
+        Returns
+        -------
+        threading.Thread
+            The started daemon thread.
+
+        Examples
+        --------
+        >>> scheduler.precompute_in_background()
+
+        Notes
+        -----
+        Today's puzzle of every game is generated first, then the rest of
+        the window, so games get their daily puzzle as soon as possible.
+        Generation runs in-process, leaving the other cores to the game. A
+        calendar that fails is logged and skipped.
+        """
+
+        def precompute() -> None:
+            for window in (1, days):
+                for calendar in self.calendars.values():
+                    try:
+                        calendar.precompute(window, workers=1)
+                    except Exception as error:
+                        daily_scheduler_logger.error(
+                            f"Could not precompute the daily {calendar.game} puzzles: {error}"
+                        )
+
+        thread = threading.Thread(target=precompute, name="daily-precompute", daemon=True)
+        thread.start()
+        return thread
@@ -1,5 +1,7 @@
 """game_infrastructure.py: Classes for the games to inherit from."""
 
+import pygame
+
 from ..logs.setup_logging import setup_logging
 
 game_infrastructure_logger = setup_logging()
@@ -22,6 +24,14 @@ class Game:
     -------
     play()
         Play the game.
+    enter(screen: pygame.Surface) -> None:
+        Start a session on a display.
+    update(events: list[pygame.event.Event], dt: int) -> None:
+        Handle a frame's events and advance by its time.
+    render(screen: pygame.Surface) -> list[pygame.Rect]:
+        Draw what changed.
+    exit() -> None:
+        End the session.
 
     Examples
     --------
@@ -30,6 +40,9 @@ class Game:
     Notes
     -----
     This class initialises the game with a name, description, and instructions.
+    A game runs as a scene of the ``SceneManager`` through ``enter``,
+    ``update``, ``render`` and ``exit``, for as long as ``running`` is true.
+    By default ``enter`` just calls ``play``, for games without a display.
     """
 
     def __init__(self, name: str, description: str, instructions: str) -> None:
@@ -57,6 +70,8 @@ class Game:
         self.description = description
         self.instructions = instructions
         self.score: int | None = None
+        self.won: bool | None = None
+        self.running = False
 
     def __name__(self) -> str:
         """
@@ -134,3 +149,103 @@ class Game:
         print(f"{self.name}: {self.description}")
         print(f"Instructions: {self.instructions}")
         self.score = 0
+
+    @property
+    def animating(self) -> bool:
+        """
+        Return whether the game needs frames without waiting for input.
+
+        Returns
+        -------
+        bool
+            True while something is moving.
+
+        Examples
+        --------
+        >>> game.animating
+        False
+
+        Notes
+        -----
+        While this is false, the scene manager blocks until the next event.
+        """
+        return False
+
+    def enter(self, screen: pygame.Surface) -> None:
+        """
+        Start a session on a display.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The display, already cleared.
+
+        Examples
+        --------
+        >>> game.enter(pygame.display.get_surface())
+
+        Notes
+        -----
+        Games with a display set ``running`` here and draw on ``screen``; it
+        belongs to the scene manager, so they must not open their own. This
+        default plays the game outright, so ``running`` stays false.
+        """
+        self.play()
+
+    def update(self, events: list[pygame.event.Event], dt: int) -> None:
+        """
+        Handle a frame's events and advance by its time.
+
+        Parameters
+        ----------
+        events : list[pygame.event.Event]
+            The events since the last frame.
+        dt : int
+            The milliseconds since the last frame, or 0 after waiting for input.
+
+        Examples
+        --------
+        >>> game.update(pygame.event.get(), 16)
+
+        Notes
+        -----
+        Set ``running`` to false to end the session.
+        """
+
+    def render(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """
+        Draw what changed.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The display.
+
+        Returns
+        -------
+        list[pygame.Rect]
+            The areas drawn, to pass to ``pygame.display.update``.
+
+        Examples
+        --------
+        >>> pygame.display.update(game.render(screen))
+
+        Notes
+        -----
+        Return nothing if nothing changed, so the frame costs no update.
+        """
+        return []
+
+    def exit(self) -> None:
+        """
+        End the session.
+
+        Examples
+        --------
+        >>> game.exit()
+
+        Notes
+        -----
+        This is where a game sets ``score``, and ``won`` if it was finished,
+        so the scene manager can save the result. The display stays open.
+        """
@@ -0,0 +1,161 @@
+"""cages.py: KenKen cages and the value tuples that satisfy them."""
+
+from dataclasses import dataclass
+from math import prod
+
+from ...logs.setup_logging import setup_logging
+
+cages_logger = setup_logging()
+
+ADD = "+"
+SUBTRACT = "-"
+MULTIPLY = "×"
+DIVIDE = "÷"
+GIVEN = "="  # a single cell whose value is shown
+OPERATIONS = (ADD, SUBTRACT, MULTIPLY, DIVIDE, GIVEN)
+
+
+@dataclass(frozen=True)
+class Cage:
+    """
+    A group of cells whose values must combine to a target.
+
+    Attributes
+    ----------
+    cells : tuple[tuple[int, int], ...]
+        The row and column of each cell.
+    operation : str
+        How the values combine, one of ``OPERATIONS``.
+    target : int
+        The result the values must combine to.
+
+    Examples
+    --------
+    >>> Cage(((0, 0), (0, 1)), DIVIDE, 2)
+
+    Notes
+    -----
+    Subtraction and division cages have two cells and are satisfied in
+    either order. Given cages have one cell.
+    """
+
+    cells: tuple[tuple[int, int], ...]
+    operation: str
+    target: int
+
+
+def cage_value(operation: str, values: tuple[int, ...]) -> int | None:
+    """
+    Combine values with an operation.
+
+    Parameters
+    ----------
+    operation : str
+        The operation, one of ``OPERATIONS``.
+    values : tuple[int, ...]
+        The values, in any order.
+
+    Returns
+    -------
+    int | None
+        The result, or None if the operation cannot combine these values,
+        such as a division that leaves a remainder.
+
+    Raises
+    ------
+    ValueError
+        If the operation is invalid.
+
+    Examples
+    --------
+    >>> cage_value(DIVIDE, (2, 6))
+    3
+    >>> cage_value(DIVIDE, (4, 6)) is None
+    True
+
+    Notes
+    -----
+    The generator uses this to label a cage from its solution.
+    """
+    if operation == ADD:
+        return sum(values)
+    if operation == MULTIPLY:
+        return prod(values)
+    if operation == GIVEN:
+        return values[0] if len(values) == 1 else None
+    if operation in (SUBTRACT, DIVIDE):
+        if len(values) != 2:
+            return None
+        low, high = sorted(values)
+        if operation == SUBTRACT:
+            return high - low
+        return high // low if high % low == 0 else None
+    raise ValueError(
+        "Invalid operation: " + operation + ". \nValid operations are: " + ", ".join(OPERATIONS)
+    )
+
+
+def cage_tuples(cage: Cage, size: int) -> list[tuple[int, ...]]:
+    """
+    List every assignment of values that satisfies a cage.
+
+    Parameters
+    ----------
+    cage : Cage
+        The cage.
+    size : int
+        The size of the grid, so values run from 1 to ``size``.
+
+    Returns
+    -------
+    list[tuple[int, ...]]
+        One value per cell, in the order of ``cage.cells``.
+
+    Examples
+    --------
+    >>> cage_tuples(Cage(((0, 0), (0, 1)), SUBTRACT, 3), 4)
+    [(1, 4), (4, 1)]
+
+    Notes
+    -----
+    Cells of the cage that share a row or column never repeat a value, and
+    partial sums and products that can no longer reach the target are cut
+    off early, so even a four-cell cage on a 9 × 9 grid takes a few
+    thousand steps.
+    """
+    cells = cage.cells
+    count = len(cells)
+    clashes = [
+        [k for k in range(i) if cells[k][0] == cells[i][0] or cells[k][1] == cells[i][1]]
+        for i in range(count)
+    ]
+    values = range(1, size + 1)
+    tuples: list[tuple[int, ...]] = []
+
+    def extend(partial: list[int], total: int) -> None:
+        position = len(partial)
+        if position == count:
+            if cage_value(cage.operation, tuple(partial)) == cage.target:
+                tuples.append(tuple(partial))
+            return
+
+        remaining = count - position - 1
+        for value in values:
+            if any(partial[k] == value for k in clashes[position]):
+                continue
+            if cage.operation == ADD:
+                new_total = total + value
+                if not new_total + remaining <= cage.target <= new_total + remaining * size:
+                    continue
+            elif cage.operation == MULTIPLY:
+                new_total = total * value
+                if cage.target % new_total:
+                    continue
+            else:
+                new_total = total
+            partial.append(value)
+            extend(partial, new_total)
+            partial.pop()
+
+    extend([], 1 if cage.operation == MULTIPLY else 0)
+    return tuples
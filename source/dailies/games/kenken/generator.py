@@ -0,0 +1,359 @@
+"""generator.py: A generator for KenKen puzzles with unique solutions."""
+
+import random
+
+import numpy as np
+
+from ...config.constants import Constants
+from ...logs.setup_logging import setup_logging
+from .cages import ADD, DIVIDE, GIVEN, MULTIPLY, SUBTRACT, Cage, cage_value
+from .solver import KenKenSolver
+
+generator_logger = setup_logging()
+
+Cell = tuple[int, int]
+
+
+class KenKenGenerator:
+    """
+    A generator for KenKen puzzles with unique solutions.
+
+    Attributes
+    ----------
+    size : int
+        The size of the grid.
+    rng : random.Random
+        The random number generator used for every random choice.
+
+    Methods
+    -------
+    generate_solution() -> np.ndarray:
+        Generate a random Latin square.
+    partition() -> list[list[Cell]]:
+        Split the grid into random connected cages.
+    label(cells: list[Cell], solution: np.ndarray) -> Cage:
+        Choose an operation for a cage and compute its target.
+    generate() -> tuple[list[Cage], np.ndarray]:
+        Generate a puzzle and its solution.
+
+    Examples
+    --------
+    >>> generator = KenKenGenerator(6, random.Random(42))
+    >>> cages, solution = generator.generate()
+
+    Notes
+    -----
+    A Latin square is filled by the solver with no cages, then cut into
+    random cages which are labelled from it. While the puzzle has a second
+    solution, a cage covering a cell where the two differ is repaired: it
+    is relabelled with an operation the second solution does not satisfy,
+    or, if it has been relabelled before, the cell is split off as a given.
+    Each split adds a cage, so repairs always end, and each needs only one
+    uniqueness check.
+    """
+
+    def __init__(self, size: int, rng: random.Random | None = None) -> None:
+        """
+        Initialise the generator.
+
+        Parameters
+        ----------
+        size : int
+            The size of the grid.
+        rng : random.Random | None, optional
+            The random number generator to use, by default a new unseeded one.
+
+        Raises
+        ------
+        ValueError
+            If the size is outside ``Constants.KENKEN_SIZES``.
+
+        Examples
+        --------
+        >>> generator = KenKenGenerator(6)
+
+        Notes
+        -----
+        Passing a seeded ``rng`` makes generation reproducible.
+        """
+        if size not in Constants.KENKEN_SIZES:
+            raise ValueError(
+                f"Invalid KenKen size: {size}. \nValid sizes are: "
+                + ", ".join(str(valid) for valid in Constants.KENKEN_SIZES)
+            )
+
+        self.size = size
+        self.rng = rng if rng is not None else random.Random()
+
+    def generate_solution(self) -> np.ndarray:
+        """
+        Generate a random Latin square.
+
+        Returns
+        -------
+        np.ndarray
+            The square, with every value once in each row and column.
+
+        Examples
+        --------
+        >>> generator.generate_solution()
+        array([[3, 1, 6, ...]])
+
+        Notes
+        -----
+        This solves a grid with no cages, trying candidates in a random order.
+        """
+        return KenKenSolver(self.size, []).solve(max_solutions=1, rng=self.rng)[0]
+
+    def partition(self) -> list[list[Cell]]:
+        """
+        Split the grid into random connected cages.
+
+        Returns
+        -------
+        list[list[Cell]]
+            The cells of each cage.
+
+        Examples
+        --------
+        >>> generator.partition()[0]
+        [(2, 3), (2, 4), (1, 4)]
+
+        Notes
+        -----
+        Each cage grows from a random free cell into random free neighbours,
+        up to a size drawn with ``Constants.KENKEN_CAGE_SIZE_WEIGHTS``. A
+        cage boxed in by others stays smaller.
+        """
+        sizes = range(1, len(Constants.KENKEN_CAGE_SIZE_WEIGHTS) + 1)
+        free = {(row, column) for row in range(self.size) for column in range(self.size)}
+        starts = sorted(free)
+        self.rng.shuffle(starts)
+
+        groups = []
+        for start in starts:
+            if start not in free:
+                continue
+            target = self.rng.choices(sizes, Constants.KENKEN_CAGE_SIZE_WEIGHTS)[0]
+            free.discard(start)
+            group = [start]
+            while len(group) < target:
+                neighbours = sorted(
+                    {
+                        (row + dr, column + dc)
+                        for row, column in group
+                        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                    }
+                    & free
+                )
+                if not neighbours:
+                    break
+                cell = self.rng.choice(neighbours)
+                free.discard(cell)
+                group.append(cell)
+            groups.append(group)
+        return groups
+
+    def _operations(self, values: tuple[int, ...]) -> list[str]:
+        """
+        List the operations that can label a cage.
+
+        Parameters
+        ----------
+        values : tuple[int, ...]
+            The cage's values in the solution.
+
+        Returns
+        -------
+        list[str]
+            The operations, most interesting first.
+
+        Examples
+        --------
+        >>> generator._operations((2, 6))
+        ['÷', '-', '×', '+']
+
+        Notes
+        -----
+        Division is only offered when it leaves no remainder.
+        """
+        if len(values) == 1:
+            return [GIVEN]
+        if len(values) == 2:
+            operations = [SUBTRACT, MULTIPLY, ADD]
+            if cage_value(DIVIDE, values) is not None:
+                operations.insert(0, DIVIDE)
+            return operations
+        return [MULTIPLY, ADD]
+
+    def label(self, cells: list[Cell], solution: np.ndarray) -> Cage:
+        """
+        Choose an operation for a cage and compute its target.
+
+        Parameters
+        ----------
+        cells : list[Cell]
+            The cells of the cage.
+        solution : np.ndarray
+            The solution.
+
+        Returns
+        -------
+        Cage
+            The labelled cage.
+
+        Examples
+        --------
+        >>> generator.label([(0, 0), (0, 1)], solution)
+        Cage(cells=((0, 0), (0, 1)), operation='÷', target=3)
+
+        Notes
+        -----
+        Two-cell cages favour division and subtraction, which narrow the
+        candidates most.
+        """
+        values = tuple(int(solution[cell]) for cell in cells)
+        operations = self._operations(values)
+        weights = [len(operations) - rank for rank in range(len(operations))]
+        operation = self.rng.choices(operations, weights)[0]
+        return Cage(tuple(cells), operation, int(cage_value(operation, values) or 0))
+
+    def _repair(
+        self, cages: list[Cage], solution: np.ndarray, other: np.ndarray, relabelled: set[Cell]
+    ) -> list[Cage]:
+        """
+        Change one cage so that a second solution no longer fits.
+
+        Parameters
+        ----------
+        cages : list[Cage]
+            The cages.
+        solution : np.ndarray
+            The intended solution.
+        other : np.ndarray
+            Another solution of the cages.
+        relabelled : set[Cell]
+            The first cell of every cage relabelled so far, updated in place.
+
+        Returns
+        -------
+        list[Cage]
+            The repaired cages.
+
+        Examples
+        --------
+        >>> cages = generator._repair(cages, solution, other, set())
+
+        Notes
+        -----
+        A split can leave the rest of the cage in pieces, so each connected
+        piece becomes a cage of its own.
+        """
+        differing = [(int(row), int(column)) for row, column in np.argwhere(solution != other)]
+        cell = self.rng.choice(differing)
+        number = next(n for n, cage in enumerate(cages) if cell in cage.cells)
+        cage = cages[number]
+        repaired = [other_cage for n, other_cage in enumerate(cages) if n != number]
+
+        if cage.cells[0] not in relabelled and len(cage.cells) > 1:
+            relabelled.add(cage.cells[0])
+            values = tuple(int(solution[c]) for c in cage.cells)
+            other_values = tuple(int(other[c]) for c in cage.cells)
+            operations = [
+                operation
+                for operation in self._operations(values)
+                if cage_value(operation, other_values) != cage_value(operation, values)
+            ]
+            if operations:
+                operation = self.rng.choice(operations)
+                target = int(cage_value(operation, values) or 0)
+                return repaired + [Cage(cage.cells, operation, target)]
+
+        repaired.append(self.label([cell], solution))
+        rest = [c for c in cage.cells if c != cell]
+        while rest:
+            piece = [rest.pop(0)]
+            for row, column in piece:  # grows as neighbours are found
+                for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                    neighbour = (row + dr, column + dc)
+                    if neighbour in rest:
+                        rest.remove(neighbour)
+                        piece.append(neighbour)
+            repaired.append(self.label(piece, solution))
+        return repaired
+
+    def generate(self) -> tuple[list[Cage], np.ndarray]:
+        """
+        Generate a puzzle and its solution.
+
+        Returns
+        -------
+        tuple[list[Cage], np.ndarray]
+            The cages, which have exactly one solution, and that solution.
+
+        Examples
+        --------
+        >>> cages, solution = generator.generate()
+
+        Notes
+        -----
+        The number of repairs needed is logged at debug level.
+        """
+        solution = self.generate_solution()
+        cages = [self.label(cells, solution) for cells in self.partition()]
+        relabelled: set[Cell] = set()
+        repairs = 0
+        while True:
+            solutions = KenKenSolver(self.size, cages).solve(max_solutions=2)
+            if len(solutions) == 1:
+                break
+            other = next(s for s in solutions if not np.array_equal(s, solution))
+            cages = self._repair(cages, solution, other, relabelled)
+            repairs += 1
+
+        generator_logger.debug(
+            f"Generated a {self.size} × {self.size} KenKen with {len(cages)} cages "
+            f"after {repairs} repair(s)."
+        )
+        return cages, solution
+
+
+def generate_kenken_puzzle(seed: int, size: int = Constants.KENKEN_SIZE) -> dict[str, object]:
+    """
+    Generate a single seeded KenKen puzzle as a serialisable record.
+
+    Parameters
+    ----------
+    seed : int
+        The seed for the random number generator.
+    size : int, optional
+        The size of the grid, by default ``Constants.KENKEN_SIZE``.
+
+    Returns
+    -------
+    dict[str, object]
+        The seed, size, cages and solution, using plain lists.
+
+    Examples
+    --------
+    >>> generate_kenken_puzzle(42)["cages"][0]
+    {'cells': [[2, 3], [2, 4]], 'operation': '÷', 'target': 2}
+
+    Notes
+    -----
+    This is a module-level function so that it can be sent to worker processes.
+    """
+    cages, solution = KenKenGenerator(size, random.Random(seed)).generate()
+    return {
+        "seed": seed,
+        "size": size,
+        "cages": [
+            {
+                "cells": [list(cell) for cell in cage.cells],
+                "operation": cage.operation,
+                "target": cage.target,
+            }
+            for cage in cages
+        ],
+        "solution": solution.tolist(),
+    }
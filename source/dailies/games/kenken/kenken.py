@@ -1,8 +1,19 @@
 """kenken.py: A game of KenKen, inheriting from the Game class."""
 
+import random
+from typing import Any, cast
+
+import numpy as np
+
+from ...config.constants import Constants
 from ...config.dialogue_en import DialogueEn
 from ...logs.setup_logging import setup_logging
+from ..daily_scheduler import DailyCalendar
 from ..game_infrastructure import Game
+from ..puzzle_pool import PuzzleSource
+from .cages import Cage
+from .generator import KenKenGenerator
+from .solver import KenKenSolver
 
 kenken_logger = setup_logging()
 
@@ -11,22 +22,67 @@ class KenKen(Game):
     """
     A game of KenKen.
 
+    Attributes
+    ----------
+    size : int
+        The size of the grid.
+    pool : PuzzleSource | None
+        The pool of pre-generated puzzles to draw from.
+    generator : KenKenGenerator
+        The generator used when the pool has no puzzle of the right size.
+    cages : list[Cage]
+        The cages of the current puzzle.
+    solution : np.ndarray
+        The solution of the current puzzle.
+
+    Methods
+    -------
+    solve(cages: list[Cage]) -> list[np.ndarray]:
+        Solve a puzzle.
+    play() -> None:
+        Generate a puzzle and play the game.
+
+    Examples
+    --------
+    >>> kenken = KenKen(6)
+    >>> kenken.play()
+
     Notes
     -----
     This class represents the KenKen game.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        size: int = Constants.KENKEN_SIZE,
+        pool: PuzzleSource | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
         """
         Initialise the KenKen game.
 
+        Parameters
+        ----------
+        size : int, optional
+            The size of the grid, by default ``Constants.KENKEN_SIZE``.
+        pool : PuzzleSource | None, optional
+            The pool of pre-generated puzzles to draw from, by default None.
+        rng : random.Random | None, optional
+            The random number generator for generation, by default a new unseeded one.
+
+        Raises
+        ------
+        ValueError
+            If the size is outside ``Constants.KENKEN_SIZES``.
+
         Examples
         --------
         >>> kenken = KenKen()
+        >>> kenken = KenKen(9, PuzzlePool("kenken"))
 
         Notes
         -----
-        This method initialises the KenKen game.
+        No puzzle is generated until the game is played.
         """
         super().__init__(
             DialogueEn.KENKEN_NAME,
@@ -34,4 +90,97 @@ class KenKen(Game):
             DialogueEn.KENKEN_INSTRUCTIONS,
         )
 
-        # TODO: Implement the KenKen game.
+        self.size = size
+        self.pool = pool
+        self.generator = KenKenGenerator(size, rng)
+        self.cages: list[Cage] = []
+        self.solution = np.zeros((size, size), dtype=int)
+
+    def solve(self, cages: list[Cage]) -> list[np.ndarray]:
+        """
+        Solve a puzzle.
+
+        Parameters
+        ----------
+        cages : list[Cage]
+            The cages of the puzzle.
+
+        Returns
+        -------
+        list[np.ndarray]
+            The solutions, stopping after two.
+
+        Examples
+        --------
+        >>> kenken.solve(kenken.cages)
+        [array([[1, 6, 2, ...]])]
+
+        Notes
+        -----
+        Two solutions are enough to tell that a puzzle is not unique.
+        """
+        return KenKenSolver(self.size, cages).solve(max_solutions=2)
+
+    def _generate(self) -> None:
+        """
+        Generate a KenKen puzzle.
+
+        Examples
+        --------
+        >>> kenken._generate()
+
+        Notes
+        -----
+        A puzzle is drawn from the pool when one of the right size is
+        available, and generated otherwise.
+        """
+        record = self.pool.draw() if self.pool is not None else None
+        if record is not None and record["size"] == self.size:
+            self.cages = []
+            for cage in cast(list[dict[str, Any]], record["cages"]):
+                cells = tuple((row, column) for row, column in cage["cells"])
+                self.cages.append(Cage(cells, cage["operation"], cage["target"]))
+            self.solution = np.array(record["solution"], dtype=int)
+        else:
+            self.cages, self.solution = self.generator.generate()
+
+        kenken_logger.info(
+            f"Generated a {self.size} × {self.size} KenKen with {len(self.cages)} cages."
+        )
+
+    def play(self) -> None:
+        """
+        Generate a puzzle and play the game.
+
+        Examples
+        --------
+        >>> kenken.play()
+
+        Notes
+        -----
+        The puzzle is generated on demand, in well under a second even at 9 × 9.
+        """
+        self._generate()
+        super().play()
+
+    # TODO: Implement the GUI for the KenKen game.
+
+
+def create_kenken() -> KenKen:
+    """
+    Create a KenKen game with the default settings and daily calendar.
+
+    Returns
+    -------
+    KenKen
+        The game.
+
+    Examples
+    --------
+    >>> kenken = create_kenken()
+
+    Notes
+    -----
+    This is the game's entry point in the game registry.
+    """
+    return KenKen(Constants.KENKEN_SIZE, DailyCalendar("kenken"))
@@ -0,0 +1,331 @@
+"""solver.py: A constraint propagation solver for KenKen grids, using cage tuples as bitmasks."""
+
+import random
+
+import numpy as np
+
+from ...logs.setup_logging import setup_logging
+from .cages import Cage, cage_tuples
+
+solver_logger = setup_logging()
+
+
+class KenKenSolver:
+    """
+    A KenKen solver using candidate bitmasks and precomputed cage tuples.
+
+    Attributes
+    ----------
+    size : int
+        The size of the grid.
+    cages : list[Cage]
+        The cages of the puzzle.
+    full_mask : int
+        The bitmask with a bit set for every value.
+    units : list[list[int]]
+        The flat cell indices of every row and column.
+    peers : list[list[int]]
+        The other cells in the row and column of every flat cell index.
+    cage_cells : list[list[int]]
+        The flat cell indices of every cage.
+    cage_masks : list[list[tuple[int, ...]]]
+        Every value tuple that satisfies each cage, with value ``v`` stored
+        as bit ``v - 1``.
+    cell_cage : list[int]
+        The cage of every flat cell index, or -1 if it is in none.
+
+    Methods
+    -------
+    solve(max_solutions: int = 2, rng: random.Random | None = None) -> list[np.ndarray]:
+        Solve the puzzle.
+
+    Examples
+    --------
+    >>> solver = KenKenSolver(6, cages)
+    >>> solver.solve()
+    [array([[1, 6, 2, ...]])]
+
+    Notes
+    -----
+    Each cell keeps a bitmask of its candidate values, and each cage keeps
+    the tuples that are still possible. Propagation is generalised arc
+    consistency: a cage's tuples are filtered against its cells' candidates,
+    and each cell is narrowed to the values its cage's surviving tuples use.
+    A cell with one value left is removed from its row and column, and a
+    value with one possible cell in a row or column is placed there. Search
+    branches on the cell with the fewest candidates. Uniqueness checks on
+    9 × 9 grids usually finish in a few hundred nodes.
+    """
+
+    def __init__(self, size: int, cages: list[Cage]) -> None:
+        """
+        Initialise the solver.
+
+        Parameters
+        ----------
+        size : int
+            The size of the grid.
+        cages : list[Cage]
+            The cages of the puzzle. Cells in no cage are only constrained by
+            their row and column, so no cages at all fills a Latin square.
+
+        Raises
+        ------
+        ValueError
+            If the size is not positive, or a cage has a cell outside the
+            grid or shared with another cage.
+
+        Examples
+        --------
+        >>> solver = KenKenSolver(4, [])
+
+        Notes
+        -----
+        Every cage's tuples are computed here, once, so a search only ever
+        filters them.
+        """
+        if size < 1:
+            raise ValueError(f"Invalid KenKen size: {size}. It must be positive.")
+
+        self.size = size
+        self.cages = cages
+        self.full_mask = (1 << size) - 1
+        cell_count = size * size
+
+        rows = [[i * size + j for j in range(size)] for i in range(size)]
+        columns = [[i * size + j for i in range(size)] for j in range(size)]
+        self.units = rows + columns
+        self.peers = [
+            [peer for peer in rows[index // size] + columns[index % size] if peer != index]
+            for index in range(cell_count)
+        ]
+
+        self.cell_cage = [-1] * cell_count
+        self.cage_cells: list[list[int]] = []
+        self.cage_masks: list[list[tuple[int, ...]]] = []
+        for number, cage in enumerate(cages):
+            indices = []
+            for row, column in cage.cells:
+                index = row * size + column
+                if not (0 <= row < size and 0 <= column < size) or self.cell_cage[index] != -1:
+                    raise ValueError(
+                        f"Invalid cages: cell {(row, column)} is outside the grid or in two cages."
+                    )
+                self.cell_cage[index] = number
+                indices.append(index)
+            self.cage_cells.append(indices)
+            self.cage_masks.append(
+                [tuple(1 << (value - 1) for value in values) for values in cage_tuples(cage, size)]
+            )
+
+    def solve(self, max_solutions: int = 2, rng: random.Random | None = None) -> list[np.ndarray]:
+        """
+        Solve the puzzle.
+
+        Parameters
+        ----------
+        max_solutions : int, optional
+            The number of solutions after which to stop searching, by default 2.
+        rng : random.Random | None, optional
+            The random number generator used to shuffle the order in which
+            candidates are tried, by default None (ascending order).
+
+        Returns
+        -------
+        list[np.ndarray]
+            The solutions found, at most ``max_solutions`` of them.
+
+        Examples
+        --------
+        >>> len(solver.solve())
+        1
+
+        Notes
+        -----
+        Two solutions are enough to tell that a puzzle is not unique. Passing
+        ``rng`` with ``max_solutions=1`` and no cages turns the solver into a
+        random Latin square filler.
+        """
+        domains = [self.full_mask] * (self.size * self.size)
+        live = list(self.cage_masks)
+        solutions: list[np.ndarray] = []
+        if self._propagate(domains, live, [], list(range(len(self.cages)))):
+            self._search(domains, live, solutions, max_solutions, rng)
+        return solutions
+
+    def _propagate(
+        self,
+        domains: list[int],
+        live: list[list[tuple[int, ...]]],
+        singles: list[int],
+        pending: list[int],
+    ) -> bool:
+        """
+        Narrow the candidates until nothing more can be deduced.
+
+        Parameters
+        ----------
+        domains : list[int]
+            The candidate bitmask of every cell.
+        live : list[list[tuple[int, ...]]]
+            The tuples still possible for every cage.
+        singles : list[int]
+            The cells newly narrowed to one value.
+        pending : list[int]
+            The cages whose cells have changed.
+
+        Returns
+        -------
+        bool
+            False on a contradiction.
+
+        Examples
+        --------
+        >>> solver._propagate(domains, live, [12], [4])
+        True
+
+        Notes
+        -----
+        ``domains`` and ``live`` are modified in place; ``live`` has its
+        entries replaced, never mutated, so a shallow copy is a snapshot.
+        """
+        full_mask = self.full_mask
+        peers = self.peers
+        cell_cage = self.cell_cage
+        queued = set(pending)
+
+        while True:
+            while singles or pending:
+                while singles:
+                    index = singles.pop()
+                    bit = domains[index]
+                    for peer in peers[index]:
+                        if domains[peer] & bit:
+                            mask = domains[peer] & ~bit
+                            if mask == 0:
+                                return False
+                            domains[peer] = mask
+                            if mask & (mask - 1) == 0:
+                                singles.append(peer)
+                            cage = cell_cage[peer]
+                            if cage != -1 and cage not in queued:
+                                queued.add(cage)
+                                pending.append(cage)
+
+                if pending:
+                    cage = pending.pop()
+                    queued.discard(cage)
+                    cells = self.cage_cells[cage]
+                    masks = [domains[index] for index in cells]
+                    tuples = [
+                        bits for bits in live[cage] if all(m & b for m, b in zip(masks, bits))
+                    ]
+                    if not tuples:
+                        return False
+                    live[cage] = tuples
+
+                    supported = [0] * len(cells)
+                    for bits in tuples:
+                        for position, bit in enumerate(bits):
+                            supported[position] |= bit
+                    for index, mask in zip(cells, supported):
+                        if mask != domains[index]:
+                            domains[index] = mask
+                            if mask & (mask - 1) == 0:
+                                singles.append(index)
+
+            # Hidden singles: values with a single possible cell in a row or column.
+            placed = False
+            for unit in self.units:
+                seen_once = 0
+                seen_twice = 0
+                for index in unit:
+                    mask = domains[index]
+                    seen_twice |= seen_once & mask
+                    seen_once |= mask
+                if seen_once != full_mask:
+                    return False
+
+                hidden = seen_once & ~seen_twice
+                while hidden:
+                    bit = hidden & -hidden
+                    hidden ^= bit
+                    for index in unit:
+                        if domains[index] & bit and domains[index] != bit:
+                            domains[index] = bit
+                            singles.append(index)
+                            cage = cell_cage[index]
+                            if cage != -1 and cage not in queued:
+                                queued.add(cage)
+                                pending.append(cage)
+                            placed = True
+                            break
+
+            if not placed:
+                return True
+
+    def _search(
+        self,
+        domains: list[int],
+        live: list[list[tuple[int, ...]]],
+        solutions: list[np.ndarray],
+        max_solutions: int,
+        rng: random.Random | None = None,
+    ) -> None:
+        """
+        Search for solutions, branching on the most constrained cell.
+
+        Parameters
+        ----------
+        domains : list[int]
+            The candidate bitmask of every cell, already propagated.
+        live : list[list[tuple[int, ...]]]
+            The tuples still possible for every cage.
+        solutions : list[np.ndarray]
+            The list of solutions found so far.
+        max_solutions : int
+            The number of solutions after which to stop searching.
+        rng : random.Random | None, optional
+            The random number generator used to order candidates, by default None.
+
+        Examples
+        --------
+        >>> solver._search(domains, live, solutions, 2)
+
+        Notes
+        -----
+        Each branch works on copies of the state, so no undo step is needed.
+        """
+        best_index, best_count = -1, self.size + 1
+        for index, mask in enumerate(domains):
+            if mask & (mask - 1):
+                count = bin(mask).count("1")
+                if count < best_count:
+                    best_index, best_count = index, count
+                    if count == 2:
+                        break
+
+        if best_index == -1:
+            values = [mask.bit_length() for mask in domains]
+            solutions.append(np.array(values, dtype=int).reshape(self.size, self.size))
+            return
+
+        mask = domains[best_index]
+        bits = []
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            bits.append(bit)
+        if rng is not None:
+            rng.shuffle(bits)
+
+        cage = self.cell_cage[best_index]
+        for bit in bits:
+            if len(solutions) >= max_solutions:
+                return
+            branch_domains, branch_live = domains.copy(), live.copy()
+            branch_domains[best_index] = bit
+            if self._propagate(
+                branch_domains, branch_live, [best_index], [cage] if cage != -1 else []
+            ):
+                self._search(branch_domains, branch_live, solutions, max_solutions, rng)
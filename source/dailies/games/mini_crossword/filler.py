@@ -0,0 +1,467 @@
+"""filler.py: A crossword grid filler using pattern index bitsets and constraint propagation."""
+
+import random
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable
+
+from ...config.constants import Constants
+from ...config.paths import Paths
+from ...logs.setup_logging import setup_logging
+from .pattern_index import ALL_LETTERS, PatternIndex, load_pattern_index
+
+filler_logger = setup_logging()
+
+Cell = tuple[int, int]
+
+ACROSS = "across"
+DOWN = "down"
+BLOCK = "#"  # a black square in a template
+
+
+@dataclass(frozen=True)
+class Slot:
+    """
+    A run of open cells that holds one word.
+
+    Attributes
+    ----------
+    number : int
+        The clue number, shared by an across and a down slot starting in the same cell.
+    direction : str
+        ``ACROSS`` or ``DOWN``.
+    cells : tuple[Cell, ...]
+        The row and column of each cell, in reading order.
+
+    Examples
+    --------
+    >>> Slot(1, ACROSS, ((0, 1), (0, 2), (0, 3), (0, 4)))
+
+    Notes
+    -----
+    Runs of a single cell are not slots.
+    """
+
+    number: int
+    direction: str
+    cells: tuple[Cell, ...]
+
+
+def template_slots(template: tuple[str, ...]) -> list[Slot]:
+    """
+    Find the slots of a template, numbered as in a printed crossword.
+
+    Parameters
+    ----------
+    template : tuple[str, ...]
+        The rows of the grid, with ``BLOCK`` for black squares and any other
+        character for open cells.
+
+    Returns
+    -------
+    list[Slot]
+        The across slots, then the down slots, each in clue number order.
+
+    Raises
+    ------
+    ValueError
+        If the template is empty or its rows differ in length.
+
+    Examples
+    --------
+    >>> [(slot.number, slot.direction) for slot in template_slots(("#??", "???", "??#"))][:3]
+    [(1, 'across'), (3, 'across'), (4, 'across')]
+
+    Notes
+    -----
+    A cell is numbered when an across or down slot starts there.
+    """
+    if not template or len({len(row) for row in template}) != 1:
+        raise ValueError(f"Invalid template: {template}. Rows must be non-empty and equal.")
+
+    rows, columns = len(template), len(template[0])
+
+    def run(row: int, column: int, dr: int, dc: int) -> tuple[Cell, ...]:
+        cells = []
+        while row < rows and column < columns and template[row][column] != BLOCK:
+            cells.append((row, column))
+            row, column = row + dr, column + dc
+        return tuple(cells)
+
+    across, down = [], []
+    number = 0
+    for row in range(rows):
+        for column in range(columns):
+            if template[row][column] == BLOCK:
+                continue
+            starts_across = column == 0 or template[row][column - 1] == BLOCK
+            starts_down = row == 0 or template[row - 1][column] == BLOCK
+            across_cells = run(row, column, 0, 1) if starts_across else ()
+            down_cells = run(row, column, 1, 0) if starts_down else ()
+            if len(across_cells) < 2 and len(down_cells) < 2:
+                continue
+            number += 1
+            if len(across_cells) > 1:
+                across.append(Slot(number, ACROSS, across_cells))
+            if len(down_cells) > 1:
+                down.append(Slot(number, DOWN, down_cells))
+    return across + down
+
+
+class CrosswordFiller:
+    """
+    A crossword grid filler using pattern index bitsets and constraint propagation.
+
+    Attributes
+    ----------
+    index : PatternIndex
+        The words to fill with.
+    template : tuple[str, ...]
+        The rows of the grid, with ``BLOCK`` for black squares.
+    slots : list[Slot]
+        The slots of the template.
+    crossings : list[tuple[int, int, int, int]]
+        Every cell shared by two slots, as the first slot's number in
+        ``slots`` and position in it, then the second's.
+    rng : random.Random
+        The random number generator used to order candidates.
+
+    Methods
+    -------
+    fill() -> dict[Slot, str] | None:
+        Fill the grid with distinct words.
+    grid(words: dict[Slot, str]) -> list[str]:
+        Write filled words into the rows of the template.
+
+    Examples
+    --------
+    >>> filler = CrosswordFiller(index, ("#????", "?????", "?????", "?????", "????#"))
+    >>> filler.grid(filler.fill())
+    ['#scab', 'opera', ...]
+
+    Notes
+    -----
+    Each slot keeps its candidates as a pattern index bitset. Propagation
+    is arc consistency over the crossings: the letters one slot's
+    candidates allow in a shared cell are intersected with the other's,
+    and both are narrowed to the survivors, which is a handful of integer
+    ANDs rather than a pass over the words. Search fills the slot with the
+    fewest candidates first, trying first the words that leave the most
+    candidates in the slots they cross, with random weights for variety.
+    Because a few unlucky early choices can lead into a barren subtree,
+    the search restarts whenever it has tried a budget of words, which
+    doubles each time. A 5 × 5 mini usually fills in under 10 ms, and
+    rarely takes as long as 100 ms.
+    """
+
+    def __init__(
+        self, index: PatternIndex, template: tuple[str, ...], rng: random.Random | None = None
+    ) -> None:
+        """
+        Initialise the filler.
+
+        Parameters
+        ----------
+        index : PatternIndex
+            The words to fill with.
+        template : tuple[str, ...]
+            The rows of the grid, with ``BLOCK`` for black squares.
+        rng : random.Random | None, optional
+            The random number generator to use, by default a new unseeded one.
+
+        Raises
+        ------
+        ValueError
+            If the template is empty or its rows differ in length.
+
+        Examples
+        --------
+        >>> filler = CrosswordFiller(index, Constants.MINI_CROSSWORD_TEMPLATES[0])
+
+        Notes
+        -----
+        Passing a seeded ``rng`` makes filling reproducible.
+        """
+        self.index = index
+        self.template = template
+        self.slots = template_slots(template)
+        self.rng = rng if rng is not None else random.Random()
+
+        owners: dict[Cell, list[tuple[int, int]]] = {}
+        for number, slot in enumerate(self.slots):
+            for position, cell in enumerate(slot.cells):
+                owners.setdefault(cell, []).append((number, position))
+        self.crossings = [
+            (first[0], first[1], second[0], second[1])
+            for first, second in (pair for pair in owners.values() if len(pair) == 2)
+        ]
+        self._lengths = [len(slot.cells) for slot in self.slots]
+        self._slot_crossings: list[list[tuple[int, int, int, int]]] = [[] for _ in self.slots]
+        for crossing, (first, first_position, second, second_position) in enumerate(self.crossings):
+            self._slot_crossings[first].append((crossing, first_position, second, second_position))
+            self._slot_crossings[second].append((crossing, second_position, first, first_position))
+
+        self._tries = 0
+        self._budget = 0
+        self._cut_off = False
+
+    def fill(self) -> dict[Slot, str] | None:
+        """
+        Fill the grid with distinct words.
+
+        Returns
+        -------
+        dict[Slot, str] | None
+            The word in every slot, or None if the words cannot fill the grid.
+
+        Examples
+        --------
+        >>> filler.fill()[filler.slots[0]]
+        'scab'
+
+        Notes
+        -----
+        The first search may try ``Constants.MINI_CROSSWORD_RESTART_TRIES``
+        words. A search that finishes within its budget is exhaustive, so
+        returning None means there is no fill at all.
+        """
+        budget = Constants.MINI_CROSSWORD_RESTART_TRIES
+        restarts = 0
+        while True:
+            self._tries, self._budget, self._cut_off = 0, budget, False
+            domains = [self.index.full.get(length, 0) for length in self._lengths]
+            letters = [ALL_LETTERS] * len(self.crossings)
+            numbers = None
+            if all(domains) and self._propagate(domains, letters, range(len(self.slots))):
+                numbers = self._search(domains, letters, [-1] * len(self.slots))
+
+            if numbers is not None or not self._cut_off:
+                filler_logger.debug(
+                    f"Filled {len(self.slots)} slots after {restarts} restart(s)."
+                    if numbers is not None
+                    else f"No fill for {self.template}."
+                )
+                if numbers is None:
+                    return None
+                return {
+                    slot: self.index.word(len(slot.cells), number)
+                    for slot, number in zip(self.slots, numbers)
+                }
+            budget *= 2
+            restarts += 1
+
+    def _propagate(self, domains: list[int], letters: list[int], changed: Iterable[int]) -> bool:
+        """
+        Narrow the candidates of every slot until the crossings agree.
+
+        Parameters
+        ----------
+        domains : list[int]
+            The candidate bitset of every slot, narrowed in place.
+        letters : list[int]
+            The letter mask still possible in every crossing, narrowed in place.
+        changed : Iterable[int]
+            The slots whose candidates have changed.
+
+        Returns
+        -------
+        bool
+            False if a slot has no candidates left.
+
+        Examples
+        --------
+        >>> filler._propagate(domains, letters, [best])
+        True
+
+        Notes
+        -----
+        Only the crossings of changed slots are checked, and only from the
+        changed side: the other side's letters are already in ``letters``.
+        """
+        index = self.index
+        lengths = self._lengths
+        queue = deque(changed)
+        queued = set(queue)
+
+        while queue:
+            slot = queue.popleft()
+            queued.discard(slot)
+            for crossing, position, other, other_position in self._slot_crossings[slot]:
+                slot_letters = index.letters_at(lengths[slot], domains[slot], position)
+                agreed = slot_letters & letters[crossing]
+                if not agreed:
+                    return False
+                if agreed != slot_letters:
+                    domains[slot] = index.restrict(lengths[slot], domains[slot], position, agreed)
+                if agreed == letters[crossing]:
+                    continue
+
+                letters[crossing] = agreed
+                narrowed = index.restrict(lengths[other], domains[other], other_position, agreed)
+                if not narrowed:
+                    return False
+                if narrowed != domains[other]:
+                    domains[other] = narrowed
+                    if other not in queued:
+                        queued.add(other)
+                        queue.append(other)
+        return True
+
+    def _search(
+        self, domains: list[int], letters: list[int], chosen: list[int]
+    ) -> list[int] | None:
+        """
+        Fill the remaining slots, most constrained first.
+
+        Parameters
+        ----------
+        domains : list[int]
+            The candidate bitset of every slot, already propagated.
+        letters : list[int]
+            The letter mask still possible in every crossing.
+        chosen : list[int]
+            The word number placed in every slot, or -1 if none is yet.
+
+        Returns
+        -------
+        list[int] | None
+            The word number of every slot, or None if there is no fill or
+            the budget of words to try ran out.
+
+        Examples
+        --------
+        >>> filler._search(domains, letters, [-1] * len(filler.slots))
+        [1532, 207, ...]
+
+        Notes
+        -----
+        A word's weight is the product, over the slots it crosses, of how
+        many of their candidates share its letter in the crossing cell, times
+        a random number. Counting per letter first makes this one lookup per
+        crossing per word. Each branch works on copies of the domains and
+        letters, so no undo step is needed.
+        """
+        best, best_count = -1, 0
+        for slot, candidates in enumerate(domains):
+            if chosen[slot] == -1:
+                count = bin(candidates).count("1")
+                if best == -1 or count < best_count:
+                    best, best_count = slot, count
+
+        if best == -1:
+            placed = set(zip(self._lengths, chosen))
+            return chosen if len(placed) == len(chosen) else None
+
+        length = len(self.slots[best].cells)
+        used = {
+            number
+            for slot, number in zip(self.slots, chosen)
+            if number != -1 and len(slot.cells) == length
+        }
+        numbers = [number for number in self.index.numbers(domains[best]) if number not in used]
+        words = self.index.words[length]
+        counts = []  # candidates of each crossing slot, by letter in the crossing
+        for _, position, other, other_position in self._slot_crossings[best]:
+            table = self.index.bits[self._lengths[other]][other_position]
+            counts.append((position, [bin(domains[other] & bits).count("1") for bits in table]))
+        scores = {}
+        for number in numbers:
+            score = self.rng.random()
+            for position, letter_counts in counts:
+                score *= letter_counts[ord(words[number][position]) - ord("a")]
+            scores[number] = score
+        numbers.sort(key=scores.__getitem__, reverse=True)
+
+        for number in numbers:
+            self._tries += 1
+            if self._tries > self._budget:
+                self._cut_off = True
+                return None
+            branch, branch_letters = domains.copy(), letters.copy()
+            branch[best] = 1 << number
+            branch_chosen = chosen.copy()
+            branch_chosen[best] = number
+            if self._propagate(branch, branch_letters, [best]):
+                result = self._search(branch, branch_letters, branch_chosen)
+                if result is not None:
+                    return result
+            if self._cut_off:
+                return None
+        return None
+
+    def grid(self, words: dict[Slot, str]) -> list[str]:
+        """
+        Write filled words into the rows of the template.
+
+        Parameters
+        ----------
+        words : dict[Slot, str]
+            The word in every slot.
+
+        Returns
+        -------
+        list[str]
+            The rows, with ``BLOCK`` for black squares.
+
+        Examples
+        --------
+        >>> filler.grid(words)
+        ['#scab', 'opera', 'liars', 'dense', 'sees#']
+
+        Notes
+        -----
+        Open cells in no slot stay as they are in the template.
+        """
+        rows = [list(row) for row in self.template]
+        for slot, word in words.items():
+            for (row, column), letter in zip(slot.cells, word):
+                rows[row][column] = letter
+        return ["".join(row) for row in rows]
+
+
+def generate_mini_crossword_puzzle(seed: int) -> dict[str, object]:
+    """
+    Fill a single seeded mini crossword as a serialisable record.
+
+    Parameters
+    ----------
+    seed : int
+        The seed for the random number generator.
+
+    Returns
+    -------
+    dict[str, object]
+        The seed, the rows of the filled grid, and the across and down
+        words by clue number.
+
+    Raises
+    ------
+    ValueError
+        If the word lists do not exist, or cannot fill the template drawn.
+
+    Examples
+    --------
+    >>> generate_mini_crossword_puzzle(42)["grid"]
+    ['#gasp', 'brine', 'easel', 'eclat', 'seek#']
+
+    Notes
+    -----
+    The template is drawn from ``Constants.MINI_CROSSWORD_TEMPLATES``. This
+    is a module-level function so that it can be sent to worker processes.
+    """
+    index = load_pattern_index()
+    if index is None:
+        raise ValueError(f"Invalid word lists: {Paths.WORDS}, {Paths.CROSSWORD_WORDS}.")
+
+    rng = random.Random(seed)
+    filler = CrosswordFiller(index, rng.choice(Constants.MINI_CROSSWORD_TEMPLATES), rng)
+    words = filler.fill()
+    if words is None:
+        raise ValueError(f"Invalid template: {filler.template}. The words cannot fill it.")
+
+    return {
+        "seed": seed,
+        "grid": filler.grid(words),
+        "across": {slot.number: word for slot, word in words.items() if slot.direction == ACROSS},
+        "down": {slot.number: word for slot, word in words.items() if slot.direction == DOWN},
+    }
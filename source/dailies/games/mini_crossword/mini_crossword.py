@@ -1,8 +1,16 @@
 """mini_crossword.py: A game of Mini Crossword, inheriting from the Game class."""
 
+import random
+from typing import cast
+
+from ...config.constants import Constants
 from ...config.dialogue_en import DialogueEn
 from ...logs.setup_logging import setup_logging
+from ..daily_scheduler import DailyCalendar
 from ..game_infrastructure import Game
+from ..puzzle_pool import PuzzleSource
+from .filler import ACROSS, CrosswordFiller, Slot, template_slots
+from .pattern_index import PatternIndex, load_pattern_index
 
 mini_crossword_logger = setup_logging()
 
@@ -11,22 +19,59 @@ class MiniCrossword(Game):
     """
     A game of Mini Crossword.
 
+    Attributes
+    ----------
+    index : PatternIndex
+        The words to fill grids with.
+    pool : PuzzleSource | None
+        The pool of pre-filled grids to draw from.
+    rng : random.Random
+        The random number generator used to choose templates and words.
+    grid : list[str]
+        The rows of the current grid, with "#" for black squares.
+    words : dict[Slot, str]
+        The word in every slot of the current grid.
+
+    Methods
+    -------
+    play() -> None:
+        Fill a grid and play the game.
+
+    Examples
+    --------
+    >>> mini_crossword = MiniCrossword(load_pattern_index())
+    >>> mini_crossword.play()
+
     Notes
     -----
     This class represents the Mini Crossword game.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        index: PatternIndex,
+        pool: PuzzleSource | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
         """
         Initialise the Mini Crossword game.
 
+        Parameters
+        ----------
+        index : PatternIndex
+            The words to fill grids with.
+        pool : PuzzleSource | None, optional
+            The pool of pre-filled grids to draw from, by default None.
+        rng : random.Random | None, optional
+            The random number generator to use, by default a new unseeded one.
+
         Examples
         --------
-        >>> mini_crossword = MiniCrossword()
+        >>> mini_crossword = MiniCrossword(index, PuzzlePool("mini_crossword"))
 
         Notes
         -----
-        This method initialises the Mini Crossword game.
+        No grid is filled until the game is played.
         """
         super().__init__(
             DialogueEn.MINI_CROSSWORD_NAME,
@@ -34,4 +79,87 @@ class MiniCrossword(Game):
             DialogueEn.MINI_CROSSWORD_INSTRUCTIONS,
         )
 
-        # TODO: Implement the Mini Crossword game.
+        self.index = index
+        self.pool = pool
+        self.rng = rng if rng is not None else random.Random()
+        self.grid: list[str] = []
+        self.words: dict[Slot, str] = {}
+
+    def _generate(self) -> None:
+        """
+        Fill a Mini Crossword grid.
+
+        Examples
+        --------
+        >>> mini_crossword._generate()
+
+        Notes
+        -----
+        A grid is drawn from the pool when one is available, and filled
+        otherwise. Templates the words cannot fill are skipped.
+        """
+        record = self.pool.draw() if self.pool is not None else None
+        if record is not None:
+            self.grid = cast(list[str], record["grid"])
+            template = tuple(self.grid)
+            self.words = {
+                slot: "".join(self.grid[row][column] for row, column in slot.cells)
+                for slot in template_slots(template)
+            }
+        else:
+            templates = list(Constants.MINI_CROSSWORD_TEMPLATES)
+            self.rng.shuffle(templates)
+            for template in templates:
+                filler = CrosswordFiller(self.index, template, self.rng)
+                words = filler.fill()
+                if words is not None:
+                    self.grid, self.words = filler.grid(words), words
+                    break
+
+        mini_crossword_logger.info(
+            f"Filled a Mini Crossword with {len(self.words)} words: "
+            + ", ".join(
+                f"{slot.number} {slot.direction}: {word}"
+                for slot, word in self.words.items()
+                if slot.direction == ACROSS
+            )
+            + "."
+        )
+
+    def play(self) -> None:
+        """
+        Fill a grid and play the game.
+
+        Examples
+        --------
+        >>> mini_crossword.play()
+
+        Notes
+        -----
+        The grid is filled on demand, usually in a few milliseconds.
+        """
+        self._generate()
+        super().play()
+
+    # TODO: Implement the GUI and clues for the Mini Crossword game.
+
+
+def create_mini_crossword() -> MiniCrossword | None:
+    """
+    Create a Mini Crossword game with the bundled words and daily calendar.
+
+    Returns
+    -------
+    MiniCrossword | None
+        The game, or None if a word list does not exist.
+
+    Examples
+    --------
+    >>> mini_crossword = create_mini_crossword()
+
+    Notes
+    -----
+    This is the game's entry point in the game registry.
+    """
+    index = load_pattern_index()
+    return MiniCrossword(index, DailyCalendar("mini_crossword")) if index else None
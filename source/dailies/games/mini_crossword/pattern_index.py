@@ -0,0 +1,360 @@
+"""pattern_index.py: A positional letter index answering crossword pattern queries with bitsets."""
+
+from functools import lru_cache
+from itertools import chain
+from string import ascii_lowercase
+from typing import Iterable
+
+from ...config.paths import Paths
+from ...file_interaction.word_cache import load_words
+from ...logs.setup_logging import setup_logging
+
+pattern_index_logger = setup_logging()
+
+BLANK = "?"  # a pattern position that matches any letter
+LETTERS = ascii_lowercase
+ALL_LETTERS = (1 << len(LETTERS)) - 1  # the letter mask with every letter set
+
+
+class PatternIndex:
+    """
+    A positional letter index of words, answering pattern queries with bitsets.
+
+    Attributes
+    ----------
+    words : dict[int, list[str]]
+        The sorted words of every length.
+    bits : dict[int, list[list[int]]]
+        For every length, position and letter, the set of words with that
+        letter there, as a bitset over ``words[length]``.
+    full : dict[int, int]
+        The bitset of every word of each length.
+
+    Methods
+    -------
+    lengths() -> list[int]:
+        Return the word lengths in the index.
+    matches(pattern: str) -> int:
+        Return the words matching a pattern, as a bitset.
+    words_matching(pattern: str) -> list[str]:
+        Return the words matching a pattern.
+    word(length: int, number: int) -> str:
+        Return a word by its bit number.
+    letters_at(length: int, candidates: int, position: int) -> int:
+        Return the letters candidates have at a position, as a letter mask.
+    restrict(length: int, candidates: int, position: int, letters: int) -> int:
+        Keep the candidates with one of some letters at a position.
+    numbers(candidates: int) -> list[int]:
+        Return the bit numbers of a bitset.
+
+    Examples
+    --------
+    >>> index = PatternIndex(["crane", "crate", "slate"])
+    >>> index.words_matching("?ra?e")
+    ['crane', 'crate']
+
+    Notes
+    -----
+    Word ``n`` of a length is bit ``n`` of that length's bitsets, and letter
+    ``l`` is bit ``l`` of a letter mask, counting from "a". A pattern query
+    ANDs one precomputed bitset per filled position, so its cost depends on
+    the length of the pattern, not on how many words match: ``?a??e`` is two
+    ANDs of integers a few hundred bytes long. A filler keeps each slot's
+    candidates as one of these bitsets and narrows it with ``restrict``.
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """
+        Initialise the index.
+
+        Parameters
+        ----------
+        words : Iterable[str]
+            The words to index.
+
+        Examples
+        --------
+        >>> index = PatternIndex(load_words(Paths.WORDS))
+
+        Notes
+        -----
+        Words are lowercased and deduplicated, and words with anything but
+        the letters a to z are left out.
+        """
+        by_length: dict[int, set[str]] = {}
+        for word in words:
+            word = word.strip().lower()
+            if word and all(letter in LETTERS for letter in word):
+                by_length.setdefault(len(word), set()).add(word)
+
+        self.words = {length: sorted(group) for length, group in sorted(by_length.items())}
+        self.bits: dict[int, list[list[int]]] = {}
+        self.full: dict[int, int] = {}
+        for length, group in self.words.items():
+            table = [[0] * len(LETTERS) for _ in range(length)]
+            for number, word in enumerate(group):
+                bit = 1 << number
+                for position, letter in enumerate(word):
+                    table[position][ord(letter) - ord("a")] |= bit
+            self.bits[length] = table
+            self.full[length] = (1 << len(group)) - 1
+
+        pattern_index_logger.debug(
+            "Indexed "
+            + ", ".join(f"{len(group)} words of {length}" for length, group in self.words.items())
+            + "."
+        )
+
+    def lengths(self) -> list[int]:
+        """
+        Return the word lengths in the index.
+
+        Returns
+        -------
+        list[int]
+            The lengths, shortest first.
+
+        Examples
+        --------
+        >>> index.lengths()
+        [5]
+
+        Notes
+        -----
+        A slot of any other length has no candidates.
+        """
+        return list(self.words)
+
+    def matches(self, pattern: str) -> int:
+        """
+        Return the words matching a pattern, as a bitset.
+
+        Parameters
+        ----------
+        pattern : str
+            The letters of the word, with ``BLANK`` for any letter.
+
+        Returns
+        -------
+        int
+            The bitset of matching words of the pattern's length.
+
+        Raises
+        ------
+        ValueError
+            If the pattern has a character that is neither a letter nor ``BLANK``.
+
+        Examples
+        --------
+        >>> bin(index.matches("?ra?e"))
+        '0b11'
+
+        Notes
+        -----
+        This is one AND per letter in the pattern.
+        """
+        table = self.bits.get(len(pattern))
+        if table is None:
+            return 0
+
+        candidates = self.full[len(pattern)]
+        for position, letter in enumerate(pattern.lower()):
+            if letter == BLANK:
+                continue
+            if letter not in LETTERS:
+                raise ValueError(f"Invalid pattern: {pattern}. Use letters and {BLANK!r} only.")
+            candidates &= table[position][ord(letter) - ord("a")]
+        return candidates
+
+    def words_matching(self, pattern: str) -> list[str]:
+        """
+        Return the words matching a pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            The letters of the word, with ``BLANK`` for any letter.
+
+        Returns
+        -------
+        list[str]
+            The matching words, in alphabetical order.
+
+        Examples
+        --------
+        >>> index.words_matching("s???e")
+        ['slate']
+
+        Notes
+        -----
+        Listing the words costs one step per match; counting them with
+        ``bin(index.matches(pattern)).count("1")`` does not.
+        """
+        words = self.words.get(len(pattern), [])
+        return [words[number] for number in self.numbers(self.matches(pattern))]
+
+    def word(self, length: int, number: int) -> str:
+        """
+        Return a word by its bit number.
+
+        Parameters
+        ----------
+        length : int
+            The length of the word.
+        number : int
+            The word's bit number in bitsets of that length.
+
+        Returns
+        -------
+        str
+            The word.
+
+        Examples
+        --------
+        >>> index.word(5, 0)
+        'crane'
+
+        Notes
+        -----
+        Bit numbers follow alphabetical order.
+        """
+        return self.words[length][number]
+
+    def letters_at(self, length: int, candidates: int, position: int) -> int:
+        """
+        Return the letters candidates have at a position, as a letter mask.
+
+        Parameters
+        ----------
+        length : int
+            The length of the candidates.
+        candidates : int
+            The bitset of candidate words.
+        position : int
+            The position in the words.
+
+        Returns
+        -------
+        int
+            The mask of letters at least one candidate has at the position.
+
+        Examples
+        --------
+        >>> index.letters_at(5, index.matches("?ra?e"), 3)
+        532480
+
+        Notes
+        -----
+        This is one AND per letter of the alphabet, or, when there are fewer
+        candidates than letters, one lookup per candidate. Late in a search
+        most slots have only a handful of candidates left.
+        """
+        if bin(candidates).count("1") <= len(LETTERS):
+            letters = 0
+            for number in self.numbers(candidates):
+                letters |= 1 << ord(self.words[length][number][position]) - ord("a")
+            return letters
+
+        letters = 0
+        for letter, words in enumerate(self.bits[length][position]):
+            if candidates & words:
+                letters |= 1 << letter
+        return letters
+
+    def restrict(self, length: int, candidates: int, position: int, letters: int) -> int:
+        """
+        Keep the candidates with one of some letters at a position.
+
+        Parameters
+        ----------
+        length : int
+            The length of the candidates.
+        candidates : int
+            The bitset of candidate words.
+        position : int
+            The position in the words.
+        letters : int
+            The mask of letters allowed at the position.
+
+        Returns
+        -------
+        int
+            The bitset of candidates that remain.
+
+        Examples
+        --------
+        >>> index.restrict(5, index.full[5], 3, 1 << 19)
+        6
+
+        Notes
+        -----
+        This is one OR per allowed letter and a final AND.
+        """
+        if letters == ALL_LETTERS:
+            return candidates
+
+        table = self.bits[length][position]
+        allowed = 0
+        while letters:
+            bit = letters & -letters
+            letters ^= bit
+            allowed |= table[bit.bit_length() - 1]
+        return candidates & allowed
+
+    @staticmethod
+    def numbers(candidates: int) -> list[int]:
+        """
+        Return the bit numbers of a bitset.
+
+        Parameters
+        ----------
+        candidates : int
+            The bitset.
+
+        Returns
+        -------
+        list[int]
+            The numbers of the set bits, lowest first.
+
+        Examples
+        --------
+        >>> PatternIndex.numbers(0b101)
+        [0, 2]
+
+        Notes
+        -----
+        This costs one step per set bit, however wide the bitset.
+        """
+        numbers = []
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+            numbers.append(bit.bit_length() - 1)
+        return numbers
+
+
+@lru_cache(maxsize=1)
+def load_pattern_index() -> PatternIndex | None:
+    """
+    Build the pattern index of the bundled word lists.
+
+    Returns
+    -------
+    PatternIndex | None
+        The index of the Wordle and crossword words, or None if either list
+        does not exist.
+
+    Examples
+    --------
+    >>> index = load_pattern_index()
+
+    Notes
+    -----
+    The Wordle list supplies the five letter words and ``Paths.CROSSWORD_WORDS``
+    the shorter ones. The index is built once per process and shared.
+    """
+    words = load_words(Paths.WORDS)
+    short_words = load_words(Paths.CROSSWORD_WORDS)
+    if words is None or short_words is None:
+        return None
+    return PatternIndex(chain(words, short_words))
@@ -0,0 +1,320 @@
+"""puzzle_pool.py: Pre-generation of puzzles into an on-disk pool."""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Protocol
+
+from ..config.paths import Paths
+from ..logs.setup_logging import setup_logging
+from .registry import load_entry_point
+
+puzzle_pool_logger = setup_logging()
+
+# Game key -> "module:attribute" of a function taking a seed and returning a puzzle record.
+PUZZLE_GENERATORS = {
+    "wordle": "dailies.games.wordle.wordle:generate_wordle_puzzle",
+    "sudoku": "dailies.games.sudoku.generator:generate_sudoku_puzzle",
+    "kenken": "dailies.games.kenken.generator:generate_kenken_puzzle",
+    "strands": "dailies.games.strands.generator:generate_strands_puzzle",
+    "mini_crossword": "dailies.games.mini_crossword.filler:generate_mini_crossword_puzzle",
+    "connections": "dailies.games.connections.builder:generate_connections_puzzle",
+}
+
+
+class PuzzleSource(Protocol):
+    """
+    Anything a game can draw its next puzzle from.
+
+    Methods
+    -------
+    draw() -> dict[str, object] | None:
+        Return the next puzzle record, or None if there is none.
+
+    Examples
+    --------
+    >>> sudoku = Sudoku(9, 0.5, PuzzlePool("sudoku"))
+    >>> sudoku = Sudoku(9, 0.5, DailyCalendar("sudoku"))
+
+    Notes
+    -----
+    ``PuzzlePool`` hands out a new puzzle on every draw, and
+    ``DailyCalendar`` the same puzzle all day.
+    """
+
+    def draw(self) -> dict[str, object] | None:
+        """
+        Return the next puzzle record, or None if there is none.
+
+        Returns
+        -------
+        dict[str, object] | None
+            The puzzle record.
+
+        Examples
+        --------
+        >>> source.draw()["seed"]
+        16928435481433721406
+
+        Notes
+        -----
+        Games fall back to generating a puzzle themselves on None.
+        """
+        ...
+
+
+def derive_seed(game: str, base_seed: int, index: int) -> int:
+    """
+    Derive the seed of a single puzzle.
+
+    Parameters
+    ----------
+    game : str
+        The key of the game the puzzle belongs to.
+    base_seed : int
+        The seed of the whole batch.
+    index : int
+        The index of the puzzle within the batch.
+
+    Returns
+    -------
+    int
+        A 64-bit seed for the puzzle.
+
+    Examples
+    --------
+    >>> derive_seed("sudoku", 0, 0)
+    16928435481433721406
+
+    Notes
+    -----
+    The seed depends only on its inputs, so a puzzle can always be regenerated
+    from its game, batch seed and index, whichever worker produced it.
+    """
+    digest = hashlib.sha256(f"{game}:{base_seed}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class PuzzlePool:
+    """
+    An on-disk pool of pre-generated puzzles for a single game.
+
+    Attributes
+    ----------
+    game : str
+        The key of the game, as used in ``PUZZLE_GENERATORS``.
+    directory : Path
+        The directory holding the pool files.
+    path : Path
+        The JSON lines file holding one puzzle per line.
+    cursor_path : Path
+        The file holding the byte offset of the next puzzle to draw.
+
+    Methods
+    -------
+    generate(
+        count: int,
+        base_seed: int = 0,
+        start: int = 0,
+        workers: int | None = None,
+        **options: Any,
+    ) -> int:
+        Generate puzzles in parallel and append them to the pool.
+    draw() -> dict[str, object] | None:
+        Take the next puzzle from the pool.
+
+    Examples
+    --------
+    >>> pool = PuzzlePool("sudoku")
+    >>> pool.generate(365)
+    365
+    >>> puzzle = pool.draw()
+
+    Notes
+    -----
+    Puzzles are appended to the end of the pool and drawn from the front.
+    Drawing seeks straight to the cursor, so it takes the same time however
+    many puzzles the pool holds.
+    """
+
+    def __init__(self, game: str, directory: Path = Paths.PUZZLE_POOL_DIR) -> None:
+        """
+        Initialise the puzzle pool.
+
+        Parameters
+        ----------
+        game : str
+            The key of the game, as used in ``PUZZLE_GENERATORS``.
+        directory : Path, optional
+            The directory holding the pool files, by default Paths.PUZZLE_POOL_DIR.
+
+        Raises
+        ------
+        ValueError
+            If there is no generator for the game.
+
+        Examples
+        --------
+        >>> pool = PuzzlePool("sudoku")
+
+        Notes
+        -----
+        No files are created until puzzles are generated.
+        """
+        if game not in PUZZLE_GENERATORS:
+            raise ValueError(
+                "Invalid game: "
+                + game
+                + ". \nValid games are: "
+                + ", ".join(PUZZLE_GENERATORS.keys())
+            )
+
+        self.game = game
+        self.directory = Path(directory)
+        self.path = self.directory / f"{game}.jsonl"
+        self.cursor_path = self.directory / f"{game}.cursor"
+
+    def _read_cursor(self) -> int:
+        """
+        Read the byte offset of the next puzzle to draw.
+
+        Returns
+        -------
+        int
+            The byte offset, or 0 if nothing has been drawn yet.
+
+        Examples
+        --------
+        >>> pool._read_cursor()
+        0
+
+        Notes
+        -----
+        This method reads the cursor file.
+        """
+        if not self.cursor_path.exists():
+            return 0
+        return int(self.cursor_path.read_text() or 0)
+
+    def __len__(self) -> int:
+        """
+        Return the number of puzzles left in the pool.
+
+        Returns
+        -------
+        int
+            The number of puzzles that have not been drawn yet.
+
+        Examples
+        --------
+        >>> len(pool)
+        365
+
+        Notes
+        -----
+        This method counts the lines after the cursor.
+        """
+        if not self.path.exists():
+            return 0
+        with open(self.path, "rb") as f:
+            f.seek(self._read_cursor())
+            return sum(1 for _ in f)
+
+    def generate(
+        self,
+        count: int,
+        base_seed: int = 0,
+        start: int = 0,
+        workers: int | None = None,
+        **options: Any,
+    ) -> int:
+        """
+        Generate puzzles in parallel and append them to the pool.
+
+        Parameters
+        ----------
+        count : int
+            The number of puzzles to generate.
+        base_seed : int, optional
+            The seed of the whole batch, by default 0.
+        start : int, optional
+            The index of the first puzzle within the batch, by default 0.
+        workers : int | None, optional
+            The number of worker processes, by default one per CPU core.
+        **options : Any
+            Extra keyword arguments for the game's generator, such as ``difficulty``.
+
+        Returns
+        -------
+        int
+            The number of puzzles generated.
+
+        Examples
+        --------
+        >>> pool.generate(365, base_seed=2024)
+        365
+        >>> pool.generate(30, difficulty="hard")
+        30
+
+        Notes
+        -----
+        Every puzzle gets its own seed from ``derive_seed``, so the output is
+        the same for any number of workers. Puzzles are written in order as
+        they complete, and a single worker runs in-process.
+        """
+        generator = partial(load_entry_point(PUZZLE_GENERATORS[self.game]), **options)
+        seeds = [derive_seed(self.game, base_seed, index) for index in range(start, start + count)]
+        workers = workers or os.cpu_count() or 1
+
+        puzzle_pool_logger.info(
+            f"Generating {count} {self.game} puzzles with {workers} worker(s)..."
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            if workers == 1:
+                for seed in seeds:
+                    f.write(json.dumps(generator(seed)) + "\n")
+            else:
+                chunksize = max(1, count // (workers * 4))
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for record in executor.map(generator, seeds, chunksize=chunksize):
+                        f.write(json.dumps(record) + "\n")
+
+        puzzle_pool_logger.info(f"Wrote {count} {self.game} puzzles to {self.path}.")
+        return count
+
+    def draw(self) -> dict[str, object] | None:
+        """
+        Take the next puzzle from the pool.
+
+        Returns
+        -------
+        dict[str, object] | None
+            The puzzle record, or None if the pool is empty.
+
+        Examples
+        --------
+        >>> pool.draw()["size"]
+        9
+
+        Notes
+        -----
+        This method reads a single line and moves the cursor past it.
+        """
+        if not self.path.exists():
+            return None
+
+        with open(self.path, "rb") as f:
+            f.seek(self._read_cursor())
+            line = f.readline()
+            offset = f.tell()
+
+        if not line.strip():
+            return None
+
+        self.cursor_path.write_text(str(offset))
+        record: dict[str, object] = json.loads(line)
+        return record
@@ -0,0 +1,324 @@
+"""registry.py: A registry of games that imports and builds each game only when it is needed."""
+
+import threading
+from importlib import import_module
+from typing import Any, Iterable
+
+from ..logs.setup_logging import setup_logging
+from .game_infrastructure import Game
+
+registry_logger = setup_logging()
+
+# Menu name -> "module:attribute" of a callable returning the game, or None if unavailable.
+DEFAULT_GAMES = {
+    "Wordle": "dailies.games.wordle.wordle:create_wordle",
+    "Quordle": "dailies.games.wordle.multi_wordle:create_quordle",
+    "Octordle": "dailies.games.wordle.multi_wordle:create_octordle",
+    "Sedecordle": "dailies.games.wordle.multi_wordle:create_sedecordle",
+    "Sudoku": "dailies.games.sudoku.sudoku:create_sudoku",
+    "Connections": "dailies.games.connections.connections:create_connections",
+    "Mini Crossword": "dailies.games.mini_crossword.mini_crossword:create_mini_crossword",
+    "Strands": "dailies.games.strands.strands:create_strands",
+    "KenKen": "dailies.games.kenken.kenken:create_kenken",
+}
+
+
+def load_entry_point(target: str) -> Any:
+    """
+    Import the object named by an entry point string.
+
+    Parameters
+    ----------
+    target : str
+        The object, written as ``"package.module:attribute"``.
+
+    Returns
+    -------
+    Any
+        The object.
+
+    Raises
+    ------
+    ValueError
+        If the target is not of the form ``"module:attribute"``.
+
+    Examples
+    --------
+    >>> load_entry_point("dailies.games.kenken.kenken:KenKen")
+    <class 'dailies.games.kenken.kenken.KenKen'>
+
+    Notes
+    -----
+    This uses the same syntax as the ``[tool.poetry.scripts]`` entry points.
+    """
+    module_name, separator, attribute = target.partition(":")
+    if not separator or not module_name or not attribute:
+        raise ValueError(f"Invalid entry point: {target}. Expected 'module:attribute'.")
+
+    obj = import_module(module_name)
+    for name in attribute.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+class GameRegistry:
+    """
+    A registry of games, built lazily the first time each one is requested.
+
+    Attributes
+    ----------
+    targets : dict[str, str]
+        The entry point of each game's factory, by menu name.
+
+    Methods
+    -------
+    register(name: str, target: str) -> None:
+        Register a game.
+    names() -> list[str]:
+        Return the names of the registered games, in menu order.
+    get(name: str) -> Game | None:
+        Return a game, building it if needed.
+    peek(name: str) -> Game | None:
+        Return a game only if it has already been built.
+    is_loaded(name: str) -> bool:
+        Check whether a game has been built.
+    is_available(name: str) -> bool | None:
+        Check whether a game could be built.
+    warm_up(names: Iterable[str] | None = None) -> threading.Thread:
+        Build games in a background thread.
+
+    Examples
+    --------
+    >>> registry = GameRegistry(DEFAULT_GAMES)
+    >>> registry.get("Sudoku").play()
+
+    Notes
+    -----
+    Registering a game costs a dictionary entry. Its module, and whatever it
+    imports (pygame, NumPy), is only imported when the game is first
+    requested, and its heavy state, such as word lists and generated grids,
+    is built at the same time. Each game is built at most once, even when the
+    menu and a warm-up thread ask for it together. A factory that returns
+    None or raises marks the game as unavailable.
+    """
+
+    def __init__(self, targets: dict[str, str] | None = None) -> None:
+        """
+        Initialise the registry.
+
+        Parameters
+        ----------
+        targets : dict[str, str] | None, optional
+            The entry point of each game's factory, by menu name, by default
+            None (an empty registry).
+
+        Examples
+        --------
+        >>> registry = GameRegistry(DEFAULT_GAMES)
+
+        Notes
+        -----
+        Nothing is imported here.
+        """
+        self.targets: dict[str, str] = {}
+        self._games: dict[str, Game | None] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        for name, target in (targets or {}).items():
+            self.register(name, target)
+
+    def register(self, name: str, target: str) -> None:
+        """
+        Register a game.
+
+        Parameters
+        ----------
+        name : str
+            The menu name of the game.
+        target : str
+            The entry point of a callable that takes no arguments and returns
+            the game, or None if it is unavailable.
+
+        Examples
+        --------
+        >>> registry.register("KenKen", "dailies.games.kenken.kenken:KenKen")
+
+        Notes
+        -----
+        Registering a name again replaces the game, and forgets any built one.
+        """
+        self.targets[name] = target
+        self._games.pop(name, None)
+        self._locks.setdefault(name, threading.Lock())
+
+    def names(self) -> list[str]:
+        """
+        Return the names of the registered games, in menu order.
+
+        Returns
+        -------
+        list[str]
+            The names, in the order they were registered.
+
+        Examples
+        --------
+        >>> registry.names()
+        ['Wordle', 'Sudoku', 'Connections', 'Mini Crossword', 'Strands', 'KenKen']
+
+        Notes
+        -----
+        Nothing is imported here.
+        """
+        return list(self.targets)
+
+    def get(self, name: str) -> Game | None:
+        """
+        Return a game, building it if needed.
+
+        Parameters
+        ----------
+        name : str
+            The menu name of the game.
+
+        Returns
+        -------
+        Game | None
+            The game, or None if it is unavailable.
+
+        Raises
+        ------
+        ValueError
+            If no game is registered under the name.
+
+        Examples
+        --------
+        >>> registry.get("Sudoku")
+
+        Notes
+        -----
+        The first call imports the game's module and calls its factory; later
+        calls return the same game.
+        """
+        if name not in self.targets:
+            raise ValueError(
+                f"Unknown game: {name}. Available games are: " + ", ".join(self.targets)
+            )
+
+        with self._locks[name]:
+            if name not in self._games:
+                registry_logger.info(f"Loading the {name} game...")
+                try:
+                    self._games[name] = load_entry_point(self.targets[name])()
+                except Exception as error:
+                    registry_logger.error(f"Could not load the {name} game: {error}")
+                    self._games[name] = None
+            return self._games[name]
+
+    def peek(self, name: str) -> Game | None:
+        """
+        Return a game only if it has already been built.
+
+        Parameters
+        ----------
+        name : str
+            The menu name of the game.
+
+        Returns
+        -------
+        Game | None
+            The game, or None if it is unavailable or not built yet.
+
+        Examples
+        --------
+        >>> registry.peek("Sudoku")
+
+        Notes
+        -----
+        This never imports or builds anything, so it is safe to call per frame.
+        """
+        return self._games.get(name)
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        Check whether a game has been built.
+
+        Parameters
+        ----------
+        name : str
+            The menu name of the game.
+
+        Returns
+        -------
+        bool
+            True if the game has been built, or found to be unavailable.
+
+        Examples
+        --------
+        >>> registry.is_loaded("Sudoku")
+        False
+
+        Notes
+        -----
+        This never imports or builds anything.
+        """
+        return name in self._games
+
+    def is_available(self, name: str) -> bool | None:
+        """
+        Check whether a game could be built.
+
+        Parameters
+        ----------
+        name : str
+            The menu name of the game.
+
+        Returns
+        -------
+        bool | None
+            Whether the game is available, or None if it has not been built yet.
+
+        Examples
+        --------
+        >>> registry.is_available("Wordle")
+        True
+
+        Notes
+        -----
+        This never imports or builds anything.
+        """
+        if name not in self._games:
+            return None
+        return self._games[name] is not None
+
+    def warm_up(self, names: Iterable[str] | None = None) -> threading.Thread:
+        """
+        Build games in a background thread.
+
+        Parameters
+        ----------
+        names : Iterable[str] | None, optional
+            The games to build, by default None (every registered game).
+
+        Returns
+        -------
+        threading.Thread
+            The started daemon thread.
+
+        Examples
+        --------
+        >>> registry.warm_up(["Wordle"])
+
+        Notes
+        -----
+        Games are built in order, so the menu can be drawn straight away while
+        the most likely choices load behind it. Selecting a game that is still
+        loading waits for that game only.
+        """
+        to_build = list(names) if names is not None else self.names()
+
+        def build() -> None:
+            for name in to_build:
+                self.get(name)
+
+        thread = threading.Thread(target=build, name="game-warm-up", daemon=True)
+        thread.start()
+        return thread
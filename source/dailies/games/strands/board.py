@@ -0,0 +1,492 @@
+"""board.py: A Strands board of letters, with theme words placed as paths of adjacent cells."""
+
+from ...config.constants import Constants
+from ...logs.setup_logging import setup_logging
+from .trie import MISSING, ROOT, Trie
+
+board_logger = setup_logging()
+
+Cell = tuple[int, int]
+Path = tuple[Cell, ...]
+
+THEME = "theme"  # a theme word, traced along its placed path
+WORD = "word"  # a dictionary word that is not a theme word
+INVALID = "invalid"  # not a path, too short, or not a word
+
+
+def neighbours(cell: Cell, rows: int, columns: int) -> list[Cell]:
+    """
+    List the cells next to a cell, including diagonally.
+
+    Parameters
+    ----------
+    cell : Cell
+        The row and column of the cell.
+    rows : int
+        The number of rows in the grid.
+    columns : int
+        The number of columns in the grid.
+
+    Returns
+    -------
+    list[Cell]
+        The neighbouring cells inside the grid.
+
+    Examples
+    --------
+    >>> neighbours((0, 0), 6, 8)
+    [(0, 1), (1, 0), (1, 1)]
+
+    Notes
+    -----
+    A corner has three neighbours and an inner cell has eight.
+    """
+    row, column = cell
+    return [
+        (row + dr, column + dc)
+        for dr in (-1, 0, 1)
+        for dc in (-1, 0, 1)
+        if (dr or dc) and 0 <= row + dr < rows and 0 <= column + dc < columns
+    ]
+
+
+class StrandsBoard:
+    """
+    A Strands board of letters, with theme words placed as paths of adjacent cells.
+
+    Attributes
+    ----------
+    theme : str
+        The clue shared by the theme words.
+    letters : list[list[str]]
+        The letter in every cell, by row and column.
+    words : dict[str, Path]
+        The path of every theme word, in reading order.
+    dictionary : Trie
+        The words that count towards hints.
+    theme_trie : Trie
+        The theme words.
+    found : set[str]
+        The theme words found so far.
+    rows : int
+        The number of rows.
+    columns : int
+        The number of columns.
+
+    Methods
+    -------
+    is_path(path: Path) -> bool:
+        Return whether cells form a path of distinct adjacent cells.
+    word_at(path: Path) -> str:
+        Return the letters along a path.
+    check(path: Path) -> str:
+        Check a traced path and record a found theme word.
+    find_words(trie: Trie, min_length: int = 1) -> dict[str, list[Path]]:
+        Find every path that spells a word of a trie.
+    solved() -> bool:
+        Return whether every theme word has been found.
+
+    Examples
+    --------
+    >>> board = StrandsBoard("Fruit", letters, {"pear": ((0, 0), (0, 1), (1, 1), (1, 0))})
+    >>> board.check(((0, 0), (0, 1), (1, 1), (1, 0)))
+    'theme'
+
+    Notes
+    -----
+    The theme words cover every cell exactly once. Checking a path reads at
+    most a few dozen cells and looks their letters up once.
+    """
+
+    def __init__(
+        self,
+        theme: str,
+        letters: list[list[str]],
+        words: dict[str, Path],
+        dictionary: Trie | None = None,
+    ) -> None:
+        """
+        Initialise the board.
+
+        Parameters
+        ----------
+        theme : str
+            The clue shared by the theme words.
+        letters : list[list[str]]
+            The letter in every cell, by row and column.
+        words : dict[str, Path]
+            The path of every theme word, in reading order.
+        dictionary : Trie | None, optional
+            The words that count towards hints, by default only the theme words.
+
+        Raises
+        ------
+        ValueError
+            If a theme word's path is not a path or does not spell the word.
+
+        Examples
+        --------
+        >>> board = StrandsBoard("Fruit", letters, paths, Trie(words))
+
+        Notes
+        -----
+        The dictionary may be shared between boards, so it is never changed:
+        the theme words are kept in a trie of their own.
+        """
+        self.theme = theme
+        self.letters = letters
+        self.rows = len(letters)
+        self.columns = len(letters[0]) if letters else 0
+        self.words = dict(words)
+        self.dictionary = dictionary if dictionary is not None else Trie()
+        self.theme_trie = Trie(self.words)
+        self.found: set[str] = set()
+
+        for word, path in self.words.items():
+            if not self.is_path(path) or self.word_at(path) != word:
+                raise ValueError(f"Invalid path for {word}: {path}.")
+
+    def is_path(self, path: Path) -> bool:
+        """
+        Return whether cells form a path of distinct adjacent cells.
+
+        Parameters
+        ----------
+        path : Path
+            The cells, in order.
+
+        Returns
+        -------
+        bool
+            True if every cell is on the board, none repeats, and each is next
+            to the one before, including diagonally.
+
+        Examples
+        --------
+        >>> board.is_path(((0, 0), (1, 1)))
+        True
+        >>> board.is_path(((0, 0), (2, 2)))
+        False
+
+        Notes
+        -----
+        An empty path is not a path.
+        """
+        if not path or len(set(path)) != len(path):
+            return False
+        if not all(0 <= row < self.rows and 0 <= column < self.columns for row, column in path):
+            return False
+        return all(
+            max(abs(row - previous_row), abs(column - previous_column)) == 1
+            for (previous_row, previous_column), (row, column) in zip(path, path[1:])
+        )
+
+    def word_at(self, path: Path) -> str:
+        """
+        Return the letters along a path.
+
+        Parameters
+        ----------
+        path : Path
+            The cells, in order.
+
+        Returns
+        -------
+        str
+            The letters.
+
+        Examples
+        --------
+        >>> board.word_at(((0, 0), (0, 1)))
+        'pe'
+
+        Notes
+        -----
+        This does not check that the cells form a path.
+        """
+        return "".join(self.letters[row][column] for row, column in path)
+
+    def check(self, path: Path) -> str:
+        """
+        Check a traced path and record a found theme word.
+
+        Parameters
+        ----------
+        path : Path
+            The traced cells, in order.
+
+        Returns
+        -------
+        str
+            ``THEME`` for a theme word, ``WORD`` for any other dictionary word
+            of at least ``Constants.STRANDS_MIN_WORD_LENGTH`` letters,
+            otherwise ``INVALID``.
+
+        Examples
+        --------
+        >>> board.check(board.words["pear"])
+        'theme'
+
+        Notes
+        -----
+        A theme word traced along some other path than its placed one still
+        counts, and is shown on its placed path.
+        """
+        path = tuple(path)
+        if len(path) < Constants.STRANDS_MIN_WORD_LENGTH or not self.is_path(path):
+            return INVALID
+
+        word = self.word_at(path)
+        if word in self.words:
+            self.found.add(word)
+            return THEME
+        return WORD if word in self.dictionary else INVALID
+
+    def find_words(self, trie: Trie, min_length: int = 1) -> dict[str, list[Path]]:
+        """
+        Find every path that spells a word of a trie.
+
+        Parameters
+        ----------
+        trie : Trie
+            The words to look for.
+        min_length : int, optional
+            The fewest letters a word may have, by default 1.
+
+        Returns
+        -------
+        dict[str, list[Path]]
+            Every path of every word found, by word.
+
+        Examples
+        --------
+        >>> board.find_words(Trie(["pear"]))
+        {'pear': [((0, 0), (0, 1), (1, 1), (1, 0))]}
+
+        Notes
+        -----
+        A depth-first search from every cell carries the trie node of the
+        letters traced so far, and the cells used as a bitmask. A branch ends
+        as soon as its letters are no word's prefix, so the search only ever
+        visits paths that could still become words, rather than the billions
+        of paths on the board.
+        """
+        rows, columns = self.rows, self.columns
+        letters = [self.letters[row][column] for row in range(rows) for column in range(columns)]
+        adjacent = [
+            [r * columns + c for r, c in neighbours(divmod(index, columns), rows, columns)]
+            for index in range(rows * columns)
+        ]
+        children, terminal = trie.children, trie.terminal
+        found: dict[str, list[Path]] = {}
+        path: list[int] = []
+
+        def extend(index: int, node: int, used: int) -> None:
+            node = children[node].get(letters[index], MISSING)
+            if node == MISSING:
+                return
+            path.append(index)
+            used |= 1 << index
+            if terminal[node] and len(path) >= min_length:
+                word = "".join(letters[i] for i in path)
+                found.setdefault(word, []).append(tuple(divmod(i, columns) for i in path))
+            for neighbour in adjacent[index]:
+                if not used >> neighbour & 1:
+                    extend(neighbour, node, used)
+            path.pop()
+
+        for index in range(rows * columns):
+            extend(index, ROOT, 0)
+        return found
+
+    def solved(self) -> bool:
+        """
+        Return whether every theme word has been found.
+
+        Returns
+        -------
+        bool
+            True once every theme word has been found.
+
+        Examples
+        --------
+        >>> board.solved()
+        False
+
+        Notes
+        -----
+        Found words are recorded by ``check``.
+        """
+        return self.found == set(self.words)
+
+
+class Trace:
+    """
+    A path being traced on a board, one cell per drag event.
+
+    Attributes
+    ----------
+    board : StrandsBoard
+        The board being traced on.
+    path : list[Cell]
+        The cells traced so far.
+
+    Methods
+    -------
+    extend(cell: Cell) -> bool:
+        Follow the drag onto a cell.
+    alive() -> bool:
+        Return whether the letters traced so far start a word.
+    word() -> str:
+        Return the letters traced so far.
+    finish() -> str:
+        Check the traced path and start a new one.
+
+    Examples
+    --------
+    >>> trace = Trace(board)
+    >>> trace.extend((0, 0))
+    True
+    >>> trace.finish()
+    'invalid'
+
+    Notes
+    -----
+    The dictionary and theme trie nodes after every traced letter are kept
+    on a stack, so moving onto a new cell or back onto the previous one
+    costs one dict lookup, however long the path. A dead prefix can still be
+    traced, so the player's drag is never refused, but ``alive`` reports it
+    at once.
+    """
+
+    def __init__(self, board: StrandsBoard) -> None:
+        """
+        Initialise the trace.
+
+        Parameters
+        ----------
+        board : StrandsBoard
+            The board being traced on.
+
+        Examples
+        --------
+        >>> trace = Trace(board)
+
+        Notes
+        -----
+        The trace starts empty.
+        """
+        self.board = board
+        self.path: list[Cell] = []
+        self._nodes = [(ROOT, ROOT)]
+
+    def extend(self, cell: Cell) -> bool:
+        """
+        Follow the drag onto a cell.
+
+        Parameters
+        ----------
+        cell : Cell
+            The cell under the pointer.
+
+        Returns
+        -------
+        bool
+            True if the path changed.
+
+        Examples
+        --------
+        >>> trace.extend((0, 1))
+        True
+
+        Notes
+        -----
+        Moving back onto the previous cell removes the last cell, as in the
+        original game. A cell that is used already, off the board, or not
+        next to the last cell is ignored.
+        """
+        if len(self.path) > 1 and cell == self.path[-2]:
+            self.path.pop()
+            self._nodes.pop()
+            return True
+
+        row, column = cell
+        if cell in self.path or not (
+            0 <= row < self.board.rows and 0 <= column < self.board.columns
+        ):
+            return False
+        if self.path and max(abs(row - self.path[-1][0]), abs(column - self.path[-1][1])) != 1:
+            return False
+
+        letter = self.board.letters[row][column]
+        node, theme_node = self._nodes[-1]
+        if node != MISSING:
+            node = self.board.dictionary.child(node, letter)
+        if theme_node != MISSING:
+            theme_node = self.board.theme_trie.child(theme_node, letter)
+        self.path.append(cell)
+        self._nodes.append((node, theme_node))
+        return True
+
+    def alive(self) -> bool:
+        """
+        Return whether the letters traced so far start a word.
+
+        Returns
+        -------
+        bool
+            True if some dictionary or theme word starts with the traced letters.
+
+        Examples
+        --------
+        >>> trace.alive()
+        True
+
+        Notes
+        -----
+        This reads the top of the node stack.
+        """
+        return self._nodes[-1] != (MISSING, MISSING)
+
+    def word(self) -> str:
+        """
+        Return the letters traced so far.
+
+        Returns
+        -------
+        str
+            The letters.
+
+        Examples
+        --------
+        >>> trace.word()
+        'pe'
+
+        Notes
+        -----
+        This is for showing the word while it is traced.
+        """
+        return self.board.word_at(tuple(self.path))
+
+    def finish(self) -> str:
+        """
+        Check the traced path and start a new one.
+
+        Returns
+        -------
+        str
+            The result of ``StrandsBoard.check``.
+
+        Examples
+        --------
+        >>> trace.finish()
+        'theme'
+
+        Notes
+        -----
+        This is called when the drag is released.
+        """
+        result = self.board.check(tuple(self.path))
+        self.path = []
+        self._nodes = [(ROOT, ROOT)]
+        return result
@@ -1,8 +1,19 @@
 """strands.py: A game of Strands, inheriting from the Game class."""
 
+import random
+from typing import cast
+
+from ...config.constants import Constants
 from ...config.dialogue_en import DialogueEn
+from ...config.paths import Paths
+from ...file_interaction.word_cache import load_words
 from ...logs.setup_logging import setup_logging
+from ..daily_scheduler import DailyCalendar
 from ..game_infrastructure import Game
+from ..puzzle_pool import PuzzleSource
+from .board import StrandsBoard, Trace
+from .generator import StrandsGenerator, read_themes
+from .trie import Trie
 
 strands_logger = setup_logging()
 
@@ -11,26 +22,64 @@ class Strands(Game):
     """
     A game of Strands.
 
+    Attributes
+    ----------
+    themes : dict[str, list[str]]
+        The words of every theme.
+    dictionary : Trie
+        The words that count towards hints.
+    pool : PuzzleSource | None
+        The pool of pre-generated boards to draw from.
+    generator : StrandsGenerator
+        The generator used when the pool has no board.
+    board : StrandsBoard | None
+        The current board.
+    trace : Trace | None
+        The path being traced on the current board.
+
+    Methods
+    -------
+    play() -> None:
+        Generate a board and play the game.
+
+    Examples
+    --------
+    >>> strands = Strands(read_themes())
+    >>> strands.play()
+
     Notes
     -----
     This class represents the Strands game.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        themes: dict[str, list[str]],
+        dictionary: Trie | None = None,
+        pool: PuzzleSource | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
         """
         Initialise the Strands game.
 
+        Parameters
+        ----------
+        themes : dict[str, list[str]]
+            The words of every theme.
+        dictionary : Trie | None, optional
+            The words that count towards hints, by default only the theme words.
+        pool : PuzzleSource | None, optional
+            The pool of pre-generated boards to draw from, by default None.
+        rng : random.Random | None, optional
+            The random number generator for generation, by default a new unseeded one.
+
         Examples
         --------
-        >>> strands = Strands(
-        ...     "Strands",
-        ...     "This is a game of Strands.",
-        ...     "Instructions for the game."
-        ... )
+        >>> strands = Strands(read_themes(), Trie(words), PuzzlePool("strands"))
 
         Notes
         -----
-        This class initialises the Strands game.
+        No board is generated until the game is played.
         """
         super().__init__(
             DialogueEn.STRANDS_NAME,
@@ -38,4 +87,86 @@ class Strands(Game):
             DialogueEn.STRANDS_INSTRUCTIONS,
         )
 
-        # TODO: Implement the Strands game.
+        self.themes = themes
+        self.dictionary = dictionary if dictionary is not None else Trie()
+        self.pool = pool
+        self.generator = StrandsGenerator(themes, rng=rng, dictionary=self.dictionary)
+        self.board: StrandsBoard | None = None
+        self.trace: Trace | None = None
+
+    def _generate(self) -> None:
+        """
+        Generate a Strands board.
+
+        Examples
+        --------
+        >>> strands._generate()
+
+        Notes
+        -----
+        A board is drawn from the pool when one is available, and generated
+        otherwise.
+        """
+        record = self.pool.draw() if self.pool is not None else None
+        if record is not None:
+            words = cast(dict[str, list[list[int]]], record["words"])
+            paths = {
+                word: tuple((row, column) for row, column in cells) for word, cells in words.items()
+            }
+            letters = [list(row) for row in cast(list[str], record["letters"])]
+            self.board = StrandsBoard(str(record["theme"]), letters, paths, self.dictionary)
+        else:
+            self.board = self.generator.generate()
+        self.trace = Trace(self.board)
+
+        strands_logger.info(
+            f"Generated a Strands board of {len(self.board.words)} words: {self.board.theme}."
+        )
+
+    def play(self) -> None:
+        """
+        Generate a board and play the game.
+
+        Examples
+        --------
+        >>> strands.play()
+
+        Notes
+        -----
+        The board is generated on demand, in well under a second.
+        """
+        self._generate()
+        super().play()
+
+    # TODO: Implement the GUI for the Strands game.
+
+
+def create_strands() -> Strands | None:
+    """
+    Create a Strands game with the bundled themes, dictionary and daily calendar.
+
+    Returns
+    -------
+    Strands | None
+        The game, or None if the themes file does not exist.
+
+    Examples
+    --------
+    >>> strands = create_strands()
+
+    Notes
+    -----
+    This is the game's entry point in the game registry. Dictionary words
+    shorter than ``Constants.STRANDS_MIN_WORD_LENGTH`` are left out of the trie.
+    Theme words are not added to it, since every board keeps its own theme
+    words in ``StrandsBoard.theme_trie``.
+    """
+    themes = read_themes()
+    if themes is None:
+        return None
+
+    store = load_words(Paths.WORDS)
+    dictionary = Trie(
+        word for word in store or () if len(word) >= Constants.STRANDS_MIN_WORD_LENGTH
+    )
+    return Strands(themes, dictionary, DailyCalendar("strands"))
@@ -0,0 +1,239 @@
+"""trie.py: A prefix trie of words, for searching letter grids one letter at a time."""
+
+from typing import Iterable
+
+from ...logs.setup_logging import setup_logging
+
+trie_logger = setup_logging()
+
+ROOT = 0  # the node of the empty prefix
+MISSING = -1  # returned by ``child`` when no word continues with a letter
+
+
+class Trie:
+    """
+    A prefix trie of words, stored as flat lists indexed by node.
+
+    Attributes
+    ----------
+    children : list[dict[str, int]]
+        The child node of every node, by letter.
+    terminal : bytearray
+        1 for every node that ends a word, otherwise 0.
+
+    Methods
+    -------
+    add(word: str) -> None:
+        Add a word.
+    child(node: int, letter: str) -> int:
+        Return the node after following a letter.
+    walk(letters: Iterable[str], node: int = ROOT) -> int:
+        Return the node after following several letters.
+    is_word(node: int) -> bool:
+        Return whether a node ends a word.
+
+    Examples
+    --------
+    >>> trie = Trie(["crane", "crate"])
+    >>> "crane" in trie
+    True
+    >>> trie.walk("cra") != MISSING
+    True
+    >>> trie.walk("cro")
+    -1
+
+    Notes
+    -----
+    A search over a grid keeps the node of the letters traced so far and
+    follows one more letter per step, so a dead prefix is dropped as soon as
+    its last letter is read, without looking at any word. Nodes are plain
+    integers into shared lists rather than objects, which keeps a trie of a
+    few thousand words to one dict per node and makes a search's state a
+    single integer.
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        """
+        Initialise the trie.
+
+        Parameters
+        ----------
+        words : Iterable[str], optional
+            The words to add, by default none.
+
+        Examples
+        --------
+        >>> trie = Trie(["crane", "slate"])
+
+        Notes
+        -----
+        Words are lowercased, and empty words are ignored.
+        """
+        self.children: list[dict[str, int]] = [{}]
+        self.terminal = bytearray(1)
+        self._count = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        """
+        Add a word.
+
+        Parameters
+        ----------
+        word : str
+            The word.
+
+        Examples
+        --------
+        >>> trie.add("trace")
+
+        Notes
+        -----
+        Adding a word twice has no effect.
+        """
+        word = word.strip().lower()
+        if not word:
+            return
+
+        node = ROOT
+        for letter in word:
+            next_node = self.children[node].get(letter)
+            if next_node is None:
+                next_node = len(self.children)
+                self.children[node][letter] = next_node
+                self.children.append({})
+                self.terminal.append(0)
+            node = next_node
+
+        if not self.terminal[node]:
+            self.terminal[node] = 1
+            self._count += 1
+
+    def child(self, node: int, letter: str) -> int:
+        """
+        Return the node after following a letter.
+
+        Parameters
+        ----------
+        node : int
+            The node of the letters so far.
+        letter : str
+            The next letter.
+
+        Returns
+        -------
+        int
+            The node, or ``MISSING`` if no word continues this way.
+
+        Examples
+        --------
+        >>> trie.child(ROOT, "c")
+        1
+
+        Notes
+        -----
+        This is a single dict lookup.
+        """
+        return self.children[node].get(letter, MISSING)
+
+    def walk(self, letters: Iterable[str], node: int = ROOT) -> int:
+        """
+        Return the node after following several letters.
+
+        Parameters
+        ----------
+        letters : Iterable[str]
+            The letters to follow.
+        node : int, optional
+            The node to start from, by default ``ROOT``.
+
+        Returns
+        -------
+        int
+            The node, or ``MISSING`` if no word starts with the letters.
+
+        Examples
+        --------
+        >>> trie.walk("cra")
+        3
+
+        Notes
+        -----
+        Stops at the first letter no word continues with.
+        """
+        for letter in letters:
+            node = self.children[node].get(letter, MISSING)
+            if node == MISSING:
+                break
+        return node
+
+    def is_word(self, node: int) -> bool:
+        """
+        Return whether a node ends a word.
+
+        Parameters
+        ----------
+        node : int
+            The node.
+
+        Returns
+        -------
+        bool
+            True if the letters leading to the node are a word.
+
+        Examples
+        --------
+        >>> trie.is_word(trie.walk("crane"))
+        True
+
+        Notes
+        -----
+        ``MISSING`` is never a word.
+        """
+        return node != MISSING and bool(self.terminal[node])
+
+    def __contains__(self, word: object) -> bool:
+        """
+        Return whether a word is in the trie.
+
+        Parameters
+        ----------
+        word : object
+            The word.
+
+        Returns
+        -------
+        bool
+            True if the word was added.
+
+        Examples
+        --------
+        >>> "crane" in trie
+        True
+
+        Notes
+        -----
+        Matching ignores case.
+        """
+        return isinstance(word, str) and self.is_word(self.walk(word.lower()))
+
+    def __len__(self) -> int:
+        """
+        Return the number of words in the trie.
+
+        Returns
+        -------
+        int
+            The number of distinct words.
+
+        Examples
+        --------
+        >>> len(Trie(["crane", "crane"]))
+        1
+
+        Notes
+        -----
+        This does not count prefixes.
+        """
+        return self._count
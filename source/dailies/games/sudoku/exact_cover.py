@@ -0,0 +1,375 @@
+"""exact_cover.py: A dancing links (DLX) exact cover solver for n²×n² Sudoku grids."""
+
+import random
+from math import isqrt
+
+import numpy as np
+
+from ...logs.setup_logging import setup_logging
+
+exact_cover_logger = setup_logging()
+
+
+class DancingLinksSolver:
+    """
+    A Sudoku solver using Knuth's Algorithm X with dancing links.
+
+    Attributes
+    ----------
+    size : int
+        The size of the Sudoku grid.
+    box_size : int
+        The size of a single box within the grid.
+    left, right, up, down : list[int]
+        The links of every node, where node 0 is the root and nodes
+        ``1..column_count`` are the column headers.
+    column : list[int]
+        The column header of every node.
+    column_size : list[int]
+        The number of rows left in every column.
+    row_of : list[int]
+        The candidate (row, column, digit) index of every node.
+    row_nodes : list[int]
+        The first node of every candidate.
+    limit_reached : bool
+        Whether the last search stopped early because of its node limit.
+
+    Methods
+    -------
+    solve(
+        grid: np.ndarray,
+        max_solutions: int = 2,
+        rng: random.Random | None = None,
+        node_limit: int | None = None,
+    ) -> list[np.ndarray]:
+        Solve the Sudoku grid.
+
+    Examples
+    --------
+    >>> solver = DancingLinksSolver(16)
+    >>> solver.solve(grid)
+
+    Notes
+    -----
+    Sudoku is encoded as an exact cover problem with one row per candidate
+    (cell, digit) and four constraint columns per row: the cell is filled, and
+    the digit appears once in its row, column and box. The link structure is
+    built once per grid size. Solving covers the givens, searches, then
+    uncovers everything in reverse order, which restores the structure exactly,
+    so repeated uniqueness checks never rebuild it.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Initialise the solver.
+
+        Parameters
+        ----------
+        size : int
+            The size of the Sudoku grid.
+
+        Raises
+        ------
+        ValueError
+            If the size is not a positive square number.
+
+        Examples
+        --------
+        >>> solver = DancingLinksSolver(16)
+
+        Notes
+        -----
+        This method builds the full link structure for an empty grid.
+        """
+        box_size = isqrt(size) if size > 0 else 0
+        if box_size == 0 or box_size * box_size != size:
+            raise ValueError(f"Invalid Sudoku size: {size}. The size must be a square number.")
+
+        self.size = size
+        self.box_size = box_size
+
+        cells = size * size
+        column_count = 4 * cells
+        headers = column_count + 1
+        self.left = [index - 1 for index in range(headers)]
+        self.right = [index + 1 for index in range(headers)]
+        self.left[0], self.right[column_count] = column_count, 0
+        self.up = list(range(headers))
+        self.down = list(range(headers))
+        self.column = list(range(headers))
+        self.column_size = [0] * headers
+        self.row_of = [-1] * headers
+        self.row_nodes = [0] * (cells * size)
+        self.limit_reached = False
+        self._nodes_left = -1
+
+        for i in range(size):
+            for j in range(size):
+                box = (i // box_size) * box_size + j // box_size
+                for digit in range(size):
+                    candidate = (i * size + j) * size + digit
+                    constraint_columns = (
+                        1 + i * size + j,
+                        1 + cells + i * size + digit,
+                        1 + 2 * cells + j * size + digit,
+                        1 + 3 * cells + box * size + digit,
+                    )
+                    first = len(self.column)
+                    for offset, header in enumerate(constraint_columns):
+                        node = first + offset
+                        self.column.append(header)
+                        self.row_of.append(candidate)
+                        self.left.append(first + (offset - 1) % 4)
+                        self.right.append(first + (offset + 1) % 4)
+                        self.up.append(self.up[header])
+                        self.down.append(header)
+                        self.down[self.up[header]] = node
+                        self.up[header] = node
+                        self.column_size[header] += 1
+                    self.row_nodes[candidate] = first
+
+    def _cover(self, header: int) -> None:
+        """
+        Remove a column and every row that intersects it.
+
+        Parameters
+        ----------
+        header : int
+            The column header node.
+
+        Examples
+        --------
+        >>> solver._cover(1)
+
+        Notes
+        -----
+        This is the "dancing" half of dancing links; ``_uncover`` undoes it.
+        """
+        left, right, up, down = self.left, self.right, self.up, self.down
+        column, column_size = self.column, self.column_size
+
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        row = down[header]
+        while row != header:
+            node = right[row]
+            while node != row:
+                down[up[node]] = down[node]
+                up[down[node]] = up[node]
+                column_size[column[node]] -= 1
+                node = right[node]
+            row = down[row]
+
+    def _uncover(self, header: int) -> None:
+        """
+        Restore a column removed by ``_cover``.
+
+        Parameters
+        ----------
+        header : int
+            The column header node.
+
+        Examples
+        --------
+        >>> solver._uncover(1)
+
+        Notes
+        -----
+        Links are restored in exactly the reverse order they were removed.
+        """
+        left, right, up, down = self.left, self.right, self.up, self.down
+        column, column_size = self.column, self.column_size
+
+        row = up[header]
+        while row != header:
+            node = left[row]
+            while node != row:
+                column_size[column[node]] += 1
+                down[up[node]] = node
+                up[down[node]] = node
+                node = left[node]
+            row = up[row]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    def _select(self, row: int) -> None:
+        """
+        Cover every other column of a chosen row.
+
+        Parameters
+        ----------
+        row : int
+            A node in the chosen row, whose own column is already covered.
+
+        Examples
+        --------
+        >>> solver._select(node)
+
+        Notes
+        -----
+        This method is undone by ``_deselect``.
+        """
+        node = self.right[row]
+        while node != row:
+            self._cover(self.column[node])
+            node = self.right[node]
+
+    def _deselect(self, row: int) -> None:
+        """
+        Uncover every other column of a chosen row.
+
+        Parameters
+        ----------
+        row : int
+            A node in the chosen row.
+
+        Examples
+        --------
+        >>> solver._deselect(node)
+
+        Notes
+        -----
+        This method undoes ``_select``.
+        """
+        node = self.left[row]
+        while node != row:
+            self._uncover(self.column[node])
+            node = self.left[node]
+
+    def solve(
+        self,
+        grid: np.ndarray,
+        max_solutions: int = 2,
+        rng: random.Random | None = None,
+        node_limit: int | None = None,
+    ) -> list[np.ndarray]:
+        """
+        Solve the Sudoku grid.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The Sudoku grid to solve, with 0 representing an empty cell.
+        max_solutions : int, optional
+            The number of solutions after which to stop searching, by default 2.
+        rng : random.Random | None, optional
+            The random number generator used to shuffle the order in which
+            candidates are tried, by default None.
+        node_limit : int | None, optional
+            The number of search nodes after which to give up, by default None
+            (no limit). ``limit_reached`` records whether this happened.
+
+        Returns
+        -------
+        list[np.ndarray]
+            The solutions found, at most ``max_solutions`` of them.
+
+        Examples
+        --------
+        >>> solver.solve(grid)
+        [array([[ 7, 12,  1, ...]])]
+
+        Notes
+        -----
+        This method has the same contract as ``SudokuSolver.solve``.
+        """
+        self.limit_reached = False
+        self._nodes_left = node_limit if node_limit is not None else -1
+
+        size = self.size
+        cells = [int(value) for value in np.asarray(grid).reshape(-1)]
+        covered: set[int] = set()
+        given_rows: list[int] = []
+        consistent = True
+
+        for index, value in enumerate(cells):
+            if value == 0:
+                continue
+            row = self.row_nodes[index * size + value - 1]
+            headers = [self.column[row + offset] for offset in range(4)]
+            if covered.intersection(headers):
+                consistent = False
+                break
+            covered.update(headers)
+            self._cover(headers[0])
+            self._select(row)
+            given_rows.append(row)
+
+        solutions: list[np.ndarray] = []
+        if consistent:
+            self._search(cells, solutions, max_solutions, rng)
+
+        for row in reversed(given_rows):
+            self._deselect(row)
+            self._uncover(self.column[row])
+
+        return solutions
+
+    def _search(
+        self,
+        cells: list[int],
+        solutions: list[np.ndarray],
+        max_solutions: int,
+        rng: random.Random | None,
+    ) -> None:
+        """
+        Search for exact covers, branching on the column with the fewest rows.
+
+        Parameters
+        ----------
+        cells : list[int]
+            The flat list of cell values, filled in as rows are chosen.
+        solutions : list[np.ndarray]
+            The list of solutions found so far.
+        max_solutions : int
+            The number of solutions after which to stop searching.
+        rng : random.Random | None
+            The random number generator used to order candidates.
+
+        Examples
+        --------
+        >>> solver._search(cells, solutions, 2, None)
+
+        Notes
+        -----
+        The link structure is always restored before this method returns.
+        """
+        if self._nodes_left == 0:
+            self.limit_reached = True
+            return
+        self._nodes_left -= 1
+
+        right, column_size = self.right, self.column_size
+
+        header = right[0]
+        if header == 0:
+            solutions.append(np.array(cells, dtype=int).reshape(self.size, self.size))
+            return
+
+        best, best_size = header, column_size[header]
+        while header != 0 and best_size > 1:
+            if column_size[header] < best_size:
+                best, best_size = header, column_size[header]
+            header = right[header]
+        if best_size == 0:
+            return
+
+        rows = []
+        row = self.down[best]
+        while row != best:
+            rows.append(row)
+            row = self.down[row]
+        if rng is not None:
+            rng.shuffle(rows)
+
+        self._cover(best)
+        for row in rows:
+            candidate = self.row_of[row]
+            cells[candidate // self.size] = candidate % self.size + 1
+            self._select(row)
+            self._search(cells, solutions, max_solutions, rng)
+            self._deselect(row)
+            cells[candidate // self.size] = 0
+            if len(solutions) >= max_solutions or self.limit_reached:
+                break
+        self._uncover(best)
@@ -0,0 +1,473 @@
+"""generator.py: A constructive generator for Sudoku puzzles with unique solutions."""
+
+import random
+
+import numpy as np
+
+from ...config.constants import Constants
+from ...logs.setup_logging import setup_logging
+from .grader import DIFFICULTIES, SudokuGrader
+from .solver import SudokuSolver
+
+generator_logger = setup_logging()
+
+
+class SudokuGenerator:
+    """
+    A generator for Sudoku puzzles with unique solutions.
+
+    Attributes
+    ----------
+    size : int
+        The size of the Sudoku grid.
+    solver : SudokuSolver
+        The solver used to fill standard grids and check uniqueness.
+    exact : bool
+        Whether removals that cannot be proven unique locally are checked
+        with a full search, which is only done below Constants.SUDOKU_GIANT_SIZE.
+    peers : list[tuple[int, ...]]
+        The flat indices of the cells sharing a row, column or box with
+        every flat cell index.
+    grader : SudokuGrader
+        The grader used to keep puzzles within a difficulty band.
+    difficulties : tuple[str, ...]
+        The difficulty bands that puzzles of this size can reach.
+    rng : random.Random
+        The random number generator used for every random choice.
+
+    Methods
+    -------
+    generate_solution() -> np.ndarray:
+        Generate a random, fully solved grid.
+    remove_clues(
+        solution: np.ndarray,
+        clues_to_remove: int,
+        max_difficulty: str | None = None,
+    ) -> np.ndarray:
+        Remove clues from a solved grid while keeping the solution unique.
+    generate(
+        percent_to_remove: float,
+        difficulty: str | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        Generate a puzzle and its solution.
+
+    Examples
+    --------
+    >>> generator = SudokuGenerator(9, random.Random(42))
+    >>> puzzle, solution = generator.generate(0.6)
+
+    Notes
+    -----
+    A full solution is built once, so it can never dead-end into an invalid
+    grid. Clues are then removed one at a time in a random order, and a
+    removal is undone if the puzzle stops being unique. This takes at most
+    one uniqueness check per cell, rather than an unbounded number of
+    full-grid retries. When a difficulty is requested, removals that would
+    push the puzzle beyond it are undone in the same way.
+
+    Since the solution is known, a removal keeps the puzzle unique exactly
+    when the emptied cell cannot take any other digit. Each other digit is
+    usually refuted within a few placements of naked and hidden singles
+    around the cell, so most checks never run a full search. On giant grids
+    a removal is only kept if this local proof succeeds: puzzles are always
+    unique, and a 25 × 25 puzzle is generated in well under a second, at the
+    cost of slightly fewer removed clues.
+    """
+
+    def __init__(self, size: int, rng: random.Random | None = None) -> None:
+        """
+        Initialise the generator.
+
+        Parameters
+        ----------
+        size : int
+            The size of the Sudoku grid.
+        rng : random.Random | None, optional
+            The random number generator to use, by default a new unseeded one.
+
+        Examples
+        --------
+        >>> generator = SudokuGenerator(9)
+
+        Notes
+        -----
+        Passing a seeded ``rng`` makes generation reproducible. Only 9 × 9
+        puzzles ever need more than singles: smaller grids are too small for
+        the other techniques, and giant grids keep only clues whose removal
+        singles can prove, so both only reach the easy band.
+        """
+        self.size = size
+        self.solver = SudokuSolver(size)
+        self.exact = size < Constants.SUDOKU_GIANT_SIZE
+        self.peers: list[tuple[int, ...]] = []
+        for index, (row, column, box) in enumerate(self.solver.cell_units):
+            peers = set(self.solver.row_units[row])
+            peers.update(self.solver.column_units[column], self.solver.box_units[box])
+            peers.discard(index)
+            self.peers.append(tuple(sorted(peers)))
+        self.grader = SudokuGrader(size)
+        self.difficulties = DIFFICULTIES if size == Constants.SUDOKU_SIZE else DIFFICULTIES[:1]
+        self.rng = rng if rng is not None else random.Random()
+
+    def generate_solution(self) -> np.ndarray:
+        """
+        Generate a random, fully solved grid.
+
+        Returns
+        -------
+        np.ndarray
+            The solved grid.
+
+        Examples
+        --------
+        >>> generator.generate_solution()
+        array([[4, 9, 1, ...]])
+
+        Notes
+        -----
+        Standard grids are filled by solving an empty grid with the
+        candidates of every branch tried in a random order, stopping at the
+        first solution found. A randomised search on a giant grid can stall
+        for seconds, so giant grids instead shuffle a patterned solution:
+        digits are relabelled, rows and columns are shuffled within their
+        bands and stacks, the bands and stacks themselves are shuffled, and
+        the grid may be transposed. Every step keeps the grid valid.
+        """
+        if self.exact:
+            empty = np.zeros((self.size, self.size), dtype=int)
+            return self.solver.solve(empty, max_solutions=1, rng=self.rng)[0]
+
+        box_size = self.solver.box_size
+
+        def shuffled_lines() -> list[int]:
+            bands = list(range(box_size))
+            self.rng.shuffle(bands)
+            lines: list[int] = []
+            for band in bands:
+                offsets = list(range(box_size))
+                self.rng.shuffle(offsets)
+                lines.extend(band * box_size + offset for offset in offsets)
+            return lines
+
+        rows, columns = shuffled_lines(), shuffled_lines()
+        digits = list(range(1, self.size + 1))
+        self.rng.shuffle(digits)
+        solution = np.array(
+            [
+                [
+                    digits[(box_size * (row % box_size) + row // box_size + column) % self.size]
+                    for column in columns
+                ]
+                for row in rows
+            ],
+            dtype=int,
+        )
+        return solution.T.copy() if self.rng.random() < 0.5 else solution
+
+    def _refute(
+        self,
+        cells: list[int],
+        rows: list[int],
+        columns: list[int],
+        boxes: list[int],
+        index: int,
+        bit: int,
+    ) -> bool:
+        """
+        Check whether placing a digit in an empty cell leads to a contradiction.
+
+        Parameters
+        ----------
+        cells : list[int]
+            The flat list of cell values, with 0 for an empty cell.
+        rows : list[int]
+            The placed digits of each row.
+        columns : list[int]
+            The placed digits of each column.
+        boxes : list[int]
+            The placed digits of each box.
+        index : int
+            The flat index of the empty cell.
+        bit : int
+            The bitmask of the digit to place.
+
+        Returns
+        -------
+        bool
+            True if the digit is proven impossible, False if no contradiction
+            was found within Constants.SUDOKU_REFUTATION_LIMIT placements.
+
+        Examples
+        --------
+        >>> generator._refute(cells, rows, columns, boxes, 0, 0b100)
+        True
+
+        Notes
+        -----
+        Placing a digit only changes the candidates of its peers, so only
+        those are checked for naked singles, and only the placed cell's own
+        units for hidden singles. The state lists are not modified.
+        """
+        full_mask = self.solver.full_mask
+        cell_units = self.solver.cell_units
+        rows, columns, boxes = rows.copy(), columns.copy(), boxes.copy()
+        placed: dict[int, int] = {}
+        pending = [(index, bit)]
+
+        while pending:
+            index, bit = pending.pop()
+            if index in placed:
+                if placed[index] != bit:
+                    return True
+                continue
+            row, column, box = cell_units[index]
+            if (rows[row] | columns[column] | boxes[box]) & bit:
+                return True
+            if len(placed) == Constants.SUDOKU_REFUTATION_LIMIT:
+                return False
+            placed[index] = bit
+            rows[row] |= bit
+            columns[column] |= bit
+            boxes[box] |= bit
+
+            # Naked singles: peers left with a single candidate.
+            for peer in self.peers[index]:
+                if cells[peer] or peer in placed:
+                    continue
+                peer_row, peer_column, peer_box = cell_units[peer]
+                mask = full_mask & ~(rows[peer_row] | columns[peer_column] | boxes[peer_box])
+                if mask == 0:
+                    return True
+                if mask & (mask - 1) == 0:
+                    pending.append((peer, mask))
+
+            # Hidden singles: digits with a single possible cell in a unit.
+            for unit, filled in (
+                (self.solver.row_units[row], rows[row]),
+                (self.solver.column_units[column], columns[column]),
+                (self.solver.box_units[box], boxes[box]),
+            ):
+                seen_once = 0
+                seen_twice = 0
+                candidates = {}
+                for cell in unit:
+                    if cells[cell] or cell in placed:
+                        continue
+                    cell_row, cell_column, cell_box = cell_units[cell]
+                    mask = full_mask & ~(rows[cell_row] | columns[cell_column] | boxes[cell_box])
+                    candidates[cell] = mask
+                    seen_twice |= seen_once & mask
+                    seen_once |= mask
+                if (seen_once | filled) != full_mask:
+                    return True
+
+                hidden = seen_once & ~seen_twice & ~filled
+                while hidden:
+                    hidden_bit = hidden & -hidden
+                    hidden ^= hidden_bit
+                    for cell, mask in candidates.items():
+                        if mask & hidden_bit:
+                            pending.append((cell, hidden_bit))
+                            break
+
+        return False
+
+    def remove_clues(
+        self,
+        solution: np.ndarray,
+        clues_to_remove: int,
+        max_difficulty: str | None = None,
+    ) -> np.ndarray:
+        """
+        Remove clues from a solved grid while keeping the solution unique.
+
+        Parameters
+        ----------
+        solution : np.ndarray
+            The solved grid.
+        clues_to_remove : int
+            The number of clues to try to remove.
+        max_difficulty : str | None, optional
+            The hardest difficulty the puzzle may reach, by default None (no limit).
+
+        Returns
+        -------
+        np.ndarray
+            The puzzle, which has exactly one solution.
+
+        Examples
+        --------
+        >>> generator.remove_clues(solution, 48)
+        array([[0, 9, 0, ...]])
+
+        Notes
+        -----
+        Every cell is tried at most once, so fewer than ``clues_to_remove``
+        clues may be removed when the puzzle cannot be made any sparser.
+        A removal is unique when every other candidate of the emptied cell
+        is refuted by ``_refute``; otherwise a full search decides, on
+        standard grids only.
+        """
+        max_level = DIFFICULTIES.index(max_difficulty) if max_difficulty else len(DIFFICULTIES)
+        full_mask = self.solver.full_mask
+        cell_units = self.solver.cell_units
+        cells = [int(value) for value in solution.reshape(-1)]
+        rows, columns, boxes = (
+            [full_mask] * self.size,
+            [full_mask] * self.size,
+            [full_mask] * self.size,
+        )
+        order = list(range(self.size * self.size))
+        self.rng.shuffle(order)
+
+        removed = 0
+        for index in order:
+            if removed >= clues_to_remove:
+                break
+
+            digit = cells[index]
+            bit = 1 << (digit - 1)
+            row, column, box = cell_units[index]
+            cells[index] = 0
+            rows[row] ^= bit
+            columns[column] ^= bit
+            boxes[box] ^= bit
+
+            alternatives = full_mask & ~(rows[row] | columns[column] | boxes[box]) & ~bit
+            unique = True
+            while alternatives and unique:
+                alternative = alternatives & -alternatives
+                alternatives ^= alternative
+                unique = self._refute(cells, rows, columns, boxes, index, alternative)
+            puzzle = np.array(cells, dtype=int).reshape(self.size, self.size)
+            if not unique and self.exact:
+                unique = len(self.solver.solve(puzzle, max_solutions=2)) == 1
+
+            if unique and (
+                max_difficulty is None
+                or DIFFICULTIES.index(self.grader.grade(puzzle).difficulty) <= max_level
+            ):
+                removed += 1
+            else:
+                cells[index] = digit
+                rows[row] |= bit
+                columns[column] |= bit
+                boxes[box] |= bit
+
+        if removed < clues_to_remove:
+            generator_logger.debug(f"Removed {removed} of {clues_to_remove} requested clues.")
+
+        return np.array(cells, dtype=int).reshape(self.size, self.size)
+
+    def generate(
+        self, percent_to_remove: float, difficulty: str | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generate a puzzle and its solution.
+
+        Parameters
+        ----------
+        percent_to_remove : float
+            The percentage of cells to remove from the solved grid.
+        difficulty : str | None, optional
+            The difficulty band to generate, one of ``DIFFICULTIES``,
+            by default None (any difficulty).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The puzzle and its unique solution.
+
+        Raises
+        ------
+        ValueError
+            If the difficulty is invalid or out of reach for this size, or no
+            puzzle in its band was found.
+
+        Examples
+        --------
+        >>> puzzle, solution = generator.generate(0.6)
+        >>> puzzle, solution = generator.generate(0.6, difficulty="hard")
+
+        Notes
+        -----
+        This method generates a solution, then removes clues from it. With a
+        difficulty, ``percent_to_remove`` is ignored and clues are removed
+        for as long as the puzzle stays within the band, which usually
+        reaches it within a few solutions. A new solution is only tried when
+        the puzzle ends up easier than the band, up to
+        Constants.SUDOKU_GRADING_ATTEMPTS times; expert, the rarest band, is
+        reached about once in every 17 solutions. A band this size cannot
+        reach is rejected before any puzzle is generated.
+        """
+        if difficulty is None:
+            solution = self.generate_solution()
+            clues_to_remove = round(self.size * self.size * percent_to_remove)
+            return self.remove_clues(solution, clues_to_remove), solution
+
+        if difficulty not in self.difficulties:
+            raise ValueError(
+                "Invalid difficulty: "
+                + difficulty
+                + f". \nValid difficulties for a {self.size} × {self.size} grid are: "
+                + ", ".join(self.difficulties)
+            )
+
+        for attempt in range(1, Constants.SUDOKU_GRADING_ATTEMPTS + 1):
+            solution = self.generate_solution()
+            puzzle = self.remove_clues(solution, self.size * self.size, max_difficulty=difficulty)
+            if self.grader.grade(puzzle).difficulty == difficulty:
+                generator_logger.debug(f"Generated a {difficulty} puzzle in {attempt} attempt(s).")
+                return puzzle, solution
+
+        raise ValueError(
+            f"No {difficulty} puzzle was found in {Constants.SUDOKU_GRADING_ATTEMPTS} attempts."
+        )
+
+
+def generate_sudoku_puzzle(
+    seed: int,
+    size: int = 9,
+    percent_to_remove: float = 0.6,
+    difficulty: str | None = None,
+) -> dict[str, object]:
+    """
+    Generate a single seeded Sudoku puzzle as a serialisable record.
+
+    Parameters
+    ----------
+    seed : int
+        The seed for the random number generator.
+    size : int, optional
+        The size of the Sudoku grid, by default 9.
+    percent_to_remove : float, optional
+        The percentage of cells to remove, by default 0.6.
+    difficulty : str | None, optional
+        The difficulty band to generate, by default None (any difficulty).
+
+    Returns
+    -------
+    dict[str, object]
+        The seed, size, puzzle, solution, difficulty and technique histogram,
+        using plain lists for the grids.
+
+    Examples
+    --------
+    >>> generate_sudoku_puzzle(42)["puzzle"][0]
+    [4, 9, 0, 0, 0, 0, 6, 0, 7]
+
+    Notes
+    -----
+    This is a module-level function so that it can be sent to worker processes.
+    """
+    generator = SudokuGenerator(size, random.Random(seed))
+    puzzle, solution = generator.generate(percent_to_remove, difficulty)
+    report = generator.grader.grade(puzzle)
+    return {
+        "seed": seed,
+        "size": size,
+        "puzzle": puzzle.tolist(),
+        "solution": solution.tolist(),
+        "difficulty": report.difficulty,
+        "techniques": dict(report.techniques),
+    }
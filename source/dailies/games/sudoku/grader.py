@@ -0,0 +1,434 @@
+"""grader.py: Grades Sudoku puzzles by the human solving techniques they require."""
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import combinations
+
+import numpy as np
+
+from ...config.constants import Constants
+from ...logs.setup_logging import setup_logging
+from .solver import SudokuSolver
+
+grader_logger = setup_logging()
+
+# Techniques from simplest to hardest, with the difficulty each one implies.
+TECHNIQUE_DIFFICULTIES = {
+    "naked_single": "easy",
+    "hidden_single": "easy",
+    "naked_pair": "medium",
+    "pointing_pair": "hard",
+    "x_wing": "expert",
+}
+DIFFICULTIES = Constants.SUDOKU_DIFFICULTIES
+
+
+@dataclass
+class GradeReport:
+    """
+    The result of grading a Sudoku puzzle.
+
+    Attributes
+    ----------
+    techniques : Counter[str]
+        How many times each technique made progress.
+    solved : bool
+        Whether the techniques alone were enough to solve the puzzle.
+    solve_time : float
+        The time taken to grade the puzzle, in seconds.
+    difficulty : str
+        The difficulty band, one of ``DIFFICULTIES``.
+
+    Examples
+    --------
+    >>> report = SudokuGrader(9).grade(puzzle)
+    >>> report.difficulty
+    'medium'
+
+    Notes
+    -----
+    A puzzle that the techniques cannot solve is graded "fiendish", since it
+    needs guessing or techniques beyond those the grader knows.
+    """
+
+    techniques: Counter = field(default_factory=Counter)
+    solved: bool = False
+    solve_time: float = 0.0
+    difficulty: str = "fiendish"
+
+
+class SudokuGrader:
+    """
+    A Sudoku solver that only uses human solving techniques.
+
+    Attributes
+    ----------
+    size : int
+        The size of the Sudoku grid.
+    box_size : int
+        The size of a single box within the grid.
+    solver : SudokuSolver
+        The bitmask solver, whose units are shared with the grader.
+    peers : list[set[int]]
+        The flat indices of the cells sharing a unit with each cell.
+
+    Methods
+    -------
+    grade(grid: np.ndarray) -> GradeReport:
+        Grade the Sudoku puzzle.
+
+    Examples
+    --------
+    >>> grader = SudokuGrader(9)
+    >>> grader.grade(puzzle).techniques
+    Counter({'naked_single': 31, 'hidden_single': 19, 'naked_pair': 2})
+
+    Notes
+    -----
+    Techniques are tried from simplest to hardest, and the grader returns to
+    the simplest technique after any progress, as a human solver would. The
+    difficulty of a puzzle is that of the hardest technique it needed.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Initialise the grader.
+
+        Parameters
+        ----------
+        size : int
+            The size of the Sudoku grid.
+
+        Examples
+        --------
+        >>> grader = SudokuGrader(9)
+
+        Notes
+        -----
+        The units of the grid are shared with the bitmask solver.
+        """
+        self.size = size
+        self.solver = SudokuSolver(size)
+        self.box_size = self.solver.box_size
+        self.peers: list[set[int]] = [set() for _ in range(size * size)]
+        for unit in self.solver.units:
+            for index in unit:
+                self.peers[index].update(unit)
+        for index, peers in enumerate(self.peers):
+            peers.discard(index)
+
+    def grade(self, grid: np.ndarray) -> GradeReport:
+        """
+        Grade the Sudoku puzzle.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The Sudoku puzzle, with 0 representing an empty cell.
+
+        Returns
+        -------
+        GradeReport
+            The technique histogram, whether it was solved, the time taken and
+            the difficulty band.
+
+        Examples
+        --------
+        >>> grader.grade(puzzle).difficulty
+        'easy'
+
+        Notes
+        -----
+        The grid passed in is never modified.
+        """
+        start_time = time.perf_counter()
+        report = GradeReport()
+
+        cells = [int(value) for value in np.asarray(grid).reshape(-1)]
+        full_mask = (1 << self.size) - 1
+        candidates = [0 if value else full_mask for value in cells]
+        for index, value in enumerate(cells):
+            if value:
+                for peer in self.peers[index]:
+                    candidates[peer] &= ~(1 << (value - 1))
+
+        techniques = (
+            ("naked_single", self._naked_single),
+            ("hidden_single", self._hidden_single),
+            ("naked_pair", self._naked_pair),
+            ("pointing_pair", self._pointing_pair),
+            ("x_wing", self._x_wing),
+        )
+
+        while 0 in cells:
+            if any(not value and not candidates[index] for index, value in enumerate(cells)):
+                break  # A cell has no candidates left, so the puzzle is invalid.
+
+            for name, technique in techniques:
+                progress = technique(cells, candidates)
+                if progress:
+                    report.techniques[name] += int(progress)
+                    break
+            else:
+                break  # No technique made progress.
+
+        report.solved = 0 not in cells
+        if report.solved:
+            hardest = max(
+                (DIFFICULTIES.index(TECHNIQUE_DIFFICULTIES[name]) for name in report.techniques),
+                default=0,
+            )
+            report.difficulty = DIFFICULTIES[hardest]
+        report.solve_time = time.perf_counter() - start_time
+        return report
+
+    def _place(self, index: int, digit: int, cells: list[int], candidates: list[int]) -> None:
+        """
+        Place a digit and remove it from the candidates of its peers.
+
+        Parameters
+        ----------
+        index : int
+            The flat index of the cell.
+        digit : int
+            The digit to place.
+        cells : list[int]
+            The flat list of cell values.
+        candidates : list[int]
+            The candidate bitmask of each cell.
+
+        Examples
+        --------
+        >>> grader._place(0, 5, cells, candidates)
+
+        Notes
+        -----
+        The state lists are modified in place.
+        """
+        cells[index] = digit
+        candidates[index] = 0
+        bit = 1 << (digit - 1)
+        for peer in self.peers[index]:
+            candidates[peer] &= ~bit
+
+    def _naked_single(self, cells: list[int], candidates: list[int]) -> int:
+        """
+        Place digits in cells that have only one candidate.
+
+        Parameters
+        ----------
+        cells : list[int]
+            The flat list of cell values.
+        candidates : list[int]
+            The candidate bitmask of each cell.
+
+        Returns
+        -------
+        int
+            The number of digits placed.
+
+        Examples
+        --------
+        >>> grader._naked_single(cells, candidates)
+        4
+
+        Notes
+        -----
+        This method sweeps the grid once, placing every naked single it finds.
+        """
+        placed = 0
+        for index, mask in enumerate(candidates):
+            if mask and mask & (mask - 1) == 0:
+                self._place(index, mask.bit_length(), cells, candidates)
+                placed += 1
+        return placed
+
+    def _hidden_single(self, cells: list[int], candidates: list[int]) -> int:
+        """
+        Place digits that have only one possible cell within a unit.
+
+        Parameters
+        ----------
+        cells : list[int]
+            The flat list of cell values.
+        candidates : list[int]
+            The candidate bitmask of each cell.
+
+        Returns
+        -------
+        int
+            The number of digits placed.
+
+        Examples
+        --------
+        >>> grader._hidden_single(cells, candidates)
+        2
+
+        Notes
+        -----
+        Each unit's candidates are folded into the digits seen once and seen
+        more than once, so every hidden single in the unit is found in one pass.
+        """
+        placed = 0
+        for unit in self.solver.units:
+            seen_once = 0
+            seen_twice = 0
+            for index in unit:
+                seen_twice |= seen_once & candidates[index]
+                seen_once |= candidates[index]
+
+            hidden = seen_once & ~seen_twice
+            while hidden:
+                bit = hidden & -hidden
+                hidden ^= bit
+                for index in unit:
+                    if candidates[index] & bit:
+                        self._place(index, bit.bit_length(), cells, candidates)
+                        placed += 1
+                        break
+        return placed
+
+    def _naked_pair(self, cells: list[int], candidates: list[int]) -> bool:
+        """
+        Eliminate candidates using two cells of a unit sharing the same two candidates.
+
+        Parameters
+        ----------
+        cells : list[int]
+            The flat list of cell values.
+        candidates : list[int]
+            The candidate bitmask of each cell.
+
+        Returns
+        -------
+        bool
+            True if any candidate was eliminated.
+
+        Examples
+        --------
+        >>> grader._naked_pair(cells, candidates)
+        False
+
+        Notes
+        -----
+        The two digits must go in the two cells, so no other cell of the unit
+        can hold either of them.
+        """
+        for unit in self.solver.units:
+            pairs = [index for index in unit if bin(candidates[index]).count("1") == 2]
+            for first, second in combinations(pairs, 2):
+                mask = candidates[first]
+                if candidates[second] != mask:
+                    continue
+                progress = False
+                for index in unit:
+                    if index not in (first, second) and candidates[index] & mask:
+                        candidates[index] &= ~mask
+                        progress = True
+                if progress:
+                    return True
+        return False
+
+    def _pointing_pair(self, cells: list[int], candidates: list[int]) -> bool:
+        """
+        Eliminate candidates using a digit confined to one line within a box.
+
+        Parameters
+        ----------
+        cells : list[int]
+            The flat list of cell values.
+        candidates : list[int]
+            The candidate bitmask of each cell.
+
+        Returns
+        -------
+        bool
+            True if any candidate was eliminated.
+
+        Examples
+        --------
+        >>> grader._pointing_pair(cells, candidates)
+        False
+
+        Notes
+        -----
+        If a digit's cells within a box all share a row or column, the digit
+        must go in that box, so it can be removed from the rest of the line.
+        """
+        for box in self.solver.box_units:
+            box_cells = set(box)
+            for digit in range(1, self.size + 1):
+                bit = 1 << (digit - 1)
+                positions = [index for index in box if candidates[index] & bit]
+                if len(positions) < 2:
+                    continue
+
+                lines = []
+                if len({index // self.size for index in positions}) == 1:
+                    lines.append(self.solver.row_units[positions[0] // self.size])
+                if len({index % self.size for index in positions}) == 1:
+                    lines.append(self.solver.column_units[positions[0] % self.size])
+
+                progress = False
+                for line in lines:
+                    for index in line:
+                        if index not in box_cells and candidates[index] & bit:
+                            candidates[index] &= ~bit
+                            progress = True
+                if progress:
+                    return True
+        return False
+
+    def _x_wing(self, cells: list[int], candidates: list[int]) -> bool:
+        """
+        Eliminate candidates using an X-wing pattern.
+
+        Parameters
+        ----------
+        cells : list[int]
+            The flat list of cell values.
+        candidates : list[int]
+            The candidate bitmask of each cell.
+
+        Returns
+        -------
+        bool
+            True if any candidate was eliminated.
+
+        Examples
+        --------
+        >>> grader._x_wing(cells, candidates)
+        False
+
+        Notes
+        -----
+        If a digit has exactly two positions in each of two rows, and those
+        positions share the same two columns, the digit can be removed from
+        the rest of both columns. The same holds with rows and columns swapped.
+        """
+        rows, columns = self.solver.row_units, self.solver.column_units
+        for bases, covers in ((rows, columns), (columns, rows)):
+            for digit in range(1, self.size + 1):
+                bit = 1 << (digit - 1)
+                seen: dict[tuple[int, int], int] = {}
+                for base_number, base in enumerate(bases):
+                    cover_numbers = tuple(
+                        position for position, index in enumerate(base) if candidates[index] & bit
+                    )
+                    if len(cover_numbers) != 2:
+                        continue
+                    if cover_numbers not in seen:
+                        seen[cover_numbers] = base_number
+                        continue
+
+                    wing_bases = {seen[cover_numbers], base_number}
+                    progress = False
+                    for cover_number in cover_numbers:
+                        for position, index in enumerate(covers[cover_number]):
+                            if position not in wing_bases and candidates[index] & bit:
+                                candidates[index] &= ~bit
+                                progress = True
+                    if progress:
+                        return True
+        return False
@@ -0,0 +1,431 @@
+"""solver.py: A bitmask-based constraint propagation solver for Sudoku grids."""
+
+import random
+from math import isqrt
+
+import numpy as np
+
+from ...config.constants import Constants
+from ...logs.setup_logging import setup_logging
+from .exact_cover import DancingLinksSolver
+
+solver_logger = setup_logging()
+
+
+class SudokuSolver:
+    """
+    A Sudoku solver using candidate bitmasks.
+
+    Attributes
+    ----------
+    size : int
+        The size of the Sudoku grid.
+    box_size : int
+        The size of a single box within the grid.
+    full_mask : int
+        The bitmask with a bit set for every digit.
+    row_units : list[list[int]]
+        The flat cell indices of every row.
+    column_units : list[list[int]]
+        The flat cell indices of every column.
+    box_units : list[list[int]]
+        The flat cell indices of every box.
+    units : list[list[int]]
+        The flat cell indices of every row, column and box.
+    cell_units : list[tuple[int, int, int]]
+        The row, column and box index of every flat cell index.
+    limit_reached : bool
+        Whether the last search stopped early because of its node limit.
+
+    Methods
+    -------
+    solve(
+        grid: np.ndarray,
+        max_solutions: int = 2,
+        rng: random.Random | None = None,
+        node_limit: int | None = None,
+    ) -> list[np.ndarray]:
+        Solve the Sudoku grid.
+
+    Examples
+    --------
+    >>> solver = SudokuSolver(9)
+    >>> solver.solve(grid)
+
+    Notes
+    -----
+    Each row, column and box keeps a bitmask of the digits placed within it,
+    where digit ``d`` is stored as bit ``d - 1``. The candidates of a cell are
+    the digits missing from all three of its masks. Naked and hidden singles
+    are placed before branching, and branching always happens on the cell with
+    the fewest candidates (minimum remaining values).
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Initialise the solver.
+
+        Parameters
+        ----------
+        size : int
+            The size of the Sudoku grid.
+
+        Raises
+        ------
+        ValueError
+            If the size is not a positive square number.
+
+        Examples
+        --------
+        >>> solver = SudokuSolver(9)
+
+        Notes
+        -----
+        This method precomputes the units of the grid so that solving does
+        not need to recompute any indices.
+        """
+        box_size = isqrt(size) if size > 0 else 0
+        if box_size == 0 or box_size * box_size != size:
+            raise ValueError(f"Invalid Sudoku size: {size}. The size must be a square number.")
+
+        self.size = size
+        self.box_size = box_size
+        self.full_mask = (1 << size) - 1
+
+        self.cell_units = [
+            (i, j, (i // box_size) * box_size + j // box_size)
+            for i in range(size)
+            for j in range(size)
+        ]
+        self.row_units = [[i * size + j for j in range(size)] for i in range(size)]
+        self.column_units = [[i * size + j for i in range(size)] for j in range(size)]
+        self.box_units: list[list[int]] = [[] for _ in range(size)]
+        for index, (_, _, box) in enumerate(self.cell_units):
+            self.box_units[box].append(index)
+        self.units = self.row_units + self.column_units + self.box_units
+        self.limit_reached = False
+        self._nodes_left = -1
+
+    def solve(
+        self,
+        grid: np.ndarray,
+        max_solutions: int = 2,
+        rng: random.Random | None = None,
+        node_limit: int | None = None,
+    ) -> list[np.ndarray]:
+        """
+        Solve the Sudoku grid.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The Sudoku grid to solve, with 0 representing an empty cell.
+        max_solutions : int, optional
+            The number of solutions after which to stop searching, by default 2.
+        rng : random.Random | None, optional
+            The random number generator used to shuffle the order in which
+            candidates are tried, by default None (ascending order).
+        node_limit : int | None, optional
+            The number of search nodes after which to give up, by default None
+            (no limit). ``limit_reached`` records whether this happened.
+
+        Returns
+        -------
+        list[np.ndarray]
+            The solutions found, at most ``max_solutions`` of them.
+
+        Examples
+        --------
+        >>> solver.solve(grid)
+        [array([[5, 3, 4, ...]])]
+
+        Notes
+        -----
+        The grid passed in is never modified. A grid whose givens already
+        break the rules of Sudoku has no solutions. Passing ``rng`` with
+        ``max_solutions=1`` turns the solver into a random grid filler.
+        """
+        self.limit_reached = False
+        self._nodes_left = node_limit if node_limit is not None else -1
+
+        cells = [int(value) for value in np.asarray(grid).reshape(-1)]
+        rows = [0] * self.size
+        columns = [0] * self.size
+        boxes = [0] * self.size
+
+        for index, value in enumerate(cells):
+            if value == 0:
+                continue
+            bit = 1 << (value - 1)
+            row, column, box = self.cell_units[index]
+            if (rows[row] | columns[column] | boxes[box]) & bit:
+                return []
+            rows[row] |= bit
+            columns[column] |= bit
+            boxes[box] |= bit
+
+        solutions: list[np.ndarray] = []
+        self._search(cells, rows, columns, boxes, solutions, max_solutions, rng)
+        return solutions
+
+    def _place(
+        self,
+        index: int,
+        bit: int,
+        cells: list[int],
+        rows: list[int],
+        columns: list[int],
+        boxes: list[int],
+    ) -> bool:
+        """
+        Place a digit in a cell.
+
+        Parameters
+        ----------
+        index : int
+            The flat index of the cell.
+        bit : int
+            The bitmask of the digit to place.
+        cells : list[int]
+            The flat list of cell values.
+        rows : list[int]
+            The placed digits of each row.
+        columns : list[int]
+            The placed digits of each column.
+        boxes : list[int]
+            The placed digits of each box.
+
+        Returns
+        -------
+        bool
+            True if the digit was placed, False if it contradicts the grid.
+
+        Examples
+        --------
+        >>> solver._place(0, 0b1, cells, rows, columns, boxes)
+        True
+
+        Notes
+        -----
+        Placing the same digit in an already filled cell is a no-op.
+        """
+        digit = bit.bit_length()
+        if cells[index]:
+            return cells[index] == digit
+
+        row, column, box = self.cell_units[index]
+        if (rows[row] | columns[column] | boxes[box]) & bit:
+            return False
+
+        cells[index] = digit
+        rows[row] |= bit
+        columns[column] |= bit
+        boxes[box] |= bit
+        return True
+
+    def _propagate(
+        self,
+        cells: list[int],
+        rows: list[int],
+        columns: list[int],
+        boxes: list[int],
+    ) -> tuple[int, int] | None:
+        """
+        Place naked and hidden singles until none remain.
+
+        Parameters
+        ----------
+        cells : list[int]
+            The flat list of cell values.
+        rows : list[int]
+            The placed digits of each row.
+        columns : list[int]
+            The placed digits of each column.
+        boxes : list[int]
+            The placed digits of each box.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            The flat index and candidate mask of the most constrained empty
+            cell, ``(-1, 0)`` if the grid is full, or None on a contradiction.
+
+        Examples
+        --------
+        >>> solver._propagate(cells, rows, columns, boxes)
+        (4, 0b100100)
+
+        Notes
+        -----
+        The state lists are modified in place.
+        """
+        full_mask = self.full_mask
+        cell_units = self.cell_units
+
+        while True:
+            candidates = [0] * len(cells)
+            best_index, best_mask, best_count = -1, 0, self.size + 1
+            placed = False
+
+            # Naked singles: cells with a single candidate.
+            for index, value in enumerate(cells):
+                if value:
+                    continue
+                row, column, box = cell_units[index]
+                mask = full_mask & ~(rows[row] | columns[column] | boxes[box])
+                if mask == 0:
+                    return None
+                if mask & (mask - 1) == 0:
+                    if not self._place(index, mask, cells, rows, columns, boxes):
+                        return None
+                    placed = True
+                    continue
+                candidates[index] = mask
+                count = bin(mask).count("1")
+                if count < best_count:
+                    best_index, best_mask, best_count = index, mask, count
+
+            if placed:
+                continue
+
+            if best_index == -1:
+                return (-1, 0)
+
+            # Hidden singles: digits with a single possible cell in a unit.
+            for unit in self.units:
+                seen_once = 0
+                seen_twice = 0
+                filled = 0
+                for index in unit:
+                    if cells[index]:
+                        filled |= 1 << (cells[index] - 1)
+                        continue
+                    mask = candidates[index]
+                    seen_twice |= seen_once & mask
+                    seen_once |= mask
+
+                if (seen_once | filled) != full_mask:
+                    return None
+
+                hidden = seen_once & ~seen_twice & ~filled
+                while hidden:
+                    bit = hidden & -hidden
+                    hidden ^= bit
+                    for index in unit:
+                        if not cells[index] and candidates[index] & bit:
+                            if not self._place(index, bit, cells, rows, columns, boxes):
+                                return None
+                            placed = True
+                            break
+
+            if not placed:
+                return (best_index, best_mask)
+
+    def _search(
+        self,
+        cells: list[int],
+        rows: list[int],
+        columns: list[int],
+        boxes: list[int],
+        solutions: list[np.ndarray],
+        max_solutions: int,
+        rng: random.Random | None = None,
+    ) -> None:
+        """
+        Search for solutions, branching on the most constrained cell.
+
+        Parameters
+        ----------
+        cells : list[int]
+            The flat list of cell values.
+        rows : list[int]
+            The placed digits of each row.
+        columns : list[int]
+            The placed digits of each column.
+        boxes : list[int]
+            The placed digits of each box.
+        solutions : list[np.ndarray]
+            The list of solutions found so far.
+        max_solutions : int
+            The number of solutions after which to stop searching.
+        rng : random.Random | None, optional
+            The random number generator used to order candidates, by default None.
+
+        Examples
+        --------
+        >>> solver._search(cells, rows, columns, boxes, solutions, 2)
+
+        Notes
+        -----
+        Each branch works on copies of the state, so no undo step is needed.
+        """
+        if len(solutions) >= max_solutions:
+            return
+        if self._nodes_left == 0:
+            self.limit_reached = True
+            return
+        self._nodes_left -= 1
+
+        result = self._propagate(cells, rows, columns, boxes)
+        if result is None:
+            return
+
+        index, mask = result
+        if index == -1:
+            solutions.append(np.array(cells, dtype=int).reshape(self.size, self.size))
+            return
+
+        bits = []
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            bits.append(bit)
+        if rng is not None:
+            rng.shuffle(bits)
+
+        for bit in bits:
+            if len(solutions) >= max_solutions or self.limit_reached:
+                return
+            branch_cells, branch_rows = cells.copy(), rows.copy()
+            branch_columns, branch_boxes = columns.copy(), boxes.copy()
+            self._place(index, bit, branch_cells, branch_rows, branch_columns, branch_boxes)
+            self._search(
+                branch_cells,
+                branch_rows,
+                branch_columns,
+                branch_boxes,
+                solutions,
+                max_solutions,
+                rng,
+            )
+
+
+def create_solver(size: int) -> SudokuSolver | DancingLinksSolver:
+    """
+    Create the fastest full-search solver for a grid size.
+
+    Parameters
+    ----------
+    size : int
+        The size of the Sudoku grid.
+
+    Returns
+    -------
+    SudokuSolver | DancingLinksSolver
+        The bitmask solver for standard grids, or the dancing links solver
+        for giant grids of at least Constants.SUDOKU_GIANT_SIZE.
+
+    Examples
+    --------
+    >>> create_solver(16)
+    <dailies.games.sudoku.exact_cover.DancingLinksSolver object at ...>
+
+    Notes
+    -----
+    On giant grids, a search has to go deep before propagation pays off, and
+    dancing links does far less work per search node there. On standard grids
+    the bitmask solver wins, as propagation alone usually finishes the grid.
+    """
+    if size >= Constants.SUDOKU_GIANT_SIZE:
+        return DancingLinksSolver(size)
+    return SudokuSolver(size)
@@ -1,12 +1,18 @@
 """sudoku.py: A game of Sudoku, inheriting from the Game class."""
 
-import random
+from math import isqrt
 
 import numpy as np
 
+from ...config.constants import Constants
 from ...config.dialogue_en import DialogueEn
 from ...logs.setup_logging import setup_logging
+from ..daily_scheduler import DailyCalendar
 from ..game_infrastructure import Game
+from ..puzzle_pool import PuzzleSource
+from .generator import SudokuGenerator
+from .grader import GradeReport
+from .solver import create_solver
 
 sudoku_logger = setup_logging()
 
@@ -20,20 +26,40 @@ class Sudoku(Game):  # TODO: Refactor the Sudoku class to be more readable and m
     This class represents the Sudoku game.
     """
 
-    def __init__(self, size: int, percent_to_remove: float) -> None:
+    def __init__(
+        self,
+        size: int,
+        percent_to_remove: float,
+        pool: PuzzleSource | None = None,
+        difficulty: str | None = None,
+    ) -> None:
         """
         Initialise the Sudoku game.
 
         Parameters
         ----------
         size : int
-            The size of the Sudoku grid.
+            The size of the Sudoku grid, which must be a square number such as
+            4, 9, 16 or 25.
         percent_to_remove : float
             The percentage of cells to remove from the Sudoku grid.
+        pool : PuzzleSource | None, optional
+            The pool of pre-generated puzzles to draw from, by default None.
+        difficulty : str | None, optional
+            The difficulty band to generate, one of ``DIFFICULTIES``, by default
+            None (use ``percent_to_remove`` only).
+
+        Raises
+        ------
+        ValueError
+            If the size is not a square number.
 
         Examples
         --------
         >>> sudoku = Sudoku(9, 0.5)
+        >>> sudoku = Sudoku(9, 0.5, PuzzlePool("sudoku"))
+        >>> sudoku = Sudoku(9, 0.5, difficulty="hard")
+        >>> sudoku = Sudoku(16, 0.6)
 
         Notes
         -----
@@ -49,6 +75,13 @@ class Sudoku(Game):  # TODO: Refactor the Sudoku class to be more readable and m
         self.size = size
         self.grid = np.zeros((size, size), dtype=int)
         self.percent_to_remove = percent_to_remove
+        self.box_size = isqrt(size)
+        self.solver = create_solver(size)
+        self.generator = SudokuGenerator(size)
+        self.solution = np.zeros((size, size), dtype=int)
+        self.pool = pool
+        self.difficulty = difficulty
+        self.grade_report: GradeReport | None = None
 
     def _valid_numbers(self, i: int, j: int) -> list[int]:
         """
@@ -76,21 +109,19 @@ class Sudoku(Game):  # TODO: Refactor the Sudoku class to be more readable and m
         This method finds the valid numbers for the given cell in the Sudoku grid.
         """
         valid_numbers = set(range(1, self.size + 1))
+        valid_numbers.difference_update(self.grid[i].tolist(), self.grid[:, j].tolist())
 
-        for k in range(self.size):
-            valid_numbers.discard(self.grid[i][k])
-            valid_numbers.discard(self.grid[k][j])
-
-        i_start, j_start = 3 * (i // 3), 3 * (j // 3)
-        for i in range(i_start, i_start + 3):
-            for j in range(j_start, j_start + 3):
-                valid_numbers.discard(self.grid[i][j])
+        i_start = self.box_size * (i // self.box_size)
+        j_start = self.box_size * (j // self.box_size)
+        box_rows = slice(i_start, i_start + self.box_size)
+        box_columns = slice(j_start, j_start + self.box_size)
+        valid_numbers.difference_update(self.grid[box_rows, box_columns].reshape(-1).tolist())
 
-        return list(valid_numbers)
+        return sorted(valid_numbers)
 
     def _fill_grid(self) -> None:
         """
-        Fills the Sudoku grid with random numbers.
+        Fills the Sudoku grid with a random, valid solution.
 
         Examples
         --------
@@ -98,11 +129,11 @@ class Sudoku(Game):  # TODO: Refactor the Sudoku class to be more readable and m
 
         Notes
         -----
-        This method fills the Sudoku grid with random numbers.
+        This method fills the Sudoku grid by randomised backtracking, so the
+        result is always a valid solution, which is also kept in ``solution``.
         """
-        for i in range(self.size):
-            for j in range(self.size):
-                self.grid[i][j] = random.sample(self._valid_numbers(i, j), 1)[0]
+        self.solution = self.generator.generate_solution()
+        self.grid = self.solution.copy()
 
     def _remove_numbers(self) -> None:
         """
@@ -114,16 +145,15 @@ class Sudoku(Game):  # TODO: Refactor the Sudoku class to be more readable and m
 
         Notes
         -----
-        This method removes numbers from the Sudoku grid.
+        This method removes numbers from the Sudoku grid one at a time, keeping
+        each removal only if the grid still has a unique solution.
         """
-        for i in range(self.size):
-            for j in range(self.size):
-                if random.random() < self.percent_to_remove:
-                    self.grid[i][j] = 0
+        clues_to_remove = round(self.size * self.size * self.percent_to_remove)
+        self.grid = self.generator.remove_clues(self.grid, clues_to_remove)
 
     def solve(self, grid: np.ndarray) -> list[np.ndarray]:
         """
-        Solves the Sudoku grid using backtracking.
+        Solves the Sudoku grid.
 
         Parameters
         ----------
@@ -133,7 +163,7 @@ class Sudoku(Game):  # TODO: Refactor the Sudoku class to be more readable and m
         Returns
         -------
         list[np.ndarray]
-            The list of solutions for the Sudoku grid.
+            The list of solutions for the Sudoku grid, stopping after two.
 
         Examples
         --------
@@ -141,67 +171,12 @@ class Sudoku(Game):  # TODO: Refactor the Sudoku class to be more readable and m
 
         Notes
         -----
-        This method solves the Sudoku grid using backtracking.
+        This method solves the Sudoku grid using the bitmask solver, which
+        propagates singles and branches on the most constrained cell first, or
+        the dancing links solver for giant grids. Two solutions are enough to
+        tell that a grid is not unique.
         """
-
-        def _find_empty() -> tuple | None:
-            """
-            Finds an empty cell in the Sudoku grid.
-
-            Returns
-            -------
-            tuple | None
-                The row and column indices of the empty cell, or None if no empty cell is found.
-
-            Examples
-            --------
-            >>> _find_empty()
-            (0, 0)
-
-            Notes
-            -----
-            This method finds an empty cell in the Sudoku grid.
-            """
-            for i in range(self.size):
-                for j in range(self.size):
-                    if grid[i][j] == 0:
-                        return i, j
-            return None
-
-        def _solve_sudoku(solutions: list[np.ndarray]) -> None:
-            """
-            Solves the Sudoku grid using backtracking.
-
-            Parameters
-            ----------
-            solutions : list[np.ndarray]
-                The list of solutions for the Sudoku grid.
-
-            Examples
-            --------
-            >>> _solve_sudoku(solutions)
-
-            Notes
-            -----
-            This method solves the Sudoku grid using backtracking.
-            """
-            if len(solutions) > 1:
-                return  # Stop when multiple solutions are found
-
-            empty = _find_empty()
-            if not empty:
-                solutions.append(grid.copy())
-                return
-
-            i, j = empty
-            for n in self._valid_numbers(i, j):
-                grid[i][j] = n
-                _solve_sudoku(solutions)
-                grid[i][j] = 0  # Backtrack
-
-        solutions: list[np.ndarray] = []
-        _solve_sudoku(solutions)
-        return solutions
+        return self.solver.solve(grid, max_solutions=2)
 
     def _is_unique(self) -> bool:
         """
@@ -238,12 +213,56 @@ class Sudoku(Game):  # TODO: Refactor the Sudoku class to be more readable and m
 
         Notes
         -----
-        This method generates a Sudoku grid.
+        This method generates a Sudoku grid with a unique solution. A puzzle
+        is drawn from the pool when one of the right size and difficulty is
+        available. Otherwise, the grid is filled once and thinned out while
+        checking uniqueness (and difficulty, if set) at each step, so no
+        full-grid retries are needed. The result is graded into
+        ``grade_report`` and its technique histogram is logged.
         """
-        unique = False
-        while unique is False:
+        record = self.pool.draw() if self.pool is not None else None
+        if (
+            record is not None
+            and record["size"] == self.size
+            and self.difficulty in (None, record.get("difficulty"))
+        ):
+            self.grid = np.array(record["puzzle"], dtype=int)
+            self.solution = np.array(record["solution"], dtype=int)
+        elif self.difficulty is not None:
+            self.grid, self.solution = self.generator.generate(
+                self.percent_to_remove, self.difficulty
+            )
+        else:
             self._fill_grid()
             self._remove_numbers()
-            unique = self._is_unique()
+
+        self.grade_report = self.generator.grader.grade(self.grid)
+        sudoku_logger.info(
+            f"Generated a {self.grade_report.difficulty} Sudoku "
+            f"(graded in {self.grade_report.solve_time * 1000:.2f} ms): "
+            f"{dict(self.grade_report.techniques)}"
+        )
 
     # TODO: Implement the GUI for the Sudoku game.
+
+
+def create_sudoku() -> Sudoku:
+    """
+    Create a Sudoku game with the default settings and daily calendar.
+
+    Returns
+    -------
+    Sudoku
+        The game.
+
+    Examples
+    --------
+    >>> sudoku = create_sudoku()
+
+    Notes
+    -----
+    This is the game's entry point in the game registry.
+    """
+    return Sudoku(
+        Constants.SUDOKU_SIZE, Constants.SUDOKU_PERCENT_TO_REMOVE, DailyCalendar("sudoku")
+    )
@@ -0,0 +1,314 @@
+"""feedback_matrix.py: A precomputed, memory-mapped guess × answer matrix of pattern codes."""
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+
+from ...config.paths import Paths
+from ...logs.setup_logging import setup_logging
+from .scoring import encode_words, pattern_dtype, score_against
+
+feedback_matrix_logger = setup_logging()
+
+
+def word_list_digest(words: list[str]) -> str:
+    """
+    Return a short digest identifying an ordered word list.
+
+    Parameters
+    ----------
+    words : list[str]
+        The words, in matrix order.
+
+    Returns
+    -------
+    str
+        The first 16 hex digits of the SHA-256 of the words.
+
+    Examples
+    --------
+    >>> word_list_digest(["crane", "slate"])
+    '4207d72cc51ad297'
+
+    Notes
+    -----
+    The digest is part of the matrix file name, so a changed word list
+    simply maps to a new file.
+    """
+    return hashlib.sha256("\n".join(words).encode("utf-8")).hexdigest()[:16]
+
+
+def build_feedback_matrix(guesses: list[str], answers: list[str]) -> np.ndarray:
+    """
+    Score every guess against every answer.
+
+    Parameters
+    ----------
+    guesses : list[str]
+        The allowed guesses.
+    answers : list[str]
+        The possible answers, all as long as the guesses.
+
+    Returns
+    -------
+    np.ndarray
+        A ``(len(guesses), len(answers))`` array of pattern codes, where
+        entry ``[i, j]`` is ``score_guess(guesses[i], answers[j])``.
+
+    Raises
+    ------
+    ValueError
+        If there are no answers, or the words are not all the same length.
+
+    Examples
+    --------
+    >>> build_feedback_matrix(["crane"], ["crane", "slate"])
+    array([[242, 180]], dtype=uint8)
+
+    Notes
+    -----
+    Each row is a single ``score_against`` call.
+    """
+    if not answers:
+        raise ValueError("Invalid answers: there must be at least one answer.")
+
+    length = len(answers[0])
+    targets = encode_words(answers, length)
+    matrix = np.empty((len(guesses), len(answers)), dtype=pattern_dtype(length))
+    for row, guess in enumerate(guesses):
+        matrix[row] = score_against(guess, targets)
+    return matrix
+
+
+class FeedbackMatrix:
+    """
+    A guess × answer matrix of pattern codes, stored on disk and memory-mapped.
+
+    Attributes
+    ----------
+    guesses : list[str]
+        The allowed guesses, in row order.
+    answers : list[str]
+        The possible answers, in column order.
+    matrix : np.ndarray
+        The read-only pattern codes, of shape ``(len(guesses), len(answers))``.
+    guess_index : dict[str, int]
+        The row of each guess.
+    answer_index : dict[str, int]
+        The column of each answer.
+
+    Methods
+    -------
+    load(guesses: list[str], answers: list[str], directory: Path = Paths.CACHE_DIR)
+        -> FeedbackMatrix:
+        Load the matrix for a pair of word lists, building it if needed.
+    path_for(guesses: list[str], answers: list[str], directory: Path = Paths.CACHE_DIR) -> Path:
+        Return the file holding the matrix for a pair of word lists.
+    pattern(guess: str, answer: str) -> int:
+        Return the pattern code of a guess against an answer.
+    row(guess: str) -> np.ndarray:
+        Return the pattern codes of a guess against every answer.
+
+    Examples
+    --------
+    >>> words = store.words_of_length(5)
+    >>> feedback = FeedbackMatrix.load(words, words)
+    >>> feedback.pattern("crane", "slate")
+    180
+
+    Notes
+    -----
+    The matrix is saved with ``np.save`` and opened with ``mmap_mode="r"``, so
+    every game process shares the same pages of the operating system's file
+    cache instead of holding its own copy, and lookups replace rescoring.
+    """
+
+    def __init__(self, guesses: list[str], answers: list[str], matrix: np.ndarray) -> None:
+        """
+        Initialise the feedback matrix.
+
+        Parameters
+        ----------
+        guesses : list[str]
+            The allowed guesses, in row order.
+        answers : list[str]
+            The possible answers, in column order.
+        matrix : np.ndarray
+            The pattern codes, of shape ``(len(guesses), len(answers))``.
+
+        Raises
+        ------
+        ValueError
+            If the matrix shape does not match the word lists.
+
+        Examples
+        --------
+        >>> feedback = FeedbackMatrix(words, words, build_feedback_matrix(words, words))
+
+        Notes
+        -----
+        Use ``load`` to share the matrix between processes.
+        """
+        if matrix.shape != (len(guesses), len(answers)):
+            raise ValueError(
+                f"Invalid feedback matrix shape: {matrix.shape}. "
+                f"Expected {(len(guesses), len(answers))}."
+            )
+
+        self.guesses = guesses
+        self.answers = answers
+        self.matrix = matrix
+        self.guess_index = {word: index for index, word in enumerate(guesses)}
+        self.answer_index = {word: index for index, word in enumerate(answers)}
+
+    @staticmethod
+    def path_for(guesses: list[str], answers: list[str], directory: Path = Paths.CACHE_DIR) -> Path:
+        """
+        Return the file holding the matrix for a pair of word lists.
+
+        Parameters
+        ----------
+        guesses : list[str]
+            The allowed guesses.
+        answers : list[str]
+            The possible answers.
+        directory : Path, optional
+            The cache directory, by default ``Paths.CACHE_DIR``.
+
+        Returns
+        -------
+        Path
+            The ``.npy`` file.
+
+        Examples
+        --------
+        >>> FeedbackMatrix.path_for(words, words)
+        PosixPath('~/.dailies/cache/feedback_5_5209b35f823f8b80_5209b35f823f8b80.npy')
+
+        Notes
+        -----
+        The name includes a digest of each word list.
+        """
+        length = len(answers[0]) if answers else 0
+        return directory / (
+            f"feedback_{length}_{word_list_digest(guesses)}_{word_list_digest(answers)}.npy"
+        )
+
+    @classmethod
+    def load(
+        cls, guesses: list[str], answers: list[str], directory: Path = Paths.CACHE_DIR
+    ) -> "FeedbackMatrix":
+        """
+        Load the matrix for a pair of word lists, building it if needed.
+
+        Parameters
+        ----------
+        guesses : list[str]
+            The allowed guesses.
+        answers : list[str]
+            The possible answers.
+        directory : Path, optional
+            The cache directory, by default ``Paths.CACHE_DIR``.
+
+        Returns
+        -------
+        FeedbackMatrix
+            The memory-mapped feedback matrix.
+
+        Examples
+        --------
+        >>> feedback = FeedbackMatrix.load(words, words)
+
+        Notes
+        -----
+        A missing or unreadable file is rebuilt and written atomically. If it
+        cannot be written, the matrix is kept in memory instead.
+        """
+        path = cls.path_for(guesses, answers, directory)
+        try:
+            matrix = np.load(path, mmap_mode="r")
+            if matrix.shape == (len(guesses), len(answers)):
+                return cls(guesses, answers, matrix)
+        except (OSError, ValueError):
+            pass
+
+        feedback_matrix_logger.info(
+            f"Building the {len(guesses)} × {len(answers)} feedback matrix..."
+        )
+        matrix = build_feedback_matrix(guesses, answers)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temporary_path, "wb") as file:
+                np.save(file, matrix)
+            os.replace(temporary_path, path)
+            feedback_matrix_logger.info(f"Wrote feedback matrix: {path}")
+            return cls(guesses, answers, np.load(path, mmap_mode="r"))
+        except OSError as error:
+            feedback_matrix_logger.warning(f"Could not write feedback matrix {path}: {error}")
+            return cls(guesses, answers, matrix)
+
+    def pattern(self, guess: str, answer: str) -> int:
+        """
+        Return the pattern code of a guess against an answer.
+
+        Parameters
+        ----------
+        guess : str
+            The guess.
+        answer : str
+            The answer.
+
+        Returns
+        -------
+        int
+            The pattern code.
+
+        Raises
+        ------
+        KeyError
+            If the guess or answer is not in the matrix.
+
+        Examples
+        --------
+        >>> feedback.pattern("crane", "slate")
+        180
+
+        Notes
+        -----
+        This is two dictionary lookups and one array read.
+        """
+        return int(self.matrix[self.guess_index[guess], self.answer_index[answer]])
+
+    def row(self, guess: str) -> np.ndarray:
+        """
+        Return the pattern codes of a guess against every answer.
+
+        Parameters
+        ----------
+        guess : str
+            The guess.
+
+        Returns
+        -------
+        np.ndarray
+            The read-only row of pattern codes, in answer order.
+
+        Raises
+        ------
+        KeyError
+            If the guess is not in the matrix.
+
+        Examples
+        --------
+        >>> feedback.row("crane")[:3]
+        memmap([242,  26,  26], dtype=uint8)
+
+        Notes
+        -----
+        The row is a view into the mapping, not a copy.
+        """
+        row: np.ndarray = self.matrix[self.guess_index[guess]]
+        return row
@@ -0,0 +1,355 @@
+"""grid_model.py: A struct-of-arrays model of a grid of letter tiles, independent of any display."""
+
+import numpy as np
+
+from ...logs.setup_logging import setup_logging
+
+grid_model_logger = setup_logging()
+
+EMPTY = -1  # the mark of a tile with no feedback yet
+
+
+class GridModel:
+    """
+    The letters, marks, layout and animation state of a grid of tiles, one array per field.
+
+    Attributes
+    ----------
+    letters : np.ndarray
+        The letter in each tile, or "" if it is empty.
+    marks : np.ndarray
+        The mark of each tile, from ``scoring``, or ``EMPTY``.
+    dirty : np.ndarray
+        Whether each tile needs redrawing.
+    x : np.ndarray
+        The left edge of each tile at rest.
+    y : np.ndarray
+        The top edge of each tile at rest.
+    offset_x : np.ndarray
+        The horizontal offset each tile is drawn at, for shaking.
+    scale_y : np.ndarray
+        The fraction of its height each tile is drawn at, for flipping.
+    drawn : np.ndarray
+        The ``(x, y, width, height)`` each tile was last drawn over, with a
+        width of 0 if it has not been drawn since the screen was cleared.
+    width : int
+        The width of every tile.
+    height : int
+        The height of every tile.
+    font_size : int
+        The size of every tile's letter.
+
+    Methods
+    -------
+    layout(
+        origin: tuple[int, int], size: tuple[int, int], spacing: tuple[int, int], font_size: int
+    ) -> None:
+        Place every tile.
+    set_tile(row: int, column: int, letter: str, mark: int = EMPTY) -> None:
+        Set the letter and mark of a tile.
+    set_row(row: int, letters: str, marks: list[int]) -> None:
+        Set the letters and marks of a row.
+    set_scale(row: int, column: int, scale: float) -> None:
+        Set the vertical scale of a tile.
+    set_row_offset(row: int, offset: float) -> None:
+        Set the horizontal offset of every tile in a row.
+    tile_rect(row: int, column: int) -> tuple[int, int, int, int]:
+        Return the area a tile is drawn over now.
+    dirty_tiles() -> np.ndarray:
+        Return the tiles that need redrawing.
+
+    Examples
+    --------
+    >>> model = GridModel(6, 5)
+    >>> model.layout((160, 60), (80, 60), (16, 12), 60)
+    >>> model.set_row(0, "crane", [2, 2, 2, 2, 2])
+
+    Notes
+    -----
+    Storing each field as one array, rather than an object per tile, keeps
+    a tile down to a few bytes, so boards of hundreds of tiles cost little,
+    and lets layout be computed for every tile at once with broadcasting.
+    """
+
+    def __init__(self, rows: int, columns: int) -> None:
+        """
+        Initialise the grid model.
+
+        Parameters
+        ----------
+        rows : int
+            The number of rows.
+        columns : int
+            The number of tiles in each row.
+
+        Raises
+        ------
+        ValueError
+            If either dimension is not positive.
+
+        Examples
+        --------
+        >>> model = GridModel(6, 5)
+
+        Notes
+        -----
+        Every tile starts empty, dirty and at the origin; call ``layout``
+        before drawing.
+        """
+        if rows < 1 or columns < 1:
+            raise ValueError(f"Invalid grid size: {rows} × {columns}. Both must be positive.")
+
+        shape = (rows, columns)
+        self.letters = np.full(shape, "", dtype="<U1")
+        self.marks = np.full(shape, EMPTY, dtype=np.int8)
+        self.dirty = np.ones(shape, dtype=bool)
+        self.x = np.zeros(shape, dtype=np.int32)
+        self.y = np.zeros(shape, dtype=np.int32)
+        self.offset_x = np.zeros(shape, dtype=np.int32)
+        self.scale_y = np.ones(shape, dtype=np.float32)
+        self.drawn = np.zeros(shape + (4,), dtype=np.int32)
+        self.width = 0
+        self.height = 0
+        self.font_size = 0
+
+    @property
+    def rows(self) -> int:
+        """
+        Return the number of rows.
+
+        Returns
+        -------
+        int
+            The number of rows.
+
+        Examples
+        --------
+        >>> model.rows
+        6
+
+        Notes
+        -----
+        This is fixed when the model is created.
+        """
+        return int(self.letters.shape[0])
+
+    @property
+    def columns(self) -> int:
+        """
+        Return the number of tiles in each row.
+
+        Returns
+        -------
+        int
+            The number of columns.
+
+        Examples
+        --------
+        >>> model.columns
+        5
+
+        Notes
+        -----
+        This is fixed when the model is created.
+        """
+        return int(self.letters.shape[1])
+
+    def layout(
+        self,
+        origin: tuple[int, int],
+        size: tuple[int, int],
+        spacing: tuple[int, int],
+        font_size: int,
+    ) -> None:
+        """
+        Place every tile.
+
+        Parameters
+        ----------
+        origin : tuple[int, int]
+            The top left corner of the first tile.
+        size : tuple[int, int]
+            The width and height of every tile.
+        spacing : tuple[int, int]
+            The horizontal and vertical gap between tiles.
+        font_size : int
+            The size of every tile's letter.
+
+        Examples
+        --------
+        >>> model.layout((160, 60), (80, 60), (16, 12), 60)
+        >>> model.x[0, :3]
+        array([160, 256, 352], dtype=int32)
+
+        Notes
+        -----
+        Positions are broadcast from one column vector and one row vector,
+        so this is linear in the number of tiles. Every tile is marked dirty
+        and forgets where it was drawn, since the screen is cleared first.
+        """
+        self.width, self.height = size
+        self.font_size = font_size
+        columns = origin[0] + np.arange(self.columns, dtype=np.int32) * (size[0] + spacing[0])
+        rows = origin[1] + np.arange(self.rows, dtype=np.int32) * (size[1] + spacing[1])
+        self.x[...] = columns[np.newaxis, :]
+        self.y[...] = rows[:, np.newaxis]
+        self.drawn[...] = 0
+        self.dirty[...] = True
+
+    def set_tile(self, row: int, column: int, letter: str, mark: int = EMPTY) -> None:
+        """
+        Set the letter and mark of a tile.
+
+        Parameters
+        ----------
+        row : int
+            The row.
+        column : int
+            The column.
+        letter : str
+            The letter, or "" to clear the tile.
+        mark : int, optional
+            The mark, by default ``EMPTY``.
+
+        Examples
+        --------
+        >>> model.set_tile(0, 0, "c")
+
+        Notes
+        -----
+        The tile is only marked dirty if something changed.
+        """
+        if self.letters[row, column] != letter or self.marks[row, column] != mark:
+            self.letters[row, column] = letter
+            self.marks[row, column] = mark
+            self.dirty[row, column] = True
+
+    def set_row(self, row: int, letters: str, marks: list[int]) -> None:
+        """
+        Set the letters and marks of a row.
+
+        Parameters
+        ----------
+        row : int
+            The row.
+        letters : str
+            One letter per column.
+        marks : list[int]
+            One mark per column.
+
+        Examples
+        --------
+        >>> model.set_row(0, "crane", [2, 2, 2, 2, 2])
+
+        Notes
+        -----
+        Only tiles that changed are marked dirty.
+        """
+        new_letters = np.array(list(letters), dtype="<U1")
+        new_marks = np.array(marks, dtype=np.int8)
+        changed = (self.letters[row] != new_letters) | (self.marks[row] != new_marks)
+        self.letters[row] = new_letters
+        self.marks[row] = new_marks
+        self.dirty[row] |= changed
+
+    def set_scale(self, row: int, column: int, scale: float) -> None:
+        """
+        Set the vertical scale of a tile.
+
+        Parameters
+        ----------
+        row : int
+            The row.
+        column : int
+            The column.
+        scale : float
+            The fraction of its height to draw the tile at.
+
+        Examples
+        --------
+        >>> model.set_scale(0, 2, 0.5)
+
+        Notes
+        -----
+        This is a tween callback, usually bound with ``functools.partial``.
+        """
+        if self.scale_y[row, column] != scale:
+            self.scale_y[row, column] = scale
+            self.dirty[row, column] = True
+
+    def set_row_offset(self, row: int, offset: float) -> None:
+        """
+        Set the horizontal offset of every tile in a row.
+
+        Parameters
+        ----------
+        row : int
+            The row.
+        offset : float
+            The offset, in pixels.
+
+        Examples
+        --------
+        >>> model.set_row_offset(1, 4.5)
+
+        Notes
+        -----
+        This is a tween callback; the offset is rounded to whole pixels.
+        """
+        offset = round(offset)
+        if self.offset_x[row, 0] != offset:
+            self.offset_x[row] = offset
+            self.dirty[row] = True
+
+    def tile_rect(self, row: int, column: int) -> tuple[int, int, int, int]:
+        """
+        Return the area a tile is drawn over now.
+
+        Parameters
+        ----------
+        row : int
+            The row.
+        column : int
+            The column.
+
+        Returns
+        -------
+        tuple[int, int, int, int]
+            The ``(x, y, width, height)`` of the tile, after its offset and scale.
+
+        Examples
+        --------
+        >>> model.tile_rect(0, 0)
+        (160, 60, 80, 60)
+
+        Notes
+        -----
+        A scaled tile stays centred on its row.
+        """
+        height = round(self.height * float(self.scale_y[row, column]))
+        return (
+            int(self.x[row, column] + self.offset_x[row, column]),
+            int(self.y[row, column]) + (self.height - height) // 2,
+            self.width,
+            height,
+        )
+
+    def dirty_tiles(self) -> np.ndarray:
+        """
+        Return the tiles that need redrawing.
+
+        Returns
+        -------
+        np.ndarray
+            An ``(n, 2)`` array of the row and column of each dirty tile.
+
+        Examples
+        --------
+        >>> model.dirty_tiles()
+        array([[0, 0]])
+
+        Notes
+        -----
+        This does not clear the flags; the renderer does, as it draws.
+        """
+        return np.argwhere(self.dirty)
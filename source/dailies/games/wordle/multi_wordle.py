@@ -0,0 +1,573 @@
+"""multi_wordle.py: Wordle on several boards at once (Quordle, Octordle, Sedecordle)."""
+
+import math
+import random
+from typing import Callable
+
+import pygame
+
+from ...config.constants import Constants
+from ...config.dialogue_en import DialogueEn
+from ...config.paths import Paths
+from ...file_interaction.word_cache import load_words
+from ...file_interaction.word_store import WordStore
+from ...logs.setup_logging import setup_logging
+from .state import MultiWordleState
+from .wordle import MARK_COLOURS, Grid, Wordle
+
+multi_wordle_logger = setup_logging()
+
+BOARD_NAMES = {
+    4: DialogueEn.QUORDLE_NAME,
+    8: DialogueEn.OCTORDLE_NAME,
+    16: DialogueEn.SEDECORDLE_NAME,
+}
+
+
+class BoardGrid(Grid):
+    """
+    One board of a multi-board game, laid out in its share of the screen.
+
+    Attributes
+    ----------
+    board : int
+        The index of the board.
+    boards : int
+        The number of boards on screen.
+
+    Methods
+    -------
+    resize() -> None:
+        Lay the board out in its share of the screen.
+
+    Examples
+    --------
+    >>> grid = BoardGrid(screen, "crane", 9, board=2, boards=4)
+
+    Notes
+    -----
+    Boards are placed left to right, ``Constants.MULTI_WORDLE_BOARD_COLUMNS``
+    to a row, between the message line and the keyboard.
+    """
+
+    def __init__(
+        self, screen: pygame.Surface, target_word: str, attempts: int, board: int, boards: int
+    ) -> None:
+        """
+        Initialise the board.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The Pygame screen.
+        target_word : str
+            The target word.
+        attempts : int
+            The number of attempts.
+        board : int
+            The index of the board.
+        boards : int
+            The number of boards on screen.
+
+        Examples
+        --------
+        >>> grid = BoardGrid(screen, "crane", 9, board=2, boards=4)
+
+        Notes
+        -----
+        The board's position is needed before the grid lays itself out.
+        """
+        self.board = board
+        self.boards = boards
+        super().__init__(screen, target_word, attempts)
+
+    def resize(self) -> None:
+        """
+        Lay the board out in its share of the screen.
+
+        Examples
+        --------
+        >>> grid.resize()
+
+        Notes
+        -----
+        Each board's tiles are as large as its share allows, with a fifth of a
+        tile between them and half a tile of margin between boards.
+        """
+        width, height = self.screen.get_size()
+        board_columns = min(self.boards, Constants.MULTI_WORDLE_BOARD_COLUMNS)
+        board_rows = math.ceil(self.boards / board_columns)
+        left = width // 20
+        top = height // 10
+        bottom = Constants.KEYBOARD_Y_DOWN * (height // Constants.KEY_HEIGHT_DIVISOR)
+        board_width = (width - 2 * left) // board_columns
+        board_height = max(1, bottom - top) // board_rows
+
+        columns, rows = self.model.columns, self.model.rows
+        tile_width = max(1, int(board_width / (columns * 1.2 + 0.3)))
+        tile_height = max(1, int(board_height / (rows * 1.2 + 0.3)))
+        spacing = (tile_width // 5, tile_height // 5)
+        used_width = columns * tile_width + (columns - 1) * spacing[0]
+        used_height = rows * tile_height + (rows - 1) * spacing[1]
+
+        column, row = self.board % board_columns, self.board // board_columns
+        self.model.layout(
+            (
+                left + column * board_width + (board_width - used_width) // 2,
+                top + row * board_height + (board_height - used_height) // 2,
+            ),
+            (tile_width, tile_height),
+            spacing,
+            tile_height // Constants.FONT_DIVISOR,
+        )
+
+
+class MultiWordle(Wordle):
+    """
+    A game of Wordle played on several boards at once, with every guess going to every board.
+
+    Attributes
+    ----------
+    boards : int
+        The number of boards.
+    multi_state : MultiWordleState | None
+        The rules and progress of the current game.
+    grids : list[BoardGrid]
+        One grid per board.
+
+    Methods
+    -------
+    hint() -> str:
+        Refuse, since the solver plays a single board.
+    _warm_solver() -> None:
+        Skip loading the hint engine, since there are no hints.
+
+    Examples
+    --------
+    >>> quordle = MultiWordle(WordStore.from_file(Paths.WORDS), boards=4)
+    >>> quordle.play()
+
+    Notes
+    -----
+    Each guess is scored against every target in one ``score_against`` call
+    by ``MultiWordleState``. Typing and feedback only touch the unsolved
+    boards, and each grid draws only its changed tiles, so a solved board
+    costs nothing to render.
+    """
+
+    def __init__(self, word_list: WordStore, boards: int = 4) -> None:
+        """
+        Initialise the game.
+
+        Parameters
+        ----------
+        word_list : WordStore
+            The store of words to choose from and validate guesses against.
+        boards : int, optional
+            The number of boards, one of ``Constants.MULTI_WORDLE_BOARDS``, by
+            default 4.
+
+        Raises
+        ------
+        ValueError
+            If the number of boards is not offered.
+
+        Examples
+        --------
+        >>> octordle = MultiWordle(words, boards=8)
+
+        Notes
+        -----
+        The game is named after its number of boards.
+        """
+        if boards not in Constants.MULTI_WORDLE_BOARDS:
+            raise ValueError(
+                f"Invalid boards: {boards}. Expected one of {Constants.MULTI_WORDLE_BOARDS}."
+            )
+
+        super().__init__(word_list)
+        self.name = BOARD_NAMES[boards]
+        self.description = DialogueEn.MULTI_WORDLE_DESCRIPTION
+        self.instructions = DialogueEn.MULTI_WORDLE_INSTRUCTIONS
+        self.boards = boards
+        self.multi_state: MultiWordleState | None = None
+        self.grids: list[BoardGrid] = []
+
+    def hint(self) -> str:
+        """
+        Refuse, since the solver plays a single board.
+
+        Returns
+        -------
+        str
+            Never returns.
+
+        Raises
+        ------
+        ValueError
+            Always.
+
+        Examples
+        --------
+        >>> quordle.hint()
+        Traceback (most recent call last):
+        ValueError: Hints are only available on a single board.
+
+        Notes
+        -----
+        Tab does nothing in a multi-board game.
+        """
+        raise ValueError("Hints are only available on a single board.")
+
+    def _warm_solver(self) -> None:
+        """
+        Skip loading the hint engine, since there are no hints.
+
+        Examples
+        --------
+        >>> quordle._warm_solver()
+
+        Notes
+        -----
+        See ``hint``.
+        """
+
+    def _new_game(self) -> None:
+        """
+        Choose a target for each board and reset the rules for a new game.
+
+        Raises
+        ------
+        ValueError
+            If there are fewer words than boards.
+
+        Examples
+        --------
+        >>> _new_game()
+
+        Notes
+        -----
+        The targets are all different.
+        """
+        words = self.word_list.words_of_length(Constants.WORDLE_WORD_LENGTH)
+        if len(words) < self.boards:
+            raise ValueError(
+                f"Invalid word list: {len(words)} words cannot fill {self.boards} boards."
+            )
+
+        self.letter_tracking = {
+            chr(i): Constants.EMPTY_COLOUR for i in range(ord("a"), ord("z") + 1)
+        }
+        self.multi_state = MultiWordleState(self.word_list, random.sample(words, self.boards))
+        self.target_word = self.multi_state.target_words[0]
+        multi_wordle_logger.debug(f"Targets: {', '.join(self.multi_state.target_words)}")
+
+    def _create_boards(self) -> None:
+        """
+        Create one grid per board for the current screen.
+
+        Raises
+        ------
+        ValueError
+            If no game has started.
+
+        Examples
+        --------
+        >>> _create_boards()
+
+        Notes
+        -----
+        Every board has as many rows as the game has attempts.
+        """
+        if self.multi_state is None:
+            raise ValueError("No game is in progress.")
+
+        self.grids = [
+            BoardGrid(self.screen, target, self.multi_state.attempts, board, self.boards)
+            for board, target in enumerate(self.multi_state.target_words)
+        ]
+
+    def _resize_boards(self) -> None:
+        """
+        Lay every board out again after the window is resized.
+
+        Examples
+        --------
+        >>> _resize_boards()
+
+        Notes
+        -----
+        The screen has already been cleared.
+        """
+        for grid in self.grids:
+            grid.screen = self.screen
+            grid.resize()
+
+    def _draw_boards(self) -> list[pygame.Rect]:
+        """
+        Draw the tiles that changed on every board.
+
+        Returns
+        -------
+        list[pygame.Rect]
+            The areas drawn.
+
+        Examples
+        --------
+        >>> _draw_boards()
+
+        Notes
+        -----
+        Boards with nothing dirty add nothing.
+        """
+        return [rect for grid in self.grids for rect in grid.draw()]
+
+    def _game_over(self) -> bool:
+        """
+        Return whether the current game is over.
+
+        Returns
+        -------
+        bool
+            True once every board is solved or the guesses have run out.
+
+        Examples
+        --------
+        >>> _game_over()
+        False
+
+        Notes
+        -----
+        The game loop exits once this is true and the animations have ended.
+        """
+        return self.multi_state is not None and self.multi_state.finished
+
+    def _game_won(self) -> bool:
+        """
+        Return whether the current game was won.
+
+        Returns
+        -------
+        bool
+            True once every board is solved.
+
+        Examples
+        --------
+        >>> _game_won()
+        False
+
+        Notes
+        -----
+        This is only meaningful once ``_game_over`` is true.
+        """
+        return self.multi_state is not None and self.multi_state.won
+
+    def _attempts_used(self) -> int | None:
+        """
+        Return the number of guesses made in the current game.
+
+        Returns
+        -------
+        int | None
+            The number of guesses, or None if no game has started.
+
+        Examples
+        --------
+        >>> _attempts_used()
+        11
+
+        Notes
+        -----
+        This is the score of a finished game.
+        """
+        return self.multi_state.current_attempt if self.multi_state is not None else None
+
+    def _update_keyboard(self) -> None:
+        """
+        Colour the keyboard from the letters guessed so far.
+
+        Examples
+        --------
+        >>> _update_keyboard()
+
+        Notes
+        -----
+        A key shows the best mark its letter has had on a board that was
+        still unsolved.
+        """
+        if self.multi_state is None:
+            return
+
+        for letter, mark in self.multi_state.letter_marks.items():
+            if letter in self.letter_tracking:
+                self.letter_tracking[letter] = MARK_COLOURS[mark]
+        self.virtual_keyboard.update_key(self.letter_tracking)
+
+    def _show_message(self, message: str) -> None:
+        """
+        Show a message at the top of the screen.
+
+        Parameters
+        ----------
+        message : str
+            The message.
+
+        Examples
+        --------
+        >>> _show_message("Invalid word")
+
+        Notes
+        -----
+        See ``Wordle._draw_text``.
+        """
+        self._draw_text(
+            message,
+            Constants.POPUP_FONT_SIZE,
+            Constants.FONT_COLOUR,
+            (self.screen.get_width() // 2, self.screen.get_height() // 20),
+        )
+
+    def _handle_keydown(self, event: pygame.event.Event, current_guess: list[str]) -> None:
+        """
+        Handle the keydown event.
+
+        Parameters
+        ----------
+        event : pygame.event.Event
+            The Pygame event.
+        current_guess : list[str]
+            The current guess.
+
+        Examples
+        --------
+        >>> _handle_keydown(event, current_guess)
+
+        Notes
+        -----
+        Letters are typed into every unsolved board, and a submitted guess
+        flips the current row of every unsolved board.
+        """
+        state = self.multi_state
+        if state is None or state.finished:
+            return
+
+        unsolved = state.unsolved()
+        if event.key == pygame.K_RETURN and len(current_guess) == state.length:
+            guess = "".join(current_guess)
+            try:
+                patterns = state.submit(guess)
+            except ValueError:
+                for board in unsolved:
+                    self.grids[board].shake_row(state.current_attempt, self.animations)
+                self._show_message("Invalid word")
+                return
+
+            on_complete: Callable[[], None] | None = self._update_keyboard
+            for board in unsolved:
+                self.grids[board].update_cell(
+                    guess, int(patterns[board]), self.animations, on_complete
+                )
+                on_complete = None
+            for grid in self.grids:
+                grid.current_attempt = state.current_attempt
+            current_guess.clear()
+
+            if state.won:
+                self._show_message(f"You Win! Solved in {state.current_attempt} guesses")
+            elif state.lost:
+                missed = [state.target_words[board] for board in state.unsolved()]
+                self._show_message(f"Game Over! You missed: {', '.join(missed)}")
+        elif event.key == pygame.K_BACKSPACE and current_guess:
+            for board in unsolved:
+                self.grids[board].set_letter(len(current_guess) - 1, "")
+            current_guess.pop()
+        elif len(current_guess) < state.length and event.unicode.isalpha():
+            for board in unsolved:
+                self.grids[board].set_letter(len(current_guess), event.unicode.lower())
+            current_guess.append(event.unicode.lower())
+
+
+def create_multi_wordle(boards: int) -> MultiWordle | None:
+    """
+    Create a multi-board Wordle game from the default word list.
+
+    Parameters
+    ----------
+    boards : int
+        The number of boards.
+
+    Returns
+    -------
+    MultiWordle | None
+        The game, or None if the word list does not exist.
+
+    Examples
+    --------
+    >>> octordle = create_multi_wordle(8)
+
+    Notes
+    -----
+    The registry uses the named wrappers below.
+    """
+    words = load_words(Paths.WORDS)
+    return MultiWordle(words, boards) if words else None
+
+
+def create_quordle() -> MultiWordle | None:
+    """
+    Create a four-board game.
+
+    Returns
+    -------
+    MultiWordle | None
+        The game, or None if the word list does not exist.
+
+    Examples
+    --------
+    >>> quordle = create_quordle()
+
+    Notes
+    -----
+    This is the game's entry point in the game registry.
+    """
+    return create_multi_wordle(4)
+
+
+def create_octordle() -> MultiWordle | None:
+    """
+    Create an eight-board game.
+
+    Returns
+    -------
+    MultiWordle | None
+        The game, or None if the word list does not exist.
+
+    Examples
+    --------
+    >>> octordle = create_octordle()
+
+    Notes
+    -----
+    This is the game's entry point in the game registry.
+    """
+    return create_multi_wordle(8)
+
+
+def create_sedecordle() -> MultiWordle | None:
+    """
+    Create a sixteen-board game.
+
+    Returns
+    -------
+    MultiWordle | None
+        The game, or None if the word list does not exist.
+
+    Examples
+    --------
+    >>> sedecordle = create_sedecordle()
+
+    Notes
+    -----
+    This is the game's entry point in the game registry.
+    """
+    return create_multi_wordle(16)
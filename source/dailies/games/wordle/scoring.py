@@ -0,0 +1,288 @@
+"""scoring.py: Wordle feedback scoring, for single guesses and for whole word arrays at once."""
+
+from typing import Iterable
+
+import numpy as np
+
+from ...logs.setup_logging import setup_logging
+
+scoring_logger = setup_logging()
+
+# Feedback marks, one base-3 digit per letter.
+MISS = 0
+PRESENT = 1
+CORRECT = 2
+
+
+def pattern_dtype(length: int) -> type[np.unsignedinteger]:
+    """
+    Return the smallest unsigned integer type that holds every pattern code.
+
+    Parameters
+    ----------
+    length : int
+        The word length.
+
+    Returns
+    -------
+    type[np.unsignedinteger]
+        ``np.uint8`` for words of up to five letters, and wider types beyond.
+
+    Examples
+    --------
+    >>> pattern_dtype(5)
+    <class 'numpy.uint8'>
+
+    Notes
+    -----
+    There are ``3 ** length`` codes, so five letters fit in a byte.
+    """
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if 3**length <= np.iinfo(dtype).max + 1:
+            return dtype
+    return np.uint64
+
+
+def encode_pattern(marks: Iterable[int]) -> int:
+    """
+    Encode per-letter marks as a pattern code.
+
+    Parameters
+    ----------
+    marks : Iterable[int]
+        The mark of each letter: ``MISS``, ``PRESENT`` or ``CORRECT``.
+
+    Returns
+    -------
+    int
+        The base-3 pattern code, with the first letter as the lowest digit.
+
+    Examples
+    --------
+    >>> encode_pattern([CORRECT, MISS, PRESENT, MISS, MISS])
+    11
+
+    Notes
+    -----
+    ``decode_pattern`` is the inverse.
+    """
+    code = 0
+    for index, mark in enumerate(marks):
+        code += mark * 3**index
+    return code
+
+
+def decode_pattern(code: int, length: int) -> list[int]:
+    """
+    Decode a pattern code into per-letter marks.
+
+    Parameters
+    ----------
+    code : int
+        The base-3 pattern code.
+    length : int
+        The word length.
+
+    Returns
+    -------
+    list[int]
+        The mark of each letter.
+
+    Examples
+    --------
+    >>> decode_pattern(11, 5)
+    [2, 0, 1, 0, 0]
+
+    Notes
+    -----
+    ``encode_pattern`` is the inverse.
+    """
+    marks = []
+    for _ in range(length):
+        code, mark = divmod(code, 3)
+        marks.append(mark)
+    return marks
+
+
+def all_correct(length: int) -> int:
+    """
+    Return the pattern code of a solved guess.
+
+    Parameters
+    ----------
+    length : int
+        The word length.
+
+    Returns
+    -------
+    int
+        The code with every letter marked ``CORRECT``.
+
+    Examples
+    --------
+    >>> all_correct(5)
+    242
+
+    Notes
+    -----
+    This is ``3 ** length - 1``.
+    """
+    return int(3**length) - 1
+
+
+def score_guess(guess: str, target: str) -> int:
+    """
+    Score a guess against a target word.
+
+    Parameters
+    ----------
+    guess : str
+        The guessed word.
+    target : str
+        The target word, of the same length.
+
+    Returns
+    -------
+    int
+        The base-3 pattern code of the feedback.
+
+    Raises
+    ------
+    ValueError
+        If the words are of different lengths.
+
+    Examples
+    --------
+    >>> decode_pattern(score_guess("speed", "abide"), 5)
+    [0, 0, 1, 0, 1]
+
+    Notes
+    -----
+    Exact matches are marked first. Each remaining guess letter, from left to
+    right, is then marked present only while unmatched copies of it remain in
+    the target, so a letter guessed twice but appearing once is marked once.
+    This runs in linear time, and is on the hot path of every simulated game,
+    so the digits are accumulated inline rather than through ``encode_pattern``.
+    """
+    if len(guess) != len(target):
+        raise ValueError(
+            f"Invalid guess: {guess}. The guess must have {len(target)} letters, not {len(guess)}."
+        )
+    if guess == target:
+        return all_correct(len(guess))
+
+    code = 0
+    unmatched: dict[str, int] = {}
+    misplaced = []
+    weight = 1
+    for guess_letter, target_letter in zip(guess, target):
+        if guess_letter == target_letter:
+            code += CORRECT * weight
+        else:
+            unmatched[target_letter] = unmatched.get(target_letter, 0) + 1
+            misplaced.append((guess_letter, weight))
+        weight *= 3
+
+    for guess_letter, weight in misplaced:
+        if unmatched.get(guess_letter, 0) > 0:
+            code += PRESENT * weight
+            unmatched[guess_letter] -= 1
+
+    return code
+
+
+def encode_words(words: Iterable[str], length: int) -> np.ndarray:
+    """
+    Encode words of one length as an array of code points.
+
+    Parameters
+    ----------
+    words : Iterable[str]
+        The words, all of ``length`` characters.
+    length : int
+        The word length.
+
+    Returns
+    -------
+    np.ndarray
+        A ``(len(words), length)`` array of ``uint32`` Unicode code points.
+
+    Raises
+    ------
+    ValueError
+        If a word is of a different length.
+
+    Examples
+    --------
+    >>> encode_words(["ab", "ba"], 2)
+    array([[97, 98],
+           [98, 97]], dtype=uint32)
+
+    Notes
+    -----
+    The words are joined and encoded as UTF-32 in one call, so this costs one
+    pass over the text rather than one array per word.
+    """
+    words = list(words)
+    for word in words:
+        if len(word) != length:
+            raise ValueError(
+                f"Invalid word: {word}. Every word must have {length} letters, not {len(word)}."
+            )
+
+    encoded = np.frombuffer("".join(words).encode("utf-32-le"), dtype="<u4")
+    return encoded.astype(np.uint32).reshape(len(words), length)
+
+
+def score_against(guess: str, targets: np.ndarray) -> np.ndarray:
+    """
+    Score one guess against many target words at once.
+
+    Parameters
+    ----------
+    guess : str
+        The guessed word.
+    targets : np.ndarray
+        The target words, as returned by ``encode_words``.
+
+    Returns
+    -------
+    np.ndarray
+        The pattern code for each target, as ``pattern_dtype(len(guess))``.
+
+    Raises
+    ------
+    ValueError
+        If the guess is not as long as the target words.
+
+    Examples
+    --------
+    >>> score_against("speed", encode_words(["abide", "speed"], 5))
+    array([ 90, 242], dtype=uint8)
+
+    Notes
+    -----
+    This follows the same rules as ``score_guess``, but each step is a
+    whole-column array operation, so the Python loops run over the letters of
+    the guess only, never over the targets.
+    """
+    length = targets.shape[1]
+    if len(guess) != length:
+        raise ValueError(
+            f"Invalid guess: {guess}. The guess must have {length} letters, not {len(guess)}."
+        )
+
+    guess_codes = encode_words([guess], length)[0]
+    correct = targets == guess_codes
+    codes = np.zeros(len(targets), dtype=np.int64)
+
+    unmatched: dict[int, np.ndarray] = {}
+    for letter in set(guess_codes.tolist()):
+        unmatched[letter] = ((targets == letter) & ~correct).sum(axis=1)
+
+    for index, letter in enumerate(guess_codes.tolist()):
+        present = ~correct[:, index] & (unmatched[letter] > 0)
+        unmatched[letter] -= present
+        codes += (CORRECT * correct[:, index] + PRESENT * present) * 3**index
+
+    return codes.astype(pattern_dtype(length))
@@ -0,0 +1,299 @@
+"""simulation.py: Headless Wordle simulation, for bot evaluation and regression testing."""
+
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Container, Sequence
+
+from ...config.constants import Constants
+from ...config.paths import Paths
+from ...file_interaction.word_cache import load_words
+from ...logs.setup_logging import setup_logging
+from .feedback_matrix import FeedbackMatrix
+from .solver import WordleSolver
+from .state import WordleState
+
+simulation_logger = setup_logging()
+
+Strategy = Callable[[WordleState], str]
+
+
+@dataclass
+class SimulationResult:
+    """
+    The outcome of a batch of simulated games.
+
+    Attributes
+    ----------
+    games : int
+        The number of games played.
+    wins : int
+        The number of games won.
+    guess_counts : Counter[int]
+        The number of games won in each number of guesses.
+    elapsed : float
+        The time taken, in seconds.
+
+    Examples
+    --------
+    >>> result = simulate(words, words, solver_strategy(solver), 1000)
+    >>> result.win_rate
+    1.0
+
+    Notes
+    -----
+    Lost games are counted in ``games`` but not in ``guess_counts``.
+    """
+
+    games: int = 0
+    wins: int = 0
+    guess_counts: Counter[int] = field(default_factory=Counter)
+    elapsed: float = 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """
+        Return the fraction of games won.
+
+        Returns
+        -------
+        float
+            The win rate, or 0 if no games were played.
+
+        Examples
+        --------
+        >>> result.win_rate
+        1.0
+
+        Notes
+        -----
+        This is ``wins / games``.
+        """
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_guesses(self) -> float:
+        """
+        Return the mean number of guesses in a won game.
+
+        Returns
+        -------
+        float
+            The mean, or 0 if no games were won.
+
+        Examples
+        --------
+        >>> result.mean_guesses
+        3.49
+
+        Notes
+        -----
+        Lost games are excluded.
+        """
+        if not self.wins:
+            return 0.0
+        return sum(guesses * count for guesses, count in self.guess_counts.items()) / self.wins
+
+    @property
+    def games_per_second(self) -> float:
+        """
+        Return the simulation throughput.
+
+        Returns
+        -------
+        float
+            The number of games played per second.
+
+        Examples
+        --------
+        >>> result.games_per_second
+        25000.0
+
+        Notes
+        -----
+        Returns infinity if the batch took no measurable time.
+        """
+        return self.games / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def random_strategy(words: Sequence[str], rng: random.Random | None = None) -> Strategy:
+    """
+    Return a strategy that guesses random words.
+
+    Parameters
+    ----------
+    words : Sequence[str]
+        The words to guess from.
+    rng : random.Random | None, optional
+        The random number generator, by default a new unseeded one.
+
+    Returns
+    -------
+    Strategy
+        The strategy.
+
+    Examples
+    --------
+    >>> simulate(words, words, random_strategy(words), 10000)
+
+    Notes
+    -----
+    This is the baseline to compare bots against, and the fastest way to
+    exercise the game rules.
+    """
+    rng = rng or random.Random()
+    return lambda state: rng.choice(words)
+
+
+def solver_strategy(solver: WordleSolver) -> Strategy:
+    """
+    Return a strategy that plays a ``WordleSolver``'s suggestions.
+
+    Parameters
+    ----------
+    solver : WordleSolver
+        The solver.
+
+    Returns
+    -------
+    Strategy
+        The strategy.
+
+    Examples
+    --------
+    >>> simulate(words, words, solver_strategy(WordleSolver(feedback)), 1000)
+
+    Notes
+    -----
+    The solver is reset at the start of each game and then fed each pattern,
+    so it is updated incrementally rather than replaying the game.
+    """
+
+    def strategy(state: WordleState) -> str:
+        if not state.guesses:
+            solver.reset()
+        else:
+            solver.update(state.guesses[-1], state.patterns[-1])
+        return solver.suggest()
+
+    return strategy
+
+
+def simulate(
+    word_list: Container[str],
+    targets: Sequence[str],
+    strategy: Strategy,
+    games: int,
+    seed: int = 0,
+    attempts: int = 6,
+) -> SimulationResult:
+    """
+    Play a batch of games without a display.
+
+    Parameters
+    ----------
+    word_list : Container[str]
+        The words that may be guessed.
+    targets : Sequence[str]
+        The words to draw targets from.
+    strategy : Strategy
+        A function from the game state to the next guess.
+    games : int
+        The number of games to play.
+    seed : int, optional
+        The seed used to draw the targets, by default 0.
+    attempts : int, optional
+        The number of guesses allowed per game, by default 6.
+
+    Returns
+    -------
+    SimulationResult
+        The outcome of the batch.
+
+    Raises
+    ------
+    ValueError
+        If the strategy makes an invalid guess.
+
+    Examples
+    --------
+    >>> simulate(words, words, random_strategy(words), 10000).games_per_second
+    60000.0
+
+    Notes
+    -----
+    The same seed always plays the same targets, so results can be compared
+    between runs and between strategies. The target generator is seeded from
+    a salted string, so it never runs in step with a strategy's own generator
+    seeded with the same number.
+    """
+    rng = random.Random(f"targets:{seed}")
+    result = SimulationResult()
+    start = time.perf_counter()
+    for _ in range(games):
+        state = WordleState(word_list, rng.choice(targets), attempts)
+        while not state.finished:
+            state.submit(strategy(state))
+
+        result.games += 1
+        if state.won:
+            result.wins += 1
+            result.guess_counts[state.current_attempt] += 1
+    result.elapsed = time.perf_counter() - start
+
+    simulation_logger.info(
+        f"Simulated {result.games} games in {result.elapsed:.2f} s "
+        f"({result.games_per_second:.0f} games/s): win rate {result.win_rate:.1%}, "
+        f"mean guesses {result.mean_guesses:.3f}."
+    )
+    return result
+
+
+def run_simulation(games: int, strategy: str = "solver", seed: int = 0) -> SimulationResult | None:
+    """
+    Simulate games on the default word list, for the ``dailies simulate`` command.
+
+    Parameters
+    ----------
+    games : int
+        The number of games to play.
+    strategy : str, optional
+        ``"solver"`` for the entropy solver or ``"random"`` for random
+        guesses, by default ``"solver"``.
+    seed : int, optional
+        The seed used to choose the target words, by default 0.
+
+    Returns
+    -------
+    SimulationResult | None
+        The outcome, or None if the word list does not exist.
+
+    Raises
+    ------
+    ValueError
+        If the strategy is not recognised.
+
+    Examples
+    --------
+    >>> run_simulation(10000, "random")
+
+    Notes
+    -----
+    Nothing here imports pygame, so this runs on machines with no display.
+    """
+    store = load_words(Paths.WORDS)
+    if store is None:
+        return None
+
+    words = store.words_of_length(Constants.WORDLE_WORD_LENGTH)
+    if strategy == "solver":
+        play = solver_strategy(WordleSolver(FeedbackMatrix.load(words, words)))
+    elif strategy == "random":
+        play = random_strategy(words, random.Random(seed))
+    else:
+        raise ValueError(f"Invalid strategy: {strategy}. Expected 'solver' or 'random'.")
+
+    result = simulate(store, words, play, games, seed)
+    simulation_logger.info(f"Guess distribution: {dict(sorted(result.guess_counts.items()))}")
+    return result
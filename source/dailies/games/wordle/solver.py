@@ -0,0 +1,235 @@
+"""solver.py: An entropy-maximising Wordle solver and hint engine."""
+
+import numpy as np
+
+from ...logs.setup_logging import setup_logging
+from .feedback_matrix import FeedbackMatrix, word_list_digest
+from .scoring import all_correct, encode_words, score_against
+
+solver_logger = setup_logging()
+
+ENTROPY_BLOCK_ROWS = 512  # guesses scored per bincount, to bound temporary memory
+SUGGESTION_CACHE_SIZE = 4096  # candidate sets remembered across solvers
+
+
+class WordleSolver:
+    """
+    A Wordle solver that suggests the guess with the most expected information.
+
+    Attributes
+    ----------
+    feedback : FeedbackMatrix
+        The guess × answer pattern codes.
+    candidates : np.ndarray
+        The answer columns still consistent with every guess so far.
+    history : list[tuple[str, int]]
+        The guesses so far and their pattern codes.
+
+    Methods
+    -------
+    reset() -> None:
+        Forget every guess, so every answer is a candidate again.
+    update(guess: str, pattern: int) -> None:
+        Remove the candidates inconsistent with a guess's feedback.
+    remaining() -> list[str]:
+        Return the answers still consistent with every guess.
+    entropies() -> np.ndarray:
+        Return the expected information of every guess, in bits.
+    suggest() -> str:
+        Suggest the next guess.
+
+    Examples
+    --------
+    >>> solver = WordleSolver(FeedbackMatrix.load(words, words))
+    >>> solver.suggest()
+    'raise'
+    >>> solver.update("raise", score_guess("raise", "crane"))
+
+    Notes
+    -----
+    Each guess splits the candidates into partitions by the pattern it would
+    produce. The suggestion maximises the entropy of that split, which is the
+    expected number of bits the feedback reveals, with ties going to guesses
+    that could themselves be the answer. All partitions are counted at once
+    with one ``np.bincount`` over a slice of the feedback matrix. Candidates
+    are filtered incrementally, and suggestions are cached by candidate set,
+    so the opening guess is only computed once per process.
+    """
+
+    _suggestion_cache: dict[tuple[tuple[str, str], bytes], str] = {}
+
+    def __init__(self, feedback: FeedbackMatrix) -> None:
+        """
+        Initialise the solver.
+
+        Parameters
+        ----------
+        feedback : FeedbackMatrix
+            The guess × answer pattern codes.
+
+        Examples
+        --------
+        >>> solver = WordleSolver(FeedbackMatrix.load(words, words))
+
+        Notes
+        -----
+        Every answer starts as a candidate.
+        """
+        self.feedback = feedback
+        self.length = len(feedback.answers[0]) if feedback.answers else 0
+        self._answer_is_guess = np.array(
+            [answer in feedback.guess_index for answer in feedback.answers], dtype=bool
+        )
+        self._cache_key = (
+            word_list_digest(feedback.guesses),
+            word_list_digest(feedback.answers),
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget every guess, so every answer is a candidate again.
+
+        Examples
+        --------
+        >>> solver.reset()
+
+        Notes
+        -----
+        The suggestion cache is kept.
+        """
+        self.candidates = np.arange(len(self.feedback.answers))
+        self.history: list[tuple[str, int]] = []
+
+    def update(self, guess: str, pattern: int) -> None:
+        """
+        Remove the candidates inconsistent with a guess's feedback.
+
+        Parameters
+        ----------
+        guess : str
+            The guess.
+        pattern : int
+            The pattern code the guess received.
+
+        Examples
+        --------
+        >>> solver.update("crane", score_guess("crane", target))
+
+        Notes
+        -----
+        Only the remaining candidates are checked, so each update is cheaper
+        than the last. Guesses missing from the matrix are scored directly.
+        """
+        if guess in self.feedback.guess_index:
+            patterns = self.feedback.row(guess)[self.candidates]
+        else:
+            remaining = encode_words(self.remaining(), self.length)
+            patterns = score_against(guess, remaining)
+
+        self.candidates = self.candidates[patterns == pattern]
+        self.history.append((guess, pattern))
+        solver_logger.debug(f"{guess}: {len(self.candidates)} candidates remain.")
+
+    def remaining(self) -> list[str]:
+        """
+        Return the answers still consistent with every guess.
+
+        Returns
+        -------
+        list[str]
+            The candidate answers.
+
+        Examples
+        --------
+        >>> solver.remaining()
+        ['crane', 'crate']
+
+        Notes
+        -----
+        The candidates are kept as column indices; this decodes them.
+        """
+        return [self.feedback.answers[index] for index in self.candidates]
+
+    def entropies(self) -> np.ndarray:
+        """
+        Return the expected information of every guess, in bits.
+
+        Returns
+        -------
+        np.ndarray
+            The entropy of the partition each guess makes of the candidates,
+            in guess order.
+
+        Examples
+        --------
+        >>> solver.entropies().max()
+        5.88
+
+        Notes
+        -----
+        With ``n`` candidates split into partitions of sizes ``c``, the
+        entropy is ``log2(n) - sum(c * log2(c)) / n``. Guesses are scored in
+        blocks, each with a single ``np.bincount`` over all of its partitions.
+        """
+        count = len(self.candidates)
+        if count == 0:
+            return np.zeros(len(self.feedback.guesses))
+
+        pattern_count = all_correct(self.length) + 1
+        guess_count = len(self.feedback.guesses)
+        entropies = np.empty(guess_count)
+        for start in range(0, guess_count, ENTROPY_BLOCK_ROWS):
+            end = min(start + ENTROPY_BLOCK_ROWS, guess_count)
+            patterns = np.asarray(self.feedback.matrix[start:end, self.candidates], dtype=np.int64)
+            patterns += np.arange(end - start)[:, None] * pattern_count
+            sizes = np.bincount(patterns.ravel(), minlength=(end - start) * pattern_count)
+            sizes = sizes.reshape(-1, pattern_count).astype(float)
+            weighted = sizes * np.log2(np.where(sizes > 0, sizes, 1))
+            entropies[start:end] = np.log2(count) - weighted.sum(axis=1) / count
+        return entropies
+
+    def suggest(self) -> str:
+        """
+        Suggest the next guess.
+
+        Returns
+        -------
+        str
+            The guess with the most expected information, or the answer if
+            only one candidate remains.
+
+        Raises
+        ------
+        ValueError
+            If no candidates remain, which means the feedback was inconsistent.
+
+        Examples
+        --------
+        >>> solver.suggest()
+        'raise'
+
+        Notes
+        -----
+        Once two or fewer candidates remain, one of them is suggested, since a
+        guess that could win is worth more than one that only splits them.
+        """
+        count = len(self.candidates)
+        if count == 0:
+            raise ValueError("No candidates remain. The feedback is inconsistent.")
+
+        playable = self.candidates[self._answer_is_guess[self.candidates]]
+        if count <= 2 and len(playable) > 0:
+            return self.feedback.answers[int(playable[0])]
+
+        key = (self._cache_key, self.candidates.tobytes())
+        if key not in self._suggestion_cache:
+            scores = self.entropies()
+            is_candidate = np.zeros(len(self.feedback.guesses), dtype=bool)
+            for index in playable:
+                is_candidate[self.feedback.guess_index[self.feedback.answers[index]]] = True
+            best = int(np.lexsort((is_candidate, np.round(scores, 9)))[-1])
+            if len(self._suggestion_cache) >= SUGGESTION_CACHE_SIZE:
+                del self._suggestion_cache[next(iter(self._suggestion_cache))]
+            self._suggestion_cache[key] = self.feedback.guesses[best]
+        return self._suggestion_cache[key]
@@ -0,0 +1,510 @@
+"""state.py: The rules of a Wordle game, independent of any display."""
+
+from typing import Container, Sequence
+
+import numpy as np
+
+from ...logs.setup_logging import setup_logging
+from .scoring import all_correct, encode_words, score_against, score_guess
+
+state_logger = setup_logging()
+
+
+def validate_guess(word_list: Container[str], guess: str, length: int, finished: bool) -> None:
+    """
+    Check that a guess may be submitted.
+
+    Parameters
+    ----------
+    word_list : Container[str]
+        The words that may be guessed.
+    guess : str
+        The guess.
+    length : int
+        The length of the target words.
+    finished : bool
+        Whether the game is over.
+
+    Raises
+    ------
+    ValueError
+        If the game is over, or the guess is the wrong length or not a word.
+
+    Examples
+    --------
+    >>> validate_guess(words, "zzzzz", 5, False)
+    Traceback (most recent call last):
+    ValueError: Invalid word: zzzzz
+
+    Notes
+    -----
+    Single-board and multi-board games share these rules.
+    """
+    if finished:
+        raise ValueError("The game is over.")
+    if len(guess) != length:
+        raise ValueError(
+            f"Invalid guess: {guess}. The guess must have {length} letters, not {len(guess)}."
+        )
+    if guess not in word_list:
+        raise ValueError(f"Invalid word: {guess}")
+
+
+class WordleState:
+    """
+    The state of a single game of Wordle.
+
+    Attributes
+    ----------
+    word_list : Container[str]
+        The words that may be guessed.
+    target_word : str
+        The word to find.
+    attempts : int
+        The number of guesses allowed.
+    guesses : list[str]
+        The valid guesses made so far.
+    patterns : list[int]
+        The pattern code of each guess.
+    letter_marks : dict[str, int]
+        The best mark each guessed letter has received.
+    won : bool
+        Whether the target word has been guessed.
+    lost : bool
+        Whether every attempt has been used without finding the word.
+
+    Methods
+    -------
+    validate(guess: str) -> None:
+        Check that a guess may be submitted.
+    submit(guess: str) -> int:
+        Submit a guess.
+
+    Examples
+    --------
+    >>> state = WordleState(words, "crane")
+    >>> state.submit("slate")
+    180
+    >>> state.won
+    False
+
+    Notes
+    -----
+    This class holds every rule of the game, guess validation, scoring, and
+    winning or losing, and nothing about drawing it, so it runs anywhere:
+    the pygame frontend drives it, and so does the headless simulator.
+    """
+
+    def __init__(self, word_list: Container[str], target_word: str, attempts: int = 6) -> None:
+        """
+        Initialise the game state.
+
+        Parameters
+        ----------
+        word_list : Container[str]
+            The words that may be guessed, such as a ``WordStore`` or a set.
+        target_word : str
+            The word to find.
+        attempts : int, optional
+            The number of guesses allowed, by default 6.
+
+        Raises
+        ------
+        ValueError
+            If the number of attempts is not positive.
+
+        Examples
+        --------
+        >>> state = WordleState(words, "crane")
+
+        Notes
+        -----
+        The target does not have to be in the word list.
+        """
+        if attempts < 1:
+            raise ValueError(f"Invalid attempts: {attempts}. There must be at least one attempt.")
+
+        self.word_list = word_list
+        self.target_word = target_word
+        self.attempts = attempts
+        self.guesses: list[str] = []
+        self.patterns: list[int] = []
+        self.letter_marks: dict[str, int] = {}
+        self.won = False
+        self.lost = False
+
+    @property
+    def current_attempt(self) -> int:
+        """
+        Return the number of guesses made so far.
+
+        Returns
+        -------
+        int
+            The number of guesses.
+
+        Examples
+        --------
+        >>> state.current_attempt
+        1
+
+        Notes
+        -----
+        This is the score of a finished game.
+        """
+        return len(self.guesses)
+
+    @property
+    def finished(self) -> bool:
+        """
+        Return whether the game is over.
+
+        Returns
+        -------
+        bool
+            True if the game was won or lost.
+
+        Examples
+        --------
+        >>> state.finished
+        False
+
+        Notes
+        -----
+        No more guesses can be submitted once the game is over.
+        """
+        return self.won or self.lost
+
+    def validate(self, guess: str) -> None:
+        """
+        Check that a guess may be submitted.
+
+        Parameters
+        ----------
+        guess : str
+            The guess.
+
+        Raises
+        ------
+        ValueError
+            If the game is over, or the guess is the wrong length or not a word.
+
+        Examples
+        --------
+        >>> state.validate("zzzzz")
+        Traceback (most recent call last):
+        ValueError: Invalid word: zzzzz
+
+        Notes
+        -----
+        This does not change the state.
+        """
+        validate_guess(self.word_list, guess, len(self.target_word), self.finished)
+
+    def submit(self, guess: str) -> int:
+        """
+        Submit a guess.
+
+        Parameters
+        ----------
+        guess : str
+            The guess.
+
+        Returns
+        -------
+        int
+            The pattern code of the guess.
+
+        Raises
+        ------
+        ValueError
+            If the guess is not allowed; see ``validate``.
+
+        Examples
+        --------
+        >>> state.submit("crane")
+        242
+
+        Notes
+        -----
+        Guesses are lowercased. ``letter_marks`` only ever moves a letter up,
+        from miss to present to correct. ``won`` and ``lost`` are updated here
+        rather than recomputed on every check, since simulations check them
+        after every guess.
+        """
+        guess = guess.lower()
+        self.validate(guess)
+
+        pattern = score_guess(guess, self.target_word)
+        self.guesses.append(guess)
+        self.patterns.append(pattern)
+
+        remaining = pattern
+        for letter in guess:
+            remaining, mark = divmod(remaining, 3)
+            if mark > self.letter_marks.get(letter, -1):
+                self.letter_marks[letter] = mark
+
+        self.won = pattern == all_correct(len(guess))
+        self.lost = not self.won and len(self.guesses) >= self.attempts
+        return pattern
+
+
+class MultiWordleState:
+    """
+    The state of a game of Wordle played on several boards at once.
+
+    Attributes
+    ----------
+    word_list : Container[str]
+        The words that may be guessed.
+    target_words : list[str]
+        The word to find on each board.
+    attempts : int
+        The number of guesses allowed.
+    guesses : list[str]
+        The valid guesses made so far.
+    patterns : list[np.ndarray]
+        The pattern code of each guess on every board.
+    solved_at : list[int | None]
+        The number of guesses each board took to solve, or None if unsolved.
+    letter_marks : dict[str, int]
+        The best mark each guessed letter has received on an unsolved board.
+    won : bool
+        Whether every board has been solved.
+    lost : bool
+        Whether every attempt has been used without solving every board.
+
+    Methods
+    -------
+    validate(guess: str) -> None:
+        Check that a guess may be submitted.
+    submit(guess: str) -> np.ndarray:
+        Submit a guess to every board.
+
+    Examples
+    --------
+    >>> state = MultiWordleState(words, ["crane", "slate", "abide", "speed"])
+    >>> state.submit("slate")
+    array([180, 242, 171,  83], dtype=uint8)
+
+    Notes
+    -----
+    This is the rules of Quordle, Octordle and similar games: every guess
+    goes to every board. The targets are encoded once, and each guess is
+    scored against all of them with a single ``score_against`` call.
+    """
+
+    def __init__(
+        self,
+        word_list: Container[str],
+        target_words: Sequence[str],
+        attempts: int | None = None,
+    ) -> None:
+        """
+        Initialise the game state.
+
+        Parameters
+        ----------
+        word_list : Container[str]
+            The words that may be guessed, such as a ``WordStore`` or a set.
+        target_words : Sequence[str]
+            The word to find on each board, all the same length.
+        attempts : int | None, optional
+            The number of guesses allowed, by default five more than the
+            number of boards.
+
+        Raises
+        ------
+        ValueError
+            If there are no targets, they differ in length, or the number of
+            attempts is not positive.
+
+        Examples
+        --------
+        >>> state = MultiWordleState(words, ["crane", "slate", "abide", "speed"])
+
+        Notes
+        -----
+        Four boards get nine guesses, as in Quordle, and eight get thirteen,
+        as in Octordle.
+        """
+        if not target_words:
+            raise ValueError("Invalid target words: there must be at least one board.")
+        attempts = len(target_words) + 5 if attempts is None else attempts
+        if attempts < 1:
+            raise ValueError(f"Invalid attempts: {attempts}. There must be at least one attempt.")
+
+        self.word_list = word_list
+        self.target_words = list(target_words)
+        self.length = len(self.target_words[0])
+        self._targets = encode_words(self.target_words, self.length)
+        self.attempts = attempts
+        self.guesses: list[str] = []
+        self.patterns: list[np.ndarray] = []
+        self.solved_at: list[int | None] = [None] * len(self.target_words)
+        self.letter_marks: dict[str, int] = {}
+        self.won = False
+        self.lost = False
+
+    @property
+    def boards(self) -> int:
+        """
+        Return the number of boards.
+
+        Returns
+        -------
+        int
+            The number of boards.
+
+        Examples
+        --------
+        >>> state.boards
+        4
+
+        Notes
+        -----
+        This is the number of target words.
+        """
+        return len(self.target_words)
+
+    @property
+    def current_attempt(self) -> int:
+        """
+        Return the number of guesses made so far.
+
+        Returns
+        -------
+        int
+            The number of guesses.
+
+        Examples
+        --------
+        >>> state.current_attempt
+        1
+
+        Notes
+        -----
+        This is the score of a finished game.
+        """
+        return len(self.guesses)
+
+    @property
+    def finished(self) -> bool:
+        """
+        Return whether the game is over.
+
+        Returns
+        -------
+        bool
+            True if the game was won or lost.
+
+        Examples
+        --------
+        >>> state.finished
+        False
+
+        Notes
+        -----
+        No more guesses can be submitted once the game is over.
+        """
+        return self.won or self.lost
+
+    def unsolved(self) -> list[int]:
+        """
+        Return the boards not yet solved.
+
+        Returns
+        -------
+        list[int]
+            The indices of the unsolved boards.
+
+        Examples
+        --------
+        >>> state.unsolved()
+        [0, 2, 3]
+
+        Notes
+        -----
+        Guesses are only shown on unsolved boards.
+        """
+        return [board for board, solved in enumerate(self.solved_at) if solved is None]
+
+    def validate(self, guess: str) -> None:
+        """
+        Check that a guess may be submitted.
+
+        Parameters
+        ----------
+        guess : str
+            The guess.
+
+        Raises
+        ------
+        ValueError
+            If the game is over, or the guess is the wrong length or not a word.
+
+        Examples
+        --------
+        >>> state.validate("zzzzz")
+        Traceback (most recent call last):
+        ValueError: Invalid word: zzzzz
+
+        Notes
+        -----
+        This does not change the state.
+        """
+        validate_guess(self.word_list, guess, self.length, self.finished)
+
+    def submit(self, guess: str) -> np.ndarray:
+        """
+        Submit a guess to every board.
+
+        Parameters
+        ----------
+        guess : str
+            The guess.
+
+        Returns
+        -------
+        np.ndarray
+            The pattern code of the guess on each board.
+
+        Raises
+        ------
+        ValueError
+            If the guess is not allowed; see ``validate``.
+
+        Examples
+        --------
+        >>> state.submit("crane")
+        array([242, 180, 171,  81], dtype=uint8)
+
+        Notes
+        -----
+        Guesses are lowercased. ``letter_marks`` only counts the boards that
+        were unsolved before this guess, since solved boards stop showing
+        guesses, and it only ever moves a letter up.
+        """
+        guess = guess.lower()
+        self.validate(guess)
+
+        patterns = score_against(guess, self._targets)
+        unsolved = self.unsolved()
+        self.guesses.append(guess)
+        self.patterns.append(patterns)
+
+        place_values = 3 ** np.arange(self.length)
+        marks = (patterns[unsolved].astype(np.int64)[:, np.newaxis] // place_values) % 3
+        for letter, mark in zip(guess, marks.max(axis=0).tolist()):
+            if mark > self.letter_marks.get(letter, -1):
+                self.letter_marks[letter] = mark
+
+        win = all_correct(self.length)
+        for board in unsolved:
+            if patterns[board] == win:
+                self.solved_at[board] = len(self.guesses)
+
+        self.won = all(solved is not None for solved in self.solved_at)
+        self.lost = not self.won and len(self.guesses) >= self.attempts
+        return patterns
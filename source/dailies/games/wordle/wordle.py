@@ -1,21 +1,100 @@
 """wordle.py: A game of Wordle, inheriting from the Game class."""
 
+import math
 import random
+import threading
+from functools import partial
+from typing import Callable
 
 import pygame
 
 from ...config.constants import Constants
 from ...config.dialogue_en import DialogueEn
+from ...config.paths import Paths
+from ...file_interaction.word_cache import load_words
+from ...file_interaction.word_store import WordStore
+from ...interface.animation import AnimationScheduler, Popup, Tween, ease_in_out
+from ...interface.frame_stats import FrameStats
+from ...interface.glyph_cache import glyph_cache
+from ...interface.scene_manager import SceneManager
 from ...logs.setup_logging import setup_logging
+from ..daily_scheduler import DailyCalendar
 from ..game_infrastructure import Game
+from ..puzzle_pool import PuzzleSource
+from .feedback_matrix import FeedbackMatrix
+from .grid_model import EMPTY, GridModel
+from .scoring import CORRECT, MISS, PRESENT, decode_pattern
+from .solver import WordleSolver
+from .state import WordleState
 
 wordle_logger = setup_logging()
 
+MARK_COLOURS = {
+    EMPTY: Constants.EMPTY_COLOUR,
+    MISS: Constants.WRONG_COLOUR,
+    PRESENT: Constants.POSITION_COLOUR,
+    CORRECT: Constants.CORRECT_COLOUR,
+}
+
 # TODO: Refactor Wordle to be more readable and maintainable.
 # TODO: Implement a second list for possible words.
 # TODO: Create parent classes for the Cell and Grid classes.
 
 
+def draw_tile(
+    screen: pygame.Surface,
+    rect: pygame.Rect,
+    colour: tuple[int, int, int],
+    letter: str,
+    font_size: int,
+    previous_rect: pygame.Rect | None = None,
+) -> pygame.Rect:
+    """
+    Draw a letter tile.
+
+    Parameters
+    ----------
+    screen : pygame.Surface
+        The Pygame screen.
+    rect : pygame.Rect
+        The area of the tile.
+    colour : tuple[int, int, int]
+        The colour of the tile.
+    letter : str
+        The letter, or "" for none.
+    font_size : int
+        The size of the letter.
+    previous_rect : pygame.Rect | None, optional
+        The area the tile was last drawn over, by default None.
+
+    Returns
+    -------
+    pygame.Rect
+        The area that changed, covering both where the tile was and where it
+        is now.
+
+    Examples
+    --------
+    >>> draw_tile(screen, pygame.Rect(0, 0, 80, 60), Constants.CORRECT_COLOUR, "a", 60)
+
+    Notes
+    -----
+    The area the tile was last drawn over is cleared first, so a shaking or
+    flipping tile leaves no trail behind it. The letter comes from the shared
+    glyph cache and is clipped to the tile, so redrawing a tile only blits.
+    """
+    if previous_rect is not None:
+        screen.fill(Constants.BACKGROUND_COLOUR, previous_rect)
+
+    pygame.draw.rect(screen, colour, rect)
+    if letter:
+        text = glyph_cache.render(letter.upper(), font_size, Constants.FONT_COLOUR)
+        screen.set_clip(rect)
+        screen.blit(text, text.get_rect(center=rect.center))
+        screen.set_clip(None)
+    return rect if previous_rect is None else rect.union(previous_rect)
+
+
 class Cell:
     """
     A cell in the grid.
@@ -42,10 +121,12 @@ class Cell:
         The width of the cell.
     height : int
         The height of the cell.
-    font : pygame.font.Font
-        The font of the cell.
+    font_size : int
+        The size of the cell's letter, looked up in the shared glyph cache.
     needs_redraw : bool
         Whether the cell needs to be redrawn.
+    drawn_rect : pygame.Rect | None
+        The area the cell was last drawn over, or None if the screen was cleared.
 
     Methods
     -------
@@ -114,8 +195,9 @@ class Cell:
         self.screen = screen
         self.width = self.screen.get_width() // self.width_divisor
         self.height = self.screen.get_height() // self.height_divisor
-        self.font = pygame.font.Font(None, self.height // self.font_divisor)
+        self.font_size = self.height // self.font_divisor
         self.needs_redraw = True
+        self.drawn_rect: pygame.Rect | None = None
 
     def draw(self) -> pygame.Rect | None:
         """
@@ -124,7 +206,8 @@ class Cell:
         Returns
         -------
         pygame.Rect | None
-            The rectangle of the cell.
+            The area that changed, covering both where the cell was and where
+            it is now, or None if the cell did not need redrawing.
 
         Examples
         --------
@@ -132,17 +215,18 @@ class Cell:
 
         Notes
         -----
-        This method draws the cell.
+        See ``draw_tile``.
         """
-        if self.needs_redraw:
-            pygame.draw.rect(self.screen, self.colour, (self.x, self.y, self.width, self.height))
-            text = self.font.render(self.letter.upper(), True, Constants.FONT_COLOUR)
-            text_rect = text.get_rect(center=(self.x + self.width // 2, self.y + self.height // 2))
-            self.screen.blit(text, text_rect)
-            self.needs_redraw = False
-            return pygame.Rect(self.x, self.y, self.width, self.height)
+        if not self.needs_redraw:
+            return None
 
-        return None
+        rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        dirty_rect = draw_tile(
+            self.screen, rect, self.colour, self.letter, self.font_size, self.drawn_rect
+        )
+        self.drawn_rect = rect
+        self.needs_redraw = False
+        return dirty_rect
 
     def update(self, letter: str, colour: tuple[int, int, int]) -> None:
         """
@@ -171,14 +255,14 @@ class Cell:
 
 class Grid:
     """
-    A grid of cells.
+    A grid of letter tiles, drawn from a ``GridModel``.
 
     Attributes
     ----------
     screen : pygame.Surface
         The Pygame screen.
-    cells : list[list[Cell]]
-        The list of cells.
+    model : GridModel
+        The letters, marks, layout and animation state of every tile.
     target_word : str
         The target word.
     attempts : int
@@ -188,12 +272,21 @@ class Grid:
 
     Methods
     -------
-    update_cell(guess: str, letter_tracking: list[Cell]) -> list[Cell]:
-        Update the cell.
+    set_letter(column: int, letter: str) -> None:
+        Type or erase a letter in the current row.
+    update_cell(
+        guess: str,
+        pattern: int,
+        animations: AnimationScheduler | None = None,
+        on_complete: Callable[[], None] | None = None,
+    ) -> list[int]:
+        Colour the current row from a guess's feedback.
+    shake_row(row: int, animations: AnimationScheduler) -> None:
+        Shake a row from side to side.
     resize() -> None:
         Resize the grid.
-    draw() -> None:
-        Draw the grid.
+    draw() -> list[pygame.Rect]:
+        Draw the tiles that changed.
 
     Examples
     --------
@@ -201,7 +294,8 @@ class Grid:
 
     Notes
     -----
-    This class initialises the grid of cells.
+    The grid holds no per-tile objects: it is a thin view that lays out and
+    draws the arrays of its model.
     """
 
     def __init__(self, screen: pygame.Surface, target_word: str, attempts: int = 6) -> None:
@@ -223,82 +317,150 @@ class Grid:
 
         Notes
         -----
-        This class initialises the grid of cells.
+        The grid is laid out for the current screen size.
         """
         self.screen = screen
-        self.cells = [
-            [
-                Cell(
-                    self.screen,
-                    x=Constants.GRID_X_ACROSS
-                    * (self.screen.get_width() // Constants.CELL_WIDTH_DIVISOR)
-                    + j
-                    * (
-                        (self.screen.get_width() // Constants.CELL_WIDTH_DIVISOR)
-                        + self.screen.get_width() // (Constants.CELL_WIDTH_DIVISOR * 5)
-                    ),
-                    y=Constants.GRID_Y_DOWN
-                    * (self.screen.get_height() // Constants.CELL_HEIGHT_DIVISOR)
-                    + i
-                    * (
-                        (self.screen.get_height() // Constants.CELL_HEIGHT_DIVISOR)
-                        + self.screen.get_height() // (Constants.CELL_HEIGHT_DIVISOR * 5)
-                    ),
-                )
-                for j in range(len(target_word))
-            ]
-            for i in range(attempts)
-        ]
+        self.model = GridModel(attempts, len(target_word))
         self.target_word = target_word
         self.attempts = attempts
         self.current_attempt = 0
+        self.resize()
+
+    def set_letter(self, column: int, letter: str) -> None:
+        """
+        Type or erase a letter in the current row.
+
+        Parameters
+        ----------
+        column : int
+            The column.
+        letter : str
+            The letter, or "" to erase.
+
+        Examples
+        --------
+        >>> grid.set_letter(0, "h")
+
+        Notes
+        -----
+        The tile has no mark until the guess is submitted.
+        """
+        self.model.set_tile(self.current_attempt, column, letter)
 
     def update_cell(
-        self, guess: str, letter_tracking: dict[str, tuple[int, int, int]]
-    ) -> list[Cell]:
+        self,
+        guess: str,
+        pattern: int,
+        animations: AnimationScheduler | None = None,
+        on_complete: Callable[[], None] | None = None,
+    ) -> list[int]:
         """
-        Update the cell.
+        Colour the current row from a guess's feedback.
 
         Parameters
         ----------
         guess : str
             The guess.
-        letter_tracking : dict[str, tuple[int, int, int]]
-            The letter tracking.
+        pattern : int
+            The pattern code of the guess, from ``WordleState.submit``.
+        animations : AnimationScheduler | None, optional
+            The scheduler to flip the tiles with, by default None, which
+            colours them at once.
+        on_complete : Callable[[], None] | None, optional
+            Called once every tile shows its colour, by default None.
 
         Returns
         -------
-        list[Cell]
-            The updated letter tracking.
+        list[int]
+            The columns whose letter or mark changed, or will change once
+            their flip reaches its midpoint.
 
         Examples
         --------
-        >>> grid.update_cell("hello", {"a": (255, 255, 255)})
+        >>> grid.update_cell("hello", state.submit("hello"), animations)
 
         Notes
         -----
-        This method updates the cell.
+        The grid only draws feedback; scoring lives in ``WordleState``. Each
+        tile folds to nothing, takes its colour, and unfolds, starting
+        ``Constants.FLIP_STAGGER`` milliseconds after the tile to its left.
         """
-        updated_cells = []
-        for i, letter in enumerate(guess):
-            cell = self.cells[self.current_attempt][i]
-            correct = self.target_word[i] == letter
-            if correct:
-                new_colour = Constants.CORRECT_COLOUR
-            elif letter in self.target_word:
-                new_colour = (
-                    Constants.POSITION_COLOUR
-                    if guess.count(letter) <= self.target_word.count(letter)
-                    else Constants.WRONG_COLOUR
+        row = self.current_attempt
+        marks = decode_pattern(pattern, len(guess))
+        updated_columns = [
+            column
+            for column, (letter, mark) in enumerate(zip(guess, marks))
+            if self.model.letters[row, column] != letter or self.model.marks[row, column] != mark
+        ]
+
+        if animations is None:
+            self.model.set_row(row, guess, marks)
+        else:
+            for column in updated_columns:
+                set_scale = partial(self.model.set_scale, row, column)
+
+                def unfold(
+                    column: int = column,
+                    set_scale: Callable[[float], None] = set_scale,
+                ) -> None:
+                    self.model.set_tile(row, column, guess[column], marks[column])
+                    animations.add(Tween(0, 1, Constants.FLIP_DURATION // 2, set_scale))
+
+                animations.add(
+                    Tween(
+                        1,
+                        0,
+                        Constants.FLIP_DURATION // 2,
+                        set_scale,
+                        unfold,
+                        delay=column * Constants.FLIP_STAGGER,
+                        easing=ease_in_out,
+                    )
                 )
+
+        if on_complete is not None:
+            if animations is None:
+                on_complete()
             else:
-                new_colour = Constants.WRONG_COLOUR
+                delay = (len(guess) - 1) * Constants.FLIP_STAGGER + Constants.FLIP_DURATION
+                animations.call_later(delay, on_complete)
+
+        return updated_columns
+
+    def shake_row(self, row: int, animations: AnimationScheduler) -> None:
+        """
+        Shake a row from side to side.
+
+        Parameters
+        ----------
+        row : int
+            The index of the row.
+        animations : AnimationScheduler
+            The scheduler to shake the row with.
 
-            if cell.letter != letter or cell.colour != new_colour:
-                cell.update(letter, new_colour)  # Ensure updates are performed
-                updated_cells.append(cell)
+        Examples
+        --------
+        >>> grid.shake_row(grid.current_attempt, animations)
 
-        return updated_cells
+        Notes
+        -----
+        The swing is a sine wave that dies away to nothing, so the row always
+        comes to rest where it started. A new shake replaces one in progress.
+        Small tiles swing less, so a row never reaches into its neighbours.
+        """
+        amplitude = min(Constants.SHAKE_AMPLITUDE, self.model.width // 4)
+
+        def shake(progress: float) -> None:
+            offset = (
+                amplitude
+                * math.sin(progress * Constants.SHAKE_CYCLES * 2 * math.pi)
+                * (1 - progress)
+            )
+            self.model.set_row_offset(row, offset)
+
+        tag = ("shake", id(self), row)
+        animations.cancel(tag)
+        animations.add(Tween(0, 1, Constants.SHAKE_DURATION, shake, tag=tag))
 
     def resize(self) -> None:
         """
@@ -310,39 +472,53 @@ class Grid:
 
         Notes
         -----
-        This method resizes the grid.
+        Every tile is placed in one vectorised ``GridModel.layout`` call.
         """
-        base_x = Constants.GRID_X_ACROSS * (self.screen.get_width() // Constants.CELL_WIDTH_DIVISOR)
-        base_y = Constants.GRID_Y_DOWN * (self.screen.get_height() // Constants.CELL_HEIGHT_DIVISOR)
         width_step = self.screen.get_width() // Constants.CELL_WIDTH_DIVISOR
         height_step = self.screen.get_height() // Constants.CELL_HEIGHT_DIVISOR
-        width_spacing = width_step // 5
-        height_spacing = height_step // 5
-
-        for row in self.cells:
-            for cell in row:
-                cell.x = base_x + row.index(cell) * (width_step + width_spacing)
-                cell.y = base_y + self.cells.index(row) * (height_step + height_spacing)
-                cell.width = width_step
-                cell.height = height_step
-                cell.font = pygame.font.Font(None, cell.height // cell.font_divisor)
-                cell.needs_redraw = True
+        self.model.layout(
+            (Constants.GRID_X_ACROSS * width_step, Constants.GRID_Y_DOWN * height_step),
+            (width_step, height_step),
+            (width_step // 5, height_step // 5),
+            height_step // Constants.FONT_DIVISOR,
+        )
 
-    def draw(self) -> None:
+    def draw(self) -> list[pygame.Rect]:
         """
-        Draw the grid.
+        Draw the tiles that changed.
+
+        Returns
+        -------
+        list[pygame.Rect]
+            The areas drawn, to pass to ``pygame.display.update``.
 
         Examples
         --------
-        >>> grid.draw()
+        >>> pygame.display.update(grid.draw())
 
         Notes
         -----
-        This method draws the grid.
+        Only tiles that need redrawing are drawn, and the display is left to
+        the caller, so a frame makes a single update call.
         """
-        redraw_rects = [cell.draw() for row in self.cells for cell in row if cell.needs_redraw]
-        if redraw_rects:
-            pygame.display.update(redraw_rects)
+        model = self.model
+        redraw_rects = []
+        for row, column in model.dirty_tiles().tolist():
+            x, y, width, height = model.drawn[row, column].tolist()
+            rect = pygame.Rect(model.tile_rect(row, column))
+            redraw_rects.append(
+                draw_tile(
+                    self.screen,
+                    rect,
+                    MARK_COLOURS[int(model.marks[row, column])],
+                    str(model.letters[row, column]),
+                    model.font_size,
+                    pygame.Rect(x, y, width, height) if width else None,
+                )
+            )
+            model.drawn[row, column] = (rect.x, rect.y, rect.width, rect.height)
+        model.dirty[...] = False
+        return redraw_rects
 
 
 class VirtualKeyboard:
@@ -362,8 +538,8 @@ class VirtualKeyboard:
         Update the key colours.
     resize() -> None:
         Resize the virtual keyboard.
-    draw() -> None:
-        Draw the virtual keyboard.
+    draw() -> list[pygame.Rect]:
+        Draw the keys that changed.
 
     Examples
     --------
@@ -437,7 +613,7 @@ class VirtualKeyboard:
         This method updates the key colours.
         """
         for key in self.keys:
-            key.colour = letter_tracking[key.letter]
+            key.update(key.letter, letter_tracking[key.letter])
 
     def resize(self) -> None:
         """
@@ -466,24 +642,29 @@ class VirtualKeyboard:
                 key.y = initial_y + i * (key_height + key_height // 5)
                 key.width = key_width
                 key.height = key_height
+                key.font_size = key_height // key.font_divisor
+                key.drawn_rect = None
                 key.needs_redraw = True
                 key_index += 1
 
-    def draw(self) -> None:
+    def draw(self) -> list[pygame.Rect]:
         """
-        Draw the virtual keyboard.
+        Draw the keys that changed.
+
+        Returns
+        -------
+        list[pygame.Rect]
+            The areas drawn, to pass to ``pygame.display.update``.
 
         Examples
         --------
-        >>> virtual_keyboard.draw()
+        >>> pygame.display.update(virtual_keyboard.draw())
 
         Notes
         -----
-        This method draws the virtual keyboard.
+        Only keys that need redrawing are drawn.
         """
-        for key in self.keys:
-            key.draw()
-        pygame.display.update()
+        return [rect for key in self.keys if (rect := key.draw()) is not None]
 
 
 class Wordle(Game):
@@ -492,15 +673,31 @@ class Wordle(Game):
 
     Attributes
     ----------
-    word_list : list[str]
-        The list of words to choose from.
+    word_list : WordStore
+        The store of words to choose from and validate guesses against.
+    pool : PuzzleSource | None
+        The target words to draw from.
     letter_tracking : dict[str, tuple[int, int, int]]
         The letter tracking.
+    state : WordleState | None
+        The rules and progress of the current game.
+    solver : WordleSolver | None
+        The hint engine, loaded in the background when a game starts.
+    animations : AnimationScheduler
+        The tile flips, shakes and popup fades in progress.
+    popup : Popup
+        The message shown at the top of the screen.
+    frame_stats : FrameStats
+        The frame times and CPU usage of the last game played with ``play``.
+    current_guess : list[str]
+        The letters typed for the current guess.
 
     Methods
     -------
-    _init_pygame() -> None:
-        Initialise Pygame.
+    hint() -> str | None:
+        Suggest the most informative next guess.
+    _warm_solver() -> None:
+        Load the hint engine on a background thread.
     _draw_text(
         message: str,
         size: int,
@@ -508,33 +705,60 @@ class Wordle(Game):
         center: tuple[int, int],
         duration: int = 2000,
     ) -> None:
-        Draw text on the screen.
+        Show a message at the top of the screen.
+    _update_keyboard() -> None:
+        Colour the keyboard from the letters guessed so far.
+    _new_game() -> None:
+        Choose a target and reset the rules for a new game.
+    _create_boards() -> None:
+        Create the grids for the current screen.
+    _resize_boards() -> None:
+        Lay the grids out again after the window is resized.
+    _draw_boards() -> list[pygame.Rect]:
+        Draw the tiles that changed.
+    _game_over() -> bool:
+        Return whether the current game is over.
+    _game_won() -> bool:
+        Return whether the current game was won.
+    _attempts_used() -> int | None:
+        Return the number of guesses made in the current game.
     _handle_keydown(event: pygame.event.Event, current_guess: list[str]) -> None:
         Handle the keydown event.
+    enter(screen: pygame.Surface) -> None:
+        Start a new game on a display.
+    update(events: list[pygame.event.Event], dt: int) -> None:
+        Handle a frame's events and advance the animations.
+    render(screen: pygame.Surface) -> list[pygame.Rect]:
+        Draw the tiles, keys and message that changed.
+    exit() -> None:
+        Record the result of the game.
     play() -> None:
-        Play the Wordle game.
+        Play the Wordle game in a window of its own.
 
     Examples
     --------
-    >>> wordle = Wordle()
+    >>> wordle = Wordle(WordStore.from_file(Paths.WORDS))
 
     Notes
     -----
     This class represents the Wordle game.
     """
 
-    def __init__(self, word_list: list[str]) -> None:
+    def __init__(self, word_list: WordStore, pool: PuzzleSource | None = None) -> None:
         """
         Initialise the Wordle game.
 
         Parameters
         ----------
-        word_list : list[str]
-            The list of words to choose from.
+        word_list : WordStore
+            The store of words to choose from and validate guesses against.
+        pool : PuzzleSource | None, optional
+            The target words to draw from, by default None (a random word each game).
 
         Examples
         --------
-        >>> wordle = Wordle()
+        >>> wordle = Wordle(WordStore.from_file(Paths.WORDS))
+        >>> wordle = Wordle(WordStore.from_file(Paths.WORDS), DailyCalendar("wordle"))
 
         Notes
         -----
@@ -547,29 +771,91 @@ class Wordle(Game):
         )
 
         self.word_list = word_list
+        self.pool = pool
         self.letter_tracking = {
             chr(i): Constants.EMPTY_COLOUR for i in range(ord("a"), ord("z") + 1)
         }
+        self.state: WordleState | None = None
+        self.solver: WordleSolver | None = None
+        self._loaded_solver: WordleSolver | None = None
+        self._solver_loader: threading.Thread | None = None
+        self.animations = AnimationScheduler()
+        self.popup = Popup(self.animations)
+        self.frame_stats = FrameStats()
+        self.current_guess: list[str] = []
+
+    def hint(self) -> str | None:
+        """
+        Suggest the most informative next guess.
+
+        Returns
+        -------
+        str | None
+            The suggested guess, or None while the hint engine is still loading.
+
+        Raises
+        ------
+        ValueError
+            If no game is in progress.
+
+        Examples
+        --------
+        >>> wordle.hint()
+        'raise'
 
-    def _init_pygame(self) -> None:
+        Notes
+        -----
+        The solver is loaded by ``_warm_solver`` when the game starts, so the
+        frame loop never waits for the feedback matrix. On first use it
+        replays this game's guesses. After that it is updated as each guess
+        is made, so a hint only costs one suggestion.
+        """
+        if self.state is None:
+            raise ValueError("No game is in progress.")
+
+        if self.solver is None:
+            if self._loaded_solver is None:
+                self._warm_solver()
+                return None
+            self.solver = self._loaded_solver
+            for guess, pattern in zip(self.state.guesses, self.state.patterns):
+                self.solver.update(guess, pattern)
+        return self.solver.suggest()
+
+    def _warm_solver(self) -> None:
         """
-        Initialise Pygame.
+        Load the hint engine on a background thread.
 
         Examples
         --------
-        >>> _init_pygame()
+        >>> wordle._warm_solver()
 
         Notes
         -----
-        This method initialises Pygame.
+        The thread loads or builds the feedback matrix and computes the
+        opening suggestion, which is cached for every later game, then hands
+        the solver over through ``_loaded_solver``. The game thread only
+        starts using it after that, so the two never share a solver. This
+        does nothing once the solver is loaded or loading. If loading fails,
+        the error is logged and the next hint tries again.
         """
-        pygame.init()
-        self.screen = pygame.display.set_mode(
-            Constants.SCREEN_SIZE, pygame.RESIZABLE | pygame.DOUBLEBUF
-        )
-        pygame.display.set_caption(self.__name__())
-        self.screen.fill(Constants.BACKGROUND_COLOUR)
-        pygame.display.update()
+        if self.solver is not None or self._solver_loader is not None:
+            return
+
+        words = self.word_list.words_of_length(Constants.WORDLE_WORD_LENGTH)
+
+        def load() -> None:
+            try:
+                solver = WordleSolver(FeedbackMatrix.load(words, words))
+                solver.suggest()
+            except Exception as error:
+                wordle_logger.error(f"Could not load the Wordle hints: {error}")
+                self._solver_loader = None
+                return
+            self._loaded_solver = solver
+
+        self._solver_loader = threading.Thread(target=load, name="wordle-hints", daemon=True)
+        self._solver_loader.start()
 
     def _draw_text(
         self,
@@ -580,7 +866,7 @@ class Wordle(Game):
         duration: int = 2000,
     ) -> None:
         """
-        Draw text on the screen.
+        Show a message at the top of the screen.
 
         Parameters
         ----------
@@ -593,7 +879,7 @@ class Wordle(Game):
         center : tuple[int, int]
             The center of the text.
         duration : int, optional
-            The duration of the text, by default 2000.
+            The duration passed to ``Popup.show``, by default 2000.
 
         Examples
         --------
@@ -601,48 +887,166 @@ class Wordle(Game):
 
         Notes
         -----
-        This method draws text on the screen. The text fades in, pauses, and fades out.
-        """
-        # TODO: Fix text boldening due to not clearing the rect before/after drawing the text.
-        # TODO: Implement non-blocking text popup.
-        font = pygame.font.Font(None, size)
-        text = font.render(message, True, color)
-        text_rect = text.get_rect(center=center)
-
-        # Fade in parameters
-        fade_in_duration = duration // 2
-        fade_out_duration = duration // 2
-        fade_in_alpha = 0
-        fade_out_alpha = 0
-        fade_rate = 255 / (fade_in_duration / 1000 * Constants.FPS)
-
-        # Start the fade in effect
-        start_time = pygame.time.get_ticks()
-        while pygame.time.get_ticks() - start_time < fade_in_duration:
-            fade_in_alpha = min(fade_in_alpha + fade_rate, 255)
-            text.set_alpha(fade_in_alpha)
-            self.screen.blit(text, text_rect)
-            pygame.display.update(text_rect)
-            pygame.time.delay(1000 // Constants.FPS)
-
-        # Pause for a moment
-        pygame.time.delay(duration // 2)
-
-        # Start the fade out effect with rectangle
-        fade_out_start_time = pygame.time.get_ticks()
-        while pygame.time.get_ticks() - fade_out_start_time < fade_out_duration:
-            fade_out_alpha = min(fade_out_alpha + fade_rate, 255)
-            self.screen.blit(text, text_rect)
-            # Cover the text with a rectangle of background color gradually becoming opaque
-            overlay_rect = pygame.Surface(text.get_size())
-            overlay_rect.fill(Constants.BACKGROUND_COLOUR)
-            overlay_rect.set_alpha(fade_out_alpha)
-            self.screen.blit(overlay_rect, text_rect)
-            pygame.display.update(text_rect)
-            pygame.time.delay(1000 // Constants.FPS)
-
-        # Clear the final state
-        pygame.display.update(text_rect)  # Update the screen to clear the faded text.
+        The text fades in, pauses, and fades out, driven by the game loop's
+        animation scheduler, so this returns at once and input keeps working.
+        """
+        self.popup.show(message, size, color, center, duration)
+
+    def _update_keyboard(self) -> None:
+        """
+        Colour the keyboard from the letters guessed so far.
+
+        Examples
+        --------
+        >>> _update_keyboard()
+
+        Notes
+        -----
+        This runs once a guess's tiles have finished flipping, so the keyboard
+        never gives away a mark before the grid shows it.
+        """
+        if self.state is None:
+            return
+
+        for letter, mark in self.state.letter_marks.items():
+            if letter in self.letter_tracking:
+                self.letter_tracking[letter] = MARK_COLOURS[mark]
+        self.virtual_keyboard.update_key(self.letter_tracking)
+
+    def _new_game(self) -> None:
+        """
+        Choose a target and reset the rules for a new game.
+
+        Examples
+        --------
+        >>> _new_game()
+
+        Notes
+        -----
+        The target is drawn from the pool when one is available, and chosen at
+        random otherwise. The solver, if one was built, keeps its feedback matrix.
+        """
+        record = self.pool.draw() if self.pool is not None else None
+        if record is not None:
+            self.target_word = str(record["word"])
+        else:
+            self.target_word = self.word_list.random_word(Constants.WORDLE_WORD_LENGTH)
+        self.letter_tracking = {
+            chr(i): Constants.EMPTY_COLOUR for i in range(ord("a"), ord("z") + 1)
+        }
+        self.state = WordleState(self.word_list, self.target_word)
+        if self.solver is not None:
+            self.solver.reset()
+
+        print(f"Psst.. The word is: {self.target_word}!")  # For testing purposes
+
+    def _create_boards(self) -> None:
+        """
+        Create the grids for the current screen.
+
+        Examples
+        --------
+        >>> _create_boards()
+
+        Notes
+        -----
+        A game of Wordle has a single grid.
+        """
+        self.grid = Grid(self.screen, self.target_word)
+
+    def _resize_boards(self) -> None:
+        """
+        Lay the grids out again after the window is resized.
+
+        Examples
+        --------
+        >>> _resize_boards()
+
+        Notes
+        -----
+        The screen has already been cleared.
+        """
+        self.grid.screen = self.screen
+        self.grid.resize()
+
+    def _draw_boards(self) -> list[pygame.Rect]:
+        """
+        Draw the tiles that changed.
+
+        Returns
+        -------
+        list[pygame.Rect]
+            The areas drawn.
+
+        Examples
+        --------
+        >>> _draw_boards()
+
+        Notes
+        -----
+        See ``Grid.draw``.
+        """
+        return self.grid.draw()
+
+    def _game_over(self) -> bool:
+        """
+        Return whether the current game is over.
+
+        Returns
+        -------
+        bool
+            True once the game is won or lost.
+
+        Examples
+        --------
+        >>> _game_over()
+        False
+
+        Notes
+        -----
+        The game loop exits once this is true and the animations have ended.
+        """
+        return self.state is not None and self.state.finished
+
+    def _game_won(self) -> bool:
+        """
+        Return whether the current game was won.
+
+        Returns
+        -------
+        bool
+            True once the target has been guessed.
+
+        Examples
+        --------
+        >>> _game_won()
+        True
+
+        Notes
+        -----
+        This is only meaningful once ``_game_over`` is true.
+        """
+        return self.state is not None and self.state.won
+
+    def _attempts_used(self) -> int | None:
+        """
+        Return the number of guesses made in the current game.
+
+        Returns
+        -------
+        int | None
+            The number of guesses, or None if no game has started.
+
+        Examples
+        --------
+        >>> _attempts_used()
+        4
+
+        Notes
+        -----
+        This is the score of a finished game.
+        """
+        return self.state.current_attempt if self.state is not None else None
 
     def _handle_keydown(self, event: pygame.event.Event, current_guess: list[str]) -> None:
         """
@@ -661,52 +1065,191 @@ class Wordle(Game):
 
         Notes
         -----
-        This method handles the keydown event.
+        This method handles the keydown event. The rules are applied by
+        ``self.state``; this method only turns keys into guesses and draws the
+        result.
         """
+        if self.state is None or self.state.finished:
+            return
+
         if event.key == pygame.K_RETURN and len(current_guess) == len(self.target_word):
             guess = "".join(current_guess)
-            if guess in self.word_list:
-                updated_cells = self.grid.update_cell(guess, self.letter_tracking)
-                self.virtual_keyboard.update_key(self.letter_tracking)
-                self.grid.current_attempt += 1
-                current_guess.clear()
-                if updated_cells:
-                    self.grid.draw()
-                if guess == self.target_word:
-                    self._draw_text(
-                        f"You Win! The word was: {self.target_word}",
-                        Constants.POPUP_FONT_SIZE,
-                        Constants.FONT_COLOUR,
-                        (self.screen.get_width() // 2, self.screen.get_height() // 20),
-                    )
-                    self.running = False
-                elif self.grid.current_attempt == self.grid.attempts:
-                    self._draw_text(
-                        f"Game Over! The word was: {self.target_word}",
-                        Constants.POPUP_FONT_SIZE,
-                        Constants.FONT_COLOUR,
-                        (self.screen.get_width() // 2, self.screen.get_height() // 20),
-                    )
-                    self.running = False
-            else:
+            try:
+                pattern = self.state.submit(guess)
+            except ValueError:
+                self.grid.shake_row(self.grid.current_attempt, self.animations)
                 self._draw_text(
                     "Invalid word",
                     Constants.POPUP_FONT_SIZE,
                     Constants.FONT_COLOUR,
                     (self.screen.get_width() // 2, self.screen.get_height() // 20),
                 )
+                return
+
+            if self.solver is not None:
+                self.solver.update(guess, pattern)
+            self.grid.update_cell(guess, pattern, self.animations, self._update_keyboard)
+            self.grid.current_attempt = self.state.current_attempt
+            current_guess.clear()
+            if self.state.won:
+                self._draw_text(
+                    f"You Win! The word was: {self.target_word}",
+                    Constants.POPUP_FONT_SIZE,
+                    Constants.FONT_COLOUR,
+                    (self.screen.get_width() // 2, self.screen.get_height() // 20),
+                )
+            elif self.state.lost:
+                self._draw_text(
+                    f"Game Over! The word was: {self.target_word}",
+                    Constants.POPUP_FONT_SIZE,
+                    Constants.FONT_COLOUR,
+                    (self.screen.get_width() // 2, self.screen.get_height() // 20),
+                )
+        elif event.key == pygame.K_TAB:
+            hint = self.hint()
+            self._draw_text(
+                f"Hint: try {hint.upper()}" if hint is not None else "Hints are still loading",
+                Constants.POPUP_FONT_SIZE,
+                Constants.FONT_COLOUR,
+                (self.screen.get_width() // 2, self.screen.get_height() // 20),
+            )
         elif event.key == pygame.K_BACKSPACE and current_guess:
-            cell = self.grid.cells[self.grid.current_attempt][len(current_guess) - 1]
-            cell.update("", Constants.EMPTY_COLOUR)
+            self.grid.set_letter(len(current_guess) - 1, "")
             current_guess.pop()
         elif len(current_guess) < len(self.target_word) and event.unicode.isalpha():
-            cell = self.grid.cells[self.grid.current_attempt][len(current_guess)]
-            cell.update(event.unicode.lower(), Constants.EMPTY_COLOUR)
+            self.grid.set_letter(len(current_guess), event.unicode.lower())
             current_guess.append(event.unicode.lower())
 
+    @property
+    def animating(self) -> bool:
+        """
+        Return whether the game needs frames without waiting for input.
+
+        Returns
+        -------
+        bool
+            True while a tile, row or message is animating.
+
+        Examples
+        --------
+        >>> wordle.animating
+        False
+
+        Notes
+        -----
+        See ``Game.animating``.
+        """
+        return bool(self.animations.active)
+
+    def enter(self, screen: pygame.Surface) -> None:
+        """
+        Start a new game on a display.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The display, already cleared.
+
+        Examples
+        --------
+        >>> wordle.enter(pygame.display.get_surface())
+
+        Notes
+        -----
+        The boards, keyboard and animations are created afresh; the solver's
+        feedback matrix is kept, or starts loading in the background.
+        """
+        self.screen = screen
+        self._new_game()
+        self._warm_solver()
+        self._create_boards()
+        self.virtual_keyboard = VirtualKeyboard(self.screen)
+        self.animations = AnimationScheduler()
+        self.popup = Popup(self.animations)
+        self.current_guess = []
+        self.running = True
+
+    def update(self, events: list[pygame.event.Event], dt: int) -> None:
+        """
+        Handle a frame's events and advance the animations.
+
+        Parameters
+        ----------
+        events : list[pygame.event.Event]
+            The events since the last frame.
+        dt : int
+            The milliseconds since the last frame.
+
+        Examples
+        --------
+        >>> wordle.update(pygame.event.get(), 16)
+
+        Notes
+        -----
+        Once the game is won or lost, it keeps running until the last flip
+        and the closing message have finished.
+        """
+        for event in events:
+            if event.type == pygame.VIDEORESIZE:
+                self.screen = pygame.display.get_surface()
+                self.virtual_keyboard.screen = self.screen
+                self._resize_boards()
+                self.virtual_keyboard.resize()
+                self.popup.invalidate()
+            elif event.type == pygame.KEYDOWN:
+                self._handle_keydown(event, self.current_guess)
+
+        self.animations.update(dt)
+        if self._game_over() and not self.animations.active:
+            self.running = False
+
+    def render(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """
+        Draw the tiles, keys and message that changed.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The display.
+
+        Returns
+        -------
+        list[pygame.Rect]
+            The areas drawn.
+
+        Examples
+        --------
+        >>> pygame.display.update(wordle.render(screen))
+
+        Notes
+        -----
+        See ``Grid.draw`` and ``VirtualKeyboard.draw``.
+        """
+        dirty_rects = self._draw_boards() + self.virtual_keyboard.draw()
+        popup_rect = self.popup.draw(screen)
+        if popup_rect is not None:
+            dirty_rects.append(popup_rect)
+        return dirty_rects
+
+    def exit(self) -> None:
+        """
+        Record the result of the game.
+
+        Examples
+        --------
+        >>> wordle.exit()
+
+        Notes
+        -----
+        The score is the number of guesses made. A game left unfinished is
+        neither won nor lost, so it is not saved.
+        """
+        self.score = self._attempts_used()
+        self.won = self._game_won() if self._game_over() else None
+
     def play(self) -> None:
         """
-        Play the Wordle game.
+        Play the Wordle game in a window of its own.
 
         Examples
         --------
@@ -714,34 +1257,72 @@ class Wordle(Game):
 
         Notes
         -----
-        This method plays the Wordle game.
+        The menu runs games on its own ``SceneManager`` instead, so the
+        window is only created once. Frame statistics are kept in
+        ``frame_stats``. The window is closed afterwards, even if the game
+        raises, so Pygame and the glyph cache are left clean.
         """
-        self.target_word = random.choice(self.word_list)
-        self._init_pygame()
-        self.grid = Grid(self.screen, self.target_word)
-        self.virtual_keyboard = VirtualKeyboard(self.screen)
+        manager = SceneManager()
+        try:
+            manager.run(self)
+            self.frame_stats = manager.frame_stats
+        finally:
+            manager.close()
 
-        print(f"Psst.. The word is: {self.target_word}!")  # For testing purposes
 
-        self.running = True
-        current_guess: list[str] = []
-        while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                elif event.type == pygame.VIDEORESIZE:
-                    self.screen = pygame.display.set_mode(
-                        event.dict["size"], pygame.RESIZABLE | pygame.DOUBLEBUF
-                    )
-                    self.screen.fill(Constants.BACKGROUND_COLOUR)
-                    self.grid.resize()
-                    self.virtual_keyboard.resize()
-                    self.grid.draw()
-                    self.virtual_keyboard.draw()
-                elif event.type == pygame.KEYDOWN:
-                    self._handle_keydown(event, current_guess)
-
-            self.grid.draw()
-            self.virtual_keyboard.draw()
-
-        self.score = self.grid.current_attempt
+def create_wordle() -> Wordle | None:
+    """
+    Create a Wordle game from the default word list.
+
+    Returns
+    -------
+    Wordle | None
+        The game, or None if the word list does not exist.
+
+    Examples
+    --------
+    >>> wordle = create_wordle()
+
+    Notes
+    -----
+    This is the game's entry point in the game registry. Everyone gets the
+    same word on the same day.
+    """
+    words = load_words(Paths.WORDS)
+    return Wordle(words, DailyCalendar("wordle")) if words else None
+
+
+def generate_wordle_puzzle(seed: int) -> dict[str, object]:
+    """
+    Choose a single seeded Wordle target as a serialisable record.
+
+    Parameters
+    ----------
+    seed : int
+        The seed for the random number generator.
+
+    Returns
+    -------
+    dict[str, object]
+        The seed and the target word.
+
+    Raises
+    ------
+    ValueError
+        If the word list does not exist or has no words of the right length.
+
+    Examples
+    --------
+    >>> generate_wordle_puzzle(42)["word"]
+    'cigar'
+
+    Notes
+    -----
+    This is a module-level function so that it can be sent to worker processes.
+    """
+    words = load_words(Paths.WORDS)
+    if words is None:
+        raise ValueError(f"Invalid word list: {Paths.WORDS}.")
+
+    word = words.random_word(Constants.WORDLE_WORD_LENGTH, random.Random(seed))
+    return {"seed": seed, "word": word}
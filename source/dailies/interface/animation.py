@@ -0,0 +1,633 @@
+"""animation.py: A frame-driven tween scheduler and non-blocking popup for the game loops."""
+
+from typing import Callable, Hashable
+
+import pygame
+
+from ..config.constants import Constants
+from ..logs.setup_logging import setup_logging
+from .glyph_cache import glyph_cache
+
+animation_logger = setup_logging()
+
+Easing = Callable[[float], float]
+
+
+def linear(progress: float) -> float:
+    """
+    Map progress to itself.
+
+    Parameters
+    ----------
+    progress : float
+        The progress through the tween, from 0 to 1.
+
+    Returns
+    -------
+    float
+        The same progress.
+
+    Examples
+    --------
+    >>> linear(0.25)
+    0.25
+
+    Notes
+    -----
+    This is the default easing.
+    """
+    return progress
+
+
+def ease_in_out(progress: float) -> float:
+    """
+    Ease progress in and out with a smoothstep curve.
+
+    Parameters
+    ----------
+    progress : float
+        The progress through the tween, from 0 to 1.
+
+    Returns
+    -------
+    float
+        The eased progress, from 0 to 1.
+
+    Examples
+    --------
+    >>> ease_in_out(0.25)
+    0.15625
+
+    Notes
+    -----
+    This is ``3t² - 2t³``, which starts and ends with zero velocity.
+    """
+    return progress * progress * (3 - 2 * progress)
+
+
+class Tween:
+    """
+    A value that moves from a start to an end over a number of milliseconds.
+
+    Attributes
+    ----------
+    start : float
+        The value at the start.
+    end : float
+        The value at the end.
+    duration : int
+        The length of the tween, in milliseconds.
+    on_update : Callable[[float], None]
+        Called with the current value on every frame the tween advances.
+    on_complete : Callable[[], None] | None
+        Called once when the tween finishes.
+    delay : int
+        The time to wait before starting, in milliseconds.
+    easing : Easing
+        The easing applied to the progress.
+    tag : Hashable | None
+        A key used to cancel the tween.
+    elapsed : int
+        The time since the tween was scheduled, in milliseconds.
+
+    Methods
+    -------
+    advance(dt: int) -> bool:
+        Advance the tween by a frame.
+
+    Examples
+    --------
+    >>> Tween(0, 255, 500, popup.set_alpha)
+
+    Notes
+    -----
+    A tween does no drawing itself; its callbacks change state, such as an
+    alpha or an offset, which the next draw picks up.
+    """
+
+    def __init__(
+        self,
+        start: float,
+        end: float,
+        duration: int,
+        on_update: Callable[[float], None],
+        on_complete: Callable[[], None] | None = None,
+        delay: int = 0,
+        easing: Easing = linear,
+        tag: Hashable | None = None,
+    ) -> None:
+        """
+        Initialise the tween.
+
+        Parameters
+        ----------
+        start : float
+            The value at the start.
+        end : float
+            The value at the end.
+        duration : int
+            The length of the tween, in milliseconds.
+        on_update : Callable[[float], None]
+            Called with the current value on every frame the tween advances.
+        on_complete : Callable[[], None] | None, optional
+            Called once when the tween finishes, by default None.
+        delay : int, optional
+            The time to wait before starting, in milliseconds, by default 0.
+        easing : Easing, optional
+            The easing applied to the progress, by default ``linear``.
+        tag : Hashable | None, optional
+            A key used to cancel the tween, by default None.
+
+        Examples
+        --------
+        >>> tween = Tween(1, 0, 150, cell.set_scale, delay=300)
+
+        Notes
+        -----
+        Nothing happens until the tween is added to a scheduler.
+        """
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.on_update = on_update
+        self.on_complete = on_complete
+        self.delay = delay
+        self.easing = easing
+        self.tag = tag
+        self.elapsed = 0
+
+    def advance(self, dt: int) -> bool:
+        """
+        Advance the tween by a frame.
+
+        Parameters
+        ----------
+        dt : int
+            The time since the last frame, in milliseconds.
+
+        Returns
+        -------
+        bool
+            True once the tween has finished.
+
+        Examples
+        --------
+        >>> tween.advance(16)
+        False
+
+        Notes
+        -----
+        The final frame always reports exactly ``end``, however large ``dt``
+        is, so a slow frame can never leave a value short of its target.
+        """
+        self.elapsed += dt
+        if self.elapsed < self.delay:
+            return False
+
+        progress = min((self.elapsed - self.delay) / self.duration, 1.0) if self.duration else 1.0
+        self.on_update(self.start + (self.end - self.start) * self.easing(progress))
+        if progress < 1.0:
+            return False
+
+        if self.on_complete is not None:
+            self.on_complete()
+        return True
+
+
+class AnimationScheduler:
+    """
+    Advances every running tween once per frame.
+
+    Attributes
+    ----------
+    tweens : list[Tween]
+        The running tweens, in the order they were added.
+
+    Methods
+    -------
+    add(tween: Tween) -> Tween:
+        Start a tween.
+    cancel(tag: Hashable) -> None:
+        Stop every tween with a tag, without completing it.
+    call_later(delay: int, callback: Callable[[], None]) -> Tween:
+        Call a function after a delay.
+    update(dt: int) -> None:
+        Advance every tween by a frame.
+
+    Examples
+    --------
+    >>> animations = AnimationScheduler()
+    >>> animations.add(Tween(0, 255, 500, popup.set_alpha))
+    >>> animations.update(clock.tick(Constants.FPS))
+
+    Notes
+    -----
+    Animations are driven by the game loop rather than by their own loops,
+    so input is handled on every frame while they run. Tweens added from a
+    callback, such as the second half of a tile flip, start on the next frame.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise the scheduler.
+
+        Examples
+        --------
+        >>> animations = AnimationScheduler()
+
+        Notes
+        -----
+        The scheduler starts with no tweens.
+        """
+        self.tweens: list[Tween] = []
+
+    def __len__(self) -> int:
+        """
+        Return the number of running tweens.
+
+        Returns
+        -------
+        int
+            The number of tweens.
+
+        Examples
+        --------
+        >>> len(animations)
+        0
+
+        Notes
+        -----
+        Delayed tweens that have not started yet are counted.
+        """
+        return len(self.tweens)
+
+    @property
+    def active(self) -> bool:
+        """
+        Return whether any tween is running.
+
+        Returns
+        -------
+        bool
+            True if there is at least one tween.
+
+        Examples
+        --------
+        >>> animations.active
+        False
+
+        Notes
+        -----
+        Game loops use this to wait for an animation without blocking.
+        """
+        return bool(self.tweens)
+
+    def add(self, tween: Tween) -> Tween:
+        """
+        Start a tween.
+
+        Parameters
+        ----------
+        tween : Tween
+            The tween.
+
+        Returns
+        -------
+        Tween
+            The same tween.
+
+        Examples
+        --------
+        >>> animations.add(Tween(0, 1, 400, shake, tag="shake"))
+
+        Notes
+        -----
+        The tween's first update happens on the next call to ``update``.
+        """
+        self.tweens.append(tween)
+        return tween
+
+    def call_later(self, delay: int, callback: Callable[[], None]) -> Tween:
+        """
+        Call a function after a delay.
+
+        Parameters
+        ----------
+        delay : int
+            The delay, in milliseconds.
+        callback : Callable[[], None]
+            The function.
+
+        Returns
+        -------
+        Tween
+            The zero-length tween that makes the call.
+
+        Examples
+        --------
+        >>> animations.call_later(1000, keyboard.refresh)
+
+        Notes
+        -----
+        The call happens on the first frame after the delay has passed.
+        """
+        return self.add(Tween(0, 0, 0, lambda value: None, callback, delay=delay))
+
+    def cancel(self, tag: Hashable) -> None:
+        """
+        Stop every tween with a tag, without completing it.
+
+        Parameters
+        ----------
+        tag : Hashable
+            The tag.
+
+        Examples
+        --------
+        >>> animations.cancel("popup")
+
+        Notes
+        -----
+        ``on_complete`` is not called for cancelled tweens.
+        """
+        self.tweens = [tween for tween in self.tweens if tween.tag != tag]
+
+    def update(self, dt: int) -> None:
+        """
+        Advance every tween by a frame.
+
+        Parameters
+        ----------
+        dt : int
+            The time since the last frame, in milliseconds.
+
+        Examples
+        --------
+        >>> animations.update(16)
+
+        Notes
+        -----
+        Finished tweens are removed.
+        """
+        running, self.tweens = self.tweens, []
+        running = [tween for tween in running if not tween.advance(dt)]
+        self.tweens = running + self.tweens
+
+
+class Popup:
+    """
+    A message that fades in, holds, and fades out while the game keeps running.
+
+    Attributes
+    ----------
+    animations : AnimationScheduler
+        The scheduler that drives the fades.
+    background : tuple[int, int, int]
+        The colour drawn behind the message.
+    text : pygame.Surface | None
+        The rendered message, or None when nothing is shown.
+    rect : pygame.Rect | None
+        The area the message covers.
+    alpha : int
+        The current opacity of the message.
+
+    Methods
+    -------
+    show(
+        message: str,
+        size: int,
+        colour: tuple[int, int, int],
+        center: tuple[int, int],
+        duration: int = 2000,
+    ) -> None:
+        Show a message, replacing any current one.
+    set_alpha(alpha: float) -> None:
+        Set the opacity of the message.
+    invalidate() -> None:
+        Mark the popup to be drawn again, after the screen is cleared.
+    draw(screen: pygame.Surface) -> pygame.Rect | None:
+        Draw the popup if it has changed.
+
+    Examples
+    --------
+    >>> popup = Popup(animations)
+    >>> popup.show("Invalid word", 30, Constants.FONT_COLOUR, (400, 30))
+
+    Notes
+    -----
+    The message is rendered once per ``show``, and each frame only changes its
+    alpha, so no surface is allocated while it fades. The area is filled with
+    the background before every blit, so the text never builds up.
+    """
+
+    TAG = "popup"
+
+    def __init__(
+        self,
+        animations: AnimationScheduler,
+        background: tuple[int, int, int] = Constants.BACKGROUND_COLOUR,
+    ) -> None:
+        """
+        Initialise the popup.
+
+        Parameters
+        ----------
+        animations : AnimationScheduler
+            The scheduler that drives the fades.
+        background : tuple[int, int, int], optional
+            The colour drawn behind the message, by default
+            ``Constants.BACKGROUND_COLOUR``.
+
+        Examples
+        --------
+        >>> popup = Popup(animations)
+
+        Notes
+        -----
+        Nothing is shown until ``show`` is called.
+        """
+        self.animations = animations
+        self.background = background
+        self.text: pygame.Surface | None = None
+        self.rect: pygame.Rect | None = None
+        self.alpha = 0
+        self._dirty_rect: pygame.Rect | None = None
+
+    def show(
+        self,
+        message: str,
+        size: int,
+        colour: tuple[int, int, int],
+        center: tuple[int, int],
+        duration: int = 2000,
+    ) -> None:
+        """
+        Show a message, replacing any current one.
+
+        Parameters
+        ----------
+        message : str
+            The message.
+        size : int
+            The font size.
+        colour : tuple[int, int, int]
+            The font colour.
+        center : tuple[int, int]
+            The centre of the message.
+        duration : int, optional
+            Twice the length of each phase, by default 2000. The message fades
+            in over ``duration / 2`` ms, holds for ``duration / 2`` ms and
+            fades out over ``duration / 2`` ms, so it is shown for
+            ``1.5 * duration`` ms in all.
+
+        Examples
+        --------
+        >>> popup.show("You Win!", 30, Constants.FONT_COLOUR, (400, 30))
+
+        Notes
+        -----
+        This returns immediately; the fades run as the game loop calls the
+        scheduler.
+        """
+        self.animations.cancel(self.TAG)
+        self.text = glyph_cache.font(size).render(message, True, colour)
+        old_rect = self.rect
+        self.rect = self.text.get_rect(center=center)
+        self._mark_dirty(old_rect)
+        self._mark_dirty(self.rect)
+        self.alpha = 0
+
+        half = duration // 2
+        self.animations.add(Tween(0, 255, half, self.set_alpha, tag=self.TAG))
+        self.animations.add(
+            Tween(255, 0, half, self.set_alpha, self._hide, delay=duration, tag=self.TAG)
+        )
+
+    @property
+    def active(self) -> bool:
+        """
+        Return whether a message is being shown.
+
+        Returns
+        -------
+        bool
+            True while a message is on screen.
+
+        Examples
+        --------
+        >>> popup.active
+        False
+
+        Notes
+        -----
+        This becomes False once the fade out ends.
+        """
+        return self.text is not None
+
+    def set_alpha(self, alpha: float) -> None:
+        """
+        Set the opacity of the message.
+
+        Parameters
+        ----------
+        alpha : float
+            The opacity, from 0 to 255.
+
+        Examples
+        --------
+        >>> popup.set_alpha(128)
+
+        Notes
+        -----
+        The popup is only redrawn when the rounded alpha actually changes.
+        """
+        alpha = int(alpha)
+        if alpha != self.alpha:
+            self.alpha = alpha
+            self._mark_dirty(self.rect)
+
+    def invalidate(self) -> None:
+        """
+        Mark the popup to be drawn again, after the screen is cleared.
+
+        Examples
+        --------
+        >>> popup.invalidate()
+
+        Notes
+        -----
+        Call this after a resize fills the screen.
+        """
+        self._mark_dirty(self.rect)
+
+    def _hide(self) -> None:
+        """
+        Remove the message once it has faded out.
+
+        Examples
+        --------
+        >>> popup._hide()
+
+        Notes
+        -----
+        The area is cleared on the next draw.
+        """
+        self._mark_dirty(self.rect)
+        self.text = None
+
+    def _mark_dirty(self, rect: pygame.Rect | None) -> None:
+        """
+        Add an area to the part of the screen to redraw.
+
+        Parameters
+        ----------
+        rect : pygame.Rect | None
+            The area, or None for nothing.
+
+        Examples
+        --------
+        >>> popup._mark_dirty(popup.rect)
+
+        Notes
+        -----
+        Areas are merged, so replacing a long message with a short one still
+        clears the whole of the long one.
+        """
+        if rect is None:
+            return
+        self._dirty_rect = rect.copy() if self._dirty_rect is None else self._dirty_rect.union(rect)
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect | None:
+        """
+        Draw the popup if it has changed.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The surface to draw on.
+
+        Returns
+        -------
+        pygame.Rect | None
+            The area drawn, to pass to ``pygame.display.update``, or None if
+            nothing changed.
+
+        Examples
+        --------
+        >>> rect = popup.draw(screen)
+
+        Notes
+        -----
+        The text surface's own alpha is used, so no overlay is needed. The
+        surface is rendered from the shared font but is not itself shared, so
+        changing its alpha affects nothing else.
+        """
+        if self._dirty_rect is None:
+            return None
+
+        dirty_rect, self._dirty_rect = self._dirty_rect, None
+        screen.fill(self.background, dirty_rect)
+        if self.text is not None and self.rect is not None:
+            self.text.set_alpha(self.alpha)
+            screen.blit(self.text, self.rect)
+        return dirty_rect
@@ -0,0 +1,131 @@
+"""command_line.py: Contains the command line interface for the application."""
+
+import argparse
+
+from ..config.constants import Constants
+from ..games.puzzle_pool import PUZZLE_GENERATORS
+
+
+def parse_arguments(arguments: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Parameters
+    ----------
+    arguments : list[str] | None, optional
+        The arguments to parse, by default None (read from ``sys.argv``).
+
+    Returns
+    -------
+    argparse.Namespace
+        The parsed arguments. ``command`` is None when no subcommand is given.
+
+    Examples
+    --------
+    >>> parse_arguments(["pregenerate", "sudoku", "--count", "10"]).count
+    10
+
+    Notes
+    -----
+    Running ``dailies`` without a subcommand opens the game menu. Only the
+    Sudoku generator takes a difficulty, so ``--difficulty`` is rejected for
+    any other game.
+    """
+    parser = argparse.ArgumentParser(
+        prog="dailies", description="A collection of daily games inspired by NYT Games."
+    )
+    parser.add_argument(
+        "--warm-up",
+        action="store_true",
+        help="Load the games in the background while the menu is open.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    pregenerate_parser = subparsers.add_parser(
+        "pregenerate",
+        help="Pre-generate practice puzzles into the on-disk puzzle pool, which games draw "
+        "from while their daily puzzle is not precomputed yet.",
+    )
+    pregenerate_parser.add_argument(
+        "game", choices=sorted(PUZZLE_GENERATORS), help="The game to generate puzzles for."
+    )
+    pregenerate_parser.add_argument(
+        "--count",
+        type=int,
+        default=Constants.PUZZLE_POOL_COUNT_DEFAULT,
+        help="The number of puzzles to generate.",
+    )
+    pregenerate_parser.add_argument(
+        "--seed",
+        type=int,
+        default=Constants.PUZZLE_POOL_SEED_DEFAULT,
+        help="The seed of the batch, from which every puzzle's seed is derived.",
+    )
+    pregenerate_parser.add_argument(
+        "--start",
+        type=int,
+        default=0,
+        help="The index of the first puzzle within the batch.",
+    )
+    pregenerate_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="The number of worker processes, by default one per CPU core.",
+    )
+    pregenerate_parser.add_argument(
+        "--difficulty",
+        choices=Constants.SUDOKU_DIFFICULTIES,
+        default=None,
+        help="The Sudoku difficulty band to generate, by default any difficulty.",
+    )
+
+    schedule_parser = subparsers.add_parser(
+        "schedule", help="Precompute the daily puzzles of every game for the coming days."
+    )
+    schedule_parser.add_argument(
+        "--days",
+        type=int,
+        default=Constants.DAILY_DAYS_DEFAULT,
+        help="The number of days to precompute, starting today.",
+    )
+    schedule_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="The number of worker processes, by default one per CPU core.",
+    )
+
+    subparsers.add_parser(
+        "build-cache",
+        help="Compile the word lists into the binary word cache, and precompute the "
+        "Wordle feedback matrix.",
+    )
+
+    simulate_parser = subparsers.add_parser(
+        "simulate", help="Play Wordle games headlessly and report how a strategy performs."
+    )
+    simulate_parser.add_argument(
+        "--games",
+        type=int,
+        default=Constants.WORDLE_SIMULATION_GAMES_DEFAULT,
+        help="The number of games to play.",
+    )
+    simulate_parser.add_argument(
+        "--strategy",
+        choices=("solver", "random"),
+        default="solver",
+        help="The strategy to play: the entropy solver, or random guesses.",
+    )
+    simulate_parser.add_argument(
+        "--seed", type=int, default=0, help="The seed used to choose the target words."
+    )
+
+    parsed_arguments = parser.parse_args(arguments)
+    if (
+        parsed_arguments.command == "pregenerate"
+        and parsed_arguments.difficulty is not None
+        and parsed_arguments.game != "sudoku"
+    ):
+        pregenerate_parser.error("--difficulty is only supported for sudoku")
+    return parsed_arguments
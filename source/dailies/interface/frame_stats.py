@@ -0,0 +1,192 @@
+"""frame_stats.py: Frame-time and CPU usage statistics for the game loops."""
+
+import time
+from collections import deque
+
+from ..config.constants import Constants
+from ..logs.setup_logging import setup_logging
+
+frame_stats_logger = setup_logging()
+
+
+class FrameStats:
+    """
+    Frame-time and CPU usage of a render loop.
+
+    Attributes
+    ----------
+    frames : int
+        The number of frames recorded.
+    frame_times : deque[float]
+        The work time of the most recent frames, in seconds.
+
+    Methods
+    -------
+    record(seconds: float) -> None:
+        Record the work time of a frame.
+    mean_frame_ms() -> float:
+        Return the mean work time of the recent frames.
+    percentile_frame_ms(percentile: float) -> float:
+        Return a percentile of the work time of the recent frames.
+    cpu_percent() -> float:
+        Return the process CPU time as a percentage of wall time.
+    summary() -> str:
+        Describe the statistics in one line.
+
+    Examples
+    --------
+    >>> stats = FrameStats()
+    >>> stats.record(0.002)
+    >>> stats.summary()
+    '1 frames in 0.5 s: mean 2.00 ms, p95 2.00 ms, CPU 3%'
+
+    Notes
+    -----
+    Frame time is the time spent handling events, animating and drawing, not
+    the time spent waiting for events or for the frame cap. CPU usage is
+    measured for the whole process from when the statistics were created,
+    so an idle loop that blocks on events shows close to 0%.
+    """
+
+    def __init__(self, window: int = Constants.FRAME_STATS_WINDOW) -> None:
+        """
+        Initialise the statistics.
+
+        Parameters
+        ----------
+        window : int, optional
+            The number of recent frames kept for frame-time statistics, by
+            default ``Constants.FRAME_STATS_WINDOW``.
+
+        Examples
+        --------
+        >>> stats = FrameStats()
+
+        Notes
+        -----
+        The wall and CPU clocks start here.
+        """
+        self.frames = 0
+        self.frame_times: deque[float] = deque(maxlen=window)
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def record(self, seconds: float) -> None:
+        """
+        Record the work time of a frame.
+
+        Parameters
+        ----------
+        seconds : float
+            The time the frame took, in seconds.
+
+        Examples
+        --------
+        >>> stats.record(0.002)
+
+        Notes
+        -----
+        Only the most recent frames are kept, so memory stays bounded.
+        """
+        self.frames += 1
+        self.frame_times.append(seconds)
+
+    def mean_frame_ms(self) -> float:
+        """
+        Return the mean work time of the recent frames.
+
+        Returns
+        -------
+        float
+            The mean, in milliseconds, or 0 if no frames were recorded.
+
+        Examples
+        --------
+        >>> stats.mean_frame_ms()
+        2.0
+
+        Notes
+        -----
+        Only frames in the window are included.
+        """
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times) * 1000
+
+    def percentile_frame_ms(self, percentile: float) -> float:
+        """
+        Return a percentile of the work time of the recent frames.
+
+        Parameters
+        ----------
+        percentile : float
+            The percentile, from 0 to 100.
+
+        Returns
+        -------
+        float
+            The frame time, in milliseconds, or 0 if no frames were recorded.
+
+        Examples
+        --------
+        >>> stats.percentile_frame_ms(95)
+        2.0
+
+        Notes
+        -----
+        This is the nearest-rank percentile.
+        """
+        if not self.frame_times:
+            return 0.0
+        ordered = sorted(self.frame_times)
+        rank = min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))
+        return ordered[rank] * 1000
+
+    def cpu_percent(self) -> float:
+        """
+        Return the process CPU time as a percentage of wall time.
+
+        Returns
+        -------
+        float
+            The CPU usage since the statistics were created, where 100 is
+            one core kept busy.
+
+        Examples
+        --------
+        >>> stats.cpu_percent()
+        3.1
+
+        Notes
+        -----
+        This includes every thread in the process.
+        """
+        wall = time.perf_counter() - self._wall_start
+        if wall <= 0:
+            return 0.0
+        return (time.process_time() - self._cpu_start) / wall * 100
+
+    def summary(self) -> str:
+        """
+        Describe the statistics in one line.
+
+        Returns
+        -------
+        str
+            The number of frames, the wall time, the mean and 95th percentile
+            frame times, and the CPU usage.
+
+        Examples
+        --------
+        >>> stats.summary()
+        '1 frames in 0.5 s: mean 2.00 ms, p95 2.00 ms, CPU 3%'
+
+        Notes
+        -----
+        The game loops log this when they finish.
+        """
+        wall = time.perf_counter() - self._wall_start
+        return (
+            f"{self.frames} frames in {wall:.1f} s: mean {self.mean_frame_ms():.2f} ms, "
+            f"p95 {self.percentile_frame_ms(95):.2f} ms, CPU {self.cpu_percent():.0f}%"
+        )
@@ -0,0 +1,197 @@
+"""glyph_cache.py: A shared least-recently-used cache of fonts and rendered text."""
+
+from collections import OrderedDict
+
+import pygame
+
+from ..config.constants import Constants
+from ..logs.setup_logging import setup_logging
+
+glyph_cache_logger = setup_logging()
+
+
+class GlyphCache:
+    """
+    A least-recently-used cache of fonts by size and rendered text by size, text and colour.
+
+    Attributes
+    ----------
+    max_glyphs : int
+        The number of rendered texts kept.
+    max_fonts : int
+        The number of fonts kept.
+    hits : int
+        The number of renders served from the cache.
+    misses : int
+        The number of renders that had to be drawn.
+
+    Methods
+    -------
+    font(size: int) -> pygame.font.Font:
+        Return the default font at a size.
+    render(text: str, size: int, colour: tuple[int, int, int]) -> pygame.Surface:
+        Return a text rendered in the default font.
+    clear() -> None:
+        Forget every font and rendered text.
+
+    Examples
+    --------
+    >>> glyphs = GlyphCache()
+    >>> screen.blit(glyphs.render("A", 60, Constants.FONT_COLOUR), (0, 0))
+
+    Notes
+    -----
+    Loading a font reads and parses the font file, and rendering rasterises
+    the text, so a grid of 30 cells and a keyboard of 26 keys used to do
+    dozens of each on every resize. With the cache, a redraw is only blits.
+    Rendered surfaces are shared, so callers must not modify them; copy one
+    first to change its alpha.
+    """
+
+    def __init__(
+        self,
+        max_glyphs: int = Constants.GLYPH_CACHE_SIZE,
+        max_fonts: int = Constants.FONT_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialise the cache.
+
+        Parameters
+        ----------
+        max_glyphs : int, optional
+            The number of rendered texts kept, by default
+            ``Constants.GLYPH_CACHE_SIZE``.
+        max_fonts : int, optional
+            The number of fonts kept, by default ``Constants.FONT_CACHE_SIZE``.
+
+        Examples
+        --------
+        >>> glyphs = GlyphCache(max_glyphs=64)
+
+        Notes
+        -----
+        Nothing is loaded until it is first asked for.
+        """
+        self.max_glyphs = max_glyphs
+        self.max_fonts = max_fonts
+        self.hits = 0
+        self.misses = 0
+        self._fonts: OrderedDict[int, pygame.font.Font] = OrderedDict()
+        self._glyphs: OrderedDict[tuple[int, str, tuple[int, int, int]], pygame.Surface] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """
+        Return the number of rendered texts held.
+
+        Returns
+        -------
+        int
+            The number of rendered texts.
+
+        Examples
+        --------
+        >>> len(glyphs)
+        26
+
+        Notes
+        -----
+        Fonts are not counted.
+        """
+        return len(self._glyphs)
+
+    def font(self, size: int) -> pygame.font.Font:
+        """
+        Return the default font at a size.
+
+        Parameters
+        ----------
+        size : int
+            The font size.
+
+        Returns
+        -------
+        pygame.font.Font
+            The font.
+
+        Examples
+        --------
+        >>> glyphs.font(36).size("Hello")
+        (66, 25)
+
+        Notes
+        -----
+        The font module is initialised if it is not already.
+        """
+        font = self._fonts.get(size)
+        if font is not None:
+            self._fonts.move_to_end(size)
+            return font
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(None, size)
+        self._fonts[size] = font
+        if len(self._fonts) > self.max_fonts:
+            self._fonts.popitem(last=False)
+        return font
+
+    def render(self, text: str, size: int, colour: tuple[int, int, int]) -> pygame.Surface:
+        """
+        Return a text rendered in the default font.
+
+        Parameters
+        ----------
+        text : str
+            The text, usually a single letter.
+        size : int
+            The font size.
+        colour : tuple[int, int, int]
+            The text colour.
+
+        Returns
+        -------
+        pygame.Surface
+            The antialiased text, shared with every other caller.
+
+        Examples
+        --------
+        >>> glyphs.render("A", 60, Constants.FONT_COLOUR).get_size()
+        (29, 41)
+
+        Notes
+        -----
+        The least recently used text is evicted once the cache is full.
+        """
+        key = (size, text, colour)
+        surface = self._glyphs.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._glyphs.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size).render(text, True, colour)
+        self._glyphs[key] = surface
+        if len(self._glyphs) > self.max_glyphs:
+            self._glyphs.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """
+        Forget every font and rendered text.
+
+        Examples
+        --------
+        >>> glyphs.clear()
+
+        Notes
+        -----
+        Call this after ``pygame.quit``, since fonts do not survive it.
+        """
+        self._fonts.clear()
+        self._glyphs.clear()
+
+
+glyph_cache = GlyphCache()
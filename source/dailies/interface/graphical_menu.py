@@ -1,25 +1,30 @@
 """graphical_menu.py: Contains the graphical menu for the games."""
 
-import sys
-
 import pygame
 
 from ..config.constants import Constants
+from ..file_interaction.score_store import ScoreStore
+from ..games.registry import GameRegistry
 from ..logs.setup_logging import setup_logging
+from .glyph_cache import glyph_cache
+from .scene_manager import SceneManager
 
 interface_logger = setup_logging()
 
-# TODO: Refactor this code to use a class-based approach
+LEADERBOARD = "leaderboard"
+BACK = "back"
+
+MenuItem = tuple[str, tuple[int, int, int], str | None]  # text, colour, target
 
 
 def draw_text(
     text: str,
-    font: pygame.font.Font,
-    color: tuple,
+    font_size: int,
+    color: tuple[int, int, int],
     surface: pygame.Surface,
     x: int,
     y: int,
-) -> None:
+) -> pygame.Rect:
     """
     Draw text on the screen.
 
@@ -27,9 +32,9 @@ def draw_text(
     ----------
     text : str
         The text to display.
-    font : pygame.font.Font
-        The font to use.
-    color : tuple
+    font_size : int
+        The font size.
+    color : tuple[int, int, int]
         The color of the text.
     surface : pygame.Surface
         The Pygame surface.
@@ -38,143 +43,441 @@ def draw_text(
     y : int
         The y-coordinate of the text.
 
+    Returns
+    -------
+    pygame.Rect
+        The area of the text.
+
     Examples
     --------
-    >>> draw_text("Hello, World!", font, (255, 255, 255), screen, 50, 50)
+    >>> draw_text("Hello, World!", 36, (255, 255, 255), screen, 50, 50)
 
     Notes
     -----
-    This function draws text on the screen using Pygame.
+    This function draws text on the screen using Pygame. The rendered text
+    comes from the shared glyph cache, so each label is only rendered once.
     """
-    textobj = font.render(text, 1, color)
+    textobj = glyph_cache.render(text, font_size, color)
     textrect = textobj.get_rect()
     textrect.topleft = (x, y)
     surface.blit(textobj, textrect)
+    return textrect
+
+
+class MenuPage:
+    """
+    One page of the menu: a title and a column of clickable items.
+
+    Attributes
+    ----------
+    title : str
+        The title at the top of the page.
+    items : list[MenuItem]
+        The text, colour and target of each item; items without a target
+        cannot be clicked.
+    footer : list[MenuItem]
+        Items placed after a gap below the others.
+    font_size : int
+        The font size.
+    buttons : list[tuple[pygame.Rect, str]]
+        The clickable area and target of each item, once drawn.
+
+    Methods
+    -------
+    draw(screen: pygame.Surface) -> None:
+        Draw the whole page.
+    target_at(position: tuple[int, int]) -> str | None:
+        Return the target of the item at a position.
+
+    Examples
+    --------
+    >>> page = MenuPage("Choose a game to play:", [("1. Wordle", colour, "Wordle")])
+    >>> page.draw(screen)
+    >>> page.target_at((60, 70))
+    'Wordle'
+
+    Notes
+    -----
+    A page is only drawn when it is shown or uncovered, never every frame,
+    and its text comes from the shared glyph cache.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        items: list[MenuItem],
+        footer: list[MenuItem] | None = None,
+        font_size: int = Constants.MENU_FONT_SIZE,
+    ) -> None:
+        """
+        Initialise the page.
+
+        Parameters
+        ----------
+        title : str
+            The title at the top of the page.
+        items : list[MenuItem]
+            The text, colour and target of each item.
+        footer : list[MenuItem] | None, optional
+            Items placed after a gap below the others, by default None.
+        font_size : int, optional
+            The font size, by default ``Constants.MENU_FONT_SIZE``.
+
+        Examples
+        --------
+        >>> page = MenuPage("Leaderboards:", scores, [("Back to Menu", colour, BACK)])
+
+        Notes
+        -----
+        Nothing is drawn until ``draw`` is called.
+        """
+        self.title = title
+        self.items = items
+        self.footer = footer or []
+        self.font_size = font_size
+        self.buttons: list[tuple[pygame.Rect, str]] = []
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Draw the whole page.
+
+        Parameters
+        ----------
+        screen : pygame.Surface
+            The Pygame surface.
+
+        Examples
+        --------
+        >>> page.draw(screen)
+
+        Notes
+        -----
+        Each item's clickable area is at least ``Constants.MENU_BUTTON_SIZE``.
+        """
+        screen.fill(Constants.BACKGROUND_COLOUR)
+        title_x, title_y = Constants.MENU_TITLE_POSITION
+        draw_text(self.title, self.font_size, Constants.FONT_COLOUR, screen, title_x, title_y)
+
+        self.buttons = []
+        width, height = Constants.MENU_BUTTON_SIZE
+        y = Constants.MENU_ITEM_Y
+        for items, gap in ((self.items, 0), (self.footer, Constants.MENU_LINE_HEIGHT // 2)):
+            if items:
+                y += gap
+            for text, colour, target in items:
+                rect = draw_text(text, self.font_size, colour, screen, Constants.MENU_ITEM_X, y)
+                if target is not None:
+                    button = pygame.Rect(rect.x, rect.y, max(rect.w, width), max(rect.h, height))
+                    self.buttons.append((button, target))
+                y += Constants.MENU_LINE_HEIGHT
+
+    def target_at(self, position: tuple[int, int]) -> str | None:
+        """
+        Return the target of the item at a position.
+
+        Parameters
+        ----------
+        position : tuple[int, int]
+            The position, such as a mouse click.
+
+        Returns
+        -------
+        str | None
+            The target, or None if no item is there.
+
+        Examples
+        --------
+        >>> page.target_at((60, 70))
+        'Wordle'
+
+        Notes
+        -----
+        Only items drawn by the last ``draw`` are found.
+        """
+        for rect, target in self.buttons:
+            if rect.collidepoint(position):
+                return target
+        return None
+
+
+def main_page(registry: GameRegistry, font_size: int = Constants.MENU_FONT_SIZE) -> MenuPage:
+    """
+    Build the page listing the games.
+
+    Parameters
+    ----------
+    registry : GameRegistry
+        The registry of games.
+    font_size : int, optional
+        The font size, by default ``Constants.MENU_FONT_SIZE``.
+
+    Returns
+    -------
+    MenuPage
+        The page, with one item per game and a leaderboard item.
+
+    Examples
+    --------
+    >>> main_page(registry).draw(screen)
+
+    Notes
+    -----
+    A game is only marked as not available once loading it has failed, so
+    building the page never imports or builds a game.
+    """
+    items: list[MenuItem] = []
+    for i, game in enumerate(registry.names(), start=1):
+        if registry.is_available(game) is not False:
+            items.append((f"{i}. {game}", Constants.FONT_COLOUR, game))
+        else:
+            items.append((f"{i}. {game} (not available)", Constants.WRONG_COLOUR, game))
+    items.append(("View Leaderboard", Constants.FONT_COLOUR, LEADERBOARD))
+    return MenuPage("Choose a game to play:", items, font_size=font_size)
+
+
+def leaderboard_page(
+    registry: GameRegistry,
+    font_size: int = Constants.MENU_FONT_SIZE,
+    scores: ScoreStore | None = None,
+) -> MenuPage:
+    """
+    Build the page showing each game's score.
+
+    Parameters
+    ----------
+    registry : GameRegistry
+        The registry of games.
+    font_size : int, optional
+        The font size, by default ``Constants.MENU_FONT_SIZE``.
+    scores : ScoreStore | None, optional
+        The saved results, by default None (show the last score of each game
+        played this session).
+
+    Returns
+    -------
+    MenuPage
+        The page, with one line per game and a back item.
+
+    Examples
+    --------
+    >>> leaderboard_page(registry, scores=ScoreStore()).draw(screen)
+
+    Notes
+    -----
+    With a score store, each game shows its best score, the current streak
+    and the number of games played, all answered from indexes. Without one,
+    games that have not been loaded yet have no score, so they are not
+    loaded here.
+    """
+    items: list[MenuItem] = []
+    if scores is not None:
+        scores.flush()
+    for name in registry.names():
+        if scores is not None:
+            played = scores.played(name)
+            best = scores.top(name, 1)
+            if not played:
+                score_text = f"{name}: Not played"
+            else:
+                best_text = f"best {best[0].score}" if best else "no wins"
+                score_text = f"{name}: {best_text}, streak {scores.streak(name)}, {played} played"
+            items.append((score_text, Constants.FONT_COLOUR, None))
+            continue
+
+        game = registry.peek(name)
+        if game:
+            try:
+                score_text = f"{game.__name__()}: {game.score}"
+            except AttributeError:
+                score_text = f"{game.__name__()}: Unavailable"
+        elif not registry.is_loaded(name):
+            score_text = f"{name}: Not played"
+        else:
+            score_text = "Unavailable"  # TODO: Fix magic strings throughout the code
+        items.append((score_text, Constants.FONT_COLOUR, None))
+    back: list[MenuItem] = [("Back to Menu", Constants.FONT_COLOUR, BACK)]
+    return MenuPage("Leaderboards:", items, back, font_size)
 
 
-def gui_leaderboard(screen: pygame.Surface, font: pygame.font.Font, games: dict) -> None:
+def draw_menu(
+    screen: pygame.Surface, font_size: int, registry: GameRegistry
+) -> list[tuple[str, int, int, str]]:
     """
-    Display the leaderboard in a graphical interface.
+    Draw the main menu page.
 
     Parameters
     ----------
     screen : pygame.Surface
         The Pygame surface.
-    font : pygame.font.Font
-        The font to use.
-    games : dict
-        A dictionary of games.
+    font_size : int
+        The font size.
+    registry : GameRegistry
+        The registry of games.
+
+    Returns
+    -------
+    list[tuple[str, int, int, str]]
+        The text, x-coordinate, y-coordinate and target of every button.
 
     Examples
     --------
-    >>> gui_leaderboard(screen, font, games)
+    >>> buttons = draw_menu(screen, Constants.MENU_FONT_SIZE, registry)
 
     Notes
     -----
-    This function displays the leaderboard in a graphical interface using Pygame.
+    This draws the first frame of the menu without running it.
     """
-    running = True
-    while running:
-        screen.fill(Constants.BACKGROUND_COLOUR)
-        draw_text(
-            "Leaderboards:", font, Constants.FONT_COLOUR, screen, 20, 20
-        )  # TODO: Fix magic numbers throughout the code
-
-        y = 60
-        for game in games.values():
-            if game:
-                try:
-                    score_text = f"{game.__name__()}: {game.score}"
-                except AttributeError:
-                    score_text = f"{game.__name__()}: Unavailable"
-            else:
-                score_text = "Unavailable"  # TODO: Fix magic strings throughout the code
-            draw_text(score_text, font, Constants.FONT_COLOUR, screen, 50, y)
-            y += 40
+    page = main_page(registry, font_size)
+    page.draw(screen)
+    texts = [text for text, _, target in page.items if target is not None]
+    return [(text, rect.x, rect.y, target) for text, (rect, target) in zip(texts, page.buttons)]
+
 
-        # Draw Back to Menu button
-        back_text = "Back to Menu"
-        back_button_y = y + 20  # Positioning the button just below the last score
-        draw_text(back_text, font, Constants.FONT_COLOUR, screen, 50, back_button_y)
+class GraphicalMenu:
+    """
+    The graphical menu, as a stack of pages.
+
+    Attributes
+    ----------
+    registry : GameRegistry
+        The registry of games.
+    pages : list[MenuPage]
+        The open pages; the last one is shown.
+    scenes : SceneManager
+        The owner of the window, which games are run on and which saves
+        their results.
 
-        for event in pygame.event.get():
+    Methods
+    -------
+    run() -> None:
+        Show the menu until the window is closed.
+
+    Examples
+    --------
+    >>> GraphicalMenu(GameRegistry(DEFAULT_GAMES)).run()
+
+    Notes
+    -----
+    The menu blocks in ``pygame.event.wait`` between events and only redraws
+    when its page changes or the window is uncovered, so it uses no CPU while
+    idle. Opening the leaderboard pushes a page and going back pops it, and a
+    finished game returns to the loop rather than starting a new menu, so the
+    call stack never grows however many games are played. Games run on the
+    menu's own window, which is created once.
+    """
+
+    def __init__(self, registry: GameRegistry, scenes: SceneManager | None = None) -> None:
+        """
+        Initialise the menu.
+
+        Parameters
+        ----------
+        registry : GameRegistry
+            The registry of games.
+        scenes : SceneManager | None, optional
+            The owner of the window, by default a new one at
+            ``Constants.MENU_SIZE`` saving results to the default score store.
+
+        Examples
+        --------
+        >>> menu = GraphicalMenu(registry)
+
+        Notes
+        -----
+        The window is opened by ``run``.
+        """
+        self.registry = registry
+        self.pages: list[MenuPage] = []
+        self.scenes = scenes or SceneManager(Constants.MENU_SIZE, ScoreStore())
+
+    def _select(self, target: str) -> None:
+        """
+        Act on a clicked item.
+
+        Parameters
+        ----------
+        target : str
+            The item's target: a game name, ``LEADERBOARD`` or ``BACK``.
+
+        Examples
+        --------
+        >>> menu._select("Wordle")
+
+        Notes
+        -----
+        Playing a game blocks until it ends, then the main page is rebuilt,
+        since the game may have turned out to be unavailable.
+        """
+        if target == LEADERBOARD:
+            self.pages.append(leaderboard_page(self.registry, scores=self.scenes.scores))
+        elif target == BACK:
+            if len(self.pages) > 1:
+                self.pages.pop()
+        else:
+            selected = self.registry.get(target)
+            if selected:
+                self.scenes.run(selected)
+                pygame.display.set_caption("Game Menu")
+            self.pages[0] = main_page(self.registry)
+
+    def run(self) -> None:
+        """
+        Show the menu until the window is closed.
+
+        Examples
+        --------
+        >>> menu.run()
+
+        Notes
+        -----
+        Pygame is shut down and the score store closed when the menu closes.
+        """
+        self.scenes.open()
+        pygame.display.set_caption("Game Menu")
+        self.pages = [main_page(self.registry)]
+
+        needs_redraw = True
+        while self.pages:
+            if needs_redraw:
+                self.pages[-1].draw(self.scenes.open())
+                pygame.display.update()
+                needs_redraw = False
+
+            event = pygame.event.wait()
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                self.pages.clear()
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                x, y = event.pos
-                # Check if Back to Menu button is clicked
-                if 50 <= x <= 350 and back_button_y <= y <= back_button_y + 30:
-                    running = False  # Exit leaderboard loop to return to main menu
+                target = self.pages[-1].target_at(event.pos)
+                if target is not None:
+                    self._select(target)
+                    needs_redraw = True
+            elif event.type == pygame.VIDEORESIZE:
+                self.scenes.display = pygame.display.get_surface()
+                needs_redraw = True
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                needs_redraw = True
 
-        pygame.display.update()
+        self.scenes.close()
+        if self.scenes.scores is not None:
+            self.scenes.scores.close()
 
 
-def main_menu(games: dict) -> None:
+def main_menu(registry: GameRegistry) -> None:
     """
     Display the main menu in a graphical interface.
 
     Parameters
     ----------
-    games : dict
-        A dictionary of games.
+    registry : GameRegistry
+        The registry of games.
 
     Examples
     --------
-    >>> main_menu(games)
+    >>> main_menu(GameRegistry(DEFAULT_GAMES))
 
     Notes
     -----
     This function displays the main menu in a graphical interface using Pygame.
+    A game is loaded from the registry when it is selected.
     """
-    pygame.init()
-
-    screen_width, screen_height = 800, 600
-    screen = pygame.display.set_mode((screen_width, screen_height))
-    pygame.display.set_caption("Game Menu")
-
-    font = pygame.font.Font(None, 36)
-
-    running = True
-    while running:
-        screen.fill(Constants.BACKGROUND_COLOUR)
-        draw_text("Choose a game to play:", font, Constants.FONT_COLOUR, screen, 20, 20)
-
-        # Display games as buttons
-        button_y = 60
-        buttons = []
-        for i, game in enumerate(games.keys(), start=1):
-            text = f"{i}. {game}" if games[game] else f"{i}. {game} (not available)"
-            draw_text(
-                text,
-                font,
-                Constants.FONT_COLOUR if games[game] else Constants.WRONG_COLOUR,
-                screen,
-                50,
-                button_y,
-            )
-            buttons.append((text, 50, button_y, game))
-            button_y += 40
-
-        # Add leaderboard button
-        leaderboard_text = "View Leaderboard"
-        draw_text(leaderboard_text, font, Constants.FONT_COLOUR, screen, 50, button_y)
-        buttons.append((leaderboard_text, 50, button_y, "leaderboard"))
-
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                x, y = event.pos
-                for text, bx, by, game in buttons:
-                    if bx <= x <= bx + 300 and by <= y <= by + 30:
-                        if game == "leaderboard":
-                            gui_leaderboard(screen, font, games)
-                        elif games[game]:
-                            games[game].play()
-                            running = False
-                            main_menu(games)
-
-        pygame.display.update()
+    GraphicalMenu(registry).run()
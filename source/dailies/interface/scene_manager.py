@@ -0,0 +1,185 @@
+"""scene_manager.py: Runs games as scenes on one persistent display."""
+
+import time
+
+import pygame
+
+from ..config.constants import Constants
+from ..file_interaction.score_store import ScoreStore
+from ..games.game_infrastructure import Game
+from ..logs.setup_logging import setup_logging
+from .frame_stats import FrameStats
+from .glyph_cache import glyph_cache
+
+scene_manager_logger = setup_logging()
+
+
+class SceneManager:
+    """
+    The owner of the display, running one game at a time on it.
+
+    Attributes
+    ----------
+    size : tuple[int, int]
+        The size the display is opened at.
+    display : pygame.Surface | None
+        The display, once opened.
+    scores : ScoreStore | None
+        The store finished games are saved to, if any.
+    frame_stats : FrameStats
+        The frame times and CPU usage of the last scene run.
+
+    Methods
+    -------
+    open() -> pygame.Surface:
+        Open the display, if it is not open already.
+    run(scene: Game) -> None:
+        Run a game on the display until it stops.
+    close() -> None:
+        Close the display and shut Pygame down.
+
+    Examples
+    --------
+    >>> manager = SceneManager()
+    >>> manager.run(create_wordle())
+    >>> manager.run(create_quordle())
+    >>> manager.close()
+
+    Notes
+    -----
+    Pygame is initialised and the window created once, however many games
+    are played, so switching games only clears the screen. Every frame
+    hands the scene its events, then makes a single
+    ``pygame.display.update`` of the areas it drew. While the scene is
+    animating, frames are capped at ``Constants.FPS``; otherwise the loop
+    blocks until the next event, so an idle game uses no CPU.
+    """
+
+    def __init__(
+        self, size: tuple[int, int] = Constants.SCREEN_SIZE, scores: ScoreStore | None = None
+    ) -> None:
+        """
+        Initialise the scene manager.
+
+        Parameters
+        ----------
+        size : tuple[int, int], optional
+            The size to open the display at, by default ``Constants.SCREEN_SIZE``.
+        scores : ScoreStore | None, optional
+            The store finished games are saved to, by default None.
+
+        Examples
+        --------
+        >>> manager = SceneManager((1024, 768))
+
+        Notes
+        -----
+        The display is opened by ``open`` or the first ``run``.
+        """
+        self.size = size
+        self.scores = scores
+        self.display: pygame.Surface | None = None
+        self.frame_stats = FrameStats()
+
+    def open(self) -> pygame.Surface:
+        """
+        Open the display, if it is not open already.
+
+        Returns
+        -------
+        pygame.Surface
+            The display.
+
+        Examples
+        --------
+        >>> screen = manager.open()
+
+        Notes
+        -----
+        The display is resizable; after a resize it is fetched again with
+        ``pygame.display.get_surface`` rather than recreated.
+        """
+        if self.display is None:
+            pygame.init()
+            self.display = pygame.display.set_mode(self.size, pygame.RESIZABLE | pygame.DOUBLEBUF)
+        return self.display
+
+    def run(self, scene: Game) -> None:
+        """
+        Run a game on the display until it stops.
+
+        Parameters
+        ----------
+        scene : Game
+            The game.
+
+        Examples
+        --------
+        >>> manager.run(wordle)
+
+        Notes
+        -----
+        Closing the window ends the scene, not the application. The screen
+        is cleared when the window is resized, and updated in full after the
+        scene has laid itself out again. A finished game's result is queued
+        for the score store, which writes it on its own thread.
+        """
+        screen = self.open()
+        pygame.display.set_caption(scene.__name__())
+        screen.fill(Constants.BACKGROUND_COLOUR)
+        pygame.display.update()
+
+        self.frame_stats = FrameStats()
+        clock = pygame.time.Clock()
+        scene.enter(screen)
+        pygame.display.update(scene.render(screen))
+        while scene.running:
+            if scene.animating:
+                dt = clock.tick(Constants.FPS)
+                events = pygame.event.get()
+            else:
+                events = [pygame.event.wait()] + pygame.event.get()
+                clock.tick()  # Restart the frame timer, so the wait is not animated.
+                dt = 0
+            frame_start = time.perf_counter()
+
+            full_update = False
+            for event in events:
+                if event.type == pygame.QUIT:
+                    scene.running = False
+                elif event.type == pygame.VIDEORESIZE:
+                    screen = self.display = pygame.display.get_surface()
+                    screen.fill(Constants.BACKGROUND_COLOUR)
+                    full_update = True
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    full_update = True
+
+            scene.update(events, dt)
+            dirty_rects = scene.render(screen)
+            if full_update:
+                pygame.display.update()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
+            self.frame_stats.record(time.perf_counter() - frame_start)
+
+        scene.exit()
+        if self.scores is not None and scene.won is not None and scene.score is not None:
+            self.scores.record(scene.__name__(), scene.score, scene.won)
+        scene_manager_logger.info(f"{scene.__name__()} render loop: {self.frame_stats.summary()}")
+
+    def close(self) -> None:
+        """
+        Close the display and shut Pygame down.
+
+        Examples
+        --------
+        >>> manager.close()
+
+        Notes
+        -----
+        The glyph cache is cleared too, since fonts do not survive
+        ``pygame.quit``.
+        """
+        pygame.quit()
+        glyph_cache.clear()
+        self.display = None
@@ -1,39 +1,74 @@
 """main.py: Called when the package is run as a script."""
 
+from .config.constants import Constants
 from .config.paths import Paths
-from .file_interaction.read import read_file
-from .games.connections.connections import Connections
-from .games.kenken.kenken import KenKen
-from .games.mini_crossword.mini_crossword import MiniCrossword
-from .games.strands.strands import Strands
-from .games.sudoku.sudoku import Sudoku
-from .games.wordle.wordle import Wordle
+from .file_interaction.word_cache import build_word_cache
+from .games.daily_scheduler import DailyScheduler
+from .games.puzzle_pool import PuzzlePool
+from .games.registry import DEFAULT_GAMES, GameRegistry
+from .interface.command_line import parse_arguments
 from .interface.graphical_menu import main_menu
 from .logs.setup_logging import setup_logging
 
 main_logger = setup_logging()
 
 
-def main() -> None:
+def main(arguments: list[str] | None = None) -> None:
     """
     Main function for the application.
 
+    Parameters
+    ----------
+    arguments : list[str] | None, optional
+        The command line arguments, by default None (read from ``sys.argv``).
+
     Notes
     -----
-    This function is the entry point for the application.
+    This function is the entry point for the application. Opening the menu
+    also starts precomputing the daily puzzles in the background.
     """
+    parsed_arguments = parse_arguments(arguments)
+
     try:
+        if parsed_arguments.command == "pregenerate":
+            options = {}
+            if parsed_arguments.difficulty is not None:
+                options["difficulty"] = parsed_arguments.difficulty
+            PuzzlePool(parsed_arguments.game).generate(
+                parsed_arguments.count,
+                base_seed=parsed_arguments.seed,
+                start=parsed_arguments.start,
+                workers=parsed_arguments.workers,
+                **options,
+            )
+            return
+
+        if parsed_arguments.command == "schedule":
+            DailyScheduler().precompute(parsed_arguments.days, workers=parsed_arguments.workers)
+            return
+
+        if parsed_arguments.command == "build-cache":
+            words = build_word_cache(Paths.WORDS)
+            if words is not None:
+                from .games.wordle.feedback_matrix import FeedbackMatrix
+
+                wordle_words = words.words_of_length(Constants.WORDLE_WORD_LENGTH)
+                FeedbackMatrix.load(wordle_words, wordle_words)
+            return
+
+        if parsed_arguments.command == "simulate":
+            from .games.wordle.simulation import run_simulation
+
+            run_simulation(parsed_arguments.games, parsed_arguments.strategy, parsed_arguments.seed)
+            return
+
         main_logger.info("Application started.")
-        games = {
-            "Wordle": Wordle(read_file(Paths.WORDS)) if read_file(Paths.WORDS) else None,
-            "Sudoku": Sudoku(9, 0.6),
-            "Connections": Connections(),
-            "Mini Crossword": MiniCrossword(),
-            "Strands": Strands(),
-            "KenKen": KenKen(),
-        }
-
-        main_menu(games)
+        registry = GameRegistry(DEFAULT_GAMES)
+        DailyScheduler().precompute_in_background()
+        if parsed_arguments.warm_up:
+            registry.warm_up()
+
+        main_menu(registry)
     except KeyboardInterrupt:
         print("\n")
         main_logger.info("Exiting application due to user interrupt...")
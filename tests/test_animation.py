@@ -0,0 +1,51 @@
+"""test_animation.py: Tests for the frame-driven animation scheduler and popup."""
+
+import pygame
+from dailies.interface.animation import AnimationScheduler, Popup, Tween
+
+
+def test_scheduler() -> None:
+    """Test delays, completion, chaining from callbacks, and cancelling."""
+    animations = AnimationScheduler()
+    values: list[float] = []
+    finished: list[str] = []
+
+    def chain() -> None:
+        finished.append("first")
+        animations.call_later(10, lambda: finished.append("second"))
+
+    animations.add(Tween(0, 100, 100, values.append, chain, delay=50))
+    animations.add(Tween(0, 1, 1000, values.append, tag="cancelled"))
+    animations.cancel("cancelled")
+
+    animations.update(40)
+    assert values == [] and animations.active
+    animations.update(60)
+    assert values == [50.0]
+    animations.update(1000)
+    assert values[-1] == 100 and finished == ["first"]
+    animations.update(10)
+    assert finished == ["first", "second"] and not animations.active
+
+
+def test_popup() -> None:
+    """Test that a popup fades in, holds, fades out, and clears its area."""
+    pygame.font.init()
+    screen = pygame.Surface((200, 100))
+    animations = AnimationScheduler()
+    popup = Popup(animations, background=(0, 0, 0))
+
+    popup.show("Hi", 30, (255, 255, 255), (100, 50), duration=200)
+    rect = popup.draw(screen)
+    assert rect is not None and popup.alpha == 0
+    assert popup.draw(screen) is None
+
+    animations.update(100)
+    assert popup.alpha == 255 and popup.draw(screen) is not None
+    animations.update(100)
+    assert popup.active and popup.draw(screen) is None
+
+    animations.update(100)
+    assert not popup.active and not animations.active
+    assert popup.draw(screen) is not None
+    assert pygame.transform.average_color(screen, rect)[:3] == (0, 0, 0)
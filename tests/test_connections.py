@@ -0,0 +1,60 @@
+"""test_connections.py: Tests for the Connections category index and board builder."""
+
+import random
+
+import pytest
+from dailies.games.connections.builder import ConnectionsBuilder
+from dailies.games.connections.category_index import CategoryIndex, read_categories
+
+CATEGORIES = {
+    "Fruit": ["apple", "lime", "pear", "plum", "fig"],
+    "Green": ["lime", "mint", "sage", "moss", "jade"],
+    "Trees": ["oak", "ash", "elm", "yew", "plum", "lime"],
+    "Birds": ["owl", "wren", "lark", "kite", "crow"],
+}
+
+
+def test_category_index() -> None:
+    """Test that words map to every category holding them."""
+    index = CategoryIndex(CATEGORIES)
+
+    assert index.categories_of("Lime") == {0, 1, 2} and index.categories_of("moon") == frozenset()
+    assert index.overlap({"lime", "plum", "owl"}) == {0: 2, 1: 1, 2: 2, 3: 1}
+    assert index.groupings({"apple", "lime", "pear", "plum", "owl"}, 4) == {
+        frozenset({"apple", "lime", "pear", "plum"})
+    }
+
+
+def test_builder_counts_herrings_and_solutions() -> None:
+    """Test that shared words count as red herrings and alternative splits are found."""
+    builder = ConnectionsBuilder(CategoryIndex(CATEGORIES), groups=2, size=4)
+
+    board = {0: ("apple", "lime", "pear", "plum"), 2: ("oak", "ash", "elm", "yew")}
+    assert builder.herrings(board) == 2
+    assert builder.solutions({"apple", "lime", "pear", "plum", "oak", "ash", "elm", "yew"}) == 1
+    assert builder.solutions({"apple", "pear", "plum", "fig", "oak", "ash", "elm", "yew"}) == 1
+    assert builder.solutions({"apple", "lime", "pear", "fig", "plum", "oak", "ash", "elm"}) == 2
+
+
+@pytest.mark.parametrize("red_herrings", [0, 2])
+def test_builder_respects_the_red_herring_budget(red_herrings: int) -> None:
+    """Test that built boards have four groups, a unique split and few enough red herrings."""
+    categories = read_categories()
+    assert categories is not None
+    index = CategoryIndex(categories)
+    builder = ConnectionsBuilder(index, red_herrings=red_herrings, rng=random.Random(42))
+    board = builder.build()
+
+    assert board is not None and len(board) == 4
+    numbered = {index.names.index(name): words for name, words in board.items()}
+    words = {word for group in board.values() for word in group}
+    assert len(words) == 16 and builder.herrings(numbered) <= red_herrings
+    assert builder.solutions(words) == 1
+    for name, group in board.items():
+        assert set(group) <= set(categories[name])
+
+
+def test_builder_rejects_tiny_boards() -> None:
+    """Test that boards need at least two groups of two."""
+    with pytest.raises(ValueError):
+        ConnectionsBuilder(CategoryIndex(CATEGORIES), groups=1)
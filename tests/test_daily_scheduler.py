@@ -0,0 +1,64 @@
+"""test_daily_scheduler.py: Tests for the seeded daily puzzle calendar."""
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from dailies.games.daily_scheduler import DailyCalendar, DailyScheduler, daily_seed
+from dailies.games.kenken.generator import generate_kenken_puzzle
+from dailies.games.puzzle_pool import PuzzlePool, derive_seed
+from dailies.games.wordle.wordle import generate_wordle_puzzle
+
+DAY = date(2024, 1, 1)
+
+
+def test_daily_seed() -> None:
+    """Test that seeds depend on the game and the day, and on nothing else."""
+    assert daily_seed("sudoku", DAY) == daily_seed("sudoku", date(2024, 1, 1))
+    assert daily_seed("sudoku", DAY) != daily_seed("kenken", DAY)
+    assert daily_seed("sudoku", DAY) != daily_seed("sudoku", DAY + timedelta(days=1))
+
+
+def test_calendar_precomputes_and_serves(tmp_path: Path) -> None:
+    """Test that precomputed puzzles are cached on disk and reproducible from their date."""
+    calendar = DailyCalendar("kenken", tmp_path)
+
+    assert calendar.precompute(3, start=DAY, workers=1) == 3
+    assert calendar.precompute(4, start=DAY, workers=1) == 1
+
+    served = DailyCalendar("kenken", tmp_path).puzzle(DAY + timedelta(days=2))
+    expected = generate_kenken_puzzle(daily_seed("kenken", DAY + timedelta(days=2)))
+    assert served == {**expected, "date": "2024-01-03"}
+
+    assert calendar.precompute(2, start=DAY + timedelta(days=3), workers=1) == 1
+    assert sorted(DailyCalendar("kenken", tmp_path)._load()) == ["2024-01-04", "2024-01-05"]
+
+
+def test_scheduler_generates_missing_days(tmp_path: Path) -> None:
+    """Test that a day that was not precomputed is generated from its seed and cached."""
+    scheduler = DailyScheduler(["wordle"], tmp_path)
+
+    puzzle = scheduler.puzzle("wordle", DAY)
+    assert puzzle["word"] == generate_wordle_puzzle(daily_seed("wordle", DAY))["word"]
+    assert (tmp_path / "wordle.json").exists()
+    with pytest.raises(ValueError):
+        scheduler.puzzle("sudoku", DAY)
+    with pytest.raises(ValueError):
+        DailyCalendar("chess", tmp_path)
+
+
+def test_calendar_draws_without_generating(tmp_path: Path) -> None:
+    """Test that a game's draw falls back to the pool until today is precomputed."""
+    pool = PuzzlePool("kenken", tmp_path / "pool")
+    pool.generate(1, workers=1)
+    calendar = DailyCalendar("kenken", tmp_path, fallback=pool)
+
+    assert calendar.draw() == generate_kenken_puzzle(derive_seed("kenken", 0, 0))
+    assert calendar.draw() is None
+    assert not calendar.path.exists()
+
+    DailyScheduler(["kenken"], tmp_path).precompute_in_background(2).join()
+    assert calendar.draw() == {
+        **generate_kenken_puzzle(daily_seed("kenken", date.today())),
+        "date": date.today().isoformat(),
+    }
@@ -0,0 +1,25 @@
+"""test_feedback_matrix.py: Tests for the precomputed Wordle feedback matrix."""
+
+from pathlib import Path
+
+import numpy as np
+from dailies.games.wordle.feedback_matrix import FeedbackMatrix
+from dailies.games.wordle.scoring import score_guess
+
+
+def test_matrix_is_saved_and_memory_mapped(tmp_path: Path) -> None:
+    """Test that the matrix matches the scorer and is reloaded from disk."""
+    guesses = ["crane", "speed", "eerie"]
+    answers = ["abide", "crane", "sweet", "slate"]
+
+    built = FeedbackMatrix.load(guesses, answers, tmp_path)
+    loaded = FeedbackMatrix.load(guesses, answers, tmp_path)
+
+    assert isinstance(loaded.matrix, np.memmap) and loaded.matrix.dtype == np.uint8
+    assert np.array_equal(built.matrix, loaded.matrix)
+    for guess in guesses:
+        for answer in answers:
+            assert loaded.pattern(guess, answer) == score_guess(guess, answer)
+    assert FeedbackMatrix.path_for(guesses, answers[:2], tmp_path) != FeedbackMatrix.path_for(
+        guesses, answers, tmp_path
+    )
@@ -0,0 +1,19 @@
+"""test_frame_stats.py: Tests for the render loop frame statistics."""
+
+from dailies.interface.frame_stats import FrameStats
+
+
+def test_frame_stats() -> None:
+    """Test the frame-time window, mean, percentile and summary."""
+    stats = FrameStats(window=4)
+    assert stats.mean_frame_ms() == 0 and stats.percentile_frame_ms(95) == 0
+
+    for seconds in (0.001, 0.002, 0.003, 0.004, 0.010):
+        stats.record(seconds)
+
+    assert stats.frames == 5 and len(stats.frame_times) == 4
+    assert abs(stats.mean_frame_ms() - 4.75) < 1e-9
+    assert abs(stats.percentile_frame_ms(95) - 10) < 1e-9
+    assert abs(stats.percentile_frame_ms(50) - 3) < 1e-9
+    assert stats.cpu_percent() >= 0
+    assert stats.summary().startswith("5 frames in")
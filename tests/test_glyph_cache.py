@@ -0,0 +1,29 @@
+"""test_glyph_cache.py: Tests for the shared font and glyph cache."""
+
+from dailies.interface.glyph_cache import GlyphCache
+
+WHITE = (255, 255, 255)
+
+
+def test_glyph_cache() -> None:
+    """Test that renders are shared, counted, and evicted least recently used first."""
+    glyphs = GlyphCache(max_glyphs=2, max_fonts=1)
+
+    first = glyphs.render("A", 30, WHITE)
+    assert glyphs.render("A", 30, WHITE) is first
+    assert (glyphs.hits, glyphs.misses) == (1, 1)
+    assert glyphs.render("A", 30, (0, 0, 0)) is not first
+
+    glyphs.render("A", 30, WHITE)
+    glyphs.render("B", 30, WHITE)
+    assert len(glyphs) == 2
+    assert glyphs.render("A", 30, WHITE) is first
+    assert glyphs.misses == 3
+
+    font = glyphs.font(30)
+    assert glyphs.font(30) is font
+    glyphs.font(40)
+    assert glyphs.font(30) is not font
+
+    glyphs.clear()
+    assert len(glyphs) == 0
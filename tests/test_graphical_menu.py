@@ -0,0 +1,30 @@
+"""test_graphical_menu.py: Tests for the graphical menu pages."""
+
+import pygame
+from dailies.config.constants import Constants
+from dailies.games.registry import GameRegistry
+from dailies.interface.graphical_menu import (
+    BACK,
+    LEADERBOARD,
+    leaderboard_page,
+    main_page,
+)
+
+
+def test_menu_pages() -> None:
+    """Test that pages find the item under a click without loading any game."""
+    registry = GameRegistry({"Wordle": "dailies.games.wordle.wordle:create_wordle"})
+    screen = pygame.Surface(Constants.MENU_SIZE)
+
+    page = main_page(registry)
+    page.draw(screen)
+    assert [target for _, target in page.buttons] == ["Wordle", LEADERBOARD]
+    first = page.buttons[0][0]
+    assert page.target_at((first.x + Constants.MENU_BUTTON_SIZE[0] - 1, first.y)) == "Wordle"
+    assert page.target_at((0, 0)) is None
+
+    leaderboard = leaderboard_page(registry)
+    leaderboard.draw(screen)
+    assert leaderboard.items[0][0] == "Wordle: Not played"
+    assert [target for _, target in leaderboard.buttons] == [BACK]
+    assert not registry.is_loaded("Wordle")
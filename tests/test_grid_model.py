@@ -0,0 +1,32 @@
+"""test_grid_model.py: Tests for the struct-of-arrays Wordle grid model."""
+
+import numpy as np
+import pytest
+from dailies.games.wordle.grid_model import EMPTY, GridModel
+
+
+def test_layout_and_dirty_tracking() -> None:
+    """Test vectorised layout, change detection and animated tile areas."""
+    with pytest.raises(ValueError):
+        GridModel(0, 5)
+
+    model = GridModel(6, 5)
+    model.layout((160, 60), (80, 60), (16, 12), 60)
+    assert model.x[3].tolist() == [160, 256, 352, 448, 544]
+    assert model.y[:, 2].tolist() == [60, 132, 204, 276, 348, 420]
+    assert model.dirty.all()
+
+    model.dirty[...] = False
+    model.set_tile(0, 0, "c")
+    model.set_tile(0, 0, "c")
+    assert model.dirty_tiles().tolist() == [[0, 0]]
+
+    model.dirty[...] = False
+    model.set_row(0, "crane", [EMPTY, 1, EMPTY, 0, 0])
+    assert model.dirty[0].tolist() == [False, True, True, True, True]
+    assert "".join(model.letters[0]) == "crane" and model.marks[0, 1] == 1
+
+    model.set_scale(1, 2, 0.5)
+    model.set_row_offset(1, 4.4)
+    assert model.tile_rect(1, 2) == (356, 147, 80, 30)
+    assert np.array_equal(model.offset_x[1], [4] * 5)
@@ -0,0 +1,34 @@
+"""test_kenken.py: Tests for the KenKen cages, solver and generator."""
+
+import random
+
+import numpy as np
+import pytest
+from dailies.games.kenken.cages import SUBTRACT, Cage, cage_tuples
+from dailies.games.kenken.generator import KenKenGenerator, generate_kenken_puzzle
+from dailies.games.kenken.solver import KenKenSolver
+
+
+def test_cage_tuples() -> None:
+    """Test that cage tuples satisfy the cage in either order."""
+    assert cage_tuples(Cage(((0, 0), (0, 1)), SUBTRACT, 3), 4) == [(1, 4), (4, 1)]
+
+
+def test_generator_unique() -> None:
+    """Test that a generated puzzle covers the grid and has exactly one solution."""
+    cages, solution = KenKenGenerator(6, random.Random(42)).generate()
+    cells = sorted(cell for cage in cages for cell in cage.cells)
+    assert cells == [(row, column) for row in range(6) for column in range(6)]
+
+    solutions = KenKenSolver(6, cages).solve()
+    assert len(solutions) == 1
+    assert np.array_equal(solutions[0], solution)
+    for line in [*solution, *solution.T]:
+        assert sorted(line) == list(range(1, 7))
+
+
+def test_generate_kenken_puzzle() -> None:
+    """Test that puzzle records are reproducible from their seed."""
+    assert generate_kenken_puzzle(7, 4) == generate_kenken_puzzle(7, 4)
+    with pytest.raises(ValueError):
+        KenKenGenerator(2)
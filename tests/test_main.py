@@ -1,5 +1,8 @@
 """test_main.py: Tests for the main entry point of the application."""
 
+import pytest
+from dailies.main import main
+
 
 def test_run_main() -> None:
     """
@@ -13,3 +16,9 @@ def test_run_main() -> None:
     anything.
     """
     assert True  # TODO: Implement tests
+
+
+def test_pregenerate_rejects_difficulty_for_other_games() -> None:
+    """Test that only Sudoku can be pregenerated at a difficulty."""
+    with pytest.raises(SystemExit):
+        main(["pregenerate", "kenken", "--count", "2", "--workers", "1", "--difficulty", "hard"])
@@ -0,0 +1,61 @@
+"""test_mini_crossword.py: Tests for the Mini Crossword pattern index and filler."""
+
+import random
+
+import pytest
+from dailies.config.constants import Constants
+from dailies.games.mini_crossword.filler import (
+    ACROSS,
+    DOWN,
+    CrosswordFiller,
+    Slot,
+    template_slots,
+)
+from dailies.games.mini_crossword.pattern_index import PatternIndex, load_pattern_index
+
+
+def test_pattern_index() -> None:
+    """Test that pattern queries match positional letters."""
+    index = PatternIndex(["crane", "Crate", "slate", "cr-te"])
+
+    assert index.words_matching("?ra?e") == ["crane", "crate"]
+    assert index.words_matching("s????") == ["slate"] and index.matches("????") == 0
+    assert index.restrict(5, index.full[5], 3, 1 << 19) == 0b110
+    with pytest.raises(ValueError):
+        index.matches("c1ane")
+
+
+def test_template_slots() -> None:
+    """Test that slots are numbered as in a printed crossword."""
+    assert template_slots(("#??", "???", "??#")) == [
+        Slot(1, ACROSS, ((0, 1), (0, 2))),
+        Slot(3, ACROSS, ((1, 0), (1, 1), (1, 2))),
+        Slot(4, ACROSS, ((2, 0), (2, 1))),
+        Slot(1, DOWN, ((0, 1), (1, 1), (2, 1))),
+        Slot(2, DOWN, ((0, 2), (1, 2))),
+        Slot(3, DOWN, ((1, 0), (2, 0))),
+    ]
+    with pytest.raises(ValueError):
+        template_slots(("???", "??"))
+
+
+@pytest.mark.parametrize("template", Constants.MINI_CROSSWORD_TEMPLATES)
+def test_filler_fills_every_template(template: tuple[str, ...]) -> None:
+    """Test that filled grids use distinct dictionary words that agree at every crossing."""
+    index = load_pattern_index()
+    assert index is not None
+    filler = CrosswordFiller(index, template, random.Random(42))
+    words = filler.fill()
+
+    assert words is not None and len(set(words.values())) == len(filler.slots)
+    grid = filler.grid(words)
+    for slot, word in words.items():
+        assert word in index.words[len(word)]
+        assert "".join(grid[row][column] for row, column in slot.cells) == word
+
+
+def test_filler_reports_impossible_grids() -> None:
+    """Test that a grid with no possible fill gives None."""
+    filler = CrosswordFiller(PatternIndex(["abc", "bcd"]), ("???", "???", "???"))
+
+    assert filler.fill() is None
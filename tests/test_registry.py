@@ -0,0 +1,36 @@
+"""test_registry.py: Tests for the lazy game registry."""
+
+import pytest
+from dailies.games.kenken.kenken import KenKen
+from dailies.games.registry import GameRegistry, load_entry_point
+
+
+def test_games_are_built_once_on_demand() -> None:
+    """Test that games are only built when requested, and only once."""
+    registry = GameRegistry(
+        {
+            "KenKen": "dailies.games.kenken.kenken:KenKen",
+            "Broken": "dailies.games.kenken.kenken:Missing",
+        }
+    )
+
+    assert registry.names() == ["KenKen", "Broken"]
+    assert not registry.is_loaded("KenKen") and registry.is_available("KenKen") is None
+
+    game = registry.get("KenKen")
+    assert isinstance(game, KenKen) and registry.get("KenKen") is game
+    assert registry.get("Broken") is None and registry.is_available("Broken") is False
+
+    with pytest.raises(ValueError):
+        registry.get("Chess")
+    with pytest.raises(ValueError):
+        load_entry_point("dailies.games.kenken.kenken")
+
+
+def test_warm_up_builds_in_the_background() -> None:
+    """Test that the warm-up thread builds the requested games."""
+    registry = GameRegistry({"KenKen": "dailies.games.kenken.kenken:KenKen"})
+
+    registry.warm_up().join(timeout=10)
+
+    assert isinstance(registry.peek("KenKen"), KenKen)
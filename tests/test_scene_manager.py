@@ -0,0 +1,60 @@
+"""test_scene_manager.py: Tests for running games as scenes on one display."""
+
+import pygame
+import pytest
+from dailies.games.game_infrastructure import Game
+from dailies.interface.scene_manager import SceneManager
+
+
+class CountingScene(Game):
+    """A scene that animates for a few frames, then stops."""
+
+    def __init__(self, frames: int) -> None:
+        """Initialise the scene."""
+        super().__init__("Counting", "Counts frames.", "None.")
+        self.frames = frames
+        self.calls: list[str] = []
+
+    @property
+    def animating(self) -> bool:
+        """Ask for frames without waiting for input."""
+        return True
+
+    def enter(self, screen: pygame.Surface) -> None:
+        """Start counting."""
+        self.calls.append("enter")
+        self.running = True
+
+    def update(self, events: list[pygame.event.Event], dt: int) -> None:
+        """Count a frame."""
+        self.calls.append("update")
+        self.running = self.calls.count("update") < self.frames
+
+    def render(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """Draw nothing."""
+        self.calls.append("render")
+        return []
+
+    def exit(self) -> None:
+        """Record the score."""
+        self.calls.append("exit")
+        self.score = self.frames
+
+
+def test_scene_manager(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that scenes run through their hooks on a display opened only once."""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    manager = SceneManager((200, 100))
+    try:
+        first = CountingScene(3)
+        manager.run(first)
+        display = manager.display
+        assert first.calls == ["enter", "render"] + ["update", "render"] * 3 + ["exit"]
+        assert first.score == 3
+        assert manager.frame_stats.frames == 3
+
+        manager.run(CountingScene(1))
+        assert manager.display is display
+    finally:
+        manager.close()
+    assert manager.display is None
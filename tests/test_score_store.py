@@ -0,0 +1,37 @@
+"""test_score_store.py: Tests for the SQLite score store."""
+
+from datetime import date
+from pathlib import Path
+
+from dailies.file_interaction.score_store import ScoreStore
+
+
+def test_score_store(tmp_path: Path) -> None:
+    """Test that results are saved in batches and answer leaderboard queries."""
+    path = tmp_path / "scores.sqlite3"
+    scores = ScoreStore(path, player="ada", batch_size=2)
+    for day, score, won in [(1, 4, True), (2, 6, False), (3, 3, True), (4, 5, True), (5, 2, True)]:
+        scores.record("Wordle", score, won, played_on=date(2024, 5, day))
+    scores.record("Wordle", 1, True, player="bob", played_on=date(2024, 5, 5))
+    scores.record("Quordle", 9, True, played_on=date(2024, 5, 5))
+    scores.flush()
+
+    assert [(result.player, result.score) for result in scores.top("Wordle", 3)] == [
+        ("bob", 1),
+        ("ada", 2),
+        ("ada", 3),
+    ]
+    assert scores.streak("Wordle", today=date(2024, 5, 5)) == 3
+    assert scores.streak("Wordle", today=date(2024, 5, 6)) == 3
+    assert scores.streak("Wordle", today=date(2024, 5, 7)) == 0
+    assert scores.streak("Wordle", player="bob", today=date(2024, 5, 5)) == 1
+    assert scores.percentile("Wordle", 3) == 50.0
+    assert scores.percentile("Wordle", 6, won=False) == 0.0
+    assert scores.percentile("Strands", 1) == 0.0
+    assert scores.played("Wordle") == 6
+    scores.close()
+
+    reopened = ScoreStore(path)
+    assert reopened.played("Quordle") == 1
+    assert reopened._connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    reopened.close()
@@ -0,0 +1,56 @@
+"""test_strands.py: Tests for the Strands trie, board and generator."""
+
+import random
+
+from dailies.games.strands.board import INVALID, THEME, WORD, StrandsBoard, Trace
+from dailies.games.strands.generator import StrandsGenerator, read_themes
+from dailies.games.strands.trie import MISSING, Trie
+
+
+def test_trie() -> None:
+    """Test that the trie stores words and rejects dead prefixes."""
+    trie = Trie(["crane", "crate", "Crane", ""])
+
+    assert len(trie) == 2 and "crate" in trie and "cra" not in trie
+    assert trie.walk("cro") == MISSING and not trie.is_word(trie.walk("cra"))
+
+
+def test_board_and_trace() -> None:
+    """Test that traced paths are checked against theme words and the dictionary."""
+    letters = [list("pe"), list("ra"), list("ts")]
+    paths = {"pear": ((0, 0), (0, 1), (1, 1), (1, 0)), "st": ((2, 1), (2, 0))}
+    dictionary = Trie(["rape", "tsar"])
+    board = StrandsBoard("Test", letters, paths, dictionary)
+    assert len(dictionary) == 2 and "pear" not in dictionary
+
+    assert board.find_words(Trie(["pear", "reap"])) == {
+        "pear": [paths["pear"]],
+        "reap": [((1, 0), (0, 1), (1, 1), (0, 0))],
+    }
+    assert board.check(((1, 0), (0, 1), (1, 1), (0, 0))) == INVALID
+    assert board.check(((1, 0), (1, 1), (0, 0), (0, 1))) == WORD
+
+    trace = Trace(board)
+    for cell in [(0, 0), (0, 1), (1, 1), (2, 2), (1, 0)]:
+        trace.extend(cell)
+    assert trace.word() == "pear" and trace.alive()
+    assert trace.finish() == THEME and board.found == {"pear"} and not board.solved()
+
+    for cell in [(2, 1), (0, 0), (2, 0), (2, 1)]:
+        trace.extend(cell)
+    assert trace.path == [(2, 1)] and not trace.extend((2, 1))
+    trace.extend((1, 1))
+    assert trace.word() == "sa" and not trace.alive()
+
+
+def test_generator_covers_the_board() -> None:
+    """Test that generated theme words cover every cell exactly once."""
+    themes = read_themes()
+    assert themes is not None
+    board = StrandsGenerator(themes, rng=random.Random(42)).generate()
+
+    cells = sorted(cell for path in board.words.values() for cell in path)
+    assert cells == [(row, column) for row in range(6) for column in range(8)]
+    for word, path in board.words.items():
+        assert word in themes[board.theme] and board.check(path) == THEME
+    assert board.solved()
@@ -0,0 +1,182 @@
+"""test_sudoku.py: Tests for the Sudoku engine."""
+
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+from dailies.config.constants import Constants
+from dailies.games.puzzle_pool import PuzzlePool, derive_seed
+from dailies.games.sudoku.exact_cover import DancingLinksSolver
+from dailies.games.sudoku.generator import SudokuGenerator, generate_sudoku_puzzle
+from dailies.games.sudoku.grader import SudokuGrader
+from dailies.games.sudoku.solver import SudokuSolver
+from dailies.games.sudoku.sudoku import Sudoku
+
+# "Arto Inkala's hardest Sudoku", which has a single solution.
+HARD_PUZZLE = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+
+
+def _to_grid(puzzle: str) -> np.ndarray:
+    """
+    Convert a puzzle string into a grid.
+
+    Parameters
+    ----------
+    puzzle : str
+        The puzzle as a string of digits, with 0 for empty cells.
+
+    Returns
+    -------
+    np.ndarray
+        The puzzle as a square grid.
+    """
+    size = int(len(puzzle) ** 0.5)
+    return np.array([int(c) for c in puzzle], dtype=int).reshape(size, size)
+
+
+def _is_valid_solution(grid: np.ndarray) -> bool:
+    """
+    Check that a full grid satisfies every Sudoku constraint.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The grid to check.
+
+    Returns
+    -------
+    bool
+        True if every row, column and box contains each digit exactly once.
+    """
+    size = grid.shape[0]
+    box = int(size**0.5)
+    digits = set(range(1, size + 1))
+    boxes = grid.reshape(box, box, box, box).swapaxes(1, 2).reshape(size, size)
+    return all(
+        set(grid[k]) == digits and set(grid[:, k]) == digits and set(boxes[k]) == digits
+        for k in range(size)
+    )
+
+
+def test_solver_finds_unique_solution() -> None:
+    """Test that a hard puzzle with one solution is solved correctly."""
+    grid = _to_grid(HARD_PUZZLE)
+    solutions = SudokuSolver(9).solve(grid)
+
+    assert len(solutions) == 1
+    assert _is_valid_solution(solutions[0])
+    assert np.all(solutions[0][grid > 0] == grid[grid > 0])
+
+
+def test_solver_stops_after_two_solutions() -> None:
+    """Test that an empty grid yields exactly two solutions."""
+    solutions = SudokuSolver(9).solve(np.zeros((9, 9), dtype=int))
+
+    assert len(solutions) == 2
+    assert all(_is_valid_solution(solution) for solution in solutions)
+
+
+def test_solver_rejects_conflicting_givens() -> None:
+    """Test that a grid breaking the rules has no solutions."""
+    grid = np.zeros((9, 9), dtype=int)
+    grid[0, 0] = grid[0, 8] = 5
+
+    assert SudokuSolver(9).solve(grid) == []
+
+
+def test_generator_builds_unique_puzzle() -> None:
+    """Test that generated puzzles are unique and match their solution."""
+    generator = SudokuGenerator(9, random.Random(0))
+    puzzle, solution = generator.generate(0.6)
+
+    assert _is_valid_solution(solution)
+    assert np.all(puzzle[puzzle > 0] == solution[puzzle > 0])
+    assert len(SudokuSolver(9).solve(puzzle)) == 1
+
+
+def test_generator_is_reproducible() -> None:
+    """Test that the same seed produces the same puzzle."""
+    first, _ = SudokuGenerator(9, random.Random(7)).generate(0.5)
+    second, _ = SudokuGenerator(9, random.Random(7)).generate(0.5)
+
+    assert np.array_equal(first, second)
+
+
+def test_puzzle_pool_round_trip(tmp_path: Path) -> None:
+    """Test that pooled puzzles are reproducible and drawn in order."""
+    pool = PuzzlePool("sudoku", tmp_path)
+    pool.generate(3, base_seed=1, workers=1)
+
+    first = pool.draw()
+    assert first is not None
+    assert first["seed"] == derive_seed("sudoku", 1, 0)
+    assert first == generate_sudoku_puzzle(derive_seed("sudoku", 1, 0))
+    assert len(pool) == 2
+
+    sudoku = Sudoku(9, 0.6, pool)
+    sudoku._generate()
+    assert sudoku._is_unique()
+    assert len(pool) == 1
+
+
+def test_grader_reports_techniques() -> None:
+    """Test that a generated easy puzzle only needs singles."""
+    generator = SudokuGenerator(9, random.Random(3))
+    puzzle, _ = generator.generate(0.6, difficulty="easy")
+    report = SudokuGrader(9).grade(puzzle)
+
+    assert report.solved
+    assert report.difficulty == "easy"
+    assert set(report.techniques) <= {"naked_single", "hidden_single"}
+    assert sum(report.techniques.values()) == int((puzzle == 0).sum())
+
+
+def test_generator_targets_difficulty() -> None:
+    """Test that a puzzle can be generated within a harder band."""
+    generator = SudokuGenerator(9, random.Random(5))
+    puzzle, _ = generator.generate(0.6, difficulty="medium")
+
+    assert SudokuGrader(9).grade(puzzle).difficulty == "medium"
+    assert len(SudokuSolver(9).solve(puzzle)) == 1
+
+
+def test_dancing_links_matches_bitmask_solver() -> None:
+    """Test that both engines agree on a hard puzzle and an empty grid."""
+    grid = _to_grid(HARD_PUZZLE)
+    dancing_links = DancingLinksSolver(9)
+
+    assert np.array_equal(dancing_links.solve(grid)[0], SudokuSolver(9).solve(grid)[0])
+    assert len(dancing_links.solve(np.zeros((9, 9), dtype=int))) == 2
+    # Solving again checks that the links were fully restored.
+    assert len(dancing_links.solve(grid)) == 1
+
+
+def test_giant_sizes_generate_unique_puzzles() -> None:
+    """Test that 4×4, 16×16 and 25×25 puzzles are generated with unique solutions."""
+    for size in (4, 16, 25):
+        sudoku = Sudoku(size, 0.5)
+        sudoku._generate()
+
+        assert _is_valid_solution(sudoku.solution)
+        assert sudoku._is_unique()
+        i, j = map(int, np.argwhere(sudoku.grid == 0)[0])
+        assert sudoku.solution[i, j] in sudoku._valid_numbers(i, j)
+
+
+def test_generator_finds_expert_or_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the rarest band is searched for, and never swapped for an easier one."""
+    puzzle, _ = SudokuGenerator(9, random.Random(5)).generate(0.6, difficulty="expert")
+    assert SudokuGrader(9).grade(puzzle).difficulty == "expert"
+
+    monkeypatch.setattr(Constants, "SUDOKU_GRADING_ATTEMPTS", 0)
+    with pytest.raises(ValueError):
+        SudokuGenerator(9, random.Random(5)).generate(0.6, difficulty="expert")
+
+
+def test_generator_rejects_unreachable_difficulty() -> None:
+    """Test that a giant grid fails straight away for a band it cannot reach."""
+    with pytest.raises(ValueError):
+        SudokuGenerator(16, random.Random(1)).generate(0.6, difficulty="expert")
+    puzzle, _ = SudokuGenerator(16, random.Random(1)).generate(0.6, difficulty="easy")
+    assert SudokuGrader(16).grade(puzzle).difficulty == "easy"
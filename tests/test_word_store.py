@@ -0,0 +1,54 @@
+"""test_word_store.py: Tests for the shared word store."""
+
+import os
+import random
+from pathlib import Path
+
+from dailies.config.paths import Paths
+from dailies.file_interaction.word_cache import load_words
+from dailies.file_interaction.word_store import WordStore
+
+
+def test_membership_and_lengths() -> None:
+    """Test that words are normalised, deduplicated and bucketed by length."""
+    store = WordStore(["Crane", "slate", "crane", " at ", "", "café"])
+
+    assert len(store) == 4
+    assert "crane" in store and "CRANE" in store and "café" in store
+    assert "crate" not in store and 5 not in store
+    assert store.lengths() == [2, 4, 5]
+    assert store.words_of_length(5) == ["crane", "slate"]
+    assert store.index_of("slate") == 1
+    assert list(store) == ["at", "café", "crane", "slate"]
+
+
+def test_random_word_is_reproducible() -> None:
+    """Test that random words respect the length and the seed."""
+    store = WordStore.from_file(Paths.WORDS)
+
+    assert store is not None
+    first = store.random_word(5, random.Random(1))
+    assert first == store.random_word(5, random.Random(1))
+    assert len(first) == 5 and first in store
+
+
+def test_word_cache_round_trip(tmp_path: Path) -> None:
+    """Test that the cache is reused, refreshed on a touch, and rebuilt on an edit."""
+    source = tmp_path / "words.txt"
+    source.write_text("crane\nslate\ncafé\n")
+    cache_dir = tmp_path / "cache"
+
+    built = load_words(source, cache_dir)
+    cached = load_words(source, cache_dir)
+    assert built is not None and cached is not None
+    assert isinstance(cached.buckets[5][1], memoryview)
+    assert list(cached) == list(built) and "café" in cached and "crate" not in cached
+
+    os.utime(source, ns=(0, 0))
+    touched = load_words(source, cache_dir)
+    assert touched is not None and isinstance(touched.buckets[5][1], memoryview)
+
+    source.write_text("crane\ncrate\n")
+    edited = load_words(source, cache_dir)
+    assert edited is not None and "crate" in edited and "slate" not in edited
+    assert load_words(tmp_path / "missing.txt", cache_dir) is None
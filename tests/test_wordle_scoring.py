@@ -0,0 +1,47 @@
+"""test_wordle_scoring.py: Tests for Wordle feedback scoring."""
+
+import random
+
+import numpy as np
+from dailies.config.paths import Paths
+from dailies.file_interaction.word_store import WordStore
+from dailies.games.wordle.scoring import (
+    CORRECT,
+    MISS,
+    PRESENT,
+    all_correct,
+    decode_pattern,
+    encode_pattern,
+    encode_words,
+    score_against,
+    score_guess,
+)
+
+
+def test_duplicate_letters() -> None:
+    """Test that repeated letters are only marked as often as they are unmatched."""
+    assert decode_pattern(score_guess("speed", "abide"), 5) == [MISS, MISS, PRESENT, MISS, PRESENT]
+    assert decode_pattern(score_guess("eerie", "sweet"), 5) == [PRESENT, PRESENT, MISS, MISS, MISS]
+    assert decode_pattern(score_guess("llama", "hello"), 5) == [PRESENT, PRESENT, MISS, MISS, MISS]
+    assert decode_pattern(score_guess("hello", "level"), 5) == [
+        MISS,
+        CORRECT,
+        PRESENT,
+        PRESENT,
+        MISS,
+    ]
+    assert score_guess("crane", "crane") == all_correct(5)
+    assert encode_pattern(decode_pattern(123, 5)) == 123
+
+
+def test_batched_scoring_matches_single_scoring() -> None:
+    """Test that scoring against an array agrees with scoring pair by pair."""
+    store = WordStore.from_file(Paths.WORDS)
+    assert store is not None
+    words = store.words_of_length(5)
+    targets = encode_words(words, 5)
+
+    for guess in random.Random(0).sample(words, 20) + ["eerie", "mamma"]:
+        codes = score_against(guess, targets)
+        assert codes.dtype == np.uint8
+        assert codes.tolist() == [score_guess(guess, target) for target in words]
@@ -0,0 +1,57 @@
+"""test_wordle_solver.py: Tests for the entropy-maximising Wordle solver."""
+
+from pathlib import Path
+
+import pytest
+from dailies.config.paths import Paths
+from dailies.file_interaction.word_store import WordStore
+from dailies.games.wordle.feedback_matrix import FeedbackMatrix
+from dailies.games.wordle.scoring import score_guess
+from dailies.games.wordle.solver import WordleSolver
+from dailies.games.wordle.wordle import Wordle
+
+
+def test_solver_finds_every_answer(tmp_path: Path) -> None:
+    """Test that the solver's own suggestions solve every game within six guesses."""
+    store = WordStore.from_file(Paths.WORDS)
+    assert store is not None
+    words = store.words_of_length(5)[:300]
+    solver = WordleSolver(FeedbackMatrix.load(words, words, tmp_path))
+
+    for target in words[::10]:
+        solver.reset()
+        for _ in range(6):
+            guess = solver.suggest()
+            if guess == target:
+                break
+            solver.update(guess, score_guess(guess, target))
+            assert target in solver.remaining()
+        assert guess == target
+
+
+def test_inconsistent_feedback(tmp_path: Path) -> None:
+    """Test that feedback matching no answer is reported."""
+    words = ["crane", "slate", "abide"]
+    solver = WordleSolver(FeedbackMatrix.load(words, words, tmp_path))
+
+    solver.update("crane", score_guess("crane", "zzzzz"))
+    assert solver.remaining() == []
+    with pytest.raises(ValueError):
+        solver.suggest()
+
+
+def test_failed_hint_load_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a hint engine that fails to load is logged and loaded again later."""
+
+    def fail(*arguments: object) -> FeedbackMatrix:
+        raise OSError("disk full")
+
+    wordle = Wordle(WordStore(["crane", "slate", "trace"]))
+    monkeypatch.setattr(FeedbackMatrix, "load", fail)
+    wordle._warm_solver()
+    loader = wordle._solver_loader
+    assert loader is not None
+    loader.join()
+
+    assert wordle._solver_loader is None
+    assert wordle._loaded_solver is None
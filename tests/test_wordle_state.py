@@ -0,0 +1,68 @@
+"""test_wordle_state.py: Tests for the headless Wordle game core and simulator."""
+
+import random
+
+import pytest
+from dailies.games.wordle.scoring import CORRECT, MISS, PRESENT, score_guess
+from dailies.games.wordle.simulation import random_strategy, simulate
+from dailies.games.wordle.state import MultiWordleState, WordleState
+
+WORDS = ["crane", "slate", "abide", "speed", "eerie", "sweet", "hello", "level"]
+
+
+def test_rules() -> None:
+    """Test guess validation, letter marks, winning and losing."""
+    state = WordleState(set(WORDS), "crane", attempts=2)
+
+    with pytest.raises(ValueError):
+        state.submit("cran")
+    with pytest.raises(ValueError):
+        state.submit("zzzzz")
+    assert state.current_attempt == 0
+
+    state.submit("SLATE")
+    assert state.letter_marks["a"] == CORRECT and state.letter_marks["s"] == MISS
+    assert not state.finished
+
+    state.submit("eerie")
+    assert state.letter_marks["e"] == CORRECT and state.letter_marks["r"] == PRESENT
+    assert state.lost and not state.won
+    with pytest.raises(ValueError):
+        state.submit("crane")
+
+    state = WordleState(set(WORDS), "crane")
+    state.submit("crane")
+    assert state.won and state.finished and state.current_attempt == 1
+
+
+def test_simulation_is_reproducible() -> None:
+    """Test that the same seeds play the same games."""
+    first = simulate(set(WORDS), WORDS, random_strategy(WORDS, random.Random(0)), 500, seed=3)
+    second = simulate(set(WORDS), WORDS, random_strategy(WORDS, random.Random(0)), 500, seed=3)
+
+    assert first.games == 500 and 0 < first.wins < 500
+    assert first.guess_counts == second.guess_counts
+
+
+def test_multi_board_rules() -> None:
+    """Test that one guess is scored on every board and solved boards drop out."""
+    targets = ["crane", "slate", "abide", "speed"]
+    with pytest.raises(ValueError):
+        MultiWordleState(set(WORDS), [])
+    state = MultiWordleState(set(WORDS), targets)
+    assert state.attempts == 9
+
+    patterns = state.submit("slate")
+    assert patterns.tolist() == [score_guess("slate", target) for target in targets]
+    assert state.solved_at == [None, 1, None, None] and state.unsolved() == [0, 2, 3]
+
+    state.submit("crane")
+    assert state.letter_marks["c"] == CORRECT and state.letter_marks["s"] == CORRECT
+    state.submit("abide")
+    assert not state.finished
+    state.submit("speed")
+    assert state.won and state.solved_at == [2, 1, 3, 4]
+
+    state = MultiWordleState(set(WORDS), targets, attempts=1)
+    state.submit("hello")
+    assert state.lost